@@ -3,7 +3,6 @@ Resources used by all expressions.
 '''
 
 from __future__ import annotations
-from itertools import chain
 from typing import List, Optional, Tuple, Union, Dict, Any
 import aerospike
 from aerospike_helpers import cdt_ctx
@@ -139,6 +138,9 @@ TypeChildren = Tuple[TypeChild, ...]
 
 TypeAny = Union[_AtomExpr, Any]
 
+# Marks where the children of a node end on the compile stack.
+_SPAN_END = object()
+
 class _BaseExpr(_AtomExpr):
     _op = 0
     # type: int
@@ -148,6 +150,8 @@ class _BaseExpr(_AtomExpr):
     # type: TypeFixed
     _children = ()
     # type: TypeChildren
+    _compiled = None
+    # type: Optional[Tuple[TypeCompiledOp, ...]]
 
     def _get_op(self) -> TypeCompiledOp:
         return (self._op, self._rt, self._fixed, len(self._children))
@@ -161,24 +165,46 @@ class _BaseExpr(_AtomExpr):
         )
 
     def compile(self) -> TypeExpression:
-        expression = [self._get_op()]
+        # Expressions are not changed once built, so the compiled form
+        # of a node is kept and reused by the expressions holding it.
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = self._compile()
+        return list(compiled)
+
+    def _compile(self) -> Tuple[TypeCompiledOp, ...]:
+        expression = []
         # type: TypeExpression
-        work = chain(self._children)
-
-        while True:
-            try:
-                item = next(work)
-            except StopIteration:
-                break
-
-            if isinstance(item, _BaseExpr):
+        # Where each node compiled so far starts and ends in expression,
+        # for nodes found more than once in the tree.
+        spans = {}
+        work = [self]
+
+        while work:
+            item = work.pop()
+
+            if item is _SPAN_END:
+                node, start = work.pop()
+                spans[id(node)] = (start, len(expression))
+            elif isinstance(item, _BaseExpr):
+                if item._compiled is not None:
+                    expression.extend(item._compiled)
+                    continue
+
+                span = spans.get(id(item))
+                if span is not None:
+                    expression.extend(expression[span[0]:span[1]])
+                    continue
+
+                work.append((item, len(expression)))
+                work.append(_SPAN_END)
                 expression.append(item._get_op())
-                work = chain(item._children, work)
+                work.extend(reversed(item._children))
             else:
                 # Should be a str, bin, int, float, etc.
                 expression.append(self._vop(item))
 
-        return expression
+        return tuple(expression)
 
     def _overload_op_unary(self, op_type: int):
         if self._op == op_type:
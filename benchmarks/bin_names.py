@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+import tracemalloc
+
+from optparse import OptionParser
+from tabulate import tabulate
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=1000,
+    help="Number of records read in every batch.")
+
+optparser.add_option(
+    "--bins", dest="bins", type="int", default=20,
+    help="Number of bins of every record.")
+
+optparser.add_option(
+    "--rounds", dest="rounds", type="int", default=20,
+    help="Number of batch reads for every configuration.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Application
+##########################################################################
+
+# Reads the records in batches with the given bin name cache size. Reports the
+# time taken and the memory held by the records of one batch.
+
+
+def measure(keys, cache_size):
+    config = {
+        'hosts': [(options.host, options.port)],
+        'bin_name_cache_size': cache_size
+    }
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    # Fill the cache before measuring.
+    client.get_many(keys)
+
+    start = time.time()
+    for _ in range(options.rounds):
+        client.get_many(keys)
+    elapsed = time.time() - start
+
+    tracemalloc.start()
+    records = client.get_many(keys)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del records
+    client.close()
+    return elapsed, held
+
+
+try:
+    keys = [(options.namespace, options.set, 'bin_names_%d' % i)
+            for i in range(options.keys)]
+    bins = {'bin_name_%d' % i: i for i in range(options.bins)}
+
+    config = {'hosts': [(options.host, options.port)]}
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+    for key in keys:
+        client.put(key, bins)
+
+    table = []
+    for cache_size in [0, 1024]:
+        elapsed, held = measure(keys, cache_size)
+        table.append([cache_size,
+                      '{0:.3f}'.format(elapsed),
+                      options.rounds * options.keys / elapsed,
+                      held])
+
+    print(tabulate(table, headers=["bin_name_cache_size", "seconds",
+                                   "records per second", "bytes held per batch"]))
+
+    for key in keys:
+        client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(2)
+
+sys.exit(0)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+from tabulate import tabulate
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=100000,
+    help="Number of records scanned.")
+
+optparser.add_option(
+    "--intervals", dest="intervals", type="string", default="100,1000,5000",
+    help="Comma separated numbers of records between checkpoints to compare with none.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Application
+##########################################################################
+
+# Scans the set with a paginated foreach(), first without checkpoints and
+# then taking one every interval records, and reports the records scanned
+# per second, the size of a checkpoint and the time taking it.
+
+
+try:
+    config = {'hosts': [(options.host, options.port)]}
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    set_name = options.set + '_checkpoint'
+    keys = [(options.namespace, set_name, i) for i in range(options.keys)]
+    for i, key in enumerate(keys):
+        client.put(key, {'i': i, 'name': 'name%d' % i})
+
+    table = []
+    intervals = [None] + [int(i) for i in options.intervals.split(',')]
+    for interval in intervals:
+        scan = client.scan(options.namespace, set_name)
+        scan.paginate()
+        count = [0]
+        checkpoints = [0, 0, 0.0]
+
+        def callback(record):
+            count[0] += 1
+            if interval and count[0] % interval == 0:
+                start = time.time()
+                checkpoint = scan.checkpoint()
+                checkpoints[2] += time.time() - start
+                checkpoints[0] += 1
+                checkpoints[1] = len(checkpoint)
+
+        start = time.time()
+        scan.foreach(callback)
+        elapsed = time.time() - start
+        table.append([interval or 'none', count[0],
+                      '{0:.3f}'.format(elapsed),
+                      int(count[0] / elapsed), checkpoints[0],
+                      checkpoints[1],
+                      '{0:.1f}'.format(checkpoints[2] / checkpoints[0] * 1e6)
+                      if checkpoints[0] else '-'])
+
+    print(tabulate(table, headers=["interval", "records", "seconds",
+                                   "records per second", "checkpoints",
+                                   "bytes", "us per checkpoint"]))
+
+    for key in keys:
+        client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(2)
+
+sys.exit(0)
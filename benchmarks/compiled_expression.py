@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from aerospike_helpers import expressions as exp
+
+from optparse import OptionParser
+from tabulate import tabulate
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=1000,
+    help="Number of records read in every round.")
+
+optparser.add_option(
+    "--terms", dest="terms", type="int", default=20,
+    help="Number of comparisons in the filter expression.")
+
+optparser.add_option(
+    "--rounds", dest="rounds", type="int", default=10,
+    help="Number of rounds for every form of the expression.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Application
+##########################################################################
+
+# Reads the records one by one with a filter expression of --terms
+# comparisons, given as an expression list converted on every call and then
+# as an expression packed once by aerospike.compile_expression(). Reports
+# the time taken by both.
+
+
+def measure(client, keys, expressions):
+    policy = {'expressions': expressions}
+    start = time.time()
+    for _ in range(options.rounds):
+        for key in keys:
+            client.get(key, policy=policy)
+    return time.time() - start
+
+
+try:
+    config = {'hosts': [(options.host, options.port)]}
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    keys = [(options.namespace, options.set, 'compiled_expression_%d' % i)
+            for i in range(options.keys)]
+    for i, key in enumerate(keys):
+        client.put(key, {'i': i, 'name': 'record_%d' % i})
+
+    expr = exp.Or(
+        exp.GE(exp.IntBin('i'), 0),
+        *[exp.Eq(exp.StrBin('name'), 'name_%d' % i)
+          for i in range(options.terms)])
+
+    table = []
+    for name, expressions in [
+            ('list', expr.compile()),
+            ('compile_expression', aerospike.compile_expression(expr))]:
+        elapsed = measure(client, keys, expressions)
+        records = options.rounds * options.keys
+        table.append([name, '{0:.3f}'.format(elapsed), records / elapsed])
+
+    print(tabulate(table, headers=["expressions", "seconds", "reads per second"]))
+
+    for key in keys:
+        client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(2)
+
+sys.exit(0)
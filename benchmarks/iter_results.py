@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import resource
+import sys
+import time
+
+from optparse import OptionParser
+from tabulate import tabulate
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=100000,
+    help="Number of records scanned.")
+
+optparser.add_option(
+    "--bin-size", dest="bin_size", type="int", default=1000,
+    help="Size of the string bin of every record.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Application
+##########################################################################
+
+# Scans the set with iter_results() and then with results(), reading every
+# record. Reports the time to the first record, the total time and the peak
+# memory of the process after each. iter_results() runs first, as the peak
+# only grows.
+
+
+def measure(results):
+    start = time.time()
+    first = None
+    for _ in results():
+        if first is None:
+            first = time.time() - start
+    elapsed = time.time() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+    return first, elapsed, peak
+
+
+try:
+    config = {'hosts': [(options.host, options.port)]}
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    set_name = options.set + '_iter_results'
+    keys = [(options.namespace, set_name, i) for i in range(options.keys)]
+    for i, key in enumerate(keys):
+        client.put(key, {'i': i, 'value': 'v' * options.bin_size})
+
+    scan = client.scan(options.namespace, set_name)
+
+    table = []
+    for name, results in [('iter_results', scan.iter_results),
+                          ('results', scan.results)]:
+        first, elapsed, peak = measure(results)
+        table.append([name, '{0:.3f}'.format(first),
+                      '{0:.3f}'.format(elapsed), peak])
+
+    print(tabulate(table, headers=["method", "first record seconds",
+                                   "seconds", "peak MB"]))
+
+    for key in keys:
+        client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(2)
+
+sys.exit(0)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from aerospike import exception as e
+
+from optparse import OptionParser
+from tabulate import tabulate
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=1000,
+    help="Number of keys read in every round.")
+
+optparser.add_option(
+    "--rounds", dest="rounds", type="int", default=10,
+    help="Number of rounds for existing and missing records.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Application
+##########################################################################
+
+# Reads records one by one, first records that exist and then records that
+# do not, catching the RecordNotFound raised for each. Reports the time
+# taken by both.
+
+
+def measure(client, keys):
+    start = time.time()
+    for _ in range(options.rounds):
+        for key in keys:
+            try:
+                client.get(key)
+            except e.RecordNotFound:
+                pass
+    return time.time() - start
+
+
+try:
+    config = {'hosts': [(options.host, options.port)]}
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    keys = [(options.namespace, options.set, 'not_found_%d' % i)
+            for i in range(options.keys)]
+    for i, key in enumerate(keys):
+        client.put(key, {'i': i})
+    missing_keys = [(options.namespace, options.set, 'not_found_missing_%d' % i)
+                    for i in range(options.keys)]
+
+    table = []
+    for name, read_keys in [('found', keys), ('not found', missing_keys)]:
+        elapsed = measure(client, read_keys)
+        records = options.rounds * options.keys
+        table.append([name, '{0:.3f}'.format(elapsed), records / elapsed])
+
+    print(tabulate(table, headers=["records", "seconds", "reads per second"]))
+
+    for key in keys:
+        client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(2)
+
+sys.exit(0)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from aerospike_helpers.operations import operations
+
+from optparse import OptionParser
+from tabulate import tabulate
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=1000,
+    help="Number of records updated in every round.")
+
+optparser.add_option(
+    "--rounds", dest="rounds", type="int", default=10,
+    help="Number of rounds for every kind of operations.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Application
+##########################################################################
+
+# Updates counters of the records one by one, with a list of operations built
+# and converted on every call and then with operations prepared once, the
+# increments bound on every call. Reports the time taken by both.
+
+
+def counter_operations(hits, size):
+    return [
+        operations.increment('hits', hits),
+        operations.increment('bytes', size),
+        operations.write('source', 'benchmark'),
+        operations.read('hits')
+    ]
+
+
+def measure_list(client, keys):
+    start = time.time()
+    for i in range(options.rounds):
+        for key in keys:
+            client.operate(key, counter_operations(1, i))
+    return time.time() - start
+
+
+def measure_prepared(client, keys, prepared):
+    start = time.time()
+    for i in range(options.rounds):
+        for key in keys:
+            client.operate(key, prepared.bind(hits=1, size=i))
+    return time.time() - start
+
+
+try:
+    config = {'hosts': [(options.host, options.port)]}
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    keys = [(options.namespace, options.set, 'prepared_operations_%d' % i)
+            for i in range(options.keys)]
+    for key in keys:
+        client.put(key, {'hits': 0, 'bytes': 0})
+
+    prepared = client.prepare_operations(counter_operations(
+        aerospike.Placeholder('hits'), aerospike.Placeholder('size')))
+
+    table = []
+    for name, elapsed in [
+            ('list', measure_list(client, keys)),
+            ('prepare_operations', measure_prepared(client, keys, prepared))]:
+        records = options.rounds * options.keys
+        table.append([name, '{0:.3f}'.format(elapsed), records / elapsed])
+
+    print(tabulate(table, headers=["operations", "seconds", "updates per second"]))
+
+    for key in keys:
+        client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(2)
+
+sys.exit(0)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import datetime
+import sys
+import time
+
+from optparse import OptionParser
+from tabulate import tabulate
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "--keys", dest="keys", type="int", default=1000,
+    help="Number of records written and read in every round.")
+
+optparser.add_option(
+    "--rounds", dest="rounds", type="int", default=10,
+    help="Number of rounds for every serializer.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Application
+##########################################################################
+
+# Writes and reads back records holding values without a matching server
+# type with the given default serializer. Reports the time taken by both.
+
+
+def measure(keys, bins, serializer):
+    config = {
+        'hosts': [(options.host, options.port)],
+        'default_serializer': serializer
+    }
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    start = time.time()
+    for _ in range(options.rounds):
+        for key in keys:
+            client.put(key, bins)
+    write_elapsed = time.time() - start
+
+    start = time.time()
+    for _ in range(options.rounds):
+        client.get_many(keys)
+    read_elapsed = time.time() - start
+
+    client.close()
+    return write_elapsed, read_elapsed
+
+
+try:
+    keys = [(options.namespace, options.set, 'serializers_%d' % i)
+            for i in range(options.keys)]
+    bins = {
+        'point': (1.5, -2.25, 3.0),
+        'tags': {'red', 'green', 'blue'},
+        'created': datetime.datetime(2021, 6, 1, 12, 30, 15, 250000),
+        'history': [(i, 'event_%d' % i) for i in range(10)],
+    }
+
+    config = {'hosts': [(options.host, options.port)]}
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    table = []
+    for name in ['SERIALIZER_PYTHON', 'SERIALIZER_MSGPACK']:
+        write_elapsed, read_elapsed = measure(keys, bins,
+                                              getattr(aerospike, name))
+        records = options.rounds * options.keys
+        table.append([name,
+                      '{0:.3f}'.format(write_elapsed),
+                      records / write_elapsed,
+                      '{0:.3f}'.format(read_elapsed),
+                      records / read_elapsed])
+
+    print(tabulate(table, headers=["default_serializer", "write seconds",
+                                   "writes per second", "read seconds",
+                                   "reads per second"]))
+
+    for key in keys:
+        client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(2)
+
+sys.exit(0)
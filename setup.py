@@ -141,15 +141,15 @@ CCLIENT_PATH = os.path.join(BASEPATH, 'aerospike-client-c')
 
 if EVENT_LIB is not None:
     if EVENT_LIB == "libuv":
-        extra_compile_args = extra_compile_args + ['-DAS_EVENT_LIB_DEFINED']
+        extra_compile_args = extra_compile_args + ['-DAS_EVENT_LIB_DEFINED', '-DAS_USE_LIBUV']
         library_dirs = library_dirs + ['/usr/local/lib/']
         libraries = libraries + ['uv']
     elif EVENT_LIB == "libevent":
-        extra_compile_args = extra_compile_args + ['-DAS_EVENT_LIB_DEFINED']
+        extra_compile_args = extra_compile_args + ['-DAS_EVENT_LIB_DEFINED', '-DAS_USE_LIBEVENT']
         library_dirs = library_dirs + ['/usr/local/lib/']
         libraries = libraries + ['event_core', 'event_pthreads']
     elif EVENT_LIB == "libev":
-        extra_compile_args = extra_compile_args + ['-DAS_EVENT_LIB_DEFINED']
+        extra_compile_args = extra_compile_args + ['-DAS_EVENT_LIB_DEFINED', '-DAS_USE_LIBEV']
         library_dirs = library_dirs + ['/usr/local/lib/']
         libraries = libraries + ['ev']
     else:
@@ -261,8 +261,22 @@ setup(
                 'src/main/client/get.c',
                 'src/main/client/get_async.c',
                 'src/main/client/put_async.c',
+                'src/main/client/operate_async.c',
+                'src/main/client/remove_async.c',
+                'src/main/client/apply_async.c',
+                'src/main/client/exists_async.c',
+                'src/main/client/batch_read_async.c',
+                'src/main/async.c',
+                'src/main/batch_task.c',
+                'src/main/foreach_chunk.c',
+                'src/main/pool.c',
+                'src/main/bin_name_cache.c',
                 'src/main/client/get_many.c',
                 'src/main/client/batch_get_ops.c',
+                'src/main/client/batch_write.c',
+                'src/main/client/batch_remove.c',
+                'src/main/client/batch_apply.c',
+                'src/main/client/batch_operate.c',
                 'src/main/client/select_many.c',
                 'src/main/client/info_single_node.c',
                 'src/main/client/info_random_node.c',
@@ -282,20 +296,27 @@ setup(
                 'src/main/client/udf.c',
                 'src/main/client/sec_index.c',
                 'src/main/serializer.c',
+                'src/main/msgpack_serializer.c',
                 'src/main/client/remove_bin.c',
                 'src/main/client/get_key_digest.c',
+                'src/main/client/prepare_policy.c',
+                'src/main/client/prepare_operations.c',
                 'src/main/query/type.c',
                 'src/main/query/apply.c',
                 'src/main/query/add_ops.c',
                 'src/main/query/foreach.c',
                 'src/main/query/predexp.c',
                 'src/main/query/results.c',
+                'src/main/query/iter_results.c',
+                'src/main/query/paginate.c',
+                'src/main/query/partitions.c',
                 'src/main/query/select.c',
                 'src/main/query/where.c',
                 'src/main/query/execute_background.c',
                 'src/main/scan/type.c',
                 'src/main/scan/foreach.c',
                 'src/main/scan/results.c',
+                'src/main/scan/iter_results.c',
                 'src/main/scan/select.c',
                 'src/main/scan/execute_background.c',
                 'src/main/scan/apply.c',
@@ -312,12 +333,20 @@ setup(
                 'src/main/convert_expressions.c',
                 'src/main/policy_config.c',
                 'src/main/calc_digest.c',
+                'src/main/compile_expression.c',
                 'src/main/predicates.c',
                 'src/main/tls_config.c',
                 'src/main/global_hosts/type.c',
                 'src/main/nullobject/type.c',
                 'src/main/cdt_types/type.c',
                 'src/main/key_ordered_dict/type.c',
+                'src/main/record/type.c',
+                'src/main/lazy_bins/type.c',
+                'src/main/prepared_policy/type.c',
+                'src/main/prepared_operations/type.c',
+                'src/main/compiled_expression/type.c',
+                'src/main/result_iterator/type.c',
+                'src/main/blob_owner/type.c',
                 'src/main/client/set_xdr_filter.c',
                 'src/main/client/get_nodes.c',
                 'src/main/convert_partition_filter.c',
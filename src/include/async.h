@@ -0,0 +1,244 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+
+// Upper bound for aerospike.init_async(loops=N).
+#define ASYNC_MAX_EVENT_LOOPS 256
+
+/**
+ * Raise an exception and return false when the module was built without an
+ * event library or aerospike.init_async() has not been called.
+ */
+bool async_check_support(void);
+
+/**
+ * Create the C client event loops and reset their pending counters.
+ * Must be called before any client is created.
+ */
+as_status async_loops_init(as_error *err, uint32_t n_loops);
+
+/**
+ * Pick the event loop a command on key is issued to. An integer "event_loop"
+ * entry in the command policy pins the command to that loop, otherwise the
+ * client's event_loop_selection applies. The loop's pending counter is
+ * bumped; it must be released with async_loop_release() either by the
+ * listener or when issuing the command fails.
+ */
+as_status async_loop_acquire(AerospikeClient *self, as_error *err,
+							 PyObject *py_policy, as_key *key,
+							 as_event_loop **event_loop);
+
+/**
+ * Drop the pending counter of a loop returned by async_loop_acquire().
+ * Safe to call from any thread, NULL is ignored.
+ */
+void async_loop_release(as_event_loop *event_loop);
+
+/**
+ * aerospike.event_loop_stats() -> list of per loop dicts.
+ */
+PyObject *Aerospike_Event_Loop_Stats(PyObject *self, PyObject *args);
+
+/**
+ * Create an asyncio future bound to the event loop running in the calling
+ * thread. On success *py_loop and *py_future hold new references.
+ * Requires the GIL.
+ */
+as_status async_future_new(as_error *err, PyObject **py_loop,
+						   PyObject **py_future);
+
+/**
+ * Build the exception instance delivered through a future for a failed
+ * command. The key (may be NULL) is attached to record level exceptions.
+ * Returns a new reference. Requires the GIL.
+ */
+PyObject *async_future_exception(as_error *err, PyObject *py_key);
+
+/**
+ * Complete a future created by async_future_new() from a C client event loop
+ * thread. The result is delivered through loop.call_soon_threadsafe(), so
+ * the future is only touched on its own loop. When py_exception is not NULL
+ * it is set on the future and py_result is ignored.
+ * Steals no references. Requires the GIL.
+ */
+void async_future_resolve(PyObject *py_loop, PyObject *py_future,
+						  PyObject *py_result, PyObject *py_exception);
+
+typedef struct AsyncCommand_s AsyncCommand;
+
+/**
+ * Converts the result a listener received into the Python result of the
+ * command. Only called when the command succeeded. Returns a new reference,
+ * or NULL with err set. Requires the GIL.
+ */
+typedef PyObject *(*async_convert)(AsyncCommand *cmd, as_error *err,
+								   void *result);
+
+// Ownership of the result kept by a queued completion.
+typedef enum {
+	// Owned by the command itself, e.g. the records of a batch read.
+	ASYNC_RESULT_BORROWED,
+	ASYNC_RESULT_RECORD,
+	ASYNC_RESULT_VAL
+} async_result_type;
+
+/**
+ * State shared by the single record commands issued through
+ * async_command_new(). Exactly one of py_callback and py_future is set.
+ */
+struct AsyncCommand_s {
+	AerospikeClient *client;
+	PyObject *py_callback;
+	PyObject *py_loop;
+	PyObject *py_future;
+	as_key key;
+	// UDF module and function attached to exceptions of apply commands.
+	PyObject *py_module;
+	PyObject *py_function;
+	// The keys of batch commands, attached to exceptions instead of key.
+	// Batch callbacks receive (result, error, exception).
+	PyObject *py_keys;
+	// The callback receives (key, result, error, exception) when true,
+	// (key, error, exception) otherwise.
+	bool has_result;
+	// Builds the Python result, NULL delivers 0 as the write commands do.
+	async_convert convert;
+	// Command specific state, released with data_destroy().
+	void *data;
+	void (*data_destroy)(void *data);
+	// One of the client's async_max_commands slots is held.
+	bool holds_slot;
+	// Outcome held while the command waits in the client's completion queue.
+	as_error *error;
+	void *result;
+	async_result_type result_type;
+	AsyncCommand *next;
+};
+
+/**
+ * Allocate the state of a single record command. With a py_callback the
+ * outcome is passed to it, otherwise an asyncio future bound to the running
+ * loop is created. The command holds one of the client's
+ * async_max_commands slots until it is destroyed; callback commands wait
+ * for a free slot with the GIL released. Returns NULL and sets err on
+ * failure. Requires the GIL.
+ */
+AsyncCommand *async_command_new(AerospikeClient *self, as_error *err,
+								PyObject *py_callback, bool has_result);
+
+/**
+ * The value returned to Python once the command has been issued: the
+ * future, or None for callback commands. Returns a new reference and must
+ * be taken before the command is issued, as it may complete right away.
+ */
+PyObject *async_command_result(AsyncCommand *cmd);
+
+/**
+ * Free a command that was never issued. NULL is ignored. Requires the GIL.
+ */
+void async_command_destroy(AsyncCommand *cmd);
+
+/**
+ * Deliver the outcome of a command from its listener, without the GIL.
+ * When the client batches completions the outcome is queued, otherwise it
+ * is converted with cmd->convert and delivered right away. result must
+ * outlive the command, see async_record_listener() and
+ * async_value_listener() for results owned by the C client.
+ */
+void async_command_done(AsyncCommand *cmd, as_error *cmd_error, void *result);
+
+/**
+ * Listeners for commands created with async_command_new(), udata is the
+ * command. They release the event loop and call async_command_done().
+ */
+void async_record_listener(as_error *cmd_error, as_record *record, void *udata,
+						   as_event_loop *event_loop);
+void async_write_listener(as_error *cmd_error, void *udata,
+						  as_event_loop *event_loop);
+void async_value_listener(as_error *cmd_error, as_val *val, void *udata,
+						  as_event_loop *event_loop);
+
+/**
+ * Create the completion queue of a client from the "async_completion"
+ * config dict and start its drain thread. Sets err on invalid settings.
+ */
+as_status async_completion_queue_new(as_error *err, PyObject *py_config,
+									 AsyncCompletionQueue **queue);
+
+/**
+ * Stop the drain thread and free the queue. NULL is ignored.
+ * Requires the GIL.
+ */
+void async_completion_queue_destroy(AsyncCompletionQueue *queue);
+
+/**
+ * client.async_completion_fd() -> the file descriptor signalled when
+ * completions are ready to be drained.
+ */
+PyObject *AerospikeClient_Async_Completion_Fd(AerospikeClient *self,
+											  PyObject *args, PyObject *kwds);
+
+/**
+ * client.async_drain() -> number of completions delivered.
+ */
+PyObject *AerospikeClient_Async_Drain(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+
+/**
+ * Create the admission state of a client from its "async_max_commands"
+ * config value. *limiter stays NULL when the value is 0.
+ */
+as_status async_limiter_new(as_error *err, PyObject *py_max_commands,
+							AsyncLimiter **limiter);
+
+/**
+ * Free the admission state of a client. NULL is ignored.
+ */
+void async_limiter_destroy(AsyncLimiter *limiter);
+
+/**
+ * Hold back an awaitable command while the client is at async_max_commands.
+ * Returns true when the command must not be issued now; *py_result is then
+ * the future to return, which issues the command by calling the client
+ * method again once a slot is free, or NULL with an exception set.
+ * Requires the GIL.
+ */
+bool async_command_deferred(AerospikeClient *self, const char *method,
+							PyObject *args, PyObject *kwds,
+							PyObject **py_result);
+
+/**
+ * client.async_stats() -> dict of the client's async gauges.
+ */
+PyObject *AerospikeClient_Async_Stats(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+
+/**
+ * Raise the exception for a command that could not be issued, with the key
+ * attached to record level exceptions. Always returns NULL.
+ */
+PyObject *async_command_raise(as_error *err, PyObject *py_key);
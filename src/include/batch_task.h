@@ -0,0 +1,62 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <aerospike/aerospike.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_vector.h>
+
+#include "types.h"
+
+/**
+ * Runs the single record command for batch->keys[index]. Called from the
+ * cluster thread pool without the GIL; it must not touch Python objects.
+ * Anything other than the status is stored by the callback itself in udata,
+ * indexed by index.
+ */
+typedef as_status (*batch_task_fn)(aerospike *as, as_error *err, as_key *key,
+								   uint32_t index, void *udata);
+
+/**
+ * Run fn once for every key in batch. Keys are grouped by the node owning
+ * their partition, and each node's keys are spread over the cluster thread
+ * pool so that every node works through its share in parallel. Commands on
+ * the same key always run in the order given.
+ *
+ * results[i] receives the status of key i. Must be called without the GIL.
+ */
+void batch_task_execute(aerospike *as, as_batch *batch, batch_task_fn fn,
+						void *udata, as_status *results);
+
+/**
+ * Runs a sub-batch: offsets holds the indexes of n_offsets keys which all
+ * belong to the same node. Called from the cluster thread pool without the
+ * GIL; it must not touch Python objects nor run concurrent batches itself.
+ */
+typedef void (*batch_task_chunk_fn)(aerospike *as, const uint32_t *offsets,
+									uint32_t n_offsets, void *udata);
+
+/**
+ * Split n_keys keys, found stride bytes apart from keys, into sub-batches of
+ * at most max_chunk keys of one node each, and run fn on all of them in
+ * parallel on the cluster thread pool. Must be called without the GIL.
+ */
+void batch_task_execute_chunks(aerospike *as, as_key *keys, size_t stride,
+							   uint32_t n_keys, uint32_t max_chunk,
+							   batch_task_chunk_fn fn, void *udata);
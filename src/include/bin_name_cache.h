@@ -0,0 +1,47 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+
+#include "types.h"
+
+// Number of bin names a client keeps when "bin_name_cache_size" is not set.
+#define BIN_NAME_CACHE_DEFAULT_SIZE 1024
+
+/**
+ * Create the bin name cache of a client from its "bin_name_cache_size"
+ * config value. NULL selects the default size. *cache stays NULL when the
+ * size is 0.
+ */
+as_status bin_name_cache_new(as_error *err, PyObject *py_size,
+							 BinNameCache **cache);
+
+/**
+ * Free the bin name cache of a client. NULL is ignored.
+ */
+void bin_name_cache_destroy(BinNameCache *cache);
+
+/**
+ * Return a new reference to the interned, pre-hashed str of a bin name.
+ * The least recently used name is dropped once the cache is full. A NULL
+ * cache returns a fresh str. Must be called with the GIL held.
+ */
+PyObject *bin_name_cache_get(BinNameCache *cache, const char *name);
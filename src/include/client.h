@@ -82,6 +82,24 @@ PyObject *AerospikeClient_shm_key(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Apply(AerospikeClient *self, PyObject *args,
 								PyObject *kwds);
 
+/**
+ * Async apply a UDF on a record in the database.
+ *
+ *		client.apply_async(callback, (x,y,z), module, function, args)
+ *
+ */
+PyObject *AerospikeClient_Apply_Async(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+
+/**
+ * Apply a UDF on a record in the database, returning an asyncio future.
+ *
+ *		await client.apply_aio((x,y,z), module, function, args)
+ *
+ */
+PyObject *AerospikeClient_Apply_Aio(AerospikeClient *self, PyObject *args,
+									PyObject *kwds);
+
 PyObject *AerospikeClient_Apply_Invoke(AerospikeClient *self, PyObject *py_key,
 									   PyObject *py_module,
 									   PyObject *py_function,
@@ -96,6 +114,24 @@ PyObject *AerospikeClient_Apply_Invoke(AerospikeClient *self, PyObject *py_key,
 PyObject *AerospikeClient_Exists(AerospikeClient *self, PyObject *args,
 								 PyObject *kwds);
 
+/**
+ * Async check if a key exists in the database.
+ *
+ *		client.exists_async(callback, (x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Exists_Async(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds);
+
+/**
+ * Check if a key exists in the database, returning an asyncio future.
+ *
+ *		await client.exists_aio((x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Exists_Aio(AerospikeClient *self, PyObject *args,
+									 PyObject *kwds);
+
 PyObject *AerospikeClient_Exists_Invoke(AerospikeClient *self, PyObject *py_key,
 										PyObject *py_policy);
 
@@ -120,6 +156,15 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
 PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
 									PyObject *kwds);
 
+/**
+ * Read a record from the database, returning an asyncio future.
+ *
+ *		await client.get_aio((x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Get_Aio(AerospikeClient *self, PyObject *args,
+								  PyObject *kwds);
+
 /**
  * Project specific bins of a record from the database.
  *
@@ -152,6 +197,15 @@ PyObject *AerospikeClient_Put_Invoke(AerospikeClient *self, PyObject *py_key,
 PyObject *AerospikeClient_Put_Async(AerospikeClient *self, PyObject *args,
 									PyObject *kwds);
 
+/**
+ * Write a record in the database, returning an asyncio future.
+ *
+ *		await client.put_aio((x,y,z), ...)
+ *
+ */
+PyObject *AerospikeClient_Put_Aio(AerospikeClient *self, PyObject *args,
+								  PyObject *kwds);
+
 /**
  * Remove a record from the database.
  *
@@ -164,6 +218,24 @@ PyObject *AerospikeClient_Remove(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Remove_Invoke(AerospikeClient *self, PyObject *py_key,
 										PyObject *py_meta, PyObject *py_policy);
 
+/**
+ * Async remove a record from the database.
+ *
+ *		client.remove_async(callback, (x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Remove_Async(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds);
+
+/**
+ * Remove a record from the database, returning an asyncio future.
+ *
+ *		await client.remove_aio((x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Remove_Aio(AerospikeClient *self, PyObject *args,
+									 PyObject *kwds);
+
 /**
  * Remove bin from the database.
  *
@@ -204,6 +276,22 @@ PyObject *AerospikeClient_Increment(AerospikeClient *self, PyObject *args,
  */
 PyObject *AerospikeClient_Touch(AerospikeClient *self, PyObject *args,
 								PyObject *kwds);
+/**
+ * Async touch a record in the database.
+ *
+ *		client.touch_async(callback, (x,y,z), val)
+ *
+ */
+PyObject *AerospikeClient_Touch_Async(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+/**
+ * Touch a record in the database, returning an asyncio future.
+ *
+ *		await client.touch_aio((x,y,z), val)
+ *
+ */
+PyObject *AerospikeClient_Touch_Aio(AerospikeClient *self, PyObject *args,
+									PyObject *kwds);
 /**
  * Performs operate operations
  *
@@ -220,6 +308,41 @@ PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
  */
 PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
 										 PyObject *kwds);
+/**
+ * Performs operate operations, returning an asyncio future
+ *
+ *		await client.operate_aio((x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Operate_Aio(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+
+/**
+ * Async operate operations, delivering the record to a callback
+ *
+ *		client.operate_async(callback, (x,y,z), list)
+ *
+ */
+PyObject *AerospikeClient_Operate_Async(AerospikeClient *self, PyObject *args,
+										PyObject *kwds);
+
+/**
+ * Async operate ordered operations, delivering the record to a callback
+ *
+ *		client.operate_ordered_async(callback, (x,y,z), list)
+ *
+ */
+PyObject *AerospikeClient_OperateOrdered_Async(AerospikeClient *self,
+											   PyObject *args, PyObject *kwds);
+
+/**
+ * Performs operate ordered operations, returning an asyncio future
+ *
+ *		await client.operate_ordered_aio((x,y,z), list)
+ *
+ */
+PyObject *AerospikeClient_OperateOrdered_Aio(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds);
 
 /*******************************************************************************
  * LIST FUNCTIONS(CDT)
@@ -674,6 +797,78 @@ PyObject *AerospikeClient_Get_Many(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Batch_GetOps(AerospikeClient *self, PyObject *args,
 								   		PyObject *kwds);
 
+/**
+ * Write records in a batch
+ *
+ *		client.batch_write([(key, bins, meta)], policy)
+ *
+ */
+PyObject *AerospikeClient_Batch_Write(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+
+/**
+ * Remove records in a batch
+ *
+ *		client.batch_remove([keys], policy)
+ *
+ */
+PyObject *AerospikeClient_Batch_Remove(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds);
+
+/**
+ * Apply a UDF to records in a batch
+ *
+ *		client.batch_apply([keys], module, function, args, policy)
+ *
+ */
+PyObject *AerospikeClient_Batch_Apply(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+
+/**
+ * Perform per record operations in a batch
+ *
+ *		client.batch_operate([(key, ops, meta)], policy)
+ *
+ */
+PyObject *AerospikeClient_Batch_Operate(AerospikeClient *self, PyObject *args,
+										PyObject *kwds);
+
+/**
+ * Async get records in a batch
+ *
+ *		client.get_many_async(callback, [keys], policies)
+ *
+ */
+PyObject *AerospikeClient_Get_Many_Async(AerospikeClient *self, PyObject *args,
+										 PyObject *kwds);
+
+/**
+ * Get records in a batch, returning an asyncio future
+ *
+ *		await client.get_many_aio([keys], policies)
+ *
+ */
+PyObject *AerospikeClient_Get_Many_Aio(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds);
+
+/**
+ * Async apply read operations to records in a batch
+ *
+ *		client.batch_get_ops_async(callback, [keys], [ops])
+ *
+ */
+PyObject *AerospikeClient_Batch_GetOps_Async(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds);
+
+/**
+ * Apply read operations to records in a batch, returning an asyncio future
+ *
+ *		await client.batch_get_ops_aio([keys], [ops])
+ *
+ */
+PyObject *AerospikeClient_Batch_GetOps_Aio(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds);
+
 /**
  * Filter bins from records in a batch
  *
@@ -692,6 +887,24 @@ PyObject *AerospikeClient_Select_Many(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Exists_Many(AerospikeClient *self, PyObject *args,
 									  PyObject *kwds);
 
+/**
+ * Async check existence of given keys
+ *
+ *		client.exists_many_async(callback, [keys], policies)
+ *
+ */
+PyObject *AerospikeClient_Exists_Many_Async(AerospikeClient *self,
+											PyObject *args, PyObject *kwds);
+
+/**
+ * Check existence of given keys, returning an asyncio future
+ *
+ *		await client.exists_many_aio([keys], policies)
+ *
+ */
+PyObject *AerospikeClient_Exists_Many_Aio(AerospikeClient *self,
+										  PyObject *args, PyObject *kwds);
+
 /**
 * Perform xdr-set-filter info operation on the database.
 *
@@ -741,6 +954,22 @@ PyObject *AerospikeClient_GetNodeNames(AerospikeClient *self, PyObject *args,
 */
 PyObject *AerospikeClient_Get_Key_Digest(AerospikeClient *self, PyObject *args,
 										 PyObject *kwds);
+/**
+ * Convert a policy dict once, for many calls
+ *
+ *		client.prepare_policy('write', policy)
+ *
+ */
+PyObject *AerospikeClient_Prepare_Policy(AerospikeClient *self, PyObject *args,
+										 PyObject *kwds);
+/**
+ * Convert a list of operations once, for many operate calls
+ *
+ *		client.prepare_operations(ops)
+ *
+ */
+PyObject *AerospikeClient_Prepare_Operations(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds);
 /**
 * Perform get key's partition id from cluster.
 *
@@ -0,0 +1,50 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeCompiledExpression_Ready(void);
+
+/**
+ * Pack the compiled expression list py_exp_list into a new
+ * aerospike.CompiledExpression, converting its values as client does.
+ * Returns NULL with err set on error.
+ */
+PyObject *AerospikeCompiledExpression_New(AerospikeClient *client,
+										  as_error *err, PyObject *py_exp_list);
+
+/**
+ * Whether py_exp is an aerospike.CompiledExpression.
+ */
+bool AerospikeCompiledExpression_Check(PyObject *py_exp);
+
+/**
+ * Return the packed expression of an aerospike.CompiledExpression. It
+ * belongs to py_exp and must not be destroyed.
+ */
+as_exp *AerospikeCompiledExpression_Get(PyObject *py_exp);
@@ -77,6 +77,9 @@ as_status pyobject_to_list(AerospikeClient *self, as_error *err,
 
 as_status pyobject_to_key(as_error *err, PyObject *py_key, as_key *key);
 
+as_status pyobject_to_batch_keys(as_error *err, PyObject *py_keys,
+								 as_batch *batch);
+
 as_status pyobject_to_index(AerospikeClient *self, as_error *err,
 							PyObject *py_value, long *long_val);
 
@@ -122,6 +125,17 @@ as_status record_to_pyobject_cnvt_list_to_map(AerospikeClient *self,
 
 as_status key_to_pyobject(as_error *err, const as_key *key, PyObject **obj);
 
+/*
+ * Move the bins of rec into a new heap record. rec is left with nil values,
+ * so it can be destroyed as usual while the copy lives on.
+ */
+as_record *record_take_bins(as_record *rec);
+
+/*
+ * Like record_take_bins(), but the key is moved into the copy as well.
+ */
+as_record *record_take(as_record *rec);
+
 as_status metadata_to_pyobject(as_error *err, const as_record *rec,
 							   PyObject **obj);
 
@@ -165,6 +179,8 @@ as_status bin_strict_type_checking(AerospikeClient *self, as_error *err,
 
 as_status check_for_meta(PyObject *py_meta, as_operations *ops, as_error *err);
 
+PyObject *missing_record_to_pyobject(AerospikeClient *self, PyObject *py_key);
+
 as_status as_batch_read_results_to_pyobject(as_error *err,
 											AerospikeClient *client,
 											const as_batch_read *results,
@@ -195,5 +211,40 @@ as_status convert_partition_filter(AerospikeClient *self,
 								   as_partitions_status **ps,
 								   as_error *err);
 
+/*
+ * Convert the partition status of a partition scan or query into the
+ * partition_status dict accepted by convert_partition_filter(), mapping each
+ * partition id to (id, init, done, digest).
+ */
+as_status partitions_status_to_pyobject(as_error *err,
+										const as_partitions_status *parts_all,
+										PyObject **py_status);
+
+/*
+ * Create the status of part_count partitions from part_begin, none of them
+ * done. The first one resumes after digest, when it is set.
+ */
+as_partitions_status *parts_setup(uint16_t part_begin, uint16_t part_count,
+								  const as_digest *digest);
+
+/*
+ * Serialize the partition status of a scan or query of ns and set into a
+ * compact checkpoint: the done flag and last digest of every partition.
+ * The status may belong to a running scan.
+ */
+as_status partitions_status_to_checkpoint(as_error *err, const char *ns,
+										  const char *set,
+										  const as_partitions_status *parts_all,
+										  PyObject **py_checkpoint);
+
+/*
+ * Parse a checkpoint taken from a scan or query of ns and set into a new
+ * partition status, which the caller releases.
+ */
+as_status checkpoint_to_partitions_status(as_error *err, const char *ns,
+										  const char *set,
+										  PyObject *py_checkpoint,
+										  as_partitions_status **parts_all);
+
 as_status get_int_from_py_int(as_error *err, PyObject *py_long,
 							  int *int_pointer, const char *py_object_name);
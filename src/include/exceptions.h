@@ -19,4 +19,16 @@
 #include <Python.h>
 
 PyObject *AerospikeException_New(void);
+/**
+ * Return the exception class raised for err, looked up by its code.
+ */
 PyObject *raise_exception(as_error *err);
+
+/**
+ * Raise the exception for err, setting the key, bin, module, func and name
+ * attributes of the instance to the given values where the class has them.
+ * Attributes given as NULL are left unset.
+ */
+void raise_exception_base(as_error *err, PyObject *py_key, PyObject *py_bin,
+						  PyObject *py_module, PyObject *py_func,
+						  PyObject *py_name);
@@ -0,0 +1,82 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+
+/**
+ * Collects the values streamed to a foreach callback and passes them to the
+ * Python callback in lists of up to chunk_size, so the GIL is taken once
+ * per chunk rather than once per record.
+ */
+typedef struct {
+	pthread_mutex_t lock;
+	AerospikeClient *client;
+	PyObject *callback;
+	// Values waiting for the next chunk, NULL while there are none.
+	as_val **vals;
+	uint32_t n_vals;
+	uint32_t chunk_size;
+	// Pass (partition_id, record) tuples instead of records.
+	bool partition_ids;
+	// Set once the callback returned False or failed.
+	bool stopped;
+	// Why the callback failed.
+	as_error error;
+} ForeachChunk;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+/**
+ * Convert the chunk_size argument of foreach(). Sets *chunk_size to 0 when
+ * py_chunk_size is NULL or None, meaning one record per callback.
+ */
+as_status foreach_chunk_size(as_error *err, PyObject *py_chunk_size,
+							 uint32_t *chunk_size);
+
+void foreach_chunk_init(ForeachChunk *chunk, AerospikeClient *client,
+						PyObject *callback, uint32_t chunk_size,
+						bool partition_ids);
+
+/**
+ * The foreach callback: keep val for the current chunk, and pass the chunk
+ * to the Python callback once it is full. Called without the GIL, possibly
+ * from several threads at once. Records are moved out of val, which the
+ * C client destroys once this returns. Returns false to stop the command.
+ */
+bool foreach_chunk_add(ForeachChunk *chunk, const as_val *val);
+
+/**
+ * Pass the values of the last, partial chunk to the Python callback, unless
+ * it has been stopped. Must be called with the GIL once the command is done.
+ */
+void foreach_chunk_flush(ForeachChunk *chunk);
+
+/**
+ * Release the values which were never passed to the callback.
+ */
+void foreach_chunk_destroy(ForeachChunk *chunk);
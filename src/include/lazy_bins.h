@@ -0,0 +1,40 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeLazyBins_Ready(void);
+
+/**
+ * Build an aerospike.LazyBins mapping of the bins of rec. The bins are moved
+ * out of rec, which is left to be destroyed by its owner, and converted one
+ * by one when they are first accessed.
+ */
+as_status AerospikeLazyBins_New(AerospikeClient *client, as_error *err,
+								as_record *rec, bool cnvt_list_to_map,
+								PyObject **py_bins);
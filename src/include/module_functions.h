@@ -42,6 +42,15 @@ PyObject *Aerospike_Get_Partition_Id(PyObject *self, PyObject *args);
  */
 PyObject *Aerospike_Is_AsyncSupported(PyObject *self);
 
+/**
+ * Pack an expression once, for reuse in policies
+ *
+ *		aerospike.compile_expression(expression)
+ *
+ */
+PyObject *Aerospike_Compile_Expression(PyObject *self, PyObject *args,
+									   PyObject *kwds);
+
 /*******************************************************************************
  * Aerospike initialization
  ******************************************************************************/
@@ -0,0 +1,43 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_bytes.h>
+
+/**
+ * Serialize a value with the native msgpack serializer into an
+ * AS_BYTES_PYTHON as_bytes owning its buffer. Returns false, without a
+ * Python error set, when the value holds a type the serializer does not
+ * support; it has to be pickled instead.
+ */
+bool msgpack_serialize(PyObject *value, as_bytes *bytes);
+
+/**
+ * Whether AS_BYTES_PYTHON bytes were written by msgpack_serialize()
+ * rather than pickle.
+ */
+bool msgpack_is_serialized(const as_bytes *bytes);
+
+/**
+ * Return a new reference to the value held by bytes written by
+ * msgpack_serialize(), or NULL with a Python error set if they are
+ * malformed.
+ */
+PyObject *msgpack_deserialize(const as_bytes *bytes);
@@ -18,6 +18,7 @@
 #include <Python.h>
 #include <aerospike/as_error.h>
 #include <aerospike/as_operations.h>
+#include <aerospike/as_record.h>
 #include <aerospike/as_map_operations.h>
 #include <aerospike/aerospike_info.h>
 #include "client.h"
@@ -26,3 +27,10 @@
 as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
 				 as_vector *unicodeStrVector, as_static_pool *static_pool,
 				 as_operations *ops, long *op, long *ret_type);
+
+PyObject *create_pylist(PyObject *py_list, long operation, PyObject *py_bin,
+						PyObject *py_value);
+
+as_status operate_ordered_record_to_pyobject(AerospikeClient *self,
+											 as_error *err, as_record *rec,
+											 as_key *key, PyObject **py_rec);
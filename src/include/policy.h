@@ -41,6 +41,7 @@ enum Aerospike_serializer_values {
 	SERIALIZER_PYTHON, /* default handler for serializer type */
 	SERIALIZER_JSON,
 	SERIALIZER_USER,
+	SERIALIZER_MSGPACK,
 };
 
 enum Aerospike_send_bool_as_values {
@@ -49,6 +50,12 @@ enum Aerospike_send_bool_as_values {
 	SEND_BOOL_AS_AS_BOOL,
 };
 
+enum Aerospike_event_loop_selection_values {
+	EVENT_LOOP_ROUND_ROBIN, /* default for async commands */
+	EVENT_LOOP_PARTITION,
+	EVENT_LOOP_PINNED,
+};
+
 enum Aerospike_list_operations {
 	OP_LIST_APPEND = 1001,
 	OP_LIST_APPEND_ITEMS,
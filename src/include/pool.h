@@ -1,35 +1,60 @@
 /*
  *******************************************************************************************************
- * Static pool maintained to avoid runtime mallocs.
- * It comprises of following pools:
- * 1. Pool for Arraylist
- * 2. Pool for Hashmap
- * 3. Pool for Strings
- * 4. Pool for Integers
- * 5. Pool for Bytes
+ * Pool of the as_bytes holding the blobs and serialized values of a call.
+ * The as_bytes are handed out from chunks which are linked as the pool
+ * grows, so the pool has no size limit and an as_bytes never moves once
+ * handed out. Chunks released by POOL_DESTROY are kept for the pools of
+ * later calls.
+ * It also holds the Python buffers which blobs point to without a copy.
+ * A pool is zeroed before use and must only be used with the GIL held.
  *******************************************************************************************************
  */
-#define AS_MAX_STORE_SIZE 4096
+#define BYTES_POOL_CHUNK_SIZE 64
+
+typedef struct bytes_pool_chunk {
+	struct bytes_pool_chunk *next;
+	as_bytes bytes[BYTES_POOL_CHUNK_SIZE];
+} as_bytes_pool_chunk;
 
 typedef struct bytes_static_pool {
-	as_bytes bytes_pool[AS_MAX_STORE_SIZE];
+	// The chunk handing out as_bytes, followed by the full ones.
+	as_bytes_pool_chunk *chunks;
 	uint32_t current_bytes_id;
+	Py_buffer *buffers;
+	uint32_t buffers_size;
+	uint32_t buffers_capacity;
 } as_static_pool;
 
 #define BYTES_CNT(static_pool)                                                 \
 	(((as_static_pool *)static_pool)->current_bytes_id)
 
-#define BYTES_POOL(static_pool) ((as_static_pool *)static_pool)->bytes_pool
+/**
+ * Return the next zeroed as_bytes of the pool, or NULL if no chunk could be
+ * allocated.
+ */
+as_bytes *bytes_pool_get(as_static_pool *static_pool);
+
+/**
+ * Destroy every as_bytes handed out by the pool, release its Python buffers
+ * and keep its chunks for later pools. The pool can be used again after.
+ */
+void bytes_pool_destroy(as_static_pool *static_pool);
+
+/**
+ * Return a zeroed pool on the heap, for values living as long as an object
+ * rather than a call, or NULL if it could not be allocated.
+ */
+as_static_pool *bytes_pool_new(void);
+
+/**
+ * Destroy a pool returned by bytes_pool_new() and free it.
+ */
+void bytes_pool_free(as_static_pool *static_pool);
 
 #define GET_BYTES_POOL(map_bytes, static_pool, err)                            \
-	if (AS_MAX_STORE_SIZE > BYTES_CNT(static_pool)) {                          \
-		map_bytes = &(BYTES_POOL(static_pool)[BYTES_CNT(static_pool)++]);      \
-	}                                                                          \
-	else {                                                                     \
+	if (!(map_bytes = bytes_pool_get((as_static_pool *)static_pool))) {        \
 		as_error_update(err, AEROSPIKE_ERR, "Cannot allocate as_bytes");       \
 	}
 
 #define POOL_DESTROY(static_pool)                                              \
-	for (uint32_t iter = 0; iter < BYTES_CNT(static_pool); iter++) {           \
-		as_bytes_destroy(&BYTES_POOL(static_pool)[iter]);                      \
-	}
+	bytes_pool_destroy((as_static_pool *)static_pool)
@@ -0,0 +1,64 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_vector.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeOperations_Ready(void);
+
+PyTypeObject *AerospikePlaceholder_Ready(void);
+
+/**
+ * Convert the list of operation dicts py_ops into a new aerospike.Operations.
+ * Operations holding an aerospike.Placeholder are kept as dicts, to be
+ * converted with the bound values on every use.
+ * Returns NULL with err set on error.
+ */
+PyObject *AerospikeOperations_New(AerospikeClient *client, as_error *err,
+								  PyObject *py_ops);
+
+/**
+ * Whether py_ops is an aerospike.Operations.
+ */
+bool AerospikeOperations_Check(PyObject *py_ops);
+
+/**
+ * The number of binops AerospikeOperations_Add() may append.
+ */
+Py_ssize_t AerospikeOperations_Size(PyObject *py_ops);
+
+/**
+ * Append the operations of an aerospike.Operations to ops, which must have
+ * room for AerospikeOperations_Size() binops. The converted operations are
+ * shared with py_ops and reserved, so ops is destroyed as usual.
+ */
+as_status AerospikeOperations_Add(AerospikeClient *client, as_error *err,
+								  PyObject *py_ops,
+								  as_vector *unicodeStrVector,
+								  as_static_pool *static_pool,
+								  as_operations *ops);
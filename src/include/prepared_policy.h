@@ -0,0 +1,71 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "types.h"
+
+// The kinds of policy an aerospike.Policy can be prepared as.
+typedef enum {
+	PREPARED_POLICY_READ,
+	PREPARED_POLICY_WRITE,
+	PREPARED_POLICY_OPERATE,
+	PREPARED_POLICY_BATCH,
+	PREPARED_POLICY_APPLY,
+	PREPARED_POLICY_REMOVE,
+	PREPARED_POLICY_QUERY,
+	PREPARED_POLICY_SCAN
+} prepared_policy_kind;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikePolicy_Ready(void);
+
+/**
+ * Convert the policy dict py_policy into a new aerospike.Policy of the kind
+ * named by kind, on top of the client's default policy of that kind.
+ * Returns NULL with err set on error.
+ */
+PyObject *AerospikePolicy_New(AerospikeClient *client, as_error *err,
+							  const char *kind, PyObject *py_policy);
+
+/**
+ * Whether py_policy is an aerospike.Policy.
+ */
+bool AerospikePolicy_Check(PyObject *py_policy);
+
+/**
+ * Return the converted as_policy_* of an aerospike.Policy, or NULL with err
+ * set if it was prepared as another kind. Its filter expression and predexp
+ * belong to py_policy and must not be destroyed.
+ */
+const void *AerospikePolicy_Get(PyObject *py_policy, as_error *err,
+								prepared_policy_kind kind);
+
+/**
+ * Return a borrowed reference to the value of key in py_policy, a policy dict
+ * or an aerospike.Policy, or NULL if it has none. This is how the options
+ * which are not part of the C client policy, such as partition_filter, are
+ * read.
+ */
+PyObject *AerospikePolicy_GetItem(PyObject *py_policy, const char *key);
@@ -19,11 +19,25 @@
 #include <Python.h>
 #include <stdbool.h>
 
+#include <aerospike/aerospike_query.h>
+#include <aerospike/as_partition_filter.h>
 #include <aerospike/as_query.h>
 
 #include "types.h"
 #include "client.h"
 
+/**
+ * How a query runs over partitions. Queries are run as partition scans when
+ * their policy has a partition_filter or max_records, or they are paginated.
+ */
+typedef struct {
+	bool enabled;
+	as_partition_filter filter;
+	as_partitions_status *ps;
+	as_partitions_status *parts_all;
+	uint64_t max_records;
+} QueryPartitions;
+
 /*******************************************************************************
  * FUNCTIONS
  ******************************************************************************/
@@ -112,6 +126,87 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
 								 PyObject *kwds);
 
+/**
+ * Execute the query and return an iterator over its records, buffering a
+ * bounded number of them.
+ *
+ *		for result in query.iter_results():
+ *			print result
+ *
+ */
+PyObject *AerospikeQuery_Iter_Results(AerospikeQuery *self, PyObject *args,
+									  PyObject *kwds);
+
+/**
+ * Set pagination, so that each query with max_records continues where the
+ * previous one stopped.
+ *
+ *		query.paginate()
+ *
+ */
+PyObject *AerospikeQuery_Paginate(AerospikeQuery *self, PyObject *args,
+								  PyObject *kwds);
+
+/**
+ * Whether all the partitions of a paginated query have been read.
+ *
+ *		query.is_done()
+ *
+ */
+PyObject *AerospikeQuery_Is_Done(AerospikeQuery *self, PyObject *args,
+								 PyObject *kwds);
+
+/**
+ * Return the status of the partitions of the last partition query, which a
+ * partition_filter can resume from.
+ *
+ *		query.get_partitions_status()
+ *
+ */
+PyObject *AerospikeQuery_Get_Partitions_Status(AerospikeQuery *self,
+											   PyObject *args, PyObject *kwds);
+
+/**
+ * Serialize the partition status of the partition query, which may be
+ * running, into a compact checkpoint.
+ *
+ *		query.checkpoint()
+ *
+ */
+PyObject *AerospikeQuery_Checkpoint(AerospikeQuery *self, PyObject *args,
+									PyObject *kwds);
+
+/**
+ * Continue the query from a checkpoint, paginating it.
+ *
+ *		query.from_checkpoint(checkpoint)
+ *
+ */
+AerospikeQuery *AerospikeQuery_From_Checkpoint(AerospikeQuery *self,
+											   PyObject *args, PyObject *kwds);
+
+/**
+ * Read partition_filter and max_records from py_policy. Fails when they,
+ * or pagination, are used with a query the C client cannot run over
+ * partitions. Otherwise sets the partition status the run will update in
+ * self. Must be called with the GIL.
+ */
+as_status query_partitions_init(AerospikeQuery *self, as_error *err,
+								PyObject *py_policy, QueryPartitions *qp);
+
+/**
+ * Run the query, over its partitions when qp is enabled, updating the
+ * partition status set by query_partitions_init(). Must be called without
+ * the GIL.
+ */
+as_status query_partitions_run(AerospikeQuery *self, as_error *err,
+							   const as_policy_query *policy,
+							   QueryPartitions *qp,
+							   aerospike_query_foreach_callback callback,
+							   void *udata);
+
+void query_partitions_destroy(QueryPartitions *qp);
+
 /**
  * Execute a UDF in the background. Returns the query id to allow status of the query to be monitored.
  * */
@@ -0,0 +1,42 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+
+#include <aerospike/as_record.h>
+
+#include "types.h"
+
+// Values of the client's "result_format" config.
+enum Aerospike_result_format_e {
+	RESULT_FORMAT_TUPLE, /* (key, meta, bins) tuples, the default */
+	RESULT_FORMAT_RECORD /* aerospike.Record objects */
+};
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeRecord_Ready(void);
+
+/**
+ * Build an aerospike.Record. References to py_key and py_bins are stolen.
+ * gen and ttl are taken from rec, or are None when rec is NULL.
+ */
+PyObject *AerospikeRecord_New(PyObject *py_key, const as_record *rec,
+							  PyObject *py_bins);
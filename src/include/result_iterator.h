@@ -0,0 +1,65 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * TYPES
+ ******************************************************************************/
+
+/**
+ * The callback a command calls for each record, from the threads of the C
+ * client. It returns false once the command should stop.
+ */
+typedef bool (*result_iterator_callback)(const as_val *val, void *udata);
+
+/**
+ * A query or scan run by an aerospike.ResultIterator.
+ * run() executes it on a thread of its own, without the GIL, calling
+ * callback with udata for each record. destroy() frees it with the GIL
+ * held, once run() has returned or if it never started.
+ */
+typedef struct {
+	void (*run)(void *command, as_error *err, result_iterator_callback callback,
+				void *udata);
+	void (*destroy)(void *command);
+} result_iterator_command_ops;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeResultIterator_Ready(void);
+
+/**
+ * Start running command and return an iterator over its records, buffering
+ * at most buffer_size of them. The iterator owns command from then on, even
+ * on error. py_source, the query or scan the command was built from, is kept
+ * alive as long as the iterator.
+ * Returns NULL with err set on error.
+ */
+PyObject *AerospikeResultIterator_New(AerospikeClient *client, as_error *err,
+									  PyObject *py_source, void *command,
+									  const result_iterator_command_ops *ops,
+									  uint32_t buffer_size);
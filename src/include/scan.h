@@ -84,6 +84,17 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 								PyObject *kwds);
 
+/**
+ * Execute the scan and return an iterator over its records, buffering a
+ * bounded number of them.
+ *
+ *    for result in scan.iter_results():
+ *      print result
+ *
+ */
+PyObject *AerospikeScan_Iter_Results(AerospikeScan *self, PyObject *args,
+									 PyObject *kwds);
+
 /**
  * Execute the scan in the background.
  *
@@ -126,3 +137,31 @@ PyObject *AerospikeScan_Paginate(AerospikeScan *self, PyObject *args,
  */
 PyObject *AerospikeScan_Is_Done(AerospikeScan *self, PyObject *args,
 								PyObject *kwds);
+
+/**
+ * Gets the status of the partitions of the scan.
+ *
+ *    scan.get_partitions_status()
+ *
+ */
+PyObject *AerospikeScan_Get_Partitions_Status(AerospikeScan *self,
+											  PyObject *args, PyObject *kwds);
+
+/**
+ * Serialize the partition status of the scan, which may be running, into
+ * a compact checkpoint.
+ *
+ *    scan.checkpoint()
+ *
+ */
+PyObject *AerospikeScan_Checkpoint(AerospikeScan *self, PyObject *args,
+								   PyObject *kwds);
+
+/**
+ * Continue the scan from a checkpoint.
+ *
+ *    scan.from_checkpoint(checkpoint)
+ *
+ */
+AerospikeScan *AerospikeScan_From_Checkpoint(AerospikeScan *self,
+											 PyObject *args, PyObject *kwds);
@@ -61,6 +61,14 @@ extern as_status serialize_based_on_serializer_policy(AerospikeClient *self,
 													  PyObject *value,
 													  as_error *error_p);
 
+/**
+ * Stores a bytes, bytearray, memoryview or mmap value as a blob without
+ * copying it. Returns false if the value has to be serialized instead.
+ */
+bool serialize_buffer_without_copy(AerospikeClient *self,
+								   int32_t serializer_policy, as_bytes *bytes,
+								   PyObject *value, as_static_pool *static_pool);
+
 /**
  * Deserializes Py_Object (value) into as_bytes using Deserialization logic
  * based on serializer_policy.
@@ -63,6 +63,10 @@ typedef struct {
 	int size;
 } UnicodePyObjects;
 
+typedef struct AsyncCompletionQueue_s AsyncCompletionQueue;
+typedef struct AsyncLimiter_s AsyncLimiter;
+typedef struct BinNameCache_s BinNameCache;
+
 typedef struct {
 	PyObject_HEAD aerospike *as;
 	int is_conn_16;
@@ -73,6 +77,20 @@ typedef struct {
 	bool has_connected;
 	bool use_shared_connection;
 	uint8_t send_bool_as;
+	uint8_t result_format;
+	bool lazy_bins;
+	bool blob_as_memoryview;
+	uint8_t default_serializer;
+	uint8_t event_loop_selection;
+	uint32_t event_loop_index;
+	// NULL unless async completions are delivered in batches.
+	AsyncCompletionQueue *async_queue;
+	// Async commands created and not yet delivered. Protected by the GIL.
+	uint32_t async_in_flight;
+	// NULL unless async_max_commands is set.
+	AsyncLimiter *async_limiter;
+	// Bin name keys of converted records. NULL if bin_name_cache_size is 0.
+	BinNameCache *bin_name_cache;
 } AerospikeClient;
 
 typedef struct {
@@ -81,6 +99,10 @@ typedef struct {
 	UnicodePyObjects u_objs;
 	as_vector *unicodeStrVector;
 	as_static_pool *static_pool;
+	// Status of the partitions of the last partition query, or NULL.
+	as_partitions_status *parts_all;
+	// Whether the next partition query continues from parts_all.
+	bool paginate;
 } AerospikeQuery;
 
 typedef struct {
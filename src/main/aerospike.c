@@ -19,11 +19,19 @@
 #include <stdint.h>
 #include <string.h>
 
+#include "async.h"
 #include "client.h"
 #include "query.h"
 #include "geo.h"
 #include "scan.h"
 #include "key_ordered_dict.h"
+#include "record.h"
+#include "prepared_policy.h"
+#include "prepared_operations.h"
+#include "compiled_expression.h"
+#include "lazy_bins.h"
+#include "blob_owner.h"
+#include "result_iterator.h"
 #include "predicates.h"
 #include "exceptions.h"
 #include "policy.h"
@@ -51,8 +59,16 @@ config = {\n\
 }\n\
 client = aerospike.client(config)");
 
-PyDoc_STRVAR(init_async_doc, "init_async() -> initialize aerospike async eventloop library\n\
-aerospike.init_async()");
+PyDoc_STRVAR(init_async_doc, "init_async([loops]) -> initialize aerospike async eventloop library\n\
+\n\
+Creates loops event loop threads (default 1) shared by all clients. \
+Call it before creating any client.\n\
+aerospike.init_async(loops=4)");
+
+PyDoc_STRVAR(event_loop_stats_doc, "event_loop_stats() -> list\n\
+\n\
+Return one dict per event loop holding its index, the number of pending \
+async commands and the size of its delay queue.");
 
 static PyMethodDef Aerospike_Methods[] = {
 
@@ -66,6 +82,8 @@ static PyMethodDef Aerospike_Methods[] = {
 
 	{"init_async", (PyCFunction)AerospikeInitAsync, METH_VARARGS | METH_KEYWORDS,
 	 init_async_doc},
+	{"event_loop_stats", (PyCFunction)Aerospike_Event_Loop_Stats, METH_NOARGS,
+	 event_loop_stats_doc},
 	{"client", (PyCFunction)AerospikeClient_New, METH_VARARGS | METH_KEYWORDS,
 	 client_doc},
 	{"set_log_level", (PyCFunction)Aerospike_Set_Log_Level,
@@ -87,6 +105,11 @@ static PyMethodDef Aerospike_Methods[] = {
 	{"get_partition_id", (PyCFunction)Aerospike_Get_Partition_Id,
 	 METH_VARARGS, "Get partition ID for given digest"},
 
+	//Pack an expression once, for reuse in policies
+	{"compile_expression", (PyCFunction)Aerospike_Compile_Expression,
+	 METH_VARARGS | METH_KEYWORDS,
+	 "Pack an expression once, for reuse in policies"},
+
 	//Is async supported
 	{"is_async_supoorted", (PyCFunction)Aerospike_Is_AsyncSupported,
 	 METH_NOARGS, "check whether async supported or not"},
@@ -120,6 +143,12 @@ struct Aerospike_State{
 	PyTypeObject		*query;
 	PyTypeObject		*scan;
 	PyTypeObject		*kdict;
+	PyTypeObject		*record;
+	PyTypeObject		*lazy_bins;
+	PyTypeObject		*policy;
+	PyTypeObject		*operations;
+	PyTypeObject		*placeholder;
+	PyTypeObject		*compiled_expression;
 	PyObject			*predicates;
 	PyObject			*predexps;
 	PyTypeObject		*geospatial;
@@ -142,6 +171,12 @@ static int Aerospike_Clear(PyObject *aerospike)
 	Py_CLEAR(Aerospike_State(aerospike)->query);
 	Py_CLEAR(Aerospike_State(aerospike)->scan);
 	Py_CLEAR(Aerospike_State(aerospike)->kdict);
+	Py_CLEAR(Aerospike_State(aerospike)->record);
+	Py_CLEAR(Aerospike_State(aerospike)->lazy_bins);
+	Py_CLEAR(Aerospike_State(aerospike)->policy);
+	Py_CLEAR(Aerospike_State(aerospike)->operations);
+	Py_CLEAR(Aerospike_State(aerospike)->placeholder);
+	Py_CLEAR(Aerospike_State(aerospike)->compiled_expression);
 	Py_CLEAR(Aerospike_State(aerospike)->predicates);
 	Py_CLEAR(Aerospike_State(aerospike)->predexps);
 	Py_CLEAR(Aerospike_State(aerospike)->geospatial);
@@ -197,6 +232,42 @@ MOD_INIT(aerospike)
 	PyModule_AddObject(aerospike, "KeyOrderedDict", (PyObject *)kdict);
 	Aerospike_State(aerospike)->kdict = kdict;
 
+	PyTypeObject *record = AerospikeRecord_Ready();
+	Py_INCREF(record);
+	PyModule_AddObject(aerospike, "Record", (PyObject *)record);
+	Aerospike_State(aerospike)->record = record;
+
+	PyTypeObject *lazy_bins = AerospikeLazyBins_Ready();
+	Py_INCREF(lazy_bins);
+	PyModule_AddObject(aerospike, "LazyBins", (PyObject *)lazy_bins);
+	Aerospike_State(aerospike)->lazy_bins = lazy_bins;
+
+	PyTypeObject *policy = AerospikePolicy_Ready();
+	Py_INCREF(policy);
+	PyModule_AddObject(aerospike, "Policy", (PyObject *)policy);
+	Aerospike_State(aerospike)->policy = policy;
+
+	PyTypeObject *operations = AerospikeOperations_Ready();
+	Py_INCREF(operations);
+	PyModule_AddObject(aerospike, "Operations", (PyObject *)operations);
+	Aerospike_State(aerospike)->operations = operations;
+
+	PyTypeObject *placeholder = AerospikePlaceholder_Ready();
+	Py_INCREF(placeholder);
+	PyModule_AddObject(aerospike, "Placeholder", (PyObject *)placeholder);
+	Aerospike_State(aerospike)->placeholder = placeholder;
+
+	PyTypeObject *compiled_expression = AerospikeCompiledExpression_Ready();
+	Py_INCREF(compiled_expression);
+	PyModule_AddObject(aerospike, "CompiledExpression",
+					   (PyObject *)compiled_expression);
+	Aerospike_State(aerospike)->compiled_expression = compiled_expression;
+
+	// Only created internally, for blobs read as memoryviews.
+	AerospikeBlobOwner_Ready();
+	// Only created by Query.iter_results() and Scan.iter_results().
+	AerospikeResultIterator_Ready();
+
 	/*
 	 * Add constants to module.
 	 */
@@ -249,21 +320,33 @@ MOD_INIT(aerospike)
 
 PyObject *AerospikeInitAsync(PyObject *self, PyObject *args, PyObject *kwds)
 {
-#if AS_EVENT_LIB_DEFINED
-	as_log_info("AerospikeInitAsync");
-	as_event_destroy_loops();
-	as_event_create_loops(1);
-	async_support = true;
-#else
+	int loops = 1;
+
+	static char *kwlist[] = {"loops", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|i:init_async", kwlist,
+									&loops) == false) {
+		return NULL;
+	}
+
 	as_error err;
 	as_error_init(&err);
-	as_error_update(&err, AEROSPIKE_ERR, "Support for async is disabled, build software with async option");
+
+	as_log_info("AerospikeInitAsync");
+	if (loops < 1) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"loops must be between 1 and %d",
+						ASYNC_MAX_EVENT_LOOPS);
+	}
+	else if (async_loops_init(&err, (uint32_t)loops) == AEROSPIKE_OK) {
+		async_support = true;
+		return PyLong_FromLong(0);
+	}
+
 	PyObject *py_err = NULL, *exception_type = NULL;
 	error_to_pyobject(&err, &py_err);
 	exception_type = raise_exception(&err);
 	PyErr_SetObject(exception_type, py_err);
 	Py_DECREF(py_err);
 	return NULL;
-#endif
-	return PyLong_FromLong(0);
 }
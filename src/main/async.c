@@ -0,0 +1,1490 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <time.h>
+#include <unistd.h>
+
+#include <aerospike/as_atomic.h>
+#include <aerospike/as_cluster.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_partition.h>
+
+#include "async.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "types.h"
+#include "prepared_policy.h"
+
+// Commands issued by this module and not yet completed, per event loop.
+static uint32_t async_pending[ASYNC_MAX_EVENT_LOOPS];
+
+bool async_check_support(void)
+{
+	if (!async_support) {
+		as_error err;
+		as_error_init(&err);
+		as_error_update(&err, AEROSPIKE_ERR, "Support for async is disabled, build software with async option");
+		PyObject *py_err = NULL, *exception_type = NULL;
+		error_to_pyobject(&err, &py_err);
+		exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return false;
+	}
+	return true;
+}
+
+as_status async_loops_init(as_error *err, uint32_t n_loops)
+{
+	if (n_loops == 0 || n_loops > ASYNC_MAX_EVENT_LOOPS) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "loops must be between 1 and %d",
+							   ASYNC_MAX_EVENT_LOOPS);
+	}
+
+#if AS_EVENT_LIB_DEFINED
+	as_event_destroy_loops();
+	memset(async_pending, 0, sizeof(async_pending));
+
+	if (!as_event_create_loops(n_loops)) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Failed to create %u event loops", n_loops);
+	}
+	return AEROSPIKE_OK;
+#else
+	return as_error_update(
+		err, AEROSPIKE_ERR,
+		"Support for async is disabled, build software with async option");
+#endif
+}
+
+as_status async_loop_acquire(AerospikeClient *self, as_error *err,
+							 PyObject *py_policy, as_key *key,
+							 as_event_loop **event_loop)
+{
+	uint8_t selection = self->event_loop_selection;
+	uint32_t index = self->event_loop_index;
+
+	*event_loop = NULL;
+
+	if (as_event_loop_size == 0) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Event loops have not been created");
+	}
+
+	PyObject *py_index = AerospikePolicy_GetItem(py_policy, "event_loop");
+	if (py_index && py_index != Py_None) {
+		if (!PyLong_Check(py_index)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "event_loop must be an integer");
+		}
+		long value = PyLong_AsLong(py_index);
+		if (value < 0) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "event_loop must not be negative");
+		}
+		selection = EVENT_LOOP_PINNED;
+		index = (uint32_t)value;
+	}
+
+	switch (selection) {
+	case EVENT_LOOP_PARTITION:
+		if (key && as_key_digest(key)) {
+			uint32_t n_partitions = self->as->cluster->n_partitions;
+			uint32_t partition_id = as_partition_getid(
+				key->digest.value, n_partitions ? n_partitions : 4096);
+			*event_loop =
+				as_event_loop_get_by_index(partition_id % as_event_loop_size);
+		}
+		break;
+	case EVENT_LOOP_PINNED:
+		if (index >= as_event_loop_size) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "event_loop %u out of range, %u loops",
+								   index, as_event_loop_size);
+		}
+		*event_loop = as_event_loop_get_by_index(index);
+		break;
+	}
+
+	if (!*event_loop) {
+		*event_loop = as_event_loop_get();
+	}
+
+	as_incr_uint32(&async_pending[(*event_loop)->index]);
+	return AEROSPIKE_OK;
+}
+
+void async_loop_release(as_event_loop *event_loop)
+{
+	if (event_loop) {
+		as_decr_uint32(&async_pending[event_loop->index]);
+	}
+}
+
+PyObject *Aerospike_Event_Loop_Stats(PyObject *self, PyObject *args)
+{
+	PyObject *py_stats = PyList_New(0);
+	if (!py_stats) {
+		return NULL;
+	}
+
+	for (uint32_t i = 0; i < as_event_loop_size; i++) {
+		as_event_loop *event_loop = as_event_loop_get_by_index(i);
+		// The delay queue only exists when max_commands_in_process is set.
+		uint32_t queue_size = event_loop->using_delay_queue
+								  ? as_event_loop_get_queue_size(event_loop)
+								  : 0;
+		PyObject *py_loop =
+			Py_BuildValue("{s:I,s:I,s:I}", "index", i, "pending",
+						  as_load_uint32(&async_pending[i]), "queue_size",
+						  queue_size);
+
+		if (!py_loop || PyList_Append(py_stats, py_loop) == -1) {
+			Py_XDECREF(py_loop);
+			Py_DECREF(py_stats);
+			return NULL;
+		}
+		Py_DECREF(py_loop);
+	}
+
+	return py_stats;
+}
+
+// Cached lookups, populated on first use while holding the GIL.
+static PyObject *py_get_running_loop = NULL;
+static PyObject *py_find_running_loop = NULL;
+static PyObject *py_set_future_state = NULL;
+static PyObject *py_set_future_states = NULL;
+static PyObject *py_str_create_future = NULL;
+static PyObject *py_str_call_soon_threadsafe = NULL;
+static PyObject *py_str_done = NULL;
+static PyObject *py_str_set_result = NULL;
+static PyObject *py_str_set_exception = NULL;
+
+/**
+ * Completes a future unless it is already done, e.g. because the awaiting
+ * task was cancelled. Returns -1 with a Python error set on failure.
+ */
+static int future_set_state(PyObject *py_future, PyObject *py_result,
+							PyObject *py_exception)
+{
+	PyObject *py_done = NULL;
+	PyObject *py_return = NULL;
+
+	py_done = PyObject_CallMethodObjArgs(py_future, py_str_done, NULL);
+	if (!py_done) {
+		return -1;
+	}
+
+	if (py_done == Py_False) {
+		if (py_exception != Py_None) {
+			py_return = PyObject_CallMethodObjArgs(
+				py_future, py_str_set_exception, py_exception, NULL);
+		}
+		else {
+			py_return = PyObject_CallMethodObjArgs(
+				py_future, py_str_set_result, py_result, NULL);
+		}
+		if (!py_return) {
+			Py_DECREF(py_done);
+			return -1;
+		}
+		Py_DECREF(py_return);
+	}
+	Py_DECREF(py_done);
+
+	return 0;
+}
+
+/**
+ *******************************************************************************************************
+ * Runs on the future's own loop.
+ *
+ * @param self                  Unused
+ * @param args                  (future, result, exception)
+ *******************************************************************************************************
+ */
+static PyObject *set_future_state(PyObject *self, PyObject *args)
+{
+	PyObject *py_future = NULL;
+	PyObject *py_result = NULL;
+	PyObject *py_exception = NULL;
+
+	if (!PyArg_ParseTuple(args, "OOO", &py_future, &py_result,
+						  &py_exception)) {
+		return NULL;
+	}
+
+	if (future_set_state(py_future, py_result, py_exception) == -1) {
+		return NULL;
+	}
+
+	Py_RETURN_NONE;
+}
+
+/**
+ *******************************************************************************************************
+ * Runs on the futures' own loop, completing every future of a drained
+ * batch with a single loop callback.
+ *
+ * @param self                  Unused
+ * @param py_states             List of (future, result, exception) tuples
+ *******************************************************************************************************
+ */
+static PyObject *set_future_states(PyObject *self, PyObject *py_states)
+{
+	Py_ssize_t size = PyList_Size(py_states);
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_state = PyList_GET_ITEM(py_states, i);
+		if (future_set_state(PyTuple_GET_ITEM(py_state, 0),
+							 PyTuple_GET_ITEM(py_state, 1),
+							 PyTuple_GET_ITEM(py_state, 2)) == -1) {
+			// Keep completing the other futures of the batch.
+			PyErr_WriteUnraisable(py_state);
+		}
+	}
+
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef set_future_state_def = {
+	"_set_future_state", (PyCFunction)set_future_state, METH_VARARGS, NULL};
+
+static PyMethodDef set_future_states_def = {
+	"_set_future_states", (PyCFunction)set_future_states, METH_O, NULL};
+
+static as_status async_future_init(as_error *err)
+{
+	if (py_get_running_loop) {
+		return AEROSPIKE_OK;
+	}
+
+	PyObject *py_asyncio = PyImport_ImportModule("asyncio");
+	if (!py_asyncio) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to import asyncio");
+	}
+
+	PyObject *py_func = PyObject_GetAttrString(py_asyncio, "get_running_loop");
+	// Returns None instead of raising outside of a running loop.
+	PyObject *py_find_func =
+		PyObject_GetAttrString(py_asyncio, "_get_running_loop");
+	Py_DECREF(py_asyncio);
+	if (!py_func || !py_find_func) {
+		PyErr_Clear();
+		Py_XDECREF(py_func);
+		Py_XDECREF(py_find_func);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "asyncio.get_running_loop is not available");
+	}
+
+	py_find_running_loop = py_find_func;
+	py_set_future_state = PyCFunction_New(&set_future_state_def, NULL);
+	py_set_future_states = PyCFunction_New(&set_future_states_def, NULL);
+	py_str_create_future = PyUnicode_InternFromString("create_future");
+	py_str_call_soon_threadsafe =
+		PyUnicode_InternFromString("call_soon_threadsafe");
+	py_str_done = PyUnicode_InternFromString("done");
+	py_str_set_result = PyUnicode_InternFromString("set_result");
+	py_str_set_exception = PyUnicode_InternFromString("set_exception");
+	py_get_running_loop = py_func;
+
+	return AEROSPIKE_OK;
+}
+
+as_status async_future_new(as_error *err, PyObject **py_loop,
+						   PyObject **py_future)
+{
+	*py_loop = NULL;
+	*py_future = NULL;
+
+	if (async_future_init(err) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	PyObject *py_running_loop = PyObject_CallObject(py_get_running_loop, NULL);
+	if (!py_running_loop) {
+		PyErr_Clear();
+		return as_error_update(
+			err, AEROSPIKE_ERR_CLIENT,
+			"Awaitable commands must be called from a running asyncio loop");
+	}
+
+	PyObject *py_new_future = PyObject_CallMethodObjArgs(
+		py_running_loop, py_str_create_future, NULL);
+	if (!py_new_future) {
+		PyErr_Clear();
+		Py_DECREF(py_running_loop);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to create an asyncio future");
+	}
+
+	*py_loop = py_running_loop;
+	*py_future = py_new_future;
+	return AEROSPIKE_OK;
+}
+
+PyObject *async_future_exception(as_error *err, PyObject *py_key)
+{
+	PyObject *py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *py_exception_type = raise_exception(err);
+
+	PyObject *py_exception = PyObject_Call(py_exception_type, py_err, NULL);
+	Py_DECREF(py_err);
+	if (!py_exception) {
+		// Fall back to the class, asyncio instantiates it on set_exception().
+		PyErr_Clear();
+		Py_INCREF(py_exception_type);
+		return py_exception_type;
+	}
+
+	if (PyObject_HasAttrString(py_exception_type, "key")) {
+		PyObject_SetAttrString(py_exception, "key",
+							   py_key ? py_key : Py_None);
+	}
+	if (PyObject_HasAttrString(py_exception_type, "bin")) {
+		PyObject_SetAttrString(py_exception, "bin", Py_None);
+	}
+
+	return py_exception;
+}
+
+void async_future_resolve(PyObject *py_loop, PyObject *py_future,
+						  PyObject *py_result, PyObject *py_exception)
+{
+	if (!py_result) {
+		py_result = Py_None;
+	}
+	if (!py_exception) {
+		py_exception = Py_None;
+	}
+
+	PyObject *py_return = PyObject_CallMethodObjArgs(
+		py_loop, py_str_call_soon_threadsafe, py_set_future_state, py_future,
+		py_result, py_exception, NULL);
+
+	if (!py_return) {
+		// The loop has been closed, nobody is left to await the future.
+		PyErr_Clear();
+		return;
+	}
+	Py_DECREF(py_return);
+}
+
+/*******************************************************************************
+ * ADMISSION
+ ******************************************************************************/
+
+typedef struct AsyncWaiter_s {
+	PyObject *py_loop;
+	// (client, future, method, args, kwds) handed to async_admit().
+	PyObject *py_state;
+	struct AsyncWaiter_s *next;
+} AsyncWaiter;
+
+struct AsyncLimiter_s {
+	uint32_t max_commands;
+	// A slot was reserved by async_admit() for the command being created.
+	uint32_t admitted;
+	// Awaitable commands waiting for a slot, oldest first.
+	AsyncWaiter *head;
+	AsyncWaiter *tail;
+	uint32_t n_waiting;
+	// Callback commands waiting for a slot with the GIL released. They
+	// sleep until generation changes.
+	uint32_t n_blocked;
+	uint64_t generation;
+	pthread_mutex_t lock;
+	pthread_cond_t cond;
+};
+
+// Set while a completion is delivered on this thread.
+static __thread bool async_delivering = false;
+
+static bool async_completion_queue_notifies(AsyncCompletionQueue *queue);
+static uint32_t async_completion_queue_drain(AerospikeClient *self,
+											 PyObject *py_running_loop);
+
+static PyObject *py_async_admit = NULL;
+
+as_status async_limiter_new(as_error *err, PyObject *py_max_commands,
+							AsyncLimiter **limiter)
+{
+	*limiter = NULL;
+
+	long max_commands = -1;
+	if (PyLong_Check(py_max_commands)) {
+		max_commands = PyLong_AsLong(py_max_commands);
+	}
+	if (max_commands < 0 || max_commands > UINT32_MAX) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "async_max_commands must be a non-negative "
+							   "integer");
+	}
+
+	if (max_commands == 0) {
+		return AEROSPIKE_OK;
+	}
+
+	AsyncLimiter *new_limiter = cf_malloc(sizeof(AsyncLimiter));
+	memset(new_limiter, 0, sizeof(AsyncLimiter));
+	new_limiter->max_commands = (uint32_t)max_commands;
+	pthread_mutex_init(&new_limiter->lock, NULL);
+	pthread_cond_init(&new_limiter->cond, NULL);
+
+	*limiter = new_limiter;
+	return AEROSPIKE_OK;
+}
+
+void async_limiter_destroy(AsyncLimiter *limiter)
+{
+	if (!limiter) {
+		return;
+	}
+
+	// Waiters hold a reference to the client, so none are left here.
+	pthread_cond_destroy(&limiter->cond);
+	pthread_mutex_destroy(&limiter->lock);
+	cf_free(limiter);
+}
+
+/**
+ * Give back the slot of a command and pass free slots on to the oldest
+ * waiting commands. Requires the GIL.
+ */
+static void async_slot_release(AerospikeClient *self)
+{
+	AsyncLimiter *limiter = self->async_limiter;
+
+	self->async_in_flight--;
+
+	if (!limiter) {
+		return;
+	}
+
+	PyObject *py_type = NULL, *py_value = NULL, *py_traceback = NULL;
+	PyErr_Fetch(&py_type, &py_value, &py_traceback);
+
+	while (limiter->head && self->async_in_flight < limiter->max_commands) {
+		AsyncWaiter *waiter = limiter->head;
+		limiter->head = waiter->next;
+		if (!limiter->head) {
+			limiter->tail = NULL;
+		}
+		limiter->n_waiting--;
+
+		// The slot stays reserved until async_admit() issues the command.
+		self->async_in_flight++;
+
+		PyObject *py_return = PyObject_CallMethodObjArgs(
+			waiter->py_loop, py_str_call_soon_threadsafe, py_async_admit,
+			waiter->py_state, NULL);
+		if (!py_return) {
+			// The loop has been closed, nobody is left to await the command.
+			PyErr_Clear();
+			self->async_in_flight--;
+		}
+		Py_XDECREF(py_return);
+
+		Py_DECREF(waiter->py_loop);
+		Py_DECREF(waiter->py_state);
+		cf_free(waiter);
+	}
+
+	PyErr_Restore(py_type, py_value, py_traceback);
+
+	if (limiter->n_blocked) {
+		pthread_mutex_lock(&limiter->lock);
+		limiter->generation++;
+		pthread_cond_broadcast(&limiter->cond);
+		pthread_mutex_unlock(&limiter->lock);
+	}
+}
+
+/**
+ * Take a slot for a new command. Callback commands wait for one with the
+ * GIL released, unless called from a completion, as waiting there could
+ * stall the thread which frees slots. With notify_fd, completions are only
+ * delivered by async_drain(), usually on this very thread, so they deliver
+ * the queued completions themselves while they wait. Requires the GIL.
+ */
+static void async_slot_acquire(AerospikeClient *self, bool wait)
+{
+	AsyncLimiter *limiter = self->async_limiter;
+
+	if (limiter && limiter->admitted) {
+		// Reserved by async_admit(), already counted.
+		limiter->admitted--;
+		return;
+	}
+
+	while (wait && limiter && !async_delivering &&
+		   self->async_in_flight >= limiter->max_commands) {
+		pthread_mutex_lock(&limiter->lock);
+		uint64_t generation = limiter->generation;
+		pthread_mutex_unlock(&limiter->lock);
+
+		if (async_completion_queue_notifies(self->async_queue)) {
+			async_completion_queue_drain(self, NULL);
+			if (self->async_in_flight < limiter->max_commands) {
+				break;
+			}
+		}
+
+		limiter->n_blocked++;
+		Py_BEGIN_ALLOW_THREADS
+		pthread_mutex_lock(&limiter->lock);
+		while (limiter->generation == generation) {
+			pthread_cond_wait(&limiter->cond, &limiter->lock);
+		}
+		pthread_mutex_unlock(&limiter->lock);
+		Py_END_ALLOW_THREADS
+		limiter->n_blocked--;
+	}
+
+	self->async_in_flight++;
+}
+
+/**
+ *******************************************************************************************************
+ * Copies the outcome of the future of an admitted command to the future
+ * returned when it was deferred.
+ *
+ * @param py_outer              The future returned to the caller
+ * @param py_inner              The future of the issued command
+ *******************************************************************************************************
+ */
+static PyObject *async_chain(PyObject *py_outer, PyObject *py_inner)
+{
+	PyObject *py_done = PyObject_CallMethodObjArgs(py_outer, py_str_done, NULL);
+	if (!py_done) {
+		return NULL;
+	}
+	if (py_done == Py_True) {
+		// Cancelled by the caller in the meantime.
+		Py_DECREF(py_done);
+		Py_RETURN_NONE;
+	}
+	Py_DECREF(py_done);
+
+	PyObject *py_exception =
+		PyObject_CallMethod(py_inner, "exception", NULL);
+	if (!py_exception) {
+		return NULL;
+	}
+
+	PyObject *py_result = NULL;
+	if (py_exception == Py_None) {
+		py_result = PyObject_CallMethod(py_inner, "result", NULL);
+		if (!py_result) {
+			Py_DECREF(py_exception);
+			return NULL;
+		}
+	}
+
+	int rv = future_set_state(py_outer, py_result ? py_result : Py_None,
+							  py_exception);
+	Py_XDECREF(py_result);
+	Py_DECREF(py_exception);
+	if (rv == -1) {
+		return NULL;
+	}
+
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef async_chain_def = {"_async_chain", (PyCFunction)async_chain,
+									  METH_O, NULL};
+
+/**
+ *******************************************************************************************************
+ * Runs on the loop of a deferred command once a slot has been reserved for
+ * it, and issues the command by calling the client method again.
+ *
+ * @param self                  Unused
+ * @param py_state              (client, future, method, args, kwds)
+ *******************************************************************************************************
+ */
+static PyObject *async_admit(PyObject *self, PyObject *py_state)
+{
+	AerospikeClient *client =
+		(AerospikeClient *)PyTuple_GET_ITEM(py_state, 0);
+	PyObject *py_future = PyTuple_GET_ITEM(py_state, 1);
+	PyObject *py_method = PyTuple_GET_ITEM(py_state, 2);
+	PyObject *py_args = PyTuple_GET_ITEM(py_state, 3);
+	PyObject *py_kwds = PyTuple_GET_ITEM(py_state, 4);
+	AsyncLimiter *limiter = client->async_limiter;
+
+	PyObject *py_done = PyObject_CallMethodObjArgs(py_future, py_str_done, NULL);
+	if (!py_done || py_done == Py_True) {
+		// Cancelled while waiting.
+		Py_XDECREF(py_done);
+		PyErr_Clear();
+		async_slot_release(client);
+		Py_RETURN_NONE;
+	}
+	Py_DECREF(py_done);
+
+	limiter->admitted++;
+	PyObject *py_inner = PyObject_Call(py_method, py_args,
+									   py_kwds == Py_None ? NULL : py_kwds);
+	if (limiter->admitted) {
+		// The command failed before it took the reserved slot.
+		limiter->admitted--;
+		async_slot_release(client);
+	}
+
+	if (!py_inner) {
+		PyObject *py_type = NULL, *py_value = NULL, *py_traceback = NULL;
+		PyErr_Fetch(&py_type, &py_value, &py_traceback);
+		PyErr_NormalizeException(&py_type, &py_value, &py_traceback);
+		if (py_traceback) {
+			PyException_SetTraceback(py_value, py_traceback);
+		}
+		int rv = future_set_state(py_future, Py_None, py_value);
+		Py_XDECREF(py_type);
+		Py_XDECREF(py_value);
+		Py_XDECREF(py_traceback);
+		if (rv == -1) {
+			return NULL;
+		}
+		Py_RETURN_NONE;
+	}
+
+	PyObject *py_chain = PyCFunction_New(&async_chain_def, py_future);
+	PyObject *py_return =
+		py_chain ? PyObject_CallMethod(py_inner, "add_done_callback", "O",
+									   py_chain)
+				 : NULL;
+	Py_XDECREF(py_chain);
+	Py_DECREF(py_inner);
+	if (!py_return) {
+		return NULL;
+	}
+	Py_DECREF(py_return);
+
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef async_admit_def = {"_async_admit", (PyCFunction)async_admit,
+									  METH_O, NULL};
+
+bool async_command_deferred(AerospikeClient *self, const char *method,
+							PyObject *args, PyObject *kwds,
+							PyObject **py_result)
+{
+	AsyncLimiter *limiter = self->async_limiter;
+
+	*py_result = NULL;
+
+	// Commands queue up behind the waiting ones, oldest first.
+	if (!limiter || limiter->admitted ||
+		(self->async_in_flight < limiter->max_commands && !limiter->head)) {
+		return false;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	PyObject *py_loop = NULL;
+	PyObject *py_future = NULL;
+	if (async_future_new(&err, &py_loop, &py_future) != AEROSPIKE_OK) {
+		async_command_raise(&err, NULL);
+		return true;
+	}
+
+	if (!py_async_admit) {
+		py_async_admit = PyCFunction_New(&async_admit_def, NULL);
+	}
+
+	PyObject *py_method = PyObject_GetAttrString((PyObject *)self, method);
+	PyObject *py_state =
+		py_method ? Py_BuildValue("(OOOOO)", self, py_future, py_method, args,
+								  kwds ? kwds : Py_None)
+				  : NULL;
+	Py_XDECREF(py_method);
+	if (!py_state) {
+		Py_DECREF(py_loop);
+		Py_DECREF(py_future);
+		return true;
+	}
+
+	AsyncWaiter *waiter = cf_malloc(sizeof(AsyncWaiter));
+	waiter->py_loop = py_loop;
+	waiter->py_state = py_state;
+	waiter->next = NULL;
+
+	if (limiter->tail) {
+		limiter->tail->next = waiter;
+	}
+	else {
+		limiter->head = waiter;
+	}
+	limiter->tail = waiter;
+	limiter->n_waiting++;
+
+	*py_result = py_future;
+	return true;
+}
+
+AsyncCommand *async_command_new(AerospikeClient *self, as_error *err,
+								PyObject *py_callback, bool has_result)
+{
+	if (!self || !self->as) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		return NULL;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		return NULL;
+	}
+
+	if (py_callback && !PyCallable_Check(py_callback)) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "Callback must be callable");
+		return NULL;
+	}
+
+	async_slot_acquire(self, py_callback != NULL);
+
+	AsyncCommand *cmd = cf_malloc(sizeof(AsyncCommand));
+	cmd->client = self;
+	cmd->py_callback = NULL;
+	cmd->py_loop = NULL;
+	cmd->py_future = NULL;
+	cmd->py_module = NULL;
+	cmd->py_function = NULL;
+	cmd->py_keys = NULL;
+	cmd->has_result = has_result;
+	cmd->holds_slot = true;
+	cmd->convert = NULL;
+	cmd->data = NULL;
+	cmd->data_destroy = NULL;
+	cmd->error = NULL;
+	cmd->result = NULL;
+	cmd->result_type = ASYNC_RESULT_BORROWED;
+	cmd->next = NULL;
+	memset(&cmd->key, 0, sizeof(cmd->key));
+
+	if (py_callback) {
+		Py_INCREF(py_callback);
+		cmd->py_callback = py_callback;
+	}
+	else if (async_future_new(err, &cmd->py_loop, &cmd->py_future) !=
+			 AEROSPIKE_OK) {
+		cf_free(cmd);
+		async_slot_release(self);
+		return NULL;
+	}
+
+	// The client, and its completion queue, outlive the command.
+	Py_INCREF(self);
+
+	return cmd;
+}
+
+PyObject *async_command_result(AsyncCommand *cmd)
+{
+	PyObject *py_result = cmd->py_future ? cmd->py_future : Py_None;
+	Py_INCREF(py_result);
+	return py_result;
+}
+
+void async_command_destroy(AsyncCommand *cmd)
+{
+	if (!cmd) {
+		return;
+	}
+
+	switch (cmd->result_type) {
+	case ASYNC_RESULT_RECORD:
+		as_record_destroy((as_record *)cmd->result);
+		break;
+	case ASYNC_RESULT_VAL:
+		as_val_destroy((as_val *)cmd->result);
+		break;
+	case ASYNC_RESULT_BORROWED:
+		break;
+	}
+
+	if (cmd->error) {
+		cf_free(cmd->error);
+	}
+
+	if (cmd->data_destroy) {
+		cmd->data_destroy(cmd->data);
+	}
+
+	as_key_destroy(&cmd->key);
+	Py_XDECREF(cmd->py_callback);
+	Py_XDECREF(cmd->py_loop);
+	Py_XDECREF(cmd->py_future);
+	Py_XDECREF(cmd->py_module);
+	Py_XDECREF(cmd->py_function);
+	Py_XDECREF(cmd->py_keys);
+	if (cmd->holds_slot) {
+		async_slot_release(cmd->client);
+	}
+	Py_DECREF(cmd->client);
+	cf_free(cmd);
+}
+
+/**
+ * Hand the outcome of a future command to its loop. While a batch of
+ * completions is delivered, the (future, result, exception) states are
+ * collected per loop in py_batches and resolved together afterwards.
+ */
+static void async_command_resolve(AsyncCommand *cmd, PyObject *py_result,
+								  PyObject *py_exception, PyObject *py_batches)
+{
+	if (!py_batches) {
+		async_future_resolve(cmd->py_loop, cmd->py_future, py_result,
+							 py_exception);
+		return;
+	}
+
+	PyObject *py_states = PyDict_GetItem(py_batches, cmd->py_loop);
+	if (!py_states) {
+		py_states = PyList_New(0);
+		if (!py_states || PyDict_SetItem(py_batches, cmd->py_loop,
+										 py_states) == -1) {
+			Py_XDECREF(py_states);
+			PyErr_Clear();
+			async_future_resolve(cmd->py_loop, cmd->py_future, py_result,
+								 py_exception);
+			return;
+		}
+		Py_DECREF(py_states);
+	}
+
+	PyObject *py_state =
+		Py_BuildValue("OOO", cmd->py_future, py_result ? py_result : Py_None,
+					  py_exception ? py_exception : Py_None);
+	if (!py_state || PyList_Append(py_states, py_state) == -1) {
+		PyErr_Clear();
+		async_future_resolve(cmd->py_loop, cmd->py_future, py_result,
+							 py_exception);
+	}
+	Py_XDECREF(py_state);
+}
+
+/**
+ * Deliver the outcome of a command and free cmd. Requires the GIL.
+ */
+static void async_command_deliver(AsyncCommand *cmd, as_error *err,
+								  PyObject *py_result, PyObject *py_batches)
+{
+	PyObject *py_key = NULL;
+	PyObject *py_exception = NULL;
+	as_error key_err;
+
+	if (cmd->py_keys) {
+		Py_INCREF(cmd->py_keys);
+		py_key = cmd->py_keys;
+	}
+	else {
+		key_to_pyobject(&key_err, &cmd->key, &py_key);
+	}
+
+	// Free the slot before anyone learns about the outcome, so a completed
+	// command is never counted as in flight.
+	cmd->holds_slot = false;
+	async_slot_release(cmd->client);
+
+	if (err->code != AEROSPIKE_OK) {
+		py_exception = async_future_exception(err, py_key);
+		py_result = NULL;
+
+		if (cmd->py_module &&
+			PyObject_HasAttrString(py_exception, "module")) {
+			PyObject_SetAttrString(py_exception, "module", cmd->py_module);
+		}
+		if (cmd->py_function && PyObject_HasAttrString(py_exception, "func")) {
+			PyObject_SetAttrString(py_exception, "func", cmd->py_function);
+		}
+	}
+
+	if (cmd->py_future) {
+		async_command_resolve(cmd, py_result, py_exception, py_batches);
+	}
+	else {
+		PyObject *py_err = NULL;
+		error_to_pyobject(err, &py_err);
+
+		PyObject *py_return = NULL;
+		bool delivering = async_delivering;
+		async_delivering = true;
+		if (cmd->py_keys) {
+			py_return = PyObject_CallFunctionObjArgs(
+				cmd->py_callback, py_result ? py_result : Py_None, py_err,
+				py_exception ? py_exception : Py_None, NULL);
+		}
+		else if (cmd->has_result) {
+			py_return = PyObject_CallFunctionObjArgs(
+				cmd->py_callback, py_key ? py_key : Py_None,
+				py_result ? py_result : Py_None, py_err,
+				py_exception ? py_exception : Py_None, NULL);
+		}
+		else {
+			py_return = PyObject_CallFunctionObjArgs(
+				cmd->py_callback, py_key ? py_key : Py_None, py_err,
+				py_exception ? py_exception : Py_None, NULL);
+		}
+
+		async_delivering = delivering;
+
+		if (!py_return) {
+			// There is no caller to propagate to on the event loop thread.
+			PyErr_WriteUnraisable(cmd->py_callback);
+		}
+		Py_XDECREF(py_return);
+		Py_XDECREF(py_err);
+	}
+
+	Py_XDECREF(py_key);
+	Py_XDECREF(py_exception);
+	async_command_destroy(cmd);
+}
+
+/**
+ * Convert the result of a command and deliver it. Requires the GIL.
+ */
+static void async_command_finish(AsyncCommand *cmd, as_error *err,
+								 void *result, PyObject *py_batches)
+{
+	PyObject *py_result = NULL;
+
+	if (err->code == AEROSPIKE_OK) {
+		py_result = cmd->convert ? cmd->convert(cmd, err, result)
+								 : PyLong_FromLong(0);
+	}
+
+	async_command_deliver(cmd, err, py_result, py_batches);
+	Py_XDECREF(py_result);
+}
+
+/*******************************************************************************
+ * COMPLETION QUEUE
+ ******************************************************************************/
+
+struct AsyncCompletionQueue_s {
+	pthread_mutex_t lock;
+	pthread_cond_t cond;
+	pthread_t thread;
+	AsyncCommand *head;
+	AsyncCommand *tail;
+	uint32_t size;
+	uint32_t max_batch;
+	uint32_t max_delay_ms;
+	// When the oldest completion in the queue was added.
+	struct timespec oldest;
+	// Signal fds[1] instead of delivering on the drain thread.
+	bool notify_fd;
+	// fds[1] was written and the queue has not been drained since.
+	bool notified;
+	int fds[2];
+	bool stopping;
+	// The queue was destroyed from its own thread, which frees it on exit.
+	bool detached;
+};
+
+/**
+ * Move the completions out of the queue. Requires the queue lock.
+ */
+static AsyncCommand *async_completion_queue_take(AsyncCompletionQueue *queue)
+{
+	AsyncCommand *cmds = queue->head;
+	queue->head = NULL;
+	queue->tail = NULL;
+	queue->size = 0;
+	queue->notified = false;
+	return cmds;
+}
+
+/**
+ * Deliver a list of queued completions, taking the lock of no queue.
+ * Futures of py_running_loop are completed directly, the others with one
+ * call_soon_threadsafe() per loop. Requires the GIL.
+ */
+static uint32_t async_completions_deliver(AsyncCommand *cmds,
+										  PyObject *py_running_loop)
+{
+	uint32_t n_delivered = 0;
+	PyObject *py_batches = PyDict_New();
+	if (!py_batches) {
+		PyErr_Clear();
+	}
+
+	while (cmds) {
+		AsyncCommand *cmd = cmds;
+		cmds = cmd->next;
+
+		as_error err;
+		as_error_init(&err);
+		async_command_finish(cmd, cmd->error ? cmd->error : &err, cmd->result,
+							 py_batches);
+		n_delivered++;
+	}
+
+	if (!py_batches) {
+		return n_delivered;
+	}
+
+	PyObject *py_loop = NULL;
+	PyObject *py_states = NULL;
+	Py_ssize_t pos = 0;
+	while (PyDict_Next(py_batches, &pos, &py_loop, &py_states)) {
+		PyObject *py_return = NULL;
+		if (py_loop == py_running_loop) {
+			py_return = set_future_states(NULL, py_states);
+		}
+		else {
+			py_return = PyObject_CallMethodObjArgs(
+				py_loop, py_str_call_soon_threadsafe, py_set_future_states,
+				py_states, NULL);
+		}
+		if (!py_return) {
+			// The loop has been closed, nobody is left to await the futures.
+			PyErr_Clear();
+		}
+		Py_XDECREF(py_return);
+	}
+	Py_DECREF(py_batches);
+
+	return n_delivered;
+}
+
+static void async_completion_queue_free(AsyncCompletionQueue *queue)
+{
+	if (queue->notify_fd) {
+		close(queue->fds[0]);
+		close(queue->fds[1]);
+	}
+	pthread_cond_destroy(&queue->cond);
+	pthread_mutex_destroy(&queue->lock);
+	cf_free(queue);
+}
+
+static void *async_completion_queue_run(void *udata)
+{
+	AsyncCompletionQueue *queue = (AsyncCompletionQueue *)udata;
+
+	pthread_mutex_lock(&queue->lock);
+
+	while (!queue->stopping) {
+		if (queue->size == 0 || queue->notified) {
+			pthread_cond_wait(&queue->cond, &queue->lock);
+			continue;
+		}
+
+		if (queue->size < queue->max_batch) {
+			struct timespec now;
+			struct timespec deadline = queue->oldest;
+			deadline.tv_sec += queue->max_delay_ms / 1000;
+			deadline.tv_nsec += (long)(queue->max_delay_ms % 1000) * 1000000;
+			if (deadline.tv_nsec >= 1000000000) {
+				deadline.tv_sec++;
+				deadline.tv_nsec -= 1000000000;
+			}
+
+			clock_gettime(CLOCK_REALTIME, &now);
+			if (now.tv_sec < deadline.tv_sec ||
+				(now.tv_sec == deadline.tv_sec &&
+				 now.tv_nsec < deadline.tv_nsec)) {
+				pthread_cond_timedwait(&queue->cond, &queue->lock, &deadline);
+				continue;
+			}
+		}
+
+		if (queue->notify_fd) {
+			queue->notified = true;
+			pthread_mutex_unlock(&queue->lock);
+			// A full pipe means the owner has a wakeup pending already.
+			while (write(queue->fds[1], "x", 1) == -1 && errno == EINTR) {
+			}
+			pthread_mutex_lock(&queue->lock);
+			continue;
+		}
+
+		AsyncCommand *cmds = async_completion_queue_take(queue);
+		pthread_mutex_unlock(&queue->lock);
+
+		PyGILState_STATE gstate = PyGILState_Ensure();
+		async_completions_deliver(cmds, NULL);
+		PyGILState_Release(gstate);
+
+		pthread_mutex_lock(&queue->lock);
+	}
+
+	bool detached = queue->detached;
+	pthread_mutex_unlock(&queue->lock);
+
+	if (detached) {
+		async_completion_queue_free(queue);
+	}
+	return NULL;
+}
+
+/**
+ * Read a non-negative integer setting of the "async_completion" dict.
+ */
+static as_status async_completion_setting(as_error *err, PyObject *py_config,
+										  const char *name, uint32_t *value)
+{
+	PyObject *py_value = PyDict_GetItemString(py_config, name);
+	if (!py_value) {
+		return AEROSPIKE_OK;
+	}
+
+	long long_value = -1;
+	if (PyLong_Check(py_value)) {
+		long_value = PyLong_AsLong(py_value);
+	}
+	if (long_value < 0 || long_value > UINT32_MAX) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "async_completion %s must be a non-negative "
+							   "integer",
+							   name);
+	}
+
+	*value = (uint32_t)long_value;
+	return AEROSPIKE_OK;
+}
+
+as_status async_completion_queue_new(as_error *err, PyObject *py_config,
+									 AsyncCompletionQueue **queue)
+{
+	uint32_t max_batch = 64;
+	uint32_t max_delay_ms = 1;
+	bool notify_fd = false;
+
+	*queue = NULL;
+
+	if (!PyDict_Check(py_config)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "async_completion must be a dict");
+	}
+
+	if (async_completion_setting(err, py_config, "max_batch", &max_batch) !=
+			AEROSPIKE_OK ||
+		async_completion_setting(err, py_config, "max_delay_ms",
+								 &max_delay_ms) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	if (max_batch == 0) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "async_completion max_batch must be positive");
+	}
+
+	PyObject *py_notify_fd = PyDict_GetItemString(py_config, "notify_fd");
+	if (py_notify_fd) {
+		if (!PyBool_Check(py_notify_fd)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "async_completion notify_fd must be a bool");
+		}
+		notify_fd = py_notify_fd == Py_True;
+	}
+
+	AsyncCompletionQueue *new_queue = cf_malloc(sizeof(AsyncCompletionQueue));
+	memset(new_queue, 0, sizeof(AsyncCompletionQueue));
+	new_queue->max_batch = max_batch;
+	new_queue->max_delay_ms = max_delay_ms;
+	new_queue->notify_fd = notify_fd;
+	new_queue->fds[0] = -1;
+	new_queue->fds[1] = -1;
+
+	if (notify_fd) {
+		if (pipe(new_queue->fds) == -1) {
+			cf_free(new_queue);
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Failed to create the completion pipe");
+		}
+		for (int i = 0; i < 2; i++) {
+			fcntl(new_queue->fds[i], F_SETFL,
+				  fcntl(new_queue->fds[i], F_GETFL) | O_NONBLOCK);
+			fcntl(new_queue->fds[i], F_SETFD, FD_CLOEXEC);
+		}
+	}
+
+	pthread_mutex_init(&new_queue->lock, NULL);
+	pthread_cond_init(&new_queue->cond, NULL);
+
+	if (pthread_create(&new_queue->thread, NULL, async_completion_queue_run,
+					   new_queue) != 0) {
+		async_completion_queue_free(new_queue);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Failed to start the completion thread");
+	}
+
+	*queue = new_queue;
+	return AEROSPIKE_OK;
+}
+
+void async_completion_queue_destroy(AsyncCompletionQueue *queue)
+{
+	if (!queue) {
+		return;
+	}
+
+	pthread_mutex_lock(&queue->lock);
+	queue->stopping = true;
+	// The last command of a client can be delivered by the drain thread.
+	queue->detached = pthread_equal(pthread_self(), queue->thread);
+	pthread_cond_signal(&queue->cond);
+	pthread_mutex_unlock(&queue->lock);
+
+	if (queue->detached) {
+		pthread_detach(queue->thread);
+		return;
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	pthread_join(queue->thread, NULL);
+	Py_END_ALLOW_THREADS
+
+	async_completion_queue_free(queue);
+}
+
+/**
+ * Keep the outcome of a command in the client's completion queue. Values
+ * the C client destroys once the listener returns are taken over first.
+ */
+static void async_command_enqueue(AsyncCompletionQueue *queue,
+								  AsyncCommand *cmd, as_error *cmd_error,
+								  void *result, async_result_type result_type)
+{
+	if (cmd_error) {
+		cmd->error = cf_malloc(sizeof(as_error));
+		as_error_copy(cmd->error, cmd_error);
+		result = NULL;
+	}
+
+	if (result && result_type == ASYNC_RESULT_RECORD) {
+		result = record_take_bins((as_record *)result);
+	}
+	else if (result && result_type == ASYNC_RESULT_VAL) {
+		as_val_reserve((as_val *)result);
+	}
+
+	cmd->result = result;
+	cmd->result_type = result ? result_type : ASYNC_RESULT_BORROWED;
+	cmd->next = NULL;
+
+	AsyncLimiter *limiter = cmd->client->async_limiter;
+
+	pthread_mutex_lock(&queue->lock);
+	if (queue->tail) {
+		queue->tail->next = cmd;
+	}
+	else {
+		queue->head = cmd;
+	}
+	queue->tail = cmd;
+	queue->size++;
+
+	if (queue->notify_fd && limiter) {
+		// Wake the commands waiting for a slot, they deliver the completion
+		// themselves. Done under the queue lock, which keeps the command,
+		// and so the client, alive.
+		pthread_mutex_lock(&limiter->lock);
+		limiter->generation++;
+		pthread_cond_broadcast(&limiter->cond);
+		pthread_mutex_unlock(&limiter->lock);
+	}
+
+	if (queue->size == 1) {
+		clock_gettime(CLOCK_REALTIME, &queue->oldest);
+		pthread_cond_signal(&queue->cond);
+	}
+	else if (queue->size == queue->max_batch) {
+		pthread_cond_signal(&queue->cond);
+	}
+	pthread_mutex_unlock(&queue->lock);
+}
+
+static void async_command_done_result(AsyncCommand *cmd, as_error *cmd_error,
+									  void *result,
+									  async_result_type result_type)
+{
+	if (cmd->client->async_queue) {
+		async_command_enqueue(cmd->client->async_queue, cmd, cmd_error, result,
+							  result_type);
+		return;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (cmd_error) {
+		as_error_copy(&err, cmd_error);
+	}
+
+	// Lock Python State
+	PyGILState_STATE gstate = PyGILState_Ensure();
+	async_command_finish(cmd, &err, result, NULL);
+	PyGILState_Release(gstate);
+}
+
+void async_command_done(AsyncCommand *cmd, as_error *cmd_error, void *result)
+{
+	async_command_done_result(cmd, cmd_error, result, ASYNC_RESULT_BORROWED);
+}
+
+void async_record_listener(as_error *cmd_error, as_record *record, void *udata,
+						   as_event_loop *event_loop)
+{
+	async_loop_release(event_loop);
+	async_command_done_result((AsyncCommand *)udata, cmd_error, record,
+							  ASYNC_RESULT_RECORD);
+}
+
+void async_write_listener(as_error *cmd_error, void *udata,
+						  as_event_loop *event_loop)
+{
+	async_loop_release(event_loop);
+	async_command_done_result((AsyncCommand *)udata, cmd_error, NULL,
+							  ASYNC_RESULT_BORROWED);
+}
+
+void async_value_listener(as_error *cmd_error, as_val *val, void *udata,
+						  as_event_loop *event_loop)
+{
+	async_loop_release(event_loop);
+	async_command_done_result((AsyncCommand *)udata, cmd_error, val,
+							  ASYNC_RESULT_VAL);
+}
+
+static bool async_completion_queue_notifies(AsyncCompletionQueue *queue)
+{
+	return queue && queue->notify_fd;
+}
+
+/**
+ * Deliver the completions queued for the client. Requires the GIL.
+ */
+static uint32_t async_completion_queue_drain(AerospikeClient *self,
+											 PyObject *py_running_loop)
+{
+	AsyncCompletionQueue *queue = self->async_queue;
+
+	if (queue->notify_fd) {
+		// Consume the wakeup before taking the completions, so a signal
+		// for completions queued later is not lost.
+		char buf[64];
+		while (read(queue->fds[0], buf, sizeof(buf)) > 0) {
+		}
+	}
+
+	pthread_mutex_lock(&queue->lock);
+	AsyncCommand *cmds = async_completion_queue_take(queue);
+	pthread_mutex_unlock(&queue->lock);
+
+	// Delivering the last command may free the client and its queue.
+	Py_INCREF(self);
+	uint32_t n_delivered = async_completions_deliver(cmds, py_running_loop);
+	Py_DECREF(self);
+
+	return n_delivered;
+}
+
+static PyObject *async_completion_raise(const char *message)
+{
+	as_error err;
+	as_error_init(&err);
+	as_error_update(&err, AEROSPIKE_ERR_PARAM, "%s", message);
+	return async_command_raise(&err, NULL);
+}
+
+PyObject *AerospikeClient_Async_Completion_Fd(AerospikeClient *self,
+											  PyObject *args, PyObject *kwds)
+{
+	if (!self->async_queue || !self->async_queue->notify_fd) {
+		return async_completion_raise(
+			"Client is not configured with async_completion notify_fd");
+	}
+
+	return PyLong_FromLong(self->async_queue->fds[0]);
+}
+
+PyObject *AerospikeClient_Async_Drain(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	AsyncCompletionQueue *queue = self->async_queue;
+	as_error err;
+	as_error_init(&err);
+
+	if (!queue) {
+		return async_completion_raise(
+			"Client is not configured with async_completion");
+	}
+
+	if (async_future_init(&err) != AEROSPIKE_OK) {
+		return async_command_raise(&err, NULL);
+	}
+
+	PyObject *py_running_loop =
+		PyObject_CallObject(py_find_running_loop, NULL);
+	if (!py_running_loop) {
+		PyErr_Clear();
+	}
+
+	uint32_t n_delivered = async_completion_queue_drain(self, py_running_loop);
+	Py_XDECREF(py_running_loop);
+
+	return PyLong_FromUnsignedLong(n_delivered);
+}
+
+PyObject *AerospikeClient_Async_Stats(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	AsyncLimiter *limiter = self->async_limiter;
+	AsyncCompletionQueue *queue = self->async_queue;
+	uint32_t queued = 0;
+
+	if (queue) {
+		pthread_mutex_lock(&queue->lock);
+		queued = queue->size;
+		pthread_mutex_unlock(&queue->lock);
+	}
+
+	return Py_BuildValue(
+		"{s:I,s:I,s:I,s:I}", "in_flight", self->async_in_flight,
+		"max_commands", limiter ? limiter->max_commands : 0, "waiting",
+		limiter ? limiter->n_waiting + limiter->n_blocked : 0,
+		"queued_completions", queued);
+}
+
+PyObject *async_command_raise(as_error *err, PyObject *py_key)
+{
+	raise_exception_base(err, py_key, Py_None, NULL, NULL, NULL);
+	return NULL;
+}
@@ -0,0 +1,273 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/as_cluster.h>
+#include <aerospike/as_partition.h>
+#include <aerospike/as_thread_pool.h>
+#include <aerospike/as_vector.h>
+
+#include "batch_task.h"
+
+typedef struct BatchTaskShared_s BatchTaskShared;
+
+struct BatchTaskShared_s {
+	aerospike *as;
+	// Runs the keys at offsets, either one by one or as a sub-batch.
+	void (*run)(BatchTaskShared *shared, const uint32_t *offsets,
+				uint32_t n_offsets);
+	as_batch *batch;
+	batch_task_fn fn;
+	as_status *results;
+	batch_task_chunk_fn chunk_fn;
+	void *udata;
+	pthread_mutex_t lock;
+	pthread_cond_t cond;
+	uint32_t pending;
+};
+
+// The keys of one node and lane, in input order.
+typedef struct {
+	as_node *node;
+	uint32_t lane;
+	as_vector offsets;
+} BatchTaskGroup;
+
+// A slice of a group which is run by a single task.
+typedef struct {
+	BatchTaskShared *shared;
+	const uint32_t *offsets;
+	uint32_t n_offsets;
+} BatchTaskChunk;
+
+static void batch_task_run_keys(BatchTaskShared *shared,
+								const uint32_t *offsets, uint32_t n_offsets)
+{
+	for (uint32_t i = 0; i < n_offsets; i++) {
+		uint32_t index = offsets[i];
+		as_error err;
+		as_error_init(&err);
+		shared->results[index] =
+			shared->fn(shared->as, &err, as_batch_keyat(shared->batch, index),
+					   index, shared->udata);
+	}
+}
+
+static void batch_task_run_chunk(BatchTaskShared *shared,
+								 const uint32_t *offsets, uint32_t n_offsets)
+{
+	shared->chunk_fn(shared->as, offsets, n_offsets, shared->udata);
+}
+
+/**
+ *******************************************************************************************************
+ * Runs a chunk and signals the caller once done.
+ *******************************************************************************************************
+ */
+static void batch_task_run(void *udata)
+{
+	BatchTaskChunk *chunk = (BatchTaskChunk *)udata;
+	BatchTaskShared *shared = chunk->shared;
+
+	shared->run(shared, chunk->offsets, chunk->n_offsets);
+
+	pthread_mutex_lock(&shared->lock);
+	if (--shared->pending == 0) {
+		pthread_cond_signal(&shared->cond);
+	}
+	pthread_mutex_unlock(&shared->lock);
+}
+
+/**
+ *******************************************************************************************************
+ * Finds the group of a node and lane, creating it on first use.
+ *******************************************************************************************************
+ */
+static BatchTaskGroup *batch_task_group(as_vector *groups, as_node *node,
+										uint32_t lane, uint32_t capacity)
+{
+	for (uint32_t i = 0; i < groups->size; i++) {
+		BatchTaskGroup *group = as_vector_get(groups, i);
+		if (group->node == node && group->lane == lane) {
+			return group;
+		}
+	}
+
+	BatchTaskGroup *group = as_vector_reserve(groups);
+	group->node = node;
+	group->lane = lane;
+	as_vector_init(&group->offsets, sizeof(uint32_t), capacity);
+	return group;
+}
+
+/**
+ *******************************************************************************************************
+ * Groups the keys by the node owning them. Keys are assigned to one of the
+ * n_lanes lanes of their node by partition, so repeated keys share a lane.
+ *******************************************************************************************************
+ */
+static void batch_task_group_keys(as_cluster *cluster, as_key *keys,
+								  size_t stride, uint32_t n_keys,
+								  uint32_t n_nodes, uint32_t n_lanes,
+								  as_vector *groups)
+{
+	uint32_t capacity = n_keys / (n_nodes * n_lanes + 1) + 1;
+
+	as_vector_init(groups, sizeof(BatchTaskGroup), n_nodes * n_lanes + 1);
+
+	for (uint32_t i = 0; i < n_keys; i++) {
+		as_key *key = (as_key *)((char *)keys + stride * i);
+		as_node *node = NULL;
+		uint32_t lane = 0;
+		as_partition_info pi;
+		as_error route_err;
+		as_error_init(&route_err);
+
+		// Keys that cannot be routed are left to fail on their own in the
+		// node-less group.
+		if (as_key_set_digest(&route_err, key) == AEROSPIKE_OK &&
+			as_partition_info_init(&pi, cluster, &route_err, key) ==
+				AEROSPIKE_OK) {
+			node = as_partition_get_node(cluster, pi.ns, pi.partition, NULL,
+										 AS_POLICY_REPLICA_MASTER, true);
+			lane = pi.partition_id % n_lanes;
+		}
+
+		BatchTaskGroup *group = batch_task_group(groups, node, lane, capacity);
+		as_vector_append(&group->offsets, &i);
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Cuts the groups into chunks of at most max_chunk keys, runs them on the
+ * cluster thread pool and waits for all of them. The groups are destroyed.
+ *******************************************************************************************************
+ */
+static void batch_task_dispatch(as_cluster *cluster, BatchTaskShared *shared,
+								as_vector *groups, uint32_t max_chunk)
+{
+	as_vector chunks;
+	as_vector_init(&chunks, sizeof(BatchTaskChunk), groups->size);
+
+	for (uint32_t i = 0; i < groups->size; i++) {
+		BatchTaskGroup *group = as_vector_get(groups, i);
+		uint32_t *offsets = (uint32_t *)group->offsets.list;
+
+		for (uint32_t done = 0; done < group->offsets.size;
+			 done += max_chunk) {
+			BatchTaskChunk *chunk = as_vector_reserve(&chunks);
+			chunk->shared = shared;
+			chunk->offsets = offsets + done;
+			chunk->n_offsets = group->offsets.size - done;
+			if (chunk->n_offsets > max_chunk) {
+				chunk->n_offsets = max_chunk;
+			}
+		}
+	}
+
+	pthread_mutex_init(&shared->lock, NULL);
+	pthread_cond_init(&shared->cond, NULL);
+
+	// Vector growth is over, the chunks can be handed out.
+	shared->pending = chunks.size;
+
+	for (uint32_t i = 0; i < chunks.size; i++) {
+		BatchTaskChunk *chunk = as_vector_get(&chunks, i);
+		if (as_thread_pool_queue_task(&cluster->thread_pool, batch_task_run,
+									  chunk) != 0) {
+			// No pool threads available, run the chunk on this thread.
+			batch_task_run(chunk);
+		}
+	}
+
+	pthread_mutex_lock(&shared->lock);
+	while (shared->pending > 0) {
+		pthread_cond_wait(&shared->cond, &shared->lock);
+	}
+	pthread_mutex_unlock(&shared->lock);
+
+	pthread_cond_destroy(&shared->cond);
+	pthread_mutex_destroy(&shared->lock);
+
+	as_vector_destroy(&chunks);
+
+	for (uint32_t i = 0; i < groups->size; i++) {
+		BatchTaskGroup *group = as_vector_get(groups, i);
+		as_vector_destroy(&group->offsets);
+	}
+	as_vector_destroy(groups);
+}
+
+static uint32_t batch_task_n_nodes(as_cluster *cluster)
+{
+	as_nodes *nodes = as_nodes_reserve(cluster);
+	uint32_t n_nodes = nodes->size;
+	as_nodes_release(nodes);
+	return n_nodes;
+}
+
+void batch_task_execute(aerospike *as, as_batch *batch, batch_task_fn fn,
+						void *udata, as_status *results)
+{
+	as_cluster *cluster = as->cluster;
+	uint32_t n_keys = batch->keys.size;
+
+	if (n_keys == 0) {
+		return;
+	}
+
+	// Each node gets an equal share of the thread pool.
+	uint32_t n_nodes = batch_task_n_nodes(cluster);
+	uint32_t n_lanes = 1;
+	if (n_nodes > 0 && cluster->thread_pool.thread_size > n_nodes) {
+		n_lanes = cluster->thread_pool.thread_size / n_nodes;
+	}
+
+	BatchTaskShared shared = {.as = as,
+							  .run = batch_task_run_keys,
+							  .batch = batch,
+							  .fn = fn,
+							  .results = results,
+							  .udata = udata};
+
+	as_vector groups;
+	batch_task_group_keys(cluster, batch->keys.entries, sizeof(as_key), n_keys,
+						  n_nodes, n_lanes, &groups);
+	batch_task_dispatch(cluster, &shared, &groups, UINT32_MAX);
+}
+
+void batch_task_execute_chunks(aerospike *as, as_key *keys, size_t stride,
+							   uint32_t n_keys, uint32_t max_chunk,
+							   batch_task_chunk_fn fn, void *udata)
+{
+	as_cluster *cluster = as->cluster;
+
+	if (n_keys == 0) {
+		return;
+	}
+
+	BatchTaskShared shared = {
+		.as = as, .run = batch_task_run_chunk, .chunk_fn = fn, .udata = udata};
+
+	as_vector groups;
+	batch_task_group_keys(cluster, keys, stride, n_keys,
+						  batch_task_n_nodes(cluster), 1, &groups);
+	batch_task_dispatch(cluster, &shared, &groups, max_chunk);
+}
@@ -0,0 +1,228 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_error.h>
+#include <citrusleaf/alloc.h>
+
+#include "bin_name_cache.h"
+
+#define BIN_NAME_CACHE_MAX_SIZE (1 << 20)
+#define BIN_NAME_CACHE_NONE UINT32_MAX
+
+typedef struct {
+	char name[AS_BIN_NAME_MAX_SIZE];
+	uint32_t hash;
+	PyObject *py_name;
+	// Next entry in the same bucket.
+	uint32_t chain;
+	// Neighbours in the LRU list, the head being the most recently used.
+	uint32_t prev;
+	uint32_t next;
+} BinNameEntry;
+
+struct BinNameCache_s {
+	BinNameEntry *entries;
+	uint32_t capacity;
+	uint32_t size;
+	uint32_t *buckets;
+	uint32_t bucket_mask;
+	uint32_t head;
+	uint32_t tail;
+};
+
+// FNV-1a, bin names are at most 15 bytes.
+static uint32_t bin_name_hash(const char *name, size_t len)
+{
+	uint32_t hash = 2166136261u;
+	for (size_t i = 0; i < len; i++) {
+		hash ^= (uint8_t)name[i];
+		hash *= 16777619u;
+	}
+	return hash;
+}
+
+static void bin_name_cache_unlink(BinNameCache *cache, uint32_t index)
+{
+	BinNameEntry *entry = &cache->entries[index];
+
+	if (entry->prev != BIN_NAME_CACHE_NONE) {
+		cache->entries[entry->prev].next = entry->next;
+	}
+	else {
+		cache->head = entry->next;
+	}
+
+	if (entry->next != BIN_NAME_CACHE_NONE) {
+		cache->entries[entry->next].prev = entry->prev;
+	}
+	else {
+		cache->tail = entry->prev;
+	}
+}
+
+static void bin_name_cache_push_head(BinNameCache *cache, uint32_t index)
+{
+	BinNameEntry *entry = &cache->entries[index];
+
+	entry->prev = BIN_NAME_CACHE_NONE;
+	entry->next = cache->head;
+	if (cache->head != BIN_NAME_CACHE_NONE) {
+		cache->entries[cache->head].prev = index;
+	}
+	cache->head = index;
+	if (cache->tail == BIN_NAME_CACHE_NONE) {
+		cache->tail = index;
+	}
+}
+
+// Drop the least recently used entry and return its slot.
+static uint32_t bin_name_cache_evict(BinNameCache *cache)
+{
+	uint32_t index = cache->tail;
+	BinNameEntry *entry = &cache->entries[index];
+	uint32_t *link = &cache->buckets[entry->hash & cache->bucket_mask];
+
+	while (*link != index) {
+		link = &cache->entries[*link].chain;
+	}
+	*link = entry->chain;
+
+	bin_name_cache_unlink(cache, index);
+	Py_CLEAR(entry->py_name);
+	return index;
+}
+
+as_status bin_name_cache_new(as_error *err, PyObject *py_size,
+							 BinNameCache **cache)
+{
+	*cache = NULL;
+
+	long size = BIN_NAME_CACHE_DEFAULT_SIZE;
+	if (py_size) {
+		size = -1;
+		if (PyLong_Check(py_size)) {
+			size = PyLong_AsLong(py_size);
+		}
+	}
+	if (size < 0 || size > BIN_NAME_CACHE_MAX_SIZE) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "bin_name_cache_size must be an integer "
+							   "between 0 and %d",
+							   BIN_NAME_CACHE_MAX_SIZE);
+	}
+
+	if (size == 0) {
+		return AEROSPIKE_OK;
+	}
+
+	// At least two buckets per entry keeps the chains short.
+	uint32_t n_buckets = 2;
+	while (n_buckets < 2 * (uint32_t)size) {
+		n_buckets <<= 1;
+	}
+
+	BinNameCache *new_cache = cf_malloc(sizeof(BinNameCache));
+	new_cache->entries = cf_calloc(size, sizeof(BinNameEntry));
+	new_cache->buckets = cf_malloc(sizeof(uint32_t) * n_buckets);
+	if (!new_cache->entries || !new_cache->buckets) {
+		cf_free(new_cache->entries);
+		cf_free(new_cache->buckets);
+		cf_free(new_cache);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Failed to allocate the bin name cache.");
+	}
+
+	memset(new_cache->buckets, 0xff, sizeof(uint32_t) * n_buckets);
+	new_cache->capacity = (uint32_t)size;
+	new_cache->size = 0;
+	new_cache->bucket_mask = n_buckets - 1;
+	new_cache->head = BIN_NAME_CACHE_NONE;
+	new_cache->tail = BIN_NAME_CACHE_NONE;
+
+	*cache = new_cache;
+	return AEROSPIKE_OK;
+}
+
+void bin_name_cache_destroy(BinNameCache *cache)
+{
+	if (!cache) {
+		return;
+	}
+
+	for (uint32_t i = 0; i < cache->size; i++) {
+		Py_CLEAR(cache->entries[i].py_name);
+	}
+	cf_free(cache->entries);
+	cf_free(cache->buckets);
+	cf_free(cache);
+}
+
+PyObject *bin_name_cache_get(BinNameCache *cache, const char *name)
+{
+	size_t len = strlen(name);
+
+	if (!cache || len >= AS_BIN_NAME_MAX_SIZE) {
+		return PyUnicode_FromString(name);
+	}
+
+	uint32_t hash = bin_name_hash(name, len);
+	uint32_t *bucket = &cache->buckets[hash & cache->bucket_mask];
+
+	for (uint32_t index = *bucket; index != BIN_NAME_CACHE_NONE;
+		 index = cache->entries[index].chain) {
+		BinNameEntry *entry = &cache->entries[index];
+
+		if (entry->hash == hash && strcmp(entry->name, name) == 0) {
+			if (cache->head != index) {
+				bin_name_cache_unlink(cache, index);
+				bin_name_cache_push_head(cache, index);
+			}
+			Py_INCREF(entry->py_name);
+			return entry->py_name;
+		}
+	}
+
+	PyObject *py_name = PyUnicode_InternFromString(name);
+	if (!py_name) {
+		return NULL;
+	}
+
+	// Hash once here so that every dict insert reuses it.
+	if (PyObject_Hash(py_name) == -1) {
+		Py_DECREF(py_name);
+		return NULL;
+	}
+
+	uint32_t index = cache->size < cache->capacity ? cache->size++
+												   : bin_name_cache_evict(cache);
+	BinNameEntry *entry = &cache->entries[index];
+
+	memcpy(entry->name, name, len + 1);
+	entry->hash = hash;
+	entry->py_name = py_name;
+	entry->chain = *bucket;
+	*bucket = index;
+	bin_name_cache_push_head(cache, index);
+
+	Py_INCREF(py_name);
+	return py_name;
+}
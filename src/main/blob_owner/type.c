@@ -0,0 +1,100 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+#include <citrusleaf/alloc.h>
+
+#include "blob_owner.h"
+
+// Keeps the memory of a blob alive for the memoryviews over it.
+typedef struct {
+	PyObject_HEAD
+	uint8_t *value;
+	uint32_t size;
+} AerospikeBlobOwner;
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static int AerospikeBlobOwner_Type_GetBuffer(AerospikeBlobOwner *self,
+											 Py_buffer *view, int flags)
+{
+	return PyBuffer_FillInfo(view, (PyObject *)self, self->value, self->size,
+							 1, flags);
+}
+
+static void AerospikeBlobOwner_Type_Dealloc(AerospikeBlobOwner *self)
+{
+	cf_free(self->value);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyBufferProcs AerospikeBlobOwner_Type_Buffer = {
+	.bf_getbuffer = (getbufferproc)AerospikeBlobOwner_Type_GetBuffer};
+
+static PyTypeObject AerospikeBlobOwner_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.BlobOwner",
+	.tp_basicsize = sizeof(AerospikeBlobOwner),
+	.tp_dealloc = (destructor)AerospikeBlobOwner_Type_Dealloc,
+	.tp_as_buffer = &AerospikeBlobOwner_Type_Buffer,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "The memory of a blob read as a memoryview.\n"};
+
+PyTypeObject *AerospikeBlobOwner_Ready()
+{
+	return PyType_Ready(&AerospikeBlobOwner_Type) == 0
+			   ? &AerospikeBlobOwner_Type
+			   : NULL;
+}
+
+PyObject *AerospikeBlobOwner_MemoryView(as_bytes *bytes)
+{
+	AerospikeBlobOwner *owner =
+		PyObject_New(AerospikeBlobOwner, &AerospikeBlobOwner_Type);
+	if (!owner) {
+		return NULL;
+	}
+
+	owner->size = bytes->size;
+	if (bytes->free) {
+		owner->value = bytes->value;
+		bytes->value = NULL;
+		bytes->size = 0;
+		bytes->capacity = 0;
+		bytes->free = false;
+	}
+	else {
+		owner->value = cf_malloc(bytes->size ? bytes->size : 1);
+		if (!owner->value) {
+			Py_DECREF(owner);
+			return PyErr_NoMemory();
+		}
+		memcpy(owner->value, bytes->value, bytes->size);
+	}
+
+	PyObject *py_view = PyMemoryView_FromObject((PyObject *)owner);
+	Py_DECREF(owner);
+	return py_view;
+}
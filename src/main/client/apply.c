@@ -184,25 +184,11 @@ CLEANUP:
 	}
 	as_list_destroy(arglist);
 	as_val_destroy(result);
+	POOL_DESTROY(&static_pool);
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		if (PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", py_module);
-		}
-		if (PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", py_function);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, Py_None, py_module, py_function,
+							 NULL);
 		return NULL;
 	}
 
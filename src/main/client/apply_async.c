@@ -0,0 +1,297 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_list.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "serializer.h"
+
+static PyObject *apply_async_convert(AsyncCommand *cmd, as_error *err,
+									  void *result)
+{
+	PyObject *py_val = NULL;
+	val_to_pyobject(cmd->client, err, (as_val *)result, &py_val);
+	return py_val;
+}
+
+/**
+ *******************************************************************************************************
+ * Issues an asynchronous UDF apply. Arguments and policy are converted
+ * exactly as the synchronous apply does.
+ *
+ * @param self                  AerospikeClient object
+ * @param py_callback           Python callable or NULL for an awaitable apply
+ * @param py_key                The key tuple
+ * @param py_module             The UDF module name
+ * @param py_function           The UDF function name
+ * @param py_arglist            The list of UDF arguments
+ * @param py_policy             The apply policy dict
+ *
+ * Returns None or the future. In case of error, appropriate exceptions
+ * will be raised.
+ *******************************************************************************************************
+ */
+static PyObject *
+AerospikeClient_Apply_Async_Invoke(AerospikeClient *self, PyObject *py_callback,
+								   PyObject *py_key, PyObject *py_module,
+								   PyObject *py_function, PyObject *py_arglist,
+								   PyObject *py_policy)
+{
+	PyObject *py_result = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	as_policy_apply apply_policy;
+	as_policy_apply *apply_policy_p = NULL;
+	char *module = NULL;
+	char *function = NULL;
+	as_list *arglist = NULL;
+
+	PyObject *py_umodule = NULL;
+	PyObject *py_ufunction = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	as_event_loop *event_loop = NULL;
+
+	if (!PyList_Check(py_arglist)) {
+		PyErr_SetString(PyExc_TypeError,
+						"expected UDF method arguments in a 'list'");
+		return NULL;
+	}
+
+	AsyncCommand *cmd = async_command_new(self, &err, py_callback, true);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+	cmd->convert = apply_async_convert;
+
+	Py_INCREF(py_module);
+	cmd->py_module = py_module;
+	Py_INCREF(py_function);
+	cmd->py_function = py_function;
+
+	self->is_client_put_serializer = false;
+	if (pyobject_to_key(&err, py_key, &cmd->key) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert python list to as_list
+	pyobject_to_list(self, &err, py_arglist, &arglist, &static_pool,
+					 SERIALIZER_PYTHON);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_apply
+	pyobject_to_policy_apply(self, &err, py_policy, &apply_policy,
+							 &apply_policy_p, &self->as->config.policies.apply,
+							 &predexp_list, &predexp_list_p, &exp_list,
+							 &exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (PyUnicode_Check(py_module)) {
+		py_umodule = PyUnicode_AsUTF8String(py_module);
+		module = PyBytes_AsString(py_umodule);
+	}
+	else if (PyString_Check(py_module)) {
+		module = PyString_AsString(py_module);
+	}
+	else {
+		as_error_update(
+			&err, AEROSPIKE_ERR_CLIENT,
+			"udf module argument must be a string or unicode string");
+		goto CLEANUP;
+	}
+
+	if (PyUnicode_Check(py_function)) {
+		py_ufunction = PyUnicode_AsUTF8String(py_function);
+		function = PyBytes_AsString(py_ufunction);
+	}
+	else if (PyString_Check(py_function)) {
+		function = PyString_AsString(py_function);
+	}
+	else {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"function name must be a string or unicode string");
+		goto CLEANUP;
+	}
+
+	if (async_loop_acquire(self, &err, py_policy, &cmd->key, &event_loop) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = async_command_result(cmd);
+
+	// Module, function and arguments are serialized into the command buffer
+	// before the call returns.
+	as_status status;
+	Py_BEGIN_ALLOW_THREADS
+	status = aerospike_key_apply_async(self->as, &err, apply_policy_p,
+									   &cmd->key, module, function, arglist,
+									   async_value_listener, cmd, event_loop,
+									   NULL);
+	Py_END_ALLOW_THREADS
+	if (status != AEROSPIKE_OK) {
+		async_loop_release(event_loop);
+		Py_CLEAR(py_result);
+		goto CLEANUP;
+	}
+
+	// cmd now belongs to the listener.
+	cmd = NULL;
+
+CLEANUP:
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	Py_XDECREF(py_umodule);
+	Py_XDECREF(py_ufunction);
+
+	as_list_destroy(arglist);
+	POOL_DESTROY(&static_pool);
+
+	async_command_destroy(cmd);
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, py_key, Py_None, py_module, py_function,
+							 NULL);
+		return NULL;
+	}
+
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Applies a UDF to a record, delivering its return value to a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (key, value, error, exception).
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Apply_Async(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_module = NULL;
+	PyObject *py_function = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"apply_callback", "key",  "module", "function",
+							 "args",		   "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOOOO|O:apply_async", kwlist,
+									&py_callback, &py_key, &py_module,
+									&py_function, &py_arglist,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Apply_Async_Invoke(self, py_callback, py_key,
+											  py_module, py_function,
+											  py_arglist, py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Applies a UDF to a record without blocking the calling asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to the UDF return value.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Apply_Aio(AerospikeClient *self, PyObject *args,
+									PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_key = NULL;
+	PyObject *py_module = NULL;
+	PyObject *py_function = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "module", "function", "args", "policy",
+							 NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOOO|O:apply_aio", kwlist,
+									&py_key, &py_module, &py_function,
+									&py_arglist, &py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "apply_aio", args, kwds, &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Apply_Async_Invoke(self, NULL, py_key, py_module,
+											  py_function, py_arglist,
+											  py_policy);
+}
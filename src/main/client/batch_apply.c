@@ -0,0 +1,226 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_list.h>
+#include <aerospike/as_val.h>
+
+#include "batch_task.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+// User data of the per record apply command.
+typedef struct {
+	as_policy_apply *policy;
+	const char *module;
+	const char *function;
+	as_list *arglist;
+	as_val **results;
+} BatchApplyData;
+
+static as_status batch_apply_record(aerospike *as, as_error *err, as_key *key,
+									uint32_t index, void *udata)
+{
+	BatchApplyData *data = (BatchApplyData *)udata;
+	return aerospike_key_apply(as, err, data->policy, key, data->module,
+							   data->function, data->arglist,
+							   &data->results[index]);
+}
+
+/**
+ *******************************************************************************************************
+ * Applies a registered udf module on a batch of records. The keys are grouped
+ * by the node owning them and the nodes are worked on in parallel.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list of (status, result) tuples, in input order.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_Apply(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_keys = NULL;
+	PyObject *py_module = NULL;
+	PyObject *py_function = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_policy = NULL;
+	PyObject *py_results = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_apply apply_policy;
+	as_policy_apply *apply_policy_p = NULL;
+	as_batch batch;
+	as_list *arglist = NULL;
+	as_status *statuses = NULL;
+	as_val **results = NULL;
+	uint32_t size = 0;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"keys", "module", "function",
+							 "args", "policy",  NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOOO|O:batch_apply", kwlist,
+									&py_keys, &py_module, &py_function,
+									&py_arglist, &py_policy) == false) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+	as_batch_init(&batch, 0);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyUnicode_Check(py_module)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"udf module argument must be a string");
+		goto CLEANUP;
+	}
+
+	if (!PyUnicode_Check(py_function)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"function name must be a string");
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_arglist)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"expected UDF method arguments in a 'list'");
+		goto CLEANUP;
+	}
+
+	self->is_client_put_serializer = false;
+	// Convert python list to as_list, it is shared by all records.
+	if (pyobject_to_list(self, &err, py_arglist, &arglist, &static_pool,
+						 SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_apply
+	if (pyobject_to_policy_apply(
+			self, &err, py_policy, &apply_policy, &apply_policy_p,
+			&self->as->config.policies.apply, &predexp_list, &predexp_list_p,
+			&exp_list, &exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_batch_keys(&err, py_keys, &batch) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	size = batch.keys.size;
+	statuses = cf_malloc(sizeof(as_status) * size + 1);
+	results = cf_calloc(size + 1, sizeof(as_val *));
+	if (!statuses || !results) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the batch results.");
+		goto CLEANUP;
+	}
+
+	BatchApplyData data = {.policy = apply_policy_p,
+						   .module = PyUnicode_AsUTF8(py_module),
+						   .function = PyUnicode_AsUTF8(py_function),
+						   .arglist = arglist,
+						   .results = results};
+
+	Py_BEGIN_ALLOW_THREADS
+	batch_task_execute(self->as, &batch, batch_apply_record, &data, statuses);
+	Py_END_ALLOW_THREADS
+
+	py_results = PyList_New(size);
+	for (uint32_t i = 0; py_results && i < size; i++) {
+		PyObject *py_result = NULL;
+
+		if (statuses[i] == AEROSPIKE_OK) {
+			if (val_to_pyobject(self, &err, results[i], &py_result) !=
+				AEROSPIKE_OK) {
+				Py_CLEAR(py_results);
+				goto CLEANUP;
+			}
+		}
+		else {
+			Py_INCREF(Py_None);
+			py_result = Py_None;
+		}
+
+		PyObject *py_tuple = PyTuple_New(2);
+		PyTuple_SET_ITEM(py_tuple, 0, PyLong_FromLong(statuses[i]));
+		PyTuple_SET_ITEM(py_tuple, 1, py_result);
+		PyList_SET_ITEM(py_results, i, py_tuple);
+	}
+
+CLEANUP:
+	for (uint32_t i = 0; results && i < size; i++) {
+		as_val_destroy(results[i]);
+	}
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	as_list_destroy(arglist);
+	POOL_DESTROY(&static_pool);
+	cf_free(results);
+	cf_free(statuses);
+	as_batch_destroy(&batch);
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, py_module, py_function, NULL);
+		return NULL;
+	}
+
+	return py_results;
+}
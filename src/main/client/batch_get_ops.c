@@ -138,6 +138,9 @@ static PyObject *AerospikeClient_Batch_GetOps_Invoke(AerospikeClient *self,
 
 	as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
 	as_operations ops;
 	Py_ssize_t ops_size = PyList_Size(py_ops);
 	as_operations_inita(&ops, ops_size);
@@ -150,9 +153,6 @@ static PyObject *AerospikeClient_Batch_GetOps_Invoke(AerospikeClient *self,
 		}
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	if (py_meta) {
 		if (check_for_meta(py_meta, &ops, err) != AEROSPIKE_OK) {
 		goto CLEANUP;
@@ -228,6 +228,7 @@ CLEANUP:
 	as_vector_destroy(unicodeStrVector);
 
 	as_operations_destroy(&ops);
+	POOL_DESTROY(&static_pool);
 
 	as_batch_destroy(&batch);
 
@@ -0,0 +1,308 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_vector.h>
+
+#include "batch_task.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "operate.h"
+#include "policy.h"
+
+// User data of the per record operate command.
+typedef struct {
+	as_policy_operate *policy;
+	as_operations **ops;
+	as_record **records;
+} BatchOperateData;
+
+static as_status batch_operate_record(aerospike *as, as_error *err,
+									  as_key *key, uint32_t index, void *udata)
+{
+	BatchOperateData *data = (BatchOperateData *)udata;
+	return aerospike_key_operate(as, err, data->policy, key, data->ops[index],
+								 &data->records[index]);
+}
+
+/**
+ *******************************************************************************************************
+ * Converts a list of (key, ops[, meta]) tuples into the batch keys and the
+ * operations of every key. The bytes of the operations are taken from
+ * static_pool.
+ *
+ * @param self                  AerospikeClient object
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ * @param py_records            The list of (key, ops[, meta]) tuples.
+ * @param batch                 The batch receiving the keys.
+ * @param ops                   The operations, one per key.
+ * @param unicodeStrVector      Receives the bin names to be freed.
+ * @param static_pool           The pool of the bytes of all the operations.
+ *******************************************************************************************************
+ */
+static as_status batch_operate_ops_convert(AerospikeClient *self,
+										   as_error *err, PyObject *py_records,
+										   as_batch *batch, as_operations **ops,
+										   as_vector *unicodeStrVector,
+										   as_static_pool *static_pool)
+{
+	long operation;
+	long return_type = -1;
+	Py_ssize_t size = PyList_Size(py_records);
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_record = PyList_GetItem(py_records, i);
+		PyObject *py_meta = NULL;
+
+		if (!PyTuple_Check(py_record) || PyTuple_Size(py_record) < 2 ||
+			PyTuple_Size(py_record) > 3) {
+			return as_error_update(
+				err, AEROSPIKE_ERR_PARAM,
+				"Record should be a tuple of (key, ops[, meta]).");
+		}
+		if (PyTuple_Size(py_record) == 3) {
+			py_meta = PyTuple_GetItem(py_record, 2);
+		}
+
+		if (pyobject_to_key(err, PyTuple_GetItem(py_record, 0),
+							as_batch_keyat(batch, (uint32_t)i)) !=
+			AEROSPIKE_OK) {
+			return err->code;
+		}
+
+		PyObject *py_ops = PyTuple_GetItem(py_record, 1);
+		if (!PyList_Check(py_ops)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "Operations should be of type list");
+		}
+
+		Py_ssize_t ops_size = PyList_Size(py_ops);
+		ops[i] = as_operations_new((uint16_t)ops_size);
+
+		if (py_meta) {
+			if (check_for_meta(py_meta, ops[i], err) != AEROSPIKE_OK) {
+				return err->code;
+			}
+		}
+
+		for (Py_ssize_t j = 0; j < ops_size; j++) {
+			PyObject *py_val = PyList_GetItem(py_ops, j);
+
+			if (PyDict_Check(py_val)) {
+				if (add_op(self, err, py_val, unicodeStrVector, static_pool,
+						   ops[i], &operation,
+						   &return_type) != AEROSPIKE_OK) {
+					return err->code;
+				}
+			}
+		}
+	}
+
+	return AEROSPIKE_OK;
+}
+
+/**
+ *******************************************************************************************************
+ * Multiple operations on each of a batch of records. Every record comes with
+ * its own list of operations. The keys are grouped by the node owning them
+ * and the nodes are worked on in parallel.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list of (status, record) tuples, in input order.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_Operate(AerospikeClient *self, PyObject *args,
+										PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_records = NULL;
+	PyObject *py_policy = NULL;
+	PyObject *py_results = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_operate operate_policy;
+	as_policy_operate *operate_policy_p = NULL;
+	as_batch batch;
+	as_operations **ops = NULL;
+	as_record **records = NULL;
+	as_status *statuses = NULL;
+	uint32_t size = 0;
+	as_vector *unicodeStrVector = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"records", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:batch_operate", kwlist,
+									&py_records, &py_policy) == false) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+	as_batch_init(&batch, 0);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_records)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Records should be a list of tuples.");
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_operate
+	if (pyobject_to_policy_operate(
+			self, &err, py_policy, &operate_policy, &operate_policy_p,
+			&self->as->config.policies.operate, &predexp_list,
+			&predexp_list_p, &exp_list, &exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	size = (uint32_t)PyList_Size(py_records);
+	as_batch_init(&batch, size);
+	if (size > 0) {
+		// Keys past a conversion error are destroyed untouched.
+		memset(batch.keys.entries, 0, sizeof(as_key) * size);
+	}
+
+	ops = cf_calloc(size + 1, sizeof(as_operations *));
+	records = cf_calloc(size + 1, sizeof(as_record *));
+	statuses = cf_malloc(sizeof(as_status) * size + 1);
+	if (!ops || !records || !statuses) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the batch records.");
+		goto CLEANUP;
+	}
+
+	unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+	if (batch_operate_ops_convert(self, &err, py_records, &batch, ops,
+								  unicodeStrVector,
+								  &static_pool) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	BatchOperateData data = {
+		.policy = operate_policy_p, .ops = ops, .records = records};
+
+	Py_BEGIN_ALLOW_THREADS
+	batch_task_execute(self->as, &batch, batch_operate_record, &data,
+					   statuses);
+	Py_END_ALLOW_THREADS
+
+	py_results = PyList_New(size);
+	for (uint32_t i = 0; py_results && i < size; i++) {
+		PyObject *py_rec = NULL;
+
+		if (statuses[i] == AEROSPIKE_OK && records[i]) {
+			if (record_to_pyobject(self, &err, records[i],
+								   as_batch_keyat(&batch, i),
+								   &py_rec) != AEROSPIKE_OK) {
+				Py_CLEAR(py_results);
+				goto CLEANUP;
+			}
+		}
+		else {
+			Py_INCREF(Py_None);
+			py_rec = Py_None;
+		}
+
+		PyObject *py_tuple = PyTuple_New(2);
+		PyTuple_SET_ITEM(py_tuple, 0, PyLong_FromLong(statuses[i]));
+		PyTuple_SET_ITEM(py_tuple, 1, py_rec);
+		PyList_SET_ITEM(py_results, i, py_tuple);
+	}
+
+CLEANUP:
+	for (uint32_t i = 0; i < size; i++) {
+		if (ops && ops[i]) {
+			as_operations_destroy(ops[i]);
+		}
+		if (records && records[i]) {
+			as_record_destroy(records[i]);
+		}
+	}
+
+	if (unicodeStrVector) {
+		for (uint32_t i = 0; i < unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(unicodeStrVector, i));
+		}
+		as_vector_destroy(unicodeStrVector);
+	}
+
+	POOL_DESTROY(&static_pool);
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	cf_free(ops);
+	cf_free(records);
+	cf_free(statuses);
+	as_batch_destroy(&batch);
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_results;
+}
@@ -0,0 +1,672 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_operations.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "operate.h"
+#include "policy.h"
+
+enum batch_read_async_type {
+	BATCH_READ_ASYNC_GET,
+	BATCH_READ_ASYNC_EXISTS,
+	BATCH_READ_ASYNC_GET_OPS
+};
+
+// Struct for Python User-Data for the Listener
+typedef struct {
+	enum batch_read_async_type type;
+	// Created with as_batch_read_create(), the C client only borrows it.
+	as_batch_read_records *records;
+	// The records, operations and their values are read again when a batch
+	// is retried, so they have to live until the listener runs.
+	as_operations *ops;
+	as_static_pool *static_pool;
+	as_vector *unicodeStrVector;
+} BatchReadAsync;
+
+static void batch_read_async_destroy(void *udata)
+{
+	BatchReadAsync *data = (BatchReadAsync *)udata;
+
+	if (data->records) {
+		as_batch_read_destroy(data->records);
+	}
+
+	if (data->ops) {
+		as_operations_destroy(data->ops);
+		cf_free(data->ops);
+	}
+
+	if (data->unicodeStrVector) {
+		for (unsigned int i = 0; i < data->unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(data->unicodeStrVector, i));
+		}
+		as_vector_destroy(data->unicodeStrVector);
+	}
+
+	if (data->static_pool) {
+		POOL_DESTROY(data->static_pool);
+		cf_free(data->static_pool);
+	}
+
+	cf_free(data);
+}
+
+/**
+ *******************************************************************************************************
+ * Builds the exists_many() result, a list of (key, meta) tuples with meta
+ * None for records which were not found.
+ *******************************************************************************************************
+ */
+static as_status batch_exists_records_to_pyobject(as_error *err,
+												  as_batch_read_records *records,
+												  PyObject **py_recs)
+{
+	as_vector *list = &records->list;
+
+	*py_recs = PyList_New(list->size);
+	if (!*py_recs) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Failed to allocate return list of records");
+	}
+
+	for (uint32_t i = 0; i < list->size; i++) {
+		as_batch_read_record *record = as_vector_get(list, i);
+		PyObject *py_key = NULL;
+		PyObject *py_meta = NULL;
+
+		key_to_pyobject(err, &record->key, &py_key);
+		if (record->result == AEROSPIKE_OK) {
+			metadata_to_pyobject(err, &record->record, &py_meta);
+		}
+
+		PyObject *py_rec = Py_BuildValue("OO", py_key ? py_key : Py_None,
+										 py_meta ? py_meta : Py_None);
+		Py_XDECREF(py_key);
+		Py_XDECREF(py_meta);
+
+		if (!py_rec) {
+			Py_CLEAR(*py_recs);
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Failed to create metadata tuple");
+		}
+		PyList_SET_ITEM(*py_recs, i, py_rec);
+	}
+
+	return as_error_reset(err);
+}
+
+/**
+ *******************************************************************************************************
+ * Builds the batch_get_ops() result: the error tuple of the batch followed
+ * by a (record, error, exception) tuple per key.
+ *******************************************************************************************************
+ */
+static as_status batch_get_ops_records_to_pyobject(AerospikeClient *self,
+												   as_error *err,
+												   as_batch_read_records *records,
+												   PyObject **py_recs)
+{
+	as_vector *list = &records->list;
+	as_error record_err;
+	PyObject *py_err = NULL;
+
+	*py_recs = PyList_New(0);
+	if (!*py_recs) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Failed to allocate return list of records");
+	}
+
+	error_to_pyobject(err, &py_err);
+	PyList_Append(*py_recs, py_err);
+	Py_DECREF(py_err);
+
+	for (uint32_t i = 0; i < list->size; i++) {
+		as_batch_read_record *record = as_vector_get(list, i);
+		PyObject *py_rec = NULL;
+		PyObject *py_exception = NULL;
+
+		as_error_init(&record_err);
+		if (record->result == AEROSPIKE_OK) {
+			record_to_resultpyobject(self, &record_err, &record->record,
+									 &py_rec);
+		}
+		else {
+			as_error_update(&record_err, record->result, NULL);
+		}
+
+		if (record_err.code == AEROSPIKE_OK) {
+			py_exception = Py_None;
+		}
+		else {
+			Py_CLEAR(py_rec);
+			py_exception = raise_exception(&record_err);
+		}
+		if (!py_rec) {
+			Py_INCREF(Py_None);
+			py_rec = Py_None;
+		}
+		error_to_pyobject(&record_err, &py_err);
+
+		PyObject *py_result = Py_BuildValue("NNO", py_rec, py_err, py_exception);
+		if (!py_result || PyList_Append(*py_recs, py_result) != 0) {
+			Py_XDECREF(py_result);
+			Py_CLEAR(*py_recs);
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Failed to add record tuple to return list");
+		}
+		Py_DECREF(py_result);
+	}
+
+	return AEROSPIKE_OK;
+}
+
+static PyObject *batch_read_async_convert(AsyncCommand *cmd, as_error *err,
+										   void *result)
+{
+	PyObject *py_recs = NULL;
+	BatchReadAsync *data = (BatchReadAsync *)cmd->data;
+	as_batch_read_records *records = (as_batch_read_records *)result;
+
+	switch (data->type) {
+	case BATCH_READ_ASYNC_GET:
+		batch_read_records_to_pyobject(cmd->client, err, records, &py_recs);
+		break;
+	case BATCH_READ_ASYNC_EXISTS:
+		batch_exists_records_to_pyobject(err, records, &py_recs);
+		break;
+	case BATCH_READ_ASYNC_GET_OPS:
+		batch_get_ops_records_to_pyobject(cmd->client, err, records, &py_recs);
+		break;
+	}
+
+	return py_recs;
+}
+
+static void batch_read_async_listener(as_error *cmd_error,
+									  as_batch_read_records *records,
+									  void *udata, as_event_loop *event_loop)
+{
+	async_loop_release(event_loop);
+	// The records belong to the command, they are released with it.
+	async_command_done((AsyncCommand *)udata, cmd_error, records);
+}
+
+/**
+ *******************************************************************************************************
+ * Issues an asynchronous batch read. The keys, policy and operations are
+ * converted as the synchronous get_many(), exists_many() and
+ * batch_get_ops() do, and the whole result list is delivered at once.
+ *
+ * @param self                  AerospikeClient object
+ * @param py_callback           Python callable or NULL for an awaitable command
+ * @param type                  Which synchronous command is mirrored
+ * @param py_keys               The list or tuple of keys
+ * @param py_ops                The list of operations, batch_get_ops only
+ * @param py_meta               The metadata for the operations
+ * @param py_policy             The batch policy dict
+ *
+ * Returns None or the future. In case of error, appropriate exceptions
+ * will be raised.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Batch_Read_Async_Invoke(
+	AerospikeClient *self, PyObject *py_callback,
+	enum batch_read_async_type type, PyObject *py_keys, PyObject *py_ops,
+	PyObject *py_meta, PyObject *py_policy)
+{
+	PyObject *py_result = NULL;
+	PyObject *py_keys_fast = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	long operation;
+	long return_type = -1;
+
+	as_policy_batch policy;
+	as_policy_batch *batch_policy_p = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_event_loop *event_loop = NULL;
+	BatchReadAsync *data = NULL;
+
+	AsyncCommand *cmd = async_command_new(self, &err, py_callback, true);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+	Py_INCREF(py_keys);
+	cmd->py_keys = py_keys;
+
+	data = cf_malloc(sizeof(BatchReadAsync));
+	memset(data, 0, sizeof(BatchReadAsync));
+	data->type = type;
+	cmd->data = data;
+	cmd->data_destroy = batch_read_async_destroy;
+	cmd->convert = batch_read_async_convert;
+
+	if (type == BATCH_READ_ASYNC_GET_OPS) {
+		if (!PyList_Check(py_keys) || !py_ops || !PyList_Check(py_ops)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"batch_get_ops keys/ops should be of type list");
+			goto CLEANUP;
+		}
+	}
+	else if (!PyList_Check(py_keys) && !PyTuple_Check(py_keys)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Keys should be specified as a list or tuple.");
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_batch
+	if (pyobject_to_policy_batch(self, &err, py_policy, &policy,
+								 &batch_policy_p,
+								 &self->as->config.policies.batch,
+								 &predexp_list, &predexp_list_p, &exp_list,
+								 &exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (type == BATCH_READ_ASYNC_GET_OPS) {
+		Py_ssize_t ops_size = PyList_Size(py_ops);
+
+		data->ops = cf_malloc(sizeof(as_operations));
+		as_operations_init(data->ops, (uint16_t)ops_size);
+		data->unicodeStrVector = as_vector_create(sizeof(char *), 128);
+		data->static_pool = cf_malloc(sizeof(as_static_pool));
+		memset(data->static_pool, 0, sizeof(as_static_pool));
+
+		if (py_meta) {
+			if (check_for_meta(py_meta, data->ops, &err) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+		}
+
+		for (Py_ssize_t i = 0; i < ops_size; i++) {
+			PyObject *py_val = PyList_GetItem(py_ops, i);
+
+			if (PyDict_Check(py_val)) {
+				if (add_op(self, &err, py_val, data->unicodeStrVector,
+						   data->static_pool, data->ops, &operation,
+						   &return_type) != AEROSPIKE_OK) {
+					goto CLEANUP;
+				}
+			}
+		}
+	}
+
+	py_keys_fast = PySequence_Fast(py_keys, "Keys should be a list or tuple");
+	if (!py_keys_fast) {
+		PyErr_Clear();
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Keys should be specified as a list or tuple.");
+		goto CLEANUP;
+	}
+
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_keys_fast);
+	data->records = as_batch_read_create((uint32_t)size);
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_key = PySequence_Fast_GET_ITEM(py_keys_fast, i);
+
+		if (!PyTuple_Check(py_key)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"Key should be a tuple.");
+			goto CLEANUP;
+		}
+
+		as_batch_read_record *record = as_batch_read_reserve(data->records);
+
+		if (pyobject_to_key(&err, py_key, &record->key) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+
+		switch (type) {
+		case BATCH_READ_ASYNC_GET:
+			record->read_all_bins = true;
+			break;
+		case BATCH_READ_ASYNC_EXISTS:
+			// Neither bins nor operations, only the record header is read.
+			break;
+		case BATCH_READ_ASYNC_GET_OPS:
+			// Sharing one as_operations lets the C client encode it once
+			// for consecutive keys.
+			record->ops = data->ops;
+			break;
+		}
+	}
+
+	if (async_loop_acquire(self, &err, py_policy, NULL, &event_loop) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = async_command_result(cmd);
+
+	as_status status;
+	Py_BEGIN_ALLOW_THREADS
+	status = aerospike_batch_read_async(self->as, &err, batch_policy_p,
+										data->records,
+										batch_read_async_listener, cmd,
+										event_loop);
+	Py_END_ALLOW_THREADS
+	if (status != AEROSPIKE_OK) {
+		// The listener is not called when queueing fails.
+		async_loop_release(event_loop);
+		Py_CLEAR(py_result);
+		goto CLEANUP;
+	}
+
+	// cmd now belongs to the listener.
+	cmd = NULL;
+
+CLEANUP:
+	Py_XDECREF(py_keys_fast);
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	async_command_destroy(cmd);
+
+	if (err.code != AEROSPIKE_OK) {
+		return async_command_raise(&err, py_keys);
+	}
+
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Gets a batch of records, delivering the list of records to a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (records, error, exception).
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Get_Many_Async(AerospikeClient *self, PyObject *args,
+										 PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_keys = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"get_many_callback", "keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:get_many_async", kwlist,
+									&py_callback, &py_keys,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Batch_Read_Async_Invoke(
+		self, py_callback, BATCH_READ_ASYNC_GET, py_keys, NULL, NULL,
+		py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Gets a batch of records without blocking the calling asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to the list of records.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Get_Many_Aio(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_keys = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get_many_aio", kwlist,
+									&py_keys, &py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "get_many_aio", args, kwds,
+							   &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Batch_Read_Async_Invoke(
+		self, NULL, BATCH_READ_ASYNC_GET, py_keys, NULL, NULL, py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Checks whether a batch of records exists, delivering the list of
+ * (key, meta) tuples to a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (records, error, exception).
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Exists_Many_Async(AerospikeClient *self,
+											PyObject *args, PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_keys = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"exists_many_callback", "keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:exists_many_async",
+									kwlist, &py_callback, &py_keys,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Batch_Read_Async_Invoke(
+		self, py_callback, BATCH_READ_ASYNC_EXISTS, py_keys, NULL, NULL,
+		py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Checks whether a batch of records exists without blocking the calling
+ * asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to the list of (key, meta) tuples.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Exists_Many_Aio(AerospikeClient *self,
+										  PyObject *args, PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_keys = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:exists_many_aio", kwlist,
+									&py_keys, &py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "exists_many_aio", args, kwds,
+							   &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Batch_Read_Async_Invoke(
+		self, NULL, BATCH_READ_ASYNC_EXISTS, py_keys, NULL, NULL, py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Applies read operations to a batch of records, delivering the results to
+ * a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (results, error, exception).
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_GetOps_Async(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_keys = NULL;
+	PyObject *py_ops = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"batch_get_ops_callback", "keys", "list", "meta",
+							 "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:batch_get_ops_async",
+									kwlist, &py_callback, &py_keys, &py_ops,
+									&py_meta, &py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Batch_Read_Async_Invoke(
+		self, py_callback, BATCH_READ_ASYNC_GET_OPS, py_keys, py_ops, py_meta,
+		py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Applies read operations to a batch of records without blocking the
+ * calling asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to the same list as batch_get_ops().
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_GetOps_Aio(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_keys = NULL;
+	PyObject *py_ops = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"keys", "list", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:batch_get_ops_aio",
+									kwlist, &py_keys, &py_ops, &py_meta,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "batch_get_ops_aio", args, kwds,
+							   &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Batch_Read_Async_Invoke(
+		self, NULL, BATCH_READ_ASYNC_GET_OPS, py_keys, py_ops, py_meta,
+		py_policy);
+}
@@ -0,0 +1,149 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+
+#include "batch_task.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+static as_status batch_remove_record(aerospike *as, as_error *err, as_key *key,
+									 uint32_t index, void *udata)
+{
+	return aerospike_key_remove(as, err, (as_policy_remove *)udata, key);
+}
+
+/**
+ *******************************************************************************************************
+ * Removes records from the Aerospike DB. The keys are grouped by the node
+ * owning them and the nodes are worked on in parallel.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list holding the status code of every key, in input order.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_Remove(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_keys = NULL;
+	PyObject *py_policy = NULL;
+	PyObject *py_results = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_remove remove_policy;
+	as_policy_remove *remove_policy_p = NULL;
+	as_batch batch;
+	as_status *statuses = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"keys", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:batch_remove", kwlist,
+									&py_keys, &py_policy) == false) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+	as_batch_init(&batch, 0);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_remove
+	if (pyobject_to_policy_remove(
+			self, &err, py_policy, &remove_policy, &remove_policy_p,
+			&self->as->config.policies.remove, &predexp_list,
+			&predexp_list_p, &exp_list, &exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_batch_keys(&err, py_keys, &batch) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	uint32_t size = batch.keys.size;
+	statuses = cf_malloc(sizeof(as_status) * size + 1);
+	if (!statuses) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the batch results.");
+		goto CLEANUP;
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	batch_task_execute(self->as, &batch, batch_remove_record, remove_policy_p,
+					   statuses);
+	Py_END_ALLOW_THREADS
+
+	py_results = PyList_New(size);
+	for (uint32_t i = 0; py_results && i < size; i++) {
+		PyList_SET_ITEM(py_results, i, PyLong_FromLong(statuses[i]));
+	}
+
+CLEANUP:
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	cf_free(statuses);
+	as_batch_destroy(&batch);
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_results;
+}
@@ -0,0 +1,258 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "batch_task.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+// User data of the per record write command.
+typedef struct {
+	as_policy_write *policy;
+	as_record *records;
+} BatchWriteData;
+
+static as_status batch_write_record(aerospike *as, as_error *err, as_key *key,
+									uint32_t index, void *udata)
+{
+	BatchWriteData *data = (BatchWriteData *)udata;
+	return aerospike_key_put(as, err, data->policy, key, &data->records[index]);
+}
+
+/**
+ *******************************************************************************************************
+ * Converts a list of (key, bins[, meta]) tuples into the batch keys and the
+ * records to write. The bytes of the records are taken from static_pool.
+ *
+ * @param self                  AerospikeClient object
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ * @param py_records            The list of record tuples.
+ * @param batch                 The batch receiving the keys.
+ * @param records               The records, one per key.
+ * @param n_records             Set to the number of records initialised.
+ * @param static_pool           The pool of the bytes of all the records.
+ * @param serializer_option     The serializer for unsupported types.
+ *******************************************************************************************************
+ */
+static as_status batch_write_records_convert(AerospikeClient *self,
+											 as_error *err,
+											 PyObject *py_records,
+											 as_batch *batch, as_record *records,
+											 uint32_t *n_records,
+											 as_static_pool *static_pool,
+											 long serializer_option)
+{
+	Py_ssize_t size = PyList_Size(py_records);
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_record = PyList_GetItem(py_records, i);
+		PyObject *py_meta = NULL;
+
+		if (!PyTuple_Check(py_record) || PyTuple_Size(py_record) < 2 ||
+			PyTuple_Size(py_record) > 3) {
+			return as_error_update(
+				err, AEROSPIKE_ERR_PARAM,
+				"Record should be a tuple of (key, bins[, meta]).");
+		}
+		if (PyTuple_Size(py_record) == 3) {
+			py_meta = PyTuple_GetItem(py_record, 2);
+		}
+
+		if (pyobject_to_key(err, PyTuple_GetItem(py_record, 0),
+							as_batch_keyat(batch, (uint32_t)i)) !=
+			AEROSPIKE_OK) {
+			return err->code;
+		}
+
+		as_record_init(&records[i], 0);
+		*n_records = (uint32_t)i + 1;
+
+		if (pyobject_to_record(self, err, PyTuple_GetItem(py_record, 1),
+							   py_meta, &records[i], serializer_option,
+							   static_pool) != AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+
+	return AEROSPIKE_OK;
+}
+
+/**
+ *******************************************************************************************************
+ * Writes records to the Aerospike DB. The records are grouped by the node
+ * owning them and the nodes are written to in parallel.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a list holding the status code of every record, in input order.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_Write(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_records = NULL;
+	PyObject *py_policy = NULL;
+	PyObject *py_serializer_option = NULL;
+	PyObject *py_results = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_write write_policy;
+	as_policy_write *write_policy_p = NULL;
+	as_batch batch;
+	as_record *records = NULL;
+	as_status *statuses = NULL;
+	uint32_t n_records = 0;
+	long serializer_option = SERIALIZER_PYTHON;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"records", "policy", "serializer", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:batch_write", kwlist,
+									&py_records, &py_policy,
+									&py_serializer_option) == false) {
+		return NULL;
+	}
+
+	as_error_init(&err);
+	as_batch_init(&batch, 0);
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_records)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Records should be a list of tuples.");
+		goto CLEANUP;
+	}
+
+	if (py_serializer_option) {
+		if (PyLong_Check(py_serializer_option)) {
+			self->is_client_put_serializer = true;
+			serializer_option = PyLong_AsLong(py_serializer_option);
+		}
+	}
+	else {
+		self->is_client_put_serializer = false;
+	}
+
+	// Convert python policy object to as_policy_write
+	if (pyobject_to_policy_write(
+			self, &err, py_policy, &write_policy, &write_policy_p,
+			&self->as->config.policies.write, &predexp_list, &predexp_list_p,
+			&exp_list, &exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	uint32_t size = (uint32_t)PyList_Size(py_records);
+	as_batch_init(&batch, size);
+	if (size > 0) {
+		// Keys past a conversion error are destroyed untouched.
+		memset(batch.keys.entries, 0, sizeof(as_key) * size);
+	}
+
+	records = cf_malloc(sizeof(as_record) * size + 1);
+	statuses = cf_malloc(sizeof(as_status) * size + 1);
+	if (!records || !statuses) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the batch records.");
+		goto CLEANUP;
+	}
+
+	if (batch_write_records_convert(self, &err, py_records, &batch, records,
+									&n_records, &static_pool,
+									serializer_option) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	BatchWriteData data = {.policy = write_policy_p, .records = records};
+
+	Py_BEGIN_ALLOW_THREADS
+	batch_task_execute(self->as, &batch, batch_write_record, &data, statuses);
+	Py_END_ALLOW_THREADS
+
+	py_results = PyList_New(size);
+	for (uint32_t i = 0; py_results && i < size; i++) {
+		PyList_SET_ITEM(py_results, i, PyLong_FromLong(statuses[i]));
+	}
+
+CLEANUP:
+	for (uint32_t i = 0; i < n_records; i++) {
+		as_record_destroy(&records[i]);
+	}
+
+	POOL_DESTROY(&static_pool);
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	cf_free(records);
+	cf_free(statuses);
+	as_batch_destroy(&batch);
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_results;
+}
@@ -0,0 +1,250 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+static PyObject *exists_async_convert(AsyncCommand *cmd, as_error *err,
+									   void *result)
+{
+	PyObject *py_result_key = NULL;
+	PyObject *py_result_meta = NULL;
+	as_record *record = (as_record *)result;
+
+	if (record) {
+		metadata_to_pyobject(err, record, &py_result_meta);
+	}
+	else {
+		Py_INCREF(Py_None);
+		py_result_meta = Py_None;
+	}
+
+	if (err->code == AEROSPIKE_OK) {
+		key_to_pyobject(err, &cmd->key, &py_result_key);
+	}
+
+	if (err->code != AEROSPIKE_OK) {
+		Py_XDECREF(py_result_key);
+		Py_XDECREF(py_result_meta);
+		return NULL;
+	}
+
+	PyObject *py_result = PyTuple_New(2);
+	PyTuple_SetItem(py_result, 0, py_result_key);
+	PyTuple_SetItem(py_result, 1, py_result_meta);
+	return py_result;
+}
+
+static void exists_async_listener(as_error *cmd_error, as_record *record,
+								  void *udata, as_event_loop *event_loop)
+{
+	// A missing record is not an error, as with the synchronous exists.
+	if (cmd_error && cmd_error->code == AEROSPIKE_ERR_RECORD_NOT_FOUND) {
+		cmd_error = NULL;
+		record = NULL;
+	}
+
+	async_record_listener(cmd_error, record, udata, event_loop);
+}
+
+/**
+ *******************************************************************************************************
+ * Issues an asynchronous exists. The policy is converted exactly as the
+ * synchronous exists does.
+ *
+ * @param self                  AerospikeClient object
+ * @param py_callback           Python callable or NULL for an awaitable exists
+ * @param py_key                The key tuple
+ * @param py_policy             The read policy dict
+ *
+ * Returns None or the future. In case of error, appropriate exceptions
+ * will be raised.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Exists_Async_Invoke(AerospikeClient *self,
+													 PyObject *py_callback,
+													 PyObject *py_key,
+													 PyObject *py_policy)
+{
+	PyObject *py_result = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	as_policy_read read_policy;
+	as_policy_read *read_policy_p = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_event_loop *event_loop = NULL;
+
+	AsyncCommand *cmd = async_command_new(self, &err, py_callback, true);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+	cmd->convert = exists_async_convert;
+
+	if (pyobject_to_key(&err, py_key, &cmd->key) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_policy_read(self, &err, py_policy, &read_policy,
+								&read_policy_p,
+								&self->as->config.policies.read, &predexp_list,
+								&predexp_list_p, &exp_list,
+								&exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (async_loop_acquire(self, &err, py_policy, &cmd->key, &event_loop) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = async_command_result(cmd);
+
+	as_status status;
+	Py_BEGIN_ALLOW_THREADS
+	status = aerospike_key_exists_async(self->as, &err, read_policy_p,
+										&cmd->key, exists_async_listener, cmd,
+										event_loop, NULL);
+	Py_END_ALLOW_THREADS
+	if (status != AEROSPIKE_OK) {
+		async_loop_release(event_loop);
+		Py_CLEAR(py_result);
+		goto CLEANUP;
+	}
+
+	// cmd now belongs to the listener.
+	cmd = NULL;
+
+CLEANUP:
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	async_command_destroy(cmd);
+
+	if (err.code != AEROSPIKE_OK) {
+		return async_command_raise(&err, py_key);
+	}
+
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Checks whether a record exists, delivering the outcome to a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (key, (key, meta), error, exception)
+ * with meta None when the record does not exist.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Exists_Async(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"exists_callback", "key", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:exists_async", kwlist,
+									&py_callback, &py_key,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Exists_Async_Invoke(self, py_callback, py_key,
+											   py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Checks whether a record exists without blocking the calling asyncio event
+ * loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to (key, meta), meta is None when the
+ * record does not exist.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Exists_Aio(AerospikeClient *self, PyObject *args,
+									 PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_key = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:exists_aio", kwlist,
+									&py_key, &py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "exists_aio", args, kwds, &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Exists_Async_Invoke(self, NULL, py_key, py_policy);
+}
@@ -22,150 +22,143 @@
 #include <aerospike/as_error.h>
 #include <aerospike/as_record.h>
 
+#include "async.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
 
-// Struct for Python User-Data for the Callback
-typedef struct {
-	as_key key;
-	as_error error;
-	PyObject *callback;
-	AerospikeClient *client;
-	as_policy_read read_policy;
-	as_policy_read *read_policy_p;
-} LocalData;
+static PyObject *get_async_convert(AsyncCommand *cmd, as_error *err,
+								   void *result)
+{
+	PyObject *py_rec = NULL;
+	record_to_pyobject(cmd->client, err, (as_record *)result, &cmd->key,
+					   &py_rec);
+	return py_rec;
+}
 
-LocalData *async_cb_create(void) { return cf_malloc(sizeof(LocalData)); }
+static PyObject *get_async_digest_convert(AsyncCommand *cmd, as_error *err,
+										  void *result)
+{
+	PyObject *py_rec = get_async_convert(cmd, err, result);
+
+	if (py_rec) {
+		// This is a special case.
+		// C-client returns NULL key, so to the user
+		// response will be (<ns>, <set>, None, <digest>)
+		// Using the same input key, just making primary key part to be None
+		// Only in case of POLICY_KEY_DIGEST or no policy specified
+		PyObject *p_key = PyTuple_GetItem(py_rec, 0);
+		Py_INCREF(Py_None);
+		PyTuple_SetItem(p_key, 2, Py_None);
+	}
 
-void async_cb_destroy(LocalData *uData) { cf_free(uData); }
+	return py_rec;
+}
 
-void read_async_callback_helper(as_error *cmd_error, as_record *record,
-								void *udata, as_event_loop *event_loop, int cb)
+/**
+ *******************************************************************************************************
+ * Issues an asynchronous get. The outcome is delivered either to py_callback
+ * or, when py_callback is NULL, to an asyncio future which is returned.
+ *
+ * @param self                  AerospikeClient object
+ * @param py_callback           Python callable or NULL for an awaitable get
+ * @param py_key                The key tuple
+ * @param py_policy             The read policy dict
+ *
+ * Returns None or the future. In case of error, appropriate exceptions
+ * will be raised.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Get_Async_Invoke(AerospikeClient *self,
+												  PyObject *py_callback,
+												  PyObject *py_key,
+												  PyObject *py_policy)
 {
-	PyObject *py_rec = NULL;
-	PyObject *py_return = NULL;
-	PyObject *py_arglist = NULL;
-	PyObject *py_err = NULL;
-	as_error *error = NULL;
-	as_error temp_error;
-	PyObject *py_key = NULL;
-	PyObject *py_exception = NULL;
+	PyObject *py_result = NULL;
 
-	// Extract callback user-data
-	LocalData *data = (LocalData *)udata;
-	PyObject *py_callback = data->callback;
+	as_error err;
+	as_error_init(&err);
 
-	error = &data->error;
-	if (cmd_error) {
-		error = cmd_error;
-	}
+	as_policy_read read_policy;
+	as_policy_read *read_policy_p = NULL;
 
-	// Lock Python State
-	PyGILState_STATE gstate;
-	if (cb) {
-		gstate = PyGILState_Ensure();
-	}
-	error_to_pyobject(error, &py_err);
-	// Convert as_key to python key object
-	key_to_pyobject(&temp_error, &data->key, &py_key);
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
 
-	if (error->code == AEROSPIKE_OK) {
+	as_event_loop *event_loop = NULL;
 
-		if (record_to_pyobject(data->client, &temp_error, record, &data->key,
-							   &py_rec) != AEROSPIKE_OK) {
-			as_error_copy(error, &temp_error);
-		}
+	AsyncCommand *cmd = async_command_new(self, &err, py_callback, true);
+	if (!cmd) {
+		goto CLEANUP;
 	}
 
-	if (error->code == AEROSPIKE_OK) {
-		if (py_rec && (!data->read_policy_p ||
-					   (data->read_policy_p &&
-						data->read_policy_p->key == AS_POLICY_KEY_DIGEST))) {
-			// This is a special case.
-			// C-client returns NULL key, so to the user
-			// response will be (<ns>, <set>, None, <digest>)
-			// Using the same input key, just making primary key part to be None
-			// Only in case of POLICY_KEY_DIGEST or no policy specified
-			PyObject *p_key = PyTuple_GetItem(py_rec, 0);
-			Py_INCREF(Py_None);
-			PyTuple_SetItem(p_key, 2, Py_None);
-		}
+	// Convert python key object to as_key
+	if (pyobject_to_key(&err, py_key, &cmd->key) != AEROSPIKE_OK) {
+		goto CLEANUP;
 	}
 
-	if (error->code != AEROSPIKE_OK) {
-		py_exception = raise_exception(error);
-		if (PyObject_HasAttrString(py_exception, "key")) {
-			PyObject_SetAttrString(py_exception, "key", py_key);
-		}
-		if (PyObject_HasAttrString(py_exception, "bin")) {
-			PyObject_SetAttrString(py_exception, "bin", Py_None);
-		}
-		if (!cb) {
-			PyErr_SetObject(py_exception, py_err);
-			Py_DECREF(py_err);
-		}
+	// Convert python policy object to as_policy_read
+	if (pyobject_to_policy_read(self, &err, py_policy, &read_policy,
+								&read_policy_p,
+								&self->as->config.policies.read, &predexp_list,
+								&predexp_list_p, &exp_list,
+								&exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
 	}
 
-	if (cb) {
-		// Build Python Function Arguments
-		py_arglist = PyTuple_New(4);
-
-		if (!py_rec) {
-			Py_INCREF(Py_None);
-			py_rec = Py_None;
-		}
-
-		if (!py_exception) {
-			Py_INCREF(Py_None);
-			py_exception = Py_None;
-		}
-
-		PyTuple_SetItem(py_arglist, 0, py_key); //0-key tuple (ns, set, key, hash)
-		PyTuple_SetItem(py_arglist, 1, py_rec); //1-record tuple (key-tuple, meta, bin)
-		PyTuple_SetItem(py_arglist, 2, py_err); //2-error tuple
-		PyTuple_SetItem(py_arglist, 3, py_exception); //3-exception
-		
-		// Invoke Python Callback
-		py_return = PyObject_Call(py_callback, py_arglist, NULL);
-
-		// Release Python Function Arguments
-		Py_DECREF(py_arglist);
-
-		// handle return value
-		if (!py_return) {
-			// an exception was raised, handle it (someday)
-			// for now, we bail from the loop
-			as_error_update(error, AEROSPIKE_ERR_CLIENT,
-							"read_async_callback function raised an exception");
-		}
-		else {
-			Py_DECREF(py_return);
-		}
+	if (!read_policy_p || read_policy_p->key == AS_POLICY_KEY_DIGEST) {
+		cmd->convert = get_async_digest_convert;
+	}
+	else {
+		cmd->convert = get_async_convert;
 	}
 
-	if (record) {
-		as_record_destroy(record);
+	if (async_loop_acquire(self, &err, py_policy, &cmd->key, &event_loop) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = async_command_result(cmd);
+
+	// Invoke operation
+	as_status status;
+	Py_BEGIN_ALLOW_THREADS
+	status = aerospike_key_get_async(self->as, &err, read_policy_p, &cmd->key,
+									 async_record_listener, cmd, event_loop,
+									 NULL);
+	Py_END_ALLOW_THREADS
+	if (status != AEROSPIKE_OK) {
+		async_loop_release(event_loop);
+		Py_CLEAR(py_result);
+		goto CLEANUP;
 	}
 
-	if (udata) {
-		as_key_destroy(&data->key);
-		//todo: dont free cb data in case of retry logic
-		async_cb_destroy(udata);
+	// cmd now belongs to the listener.
+	cmd = NULL;
+
+CLEANUP:
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
 	}
 
-	if (cb) {
-		PyGILState_Release(gstate);
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
 	}
 
-	return;
-}
+	async_command_destroy(cmd);
 
-void read_async_callback(as_error *error, as_record *record, void *udata,
-						 as_event_loop *event_loop)
-{
-	read_async_callback_helper(error, record, udata, event_loop, 1);
+	if (err.code != AEROSPIKE_OK) {
+		return async_command_raise(&err, py_key);
+	}
+
+	return py_result;
 }
 
 /**
@@ -189,15 +182,7 @@ PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
 	PyObject *py_key = NULL;
 	PyObject *py_policy = NULL;
 
-	if (!async_support) {
-		as_error err;
-		as_error_init(&err);
-		as_error_update(&err, AEROSPIKE_ERR, "Support for async is disabled, build software with async option");
-		PyObject *py_err = NULL, *exception_type = NULL;
-		error_to_pyobject(&err, &py_err);
-		exception_type = raise_exception(&err);
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+	if (!async_check_support()) {
 		return NULL;
 	}
 
@@ -211,77 +196,48 @@ PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
-	// Create and initialize callback user-data
-	LocalData *uData = async_cb_create();
-	uData->callback = py_callback;
-	uData->client = self;
-	uData->read_policy_p = NULL;
-	memset(&uData->key, 0, sizeof(uData->key));
-	as_error_init(&uData->error);
-
-	// For converting expressions.
-	as_exp exp_list;
-	as_exp *exp_list_p = NULL;
-
-	// For converting predexp.
-	as_predexp_list predexp_list;
-	as_predexp_list *predexp_list_p = NULL;
-
-	as_status status = AEROSPIKE_OK;
-
-	if (!self || !self->as) {
-		as_error_update(&uData->error, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
-		goto CLEANUP;
-	}
-
-	if (!self->is_conn_16) {
-		as_error_update(&uData->error, AEROSPIKE_ERR_CLUSTER,
-						"No connection to aerospike cluster");
-		goto CLEANUP;
-	}
-
-	// Convert python key object to as_key
-	pyobject_to_key(&uData->error, py_key, &uData->key);
-	if (uData->error.code != AEROSPIKE_OK) {
-		goto CLEANUP;
-	}
-
-	// Convert python policy object to as_policy_exists
-	pyobject_to_policy_read(self, &uData->error, py_policy, &uData->read_policy,
-							&uData->read_policy_p,
-							&self->as->config.policies.read, &predexp_list,
-							&predexp_list_p, &exp_list, &exp_list_p);
-	if (uData->error.code != AEROSPIKE_OK) {
-		goto CLEANUP;
-	}
-
-	// Invoke operation
-	Py_BEGIN_ALLOW_THREADS
-	status = aerospike_key_get_async(uData->client->as, &uData->error,
-									 uData->read_policy_p, &uData->key,
-									 read_async_callback, uData, NULL, NULL);
-	Py_END_ALLOW_THREADS
-	if (status != AEROSPIKE_OK || uData->error.code != AEROSPIKE_OK) {
-		goto CLEANUP;
-	}
+	return AerospikeClient_Get_Async_Invoke(self, py_callback, py_key,
+											py_policy);
+}
 
-CLEANUP:
+/**
+ *******************************************************************************************************
+ * Gets a record from the Aerospike DB without blocking the calling asyncio
+ * event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to a tuple of key, meta and bins.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Get_Aio(AerospikeClient *self, PyObject *args,
+								  PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_key = NULL;
+	PyObject *py_policy = NULL;
 
-	if (exp_list_p) {
-		as_exp_destroy(exp_list_p);
+	if (!async_check_support()) {
+		return NULL;
 	}
 
-	if (predexp_list_p) {
-		as_predexp_list_destroy(&predexp_list);
-	}
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "policy", NULL};
 
-	if (status != AEROSPIKE_OK || uData->error.code != AEROSPIKE_OK) {
-		//todo does raising exception alone or need cab to python?
-		read_async_callback_helper(&uData->error, NULL, uData, NULL, 0);
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:get_aio", kwlist, &py_key,
+									&py_policy) == false) {
 		return NULL;
 	}
 
-	Py_INCREF(Py_None);
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "get_aio", args, kwds, &py_deferred)) {
+		return py_deferred;
+	}
 
-	return Py_None;
+	return AerospikeClient_Get_Async_Invoke(self, NULL, py_key, py_policy);
 }
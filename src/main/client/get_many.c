@@ -15,6 +15,7 @@
  ******************************************************************************/
 
 #include <Python.h>
+#include <pthread.h>
 #include <stdbool.h>
 
 #include <aerospike/aerospike_key.h>
@@ -24,13 +25,137 @@
 #include <aerospike/as_record.h>
 #include <aerospike/as_batch.h>
 
+#include "batch_task.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "record.h"
+#include "prepared_policy.h"
 
 #define MAX_STACK_ALLOCATION 4000
 
+// User data of the sub-batches of a chunked get_many.
+typedef struct {
+	as_policy_batch *policy;
+	as_batch_read_records *records;
+	// The errors of the failed sub-batches, guarded by lock, and for each
+	// record 1 + the index of the error it failed with, or 0.
+	pthread_mutex_t lock;
+	as_vector errors;
+	uint32_t *record_errors;
+} GetManyChunks;
+
+/**
+ *******************************************************************************************************
+ * Reads one sub-batch of a chunked get_many. The records at offsets are
+ * moved into a batch of their own and moved back once read. When the
+ * sub-batch fails, its error is kept for each of its records without a
+ * result, so the other sub-batches are not affected.
+ *******************************************************************************************************
+ */
+static void get_many_chunk(aerospike *as, const uint32_t *offsets,
+						   uint32_t n_offsets, void *udata)
+{
+	GetManyChunks *chunks = (GetManyChunks *)udata;
+	as_batch_read_records sub;
+	as_error err;
+
+	as_error_init(&err);
+	as_batch_read_init(&sub, n_offsets);
+
+	for (uint32_t i = 0; i < n_offsets; i++) {
+		as_batch_read_record *record = as_batch_read_reserve(&sub);
+		memcpy(record, as_vector_get(&chunks->records->list, offsets[i]),
+			   sizeof(as_batch_read_record));
+	}
+
+	aerospike_batch_read(as, &err, chunks->policy, &sub);
+
+	uint32_t error_index = 0;
+	if (err.code != AEROSPIKE_OK) {
+		pthread_mutex_lock(&chunks->lock);
+		as_vector_append(&chunks->errors, &err);
+		error_index = chunks->errors.size;
+		pthread_mutex_unlock(&chunks->lock);
+	}
+
+	for (uint32_t i = 0; i < n_offsets; i++) {
+		as_batch_read_record *record = as_vector_get(&sub.list, i);
+		// Unanswered records are indistinguishable from missing ones here.
+		if (err.code != AEROSPIKE_OK && record->result != AEROSPIKE_OK) {
+			record->result = err.code;
+			chunks->record_errors[offsets[i]] = error_index;
+		}
+		memcpy(as_vector_get(&chunks->records->list, offsets[i]), record,
+			   sizeof(as_batch_read_record));
+	}
+
+	// The keys and records were handed back, only the list is released.
+	as_vector_destroy(&sub.list);
+}
+
+/**
+ *******************************************************************************************************
+ * Puts the exception of every record which failed, rather than not being
+ * found, into the bins of its (key, None, None) result tuple or Record.
+ * A record of a failed sub-batch gets the error of the sub-batch, any other
+ * one an error of its result code.
+ *******************************************************************************************************
+ */
+static as_status get_many_report_failures(AerospikeClient *self,
+										  as_error *err,
+										  as_batch_read_records *records,
+										  GetManyChunks *chunks,
+										  PyObject *py_recs)
+{
+	for (uint32_t i = 0; i < records->list.size; i++) {
+		as_batch_read_record *record = as_vector_get(&records->list, i);
+		if (record->result == AEROSPIKE_OK ||
+			record->result == AEROSPIKE_ERR_RECORD_NOT_FOUND) {
+			continue;
+		}
+
+		as_error record_err;
+		as_error_init(&record_err);
+		uint32_t error_index = chunks->record_errors[i];
+		if (error_index) {
+			as_error_copy(&record_err,
+						  as_vector_get(&chunks->errors, error_index - 1));
+		}
+		else {
+			as_error_update(&record_err, record->result, "%s",
+							as_error_string(record->result));
+		}
+
+		PyObject *py_err = NULL;
+		error_to_pyobject(&record_err, &py_err);
+		PyObject *exception_type = raise_exception(&record_err);
+		PyObject *py_exception = PyObject_Call(exception_type, py_err, NULL);
+		Py_DECREF(py_err);
+		if (!py_exception) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Unable to create the exception of a key");
+		}
+
+		PyObject *py_key = PyTuple_GetItem(PyList_GetItem(py_recs, i), 0);
+		if (PyObject_HasAttrString(py_exception, "key")) {
+			PyObject_SetAttrString(py_exception, "key", py_key);
+		}
+		if (self->result_format == RESULT_FORMAT_RECORD) {
+			Py_INCREF(py_key);
+			PyList_SetItem(py_recs, i,
+						   AerospikeRecord_New(py_key, NULL, py_exception));
+		}
+		else {
+			PyList_SetItem(py_recs, i, Py_BuildValue("ONN", py_key, Py_None,
+													 py_exception));
+		}
+	}
+	return AEROSPIKE_OK;
+}
+
 /**
  *******************************************************************************************************
  * This function will get a batch of records from the Aerospike DB.
@@ -39,6 +164,8 @@
  * @param self                  AerospikeClient object
  * @param py_keys               The list of keys
  * @param batch_policy_p        as_policy_batch object
+ * @param max_batch_size        Split the keys into sub-batches of at most
+ *                              this many keys per node, 0 for no limit.
  *
  * Returns the record if key exists otherwise NULL.
  *******************************************************************************************************
@@ -46,7 +173,8 @@
 static PyObject *batch_get_aerospike_batch_read(as_error *err,
 												AerospikeClient *self,
 												PyObject *py_keys,
-												as_policy_batch *batch_policy_p)
+												as_policy_batch *batch_policy_p,
+												uint32_t max_batch_size)
 {
 	PyObject *py_recs = NULL;
 
@@ -128,6 +256,39 @@ static PyObject *batch_get_aerospike_batch_read(as_error *err,
 		goto CLEANUP;
 	}
 
+	if (max_batch_size > 0 && records.list.size > max_batch_size) {
+		as_policy_batch chunk_policy;
+		as_policy_batch_copy(batch_policy_p ? batch_policy_p
+											: &self->as->config.policies.batch,
+							 &chunk_policy);
+		// The sub-batches already run in parallel on the thread pool.
+		chunk_policy.concurrent = false;
+
+		GetManyChunks chunks = {.policy = &chunk_policy, .records = &records};
+		pthread_mutex_init(&chunks.lock, NULL);
+		as_vector_init(&chunks.errors, sizeof(as_error), 4);
+		chunks.record_errors = cf_calloc(records.list.size, sizeof(uint32_t));
+
+		Py_BEGIN_ALLOW_THREADS
+		batch_task_execute_chunks(
+			self->as, &((as_batch_read_record *)records.list.list)->key,
+			sizeof(as_batch_read_record), records.list.size, max_batch_size,
+			get_many_chunk, &chunks);
+		Py_END_ALLOW_THREADS
+
+		if (batch_read_records_to_pyobject(self, err, &records, &py_recs) ==
+				AEROSPIKE_OK &&
+			get_many_report_failures(self, err, &records, &chunks, py_recs) !=
+				AEROSPIKE_OK) {
+			Py_CLEAR(py_recs);
+		}
+
+		cf_free(chunks.record_errors);
+		as_vector_destroy(&chunks.errors);
+		pthread_mutex_destroy(&chunks.lock);
+		goto CLEANUP;
+	}
+
 	// Invoke C-client API
 	Py_BEGIN_ALLOW_THREADS
 	aerospike_batch_read(self->as, err, batch_policy_p, &records);
@@ -180,6 +341,7 @@ static PyObject *AerospikeClient_Get_Many_Invoke(AerospikeClient *self,
 	as_error err;
 	as_policy_batch policy;
 	as_policy_batch *batch_policy_p = NULL;
+	uint32_t max_batch_size = 0;
 	// Initialize error
 	as_error_init(&err);
 
@@ -210,8 +372,20 @@ static PyObject *AerospikeClient_Get_Many_Invoke(AerospikeClient *self,
 		goto CLEANUP;
 	}
 
-	py_recs =
-		batch_get_aerospike_batch_read(&err, self, py_keys, batch_policy_p);
+	PyObject *py_max = AerospikePolicy_GetItem(py_policy, "max_batch_size");
+	if (py_max && py_max != Py_None) {
+		long value = PyLong_Check(py_max) ? PyLong_AsLong(py_max) : -1;
+		if (value < 0 || value > UINT32_MAX) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"max_batch_size must be a non-negative integer");
+			goto CLEANUP;
+		}
+		max_batch_size = (uint32_t)value;
+	}
+
+	py_recs = batch_get_aerospike_batch_read(&err, self, py_keys,
+											 batch_policy_p, max_batch_size);
 
 CLEANUP:
 
@@ -225,17 +399,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_keys);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_keys, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 
@@ -29,6 +29,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "prepared_operations.h"
 #include "serializer.h"
 #include "geo.h"
 #include "cdt_list_operations.h"
@@ -76,17 +77,7 @@ static inline bool isExprOp(int op);
 
 #define EXCEPTION_ON_ERROR()                                                   \
 	if (err.code != AEROSPIKE_OK) {                                            \
-		PyObject *py_err = NULL;                                               \
-		error_to_pyobject(&err, &py_err);                                      \
-		PyObject *exception_type = raise_exception(&err);                      \
-		if (PyObject_HasAttrString(exception_type, "key")) {                   \
-			PyObject_SetAttrString(exception_type, "key", py_key);             \
-		}                                                                      \
-		if (PyObject_HasAttrString(exception_type, "bin")) {                   \
-			PyObject_SetAttrString(exception_type, "bin", py_bin);             \
-		}                                                                      \
-		PyErr_SetObject(exception_type, py_err);                               \
-		Py_DECREF(py_err);                                                     \
+		raise_exception_base(&err, py_key, py_bin, NULL, NULL, NULL);          \
 		return NULL;                                                           \
 	}
 
@@ -553,7 +544,7 @@ as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
 					return err->code;
 				}
 				as_operations_add_append_rawp(ops, bin, bytes->value,
-											  bytes->size, true);
+											  bytes->size, false);
 			}
 		}
 		else {
@@ -586,7 +577,7 @@ as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
 					return err->code;
 				}
 				as_operations_add_prepend_rawp(ops, bin, bytes->value,
-											   bytes->size, true);
+											   bytes->size, false);
 			}
 		}
 		else {
@@ -855,8 +846,13 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
 
 	as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
 	as_operations ops;
-	Py_ssize_t size = PyList_Size(py_list);
+	Py_ssize_t size = AerospikeOperations_Check(py_list)
+						  ? AerospikeOperations_Size(py_list)
+						  : PyList_Size(py_list);
 	as_operations_inita(&ops, size);
 
 	if (py_policy) {
@@ -868,8 +864,6 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
 		}
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
 	CHECK_CONNECTED(err);
 
 	if (py_meta) {
@@ -878,6 +872,14 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
 		}
 	}
 
+	if (AerospikeOperations_Check(py_list)) {
+		if (AerospikeOperations_Add(self, err, py_list, unicodeStrVector,
+									&static_pool, &ops) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+		size = 0;
+	}
+
 	for (i = 0; i < size; i++) {
 		PyObject *py_val = PyList_GetItem(py_list, i);
 
@@ -931,6 +933,7 @@ CLEANUP:
 	}
 
 	as_operations_destroy(&ops);
+	POOL_DESTROY(&static_pool);
 
 	if (err->code != AEROSPIKE_OK) {
 		PyObject *py_err = NULL;
@@ -983,7 +986,8 @@ PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
 		goto CLEANUP;
 	}
 
-	if (py_list && PyList_Check(py_list)) {
+	if (py_list &&
+		(PyList_Check(py_list) || AerospikeOperations_Check(py_list))) {
 		py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
 												   py_meta, py_policy);
 	}
@@ -998,6 +1002,68 @@ CLEANUP:
 	return py_result;
 }
 
+/**
+ *******************************************************************************************************
+ * Converts the record returned by an ordered operate into the
+ * (key, meta, bins) tuple, with bins as a list of (bin, value) tuples.
+ *
+ * @param self                  AerospikeClient object
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ * @param rec                   The record returned by the operations.
+ * @param key                   The key of the record.
+ * @param py_rec                The resulting tuple, NULL on error.
+ *
+ * Returns AEROSPIKE_OK on success.
+ *******************************************************************************************************
+ */
+as_status operate_ordered_record_to_pyobject(AerospikeClient *self,
+											 as_error *err, as_record *rec,
+											 as_key *key, PyObject **py_rec)
+{
+	/* These are the values which will be returned in a 3 element list */
+	PyObject *py_return_key = NULL;
+	PyObject *py_return_meta = NULL;
+	PyObject *py_return_bins = NULL;
+
+	*py_rec = NULL;
+
+	/* Build the return tuple: (key, meta, bins) */
+	key_to_pyobject(err, key, &py_return_key);
+	if (err->code != AEROSPIKE_OK || !py_return_key) {
+		goto CLEANUP;
+	}
+
+	metadata_to_pyobject(err, rec, &py_return_meta);
+	if (err->code != AEROSPIKE_OK || !py_return_meta) {
+		goto CLEANUP;
+	}
+
+	operate_bins_to_pyobject(self, err, rec, &py_return_bins);
+	if (err->code != AEROSPIKE_OK || !py_return_bins) {
+		goto CLEANUP;
+	}
+
+	*py_rec =
+		Py_BuildValue("OOO", py_return_key, py_return_meta, py_return_bins);
+	if (!*py_rec) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to build return tuple");
+	}
+
+CLEANUP:
+	/* If Py_BuildValue succeeded it increased the reference count of all 3 of these to 2,
+	 * so we decref them.*
+	 * If Py_BuildValue failed, we aren't returning anything, so they need to be
+	 * decref'd in that case as well.
+	 */
+	Py_XDECREF(py_return_key);
+	Py_XDECREF(py_return_bins);
+	Py_XDECREF(py_return_meta);
+
+	return err->code;
+}
+
 /**
  *******************************************************************************************************
  * This function invokes csdk's API's.
@@ -1031,7 +1097,9 @@ AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
 	memset(&static_pool, 0, sizeof(static_pool));
 
 	as_operations ops;
-	Py_ssize_t ops_list_size = PyList_Size(py_list);
+	Py_ssize_t ops_list_size = AerospikeOperations_Check(py_list)
+								   ? AerospikeOperations_Size(py_list)
+								   : PyList_Size(py_list);
 	as_operations_inita(&ops, ops_list_size);
 
 	// For expressions conversion.
@@ -1042,11 +1110,6 @@ AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
 	as_predexp_list predexp_list;
 	as_predexp_list *predexp_list_p = NULL;
 
-	/* These are the values which will be returned in a 3 element list */
-	PyObject *py_return_key = NULL;
-	PyObject *py_return_meta = NULL;
-	PyObject *py_return_bins = NULL;
-
 	CHECK_CONNECTED(err);
 
 	if (py_policy) {
@@ -1064,6 +1127,14 @@ AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
 		}
 	}
 
+	if (AerospikeOperations_Check(py_list)) {
+		if (AerospikeOperations_Add(self, err, py_list, unicodeStrVector,
+									&static_pool, &ops) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+		ops_list_size = 0;
+	}
+
 	for (Py_ssize_t i = 0; i < ops_list_size; i++) {
 
 		PyObject *py_current_op = NULL;
@@ -1098,40 +1169,7 @@ AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
 
 	operation_succeeded = true;
 	if (rec) {
-		/* Build the return tuple: (key, meta, bins) */
-		key_to_pyobject(err, key, &py_return_key);
-		if (err->code != AEROSPIKE_OK || !py_return_key) {
-			goto CLEANUP;
-		}
-
-		metadata_to_pyobject(err, rec, &py_return_meta);
-		if (err->code != AEROSPIKE_OK || !py_return_meta) {
-			Py_XDECREF(py_return_key);
-			goto CLEANUP;
-		}
-
-		operate_bins_to_pyobject(self, err, rec, &py_return_bins);
-		if (err->code != AEROSPIKE_OK || !py_return_bins) {
-			Py_XDECREF(py_return_key);
-			Py_XDECREF(py_return_meta);
-			goto CLEANUP;
-		}
-
-		py_rec =
-			Py_BuildValue("OOO", py_return_key, py_return_meta, py_return_bins);
-		if (!py_rec) {
-			as_error_update(err, AEROSPIKE_ERR_CLIENT,
-							"Unable to build return tuple");
-		}
-
-		/* If Py_BuildValue succeeded it increased the reference count of all 3 of these to 2,
-		 * so we decref them.*
-		 * If Py_BuildValue failed, we aren't returning anything, so they need to be
-		 * decref'd in that case as well.
-		 */
-		Py_XDECREF(py_return_key);
-		Py_XDECREF(py_return_bins);
-		Py_XDECREF(py_return_meta);
+		operate_ordered_record_to_pyobject(self, err, rec, key, &py_rec);
 	}
 
 CLEANUP:
@@ -1157,6 +1195,7 @@ CLEANUP:
 	}
 
 	as_operations_destroy(&ops);
+	POOL_DESTROY(&static_pool);
 
 	if (err->code != AEROSPIKE_OK) {
 		PyObject *py_err = NULL;
@@ -1221,7 +1260,8 @@ PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
 		goto CLEANUP;
 	}
 
-	if (py_list && PyList_Check(py_list)) {
+	if (py_list &&
+		(PyList_Check(py_list) || AerospikeOperations_Check(py_list))) {
 		py_result = AerospikeClient_OperateOrdered_Invoke(
 			self, &err, &key, py_list, py_meta, py_policy);
 	}
@@ -1233,14 +1273,7 @@ PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, NULL, NULL, NULL, NULL);
 		return NULL;
 	}
 	return py_result;
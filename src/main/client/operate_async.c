@@ -0,0 +1,513 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_operations.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "operate.h"
+#include "policy.h"
+
+static PyObject *operate_async_convert(AsyncCommand *cmd, as_error *err,
+										void *result)
+{
+	PyObject *py_rec = NULL;
+	as_record *record = (as_record *)result;
+
+	if (!record) {
+		return PyLong_FromLong(0);
+	}
+
+	record_to_pyobject(cmd->client, err, record, &cmd->key, &py_rec);
+	return py_rec;
+}
+
+static PyObject *operate_ordered_async_convert(AsyncCommand *cmd,
+											   as_error *err, void *result)
+{
+	PyObject *py_rec = NULL;
+	as_record *record = (as_record *)result;
+
+	if (!record) {
+		return PyLong_FromLong(0);
+	}
+
+	operate_ordered_record_to_pyobject(cmd->client, err, record, &cmd->key,
+									   &py_rec);
+	return py_rec;
+}
+
+/**
+ *******************************************************************************************************
+ * Issues an asynchronous operate. Policy, meta and operations are converted
+ * exactly as the synchronous operate does.
+ *
+ * @param self                  AerospikeClient object
+ * @param py_callback           Python callable or NULL for an awaitable command
+ * @param py_key                The key tuple
+ * @param py_list               The list of operation dicts
+ * @param py_meta               The metadata for the operation
+ * @param py_policy             The operate policy dict
+ * @param convert               Builds the result from the record, NULL for 0
+ * @param has_result            Whether the callback receives the record
+ * @param ordered               Reject operations which are not dicts
+ *
+ * Returns None or the future. In case of error, appropriate exceptions
+ * will be raised.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Operate_Async_Invoke(
+	AerospikeClient *self, PyObject *py_callback, PyObject *py_key,
+	PyObject *py_list, PyObject *py_meta, PyObject *py_policy,
+	async_convert convert, bool has_result, bool ordered)
+{
+	PyObject *py_result = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	long operation;
+	long return_type = -1;
+
+	as_policy_operate operate_policy;
+	as_policy_operate *operate_policy_p = NULL;
+
+	// For expressions conversion.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_vector *unicodeStrVector = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	as_operations ops;
+	bool ops_initialised = false;
+
+	as_event_loop *event_loop = NULL;
+
+	AsyncCommand *cmd = async_command_new(self, &err, py_callback, has_result);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+	cmd->convert = convert;
+
+	if (!py_list || !PyList_Check(py_list)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Operations should be of type list");
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_key(&err, py_key, &cmd->key) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy) {
+		if (pyobject_to_policy_operate(
+				self, &err, py_policy, &operate_policy, &operate_policy_p,
+				&self->as->config.policies.operate, &predexp_list,
+				&predexp_list_p, &exp_list, &exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	Py_ssize_t size = PyList_Size(py_list);
+	as_operations_init(&ops, (uint16_t)size);
+	ops_initialised = true;
+	unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+	if (py_meta) {
+		if (check_for_meta(py_meta, &ops, &err) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_val = PyList_GetItem(py_list, i);
+
+		if (PyDict_Check(py_val)) {
+			if (add_op(self, &err, py_val, unicodeStrVector, &static_pool, &ops,
+					   &operation, &return_type) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+		}
+		else if (ordered) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"Operation must be a dict");
+			goto CLEANUP;
+		}
+	}
+
+	if (async_loop_acquire(self, &err, py_policy, &cmd->key, &event_loop) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = async_command_result(cmd);
+
+	// The operations are serialized into the command buffer before the call
+	// returns, so they can be released right away.
+	as_status status;
+	Py_BEGIN_ALLOW_THREADS
+	status = aerospike_key_operate_async(self->as, &err, operate_policy_p,
+										 &cmd->key, &ops, async_record_listener, cmd,
+										 event_loop, NULL);
+	Py_END_ALLOW_THREADS
+	if (status != AEROSPIKE_OK) {
+		async_loop_release(event_loop);
+		Py_CLEAR(py_result);
+		goto CLEANUP;
+	}
+
+	// cmd now belongs to the listener.
+	cmd = NULL;
+
+CLEANUP:
+	if (unicodeStrVector) {
+		for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(unicodeStrVector, i));
+		}
+		as_vector_destroy(unicodeStrVector);
+	}
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	if (ops_initialised) {
+		as_operations_destroy(&ops);
+	}
+	POOL_DESTROY(&static_pool);
+
+	async_command_destroy(cmd);
+
+	if (err.code != AEROSPIKE_OK) {
+		return async_command_raise(&err, py_key);
+	}
+
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Multiple operations on a single record, delivering the record to a
+ * callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (key, record, error, exception).
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Operate_Async(AerospikeClient *self, PyObject *args,
+										PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_list = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"operate_callback", "key", "list", "meta",
+							 "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:operate_async", kwlist,
+									&py_callback, &py_key, &py_list, &py_meta,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Operate_Async_Invoke(
+		self, py_callback, py_key, py_list, py_meta, py_policy,
+		operate_async_convert, true, false);
+}
+
+/**
+ *******************************************************************************************************
+ * Multiple operations on a single record, without blocking the calling
+ * asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to the record tuple.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Operate_Aio(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_key = NULL;
+	PyObject *py_list = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "list", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:operate_aio", kwlist,
+									&py_key, &py_list, &py_meta,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "operate_aio", args, kwds, &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Operate_Async_Invoke(
+		self, NULL, py_key, py_list, py_meta, py_policy,
+		operate_async_convert, true, false);
+}
+
+/**
+ *******************************************************************************************************
+ * Multiple operations on a single record, delivering the ordered results to
+ * a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (key, record, error, exception) where
+ * the bins of record are a list of (bin, value) tuples.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_OperateOrdered_Async(AerospikeClient *self,
+											   PyObject *args, PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_list = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"operate_callback", "key", "list", "meta",
+							 "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:operate_ordered_async",
+									kwlist, &py_callback, &py_key, &py_list,
+									&py_meta, &py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Operate_Async_Invoke(
+		self, py_callback, py_key, py_list, py_meta, py_policy,
+		operate_ordered_async_convert, true, true);
+}
+
+/**
+ *******************************************************************************************************
+ * Multiple operations on a single record with ordered results, without
+ * blocking the calling asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to the record tuple.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_OperateOrdered_Aio(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_key = NULL;
+	PyObject *py_list = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "list", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:operate_ordered_aio",
+									kwlist, &py_key, &py_list, &py_meta,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "operate_ordered_aio", args, kwds,
+							   &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Operate_Async_Invoke(
+		self, NULL, py_key, py_list, py_meta, py_policy,
+		operate_ordered_async_convert, true, true);
+}
+
+/**
+ *******************************************************************************************************
+ * Shared by touch_async and touch_aio. Builds the same touch operation as
+ * the synchronous touch.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Touch_Async_Invoke(AerospikeClient *self,
+													PyObject *py_callback,
+													PyObject *py_key,
+													PyObject *py_touchvalue,
+													PyObject *py_meta,
+													PyObject *py_policy)
+{
+	PyObject *py_list =
+		create_pylist(NULL, AS_OPERATOR_TOUCH, NULL, py_touchvalue);
+	PyObject *py_result = AerospikeClient_Operate_Async_Invoke(
+		self, py_callback, py_key, py_list, py_meta, py_policy,
+		NULL, false, false);
+	Py_XDECREF(py_list);
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Touch a record, delivering the outcome to a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (key, error, exception).
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Touch_Async(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_touchvalue = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"touch_callback", "key", "val", "meta", "policy",
+							 NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:touch_async", kwlist,
+									&py_callback, &py_key, &py_touchvalue,
+									&py_meta, &py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Touch_Async_Invoke(self, py_callback, py_key,
+											  py_touchvalue, py_meta,
+											  py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Touch a record without blocking the calling asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to 0.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Touch_Aio(AerospikeClient *self, PyObject *args,
+									PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_key = NULL;
+	PyObject *py_touchvalue = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "val", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:touch_aio", kwlist,
+									&py_key, &py_touchvalue, &py_meta,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "touch_aio", args, kwds, &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Touch_Async_Invoke(self, NULL, py_key, py_touchvalue,
+											  py_meta, py_policy);
+}
@@ -47,7 +47,9 @@
 	as_policy_operate *operate_policy_p = NULL;                                \
 	as_key key;                                                                \
 	bool key_created = false;                                                  \
-	char *bin = NULL;
+	char *bin = NULL;                                                          \
+	as_static_pool static_pool;                                                \
+	memset(&static_pool, 0, sizeof(static_pool));
 
 #define CHECK_CONNECTED_AND_CDT_SUPPORT()                                      \
 	if (!self || !self->as) {                                                  \
@@ -97,21 +99,12 @@
 	Py_END_ALLOW_THREADS
 
 #define EXCEPTION_ON_ERROR()                                                   \
+	POOL_DESTROY(&static_pool);                                                \
 	if (key_created) {                                                         \
 		as_key_destroy(&key);                                                  \
 	}                                                                          \
 	if (err.code != AEROSPIKE_OK) {                                            \
-		PyObject *py_err = NULL;                                               \
-		error_to_pyobject(&err, &py_err);                                      \
-		PyObject *exception_type = raise_exception(&err);                      \
-		if (PyObject_HasAttrString(exception_type, "key")) {                   \
-			PyObject_SetAttrString(exception_type, "key", py_key);             \
-		}                                                                      \
-		if (PyObject_HasAttrString(exception_type, "bin")) {                   \
-			PyObject_SetAttrString(exception_type, "bin", py_bin);             \
-		}                                                                      \
-		PyErr_SetObject(exception_type, py_err);                               \
-		Py_DECREF(py_err);                                                     \
+		raise_exception_base(&err, py_key, py_bin, NULL, NULL, NULL);          \
 		return NULL;                                                           \
 	}
 
@@ -169,9 +162,6 @@ PyObject *AerospikeClient_ListAppend(AerospikeClient *self, PyObject *args,
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	POLICY_KEY_META_BIN();
 
 	as_val *put_val = NULL;
@@ -222,9 +212,6 @@ PyObject *AerospikeClient_ListExtend(AerospikeClient *self, PyObject *args,
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	if (!PyList_Check(py_append_val)) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM,
 						"Items should be of type list");
@@ -283,9 +270,6 @@ PyObject *AerospikeClient_ListInsert(AerospikeClient *self, PyObject *args,
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	POLICY_KEY_META_BIN();
 
 	as_val *put_val = NULL;
@@ -339,9 +323,6 @@ PyObject *AerospikeClient_ListInsertItems(AerospikeClient *self, PyObject *args,
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	if (!PyList_Check(py_insert_val)) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM,
 						"Items should be of type list");
@@ -723,9 +704,6 @@ PyObject *AerospikeClient_ListSet(AerospikeClient *self, PyObject *args,
 
 	CHECK_CONNECTED_AND_CDT_SUPPORT();
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	POLICY_KEY_META_BIN();
 
 	as_val *put_val = NULL;
@@ -40,7 +40,9 @@
 	PyObject *py_bin = NULL;                                                   \
 	char *bin = NULL;                                                          \
 	bool key_created = false;                                                  \
-	as_key key;
+	as_key key;                                                                \
+	as_static_pool static_pool;                                                \
+	memset(&static_pool, 0, sizeof(static_pool));
 
 #define CHECK_CONNECTED()                                                      \
 	if (!self || !self->as) {                                                  \
@@ -126,6 +128,7 @@
 #define CLEANUP_AND_EXCEPTION_ON_ERROR(__err)                                  \
 	as_operations_destroy(&ops);                                               \
 	as_record_destroy(rec);                                                    \
+	POOL_DESTROY(&static_pool);                                                \
 	if (key_created) {                                                         \
 		as_key_destroy(&key);                                                  \
 	}                                                                          \
@@ -184,9 +187,6 @@ PyObject *AerospikeClient_MapPut(AerospikeClient *self, PyObject *args,
 {
 	BASE_VARIABLES
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	PyObject *py_mapKey = NULL;
 	PyObject *py_mapValue = NULL;
 	PyObject *py_meta = NULL;
@@ -244,9 +244,6 @@ PyObject *AerospikeClient_MapPutItems(AerospikeClient *self, PyObject *args,
 {
 	BASE_VARIABLES
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	PyObject *py_items = NULL;
 	PyObject *py_policy = NULL;
 	PyObject *py_meta = NULL;
@@ -295,9 +292,6 @@ PyObject *AerospikeClient_MapIncrement(AerospikeClient *self, PyObject *args,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapKey = NULL;
 	PyObject *py_incr = NULL;
 	PyObject *py_meta = NULL;
@@ -327,12 +321,12 @@ PyObject *AerospikeClient_MapIncrement(AerospikeClient *self, PyObject *args,
 	POLICY_KEY_META_BIN();
 	SETUP_MAP_POLICY();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_incr, &incr_put, &pool,
+	if (pyobject_to_val(self, &err, py_incr, &incr_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -354,8 +348,6 @@ PyObject *AerospikeClient_MapDecrement(AerospikeClient *self, PyObject *args,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
 	PyObject *py_mapKey = NULL;
 	PyObject *py_decr = NULL;
 	PyObject *py_meta = NULL;
@@ -384,12 +376,12 @@ PyObject *AerospikeClient_MapDecrement(AerospikeClient *self, PyObject *args,
 	POLICY_KEY_META_BIN();
 	SETUP_MAP_POLICY();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_decr, &decr_put, &pool,
+	if (pyobject_to_val(self, &err, py_decr, &decr_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -486,9 +478,6 @@ PyObject *AerospikeClient_MapRemoveByKey(AerospikeClient *self, PyObject *args,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_result = NULL;
 	PyObject *py_mapKey = NULL;
 	PyObject *py_meta = NULL;
@@ -518,7 +507,7 @@ PyObject *AerospikeClient_MapRemoveByKey(AerospikeClient *self, PyObject *args,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -540,9 +529,6 @@ PyObject *AerospikeClient_MapRemoveByKeyList(AerospikeClient *self,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_result = NULL;
 	PyObject *py_list = NULL;
 	PyObject *py_meta = NULL;
@@ -577,7 +563,7 @@ PyObject *AerospikeClient_MapRemoveByKeyList(AerospikeClient *self,
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_list, &list_put, &pool,
+	if (pyobject_to_val(self, &err, py_list, &list_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -600,9 +586,6 @@ PyObject *AerospikeClient_MapRemoveByKeyRange(AerospikeClient *self,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapKey = NULL;
 	PyObject *py_result = NULL;
 	PyObject *py_range = NULL;
@@ -635,12 +618,12 @@ PyObject *AerospikeClient_MapRemoveByKeyRange(AerospikeClient *self,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool,
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -663,9 +646,6 @@ PyObject *AerospikeClient_MapRemoveByValue(AerospikeClient *self,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapValue = NULL;
 	PyObject *py_result = NULL;
 	PyObject *py_meta = NULL;
@@ -694,7 +674,7 @@ PyObject *AerospikeClient_MapRemoveByValue(AerospikeClient *self,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -716,9 +696,6 @@ PyObject *AerospikeClient_MapRemoveByValueList(AerospikeClient *self,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_result = NULL;
 	PyObject *py_list = NULL;
 	PyObject *py_meta = NULL;
@@ -754,7 +731,7 @@ PyObject *AerospikeClient_MapRemoveByValueList(AerospikeClient *self,
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_list, &list_put, &pool,
+	if (pyobject_to_val(self, &err, py_list, &list_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -777,9 +754,6 @@ PyObject *AerospikeClient_MapRemoveByValueRange(AerospikeClient *self,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapValue = NULL;
 	PyObject *py_result = NULL;
 	PyObject *py_range = NULL;
@@ -812,12 +786,12 @@ PyObject *AerospikeClient_MapRemoveByValueRange(AerospikeClient *self,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool,
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -1019,9 +993,6 @@ PyObject *AerospikeClient_MapGetByKey(AerospikeClient *self, PyObject *args,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapKey = NULL;
 	PyObject *py_result = NULL;
 	PyObject *py_meta = NULL;
@@ -1050,7 +1021,7 @@ PyObject *AerospikeClient_MapGetByKey(AerospikeClient *self, PyObject *args,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapKey, &key_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -1072,9 +1043,6 @@ PyObject *AerospikeClient_MapGetByValue(AerospikeClient *self, PyObject *args,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapValue = NULL;
 	PyObject *py_result = NULL;
 	PyObject *py_meta = NULL;
@@ -1104,7 +1072,7 @@ PyObject *AerospikeClient_MapGetByValue(AerospikeClient *self, PyObject *args,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -1126,9 +1094,6 @@ PyObject *AerospikeClient_MapGetByKeyRange(AerospikeClient *self,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapKey = NULL;
 	PyObject *py_result = NULL;
 	PyObject *py_meta = NULL;
@@ -1160,12 +1125,12 @@ PyObject *AerospikeClient_MapGetByKeyRange(AerospikeClient *self,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapKey, &map_key, &pool,
+	if (pyobject_to_val(self, &err, py_mapKey, &map_key, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool,
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -1188,9 +1153,6 @@ PyObject *AerospikeClient_MapGetByValueRange(AerospikeClient *self,
 {
 	BASE_VARIABLES
 
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
-
 	PyObject *py_mapValue = NULL;
 	PyObject *py_result = NULL;
 	PyObject *py_meta = NULL;
@@ -1222,12 +1184,12 @@ PyObject *AerospikeClient_MapGetByValueRange(AerospikeClient *self,
 
 	POLICY_KEY_META_BIN();
 
-	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &pool,
+	if (pyobject_to_val(self, &err, py_mapValue, &value_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_range, &range_put, &pool,
+	if (pyobject_to_val(self, &err, py_range, &range_put, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -1271,8 +1233,6 @@ PyObject *AerospikeClient_MapGetByValueList(AerospikeClient *self,
 	PyObject *py_result = NULL;
 
 	//Util Vars
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
 
 	CHECK_CONNECTED();
 
@@ -1298,7 +1258,7 @@ PyObject *AerospikeClient_MapGetByValueList(AerospikeClient *self,
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_value_list, &as_value_list, &pool,
+	if (pyobject_to_val(self, &err, py_value_list, &as_value_list, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
@@ -1351,8 +1311,6 @@ PyObject *AerospikeClient_MapGetByKeyList(AerospikeClient *self, PyObject *args,
 	PyObject *py_result = NULL;
 
 	//Util Vars
-	as_static_pool pool;
-	memset(&pool, 0, sizeof(pool));
 
 	CHECK_CONNECTED();
 
@@ -1378,7 +1336,7 @@ PyObject *AerospikeClient_MapGetByKeyList(AerospikeClient *self, PyObject *args,
 		goto CLEANUP;
 	}
 
-	if (pyobject_to_val(self, &err, py_key_list, &as_key_list, &pool,
+	if (pyobject_to_val(self, &err, py_key_list, &as_key_list, &static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
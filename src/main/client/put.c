@@ -120,8 +120,6 @@ PyObject *AerospikeClient_Put_Invoke(AerospikeClient *self, PyObject *py_key,
 	}
 
 CLEANUP:
-	POOL_DESTROY(&static_pool);
-
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);
 		;
@@ -139,20 +137,11 @@ CLEANUP:
 		// Destroy the record if it is initialised.
 		as_record_destroy(&rec);
 	}
+	POOL_DESTROY(&static_pool);
 
 	// If an error occurred, tell Python.
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", py_bins);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, py_bins, NULL, NULL, NULL);
 		return NULL;
 	}
 
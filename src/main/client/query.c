@@ -494,6 +494,8 @@ CLEANUP:
 		as_query_destroy(&query);
 	}
 
+	POOL_DESTROY(&static_pool);
+
 	if (err.code != AEROSPIKE_OK) {
 		PyObject *py_err = NULL;
 		error_to_pyobject(&err, &py_err);
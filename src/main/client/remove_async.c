@@ -0,0 +1,232 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Issues an asynchronous remove. The policy and the generation in meta are
+ * converted exactly as the synchronous remove does.
+ *
+ * @param self                  AerospikeClient object
+ * @param py_callback           Python callable or NULL for an awaitable remove
+ * @param py_key                The key tuple
+ * @param py_meta               The metadata dict, only gen is used
+ * @param py_policy             The remove policy dict
+ *
+ * Returns None or the future. In case of error, appropriate exceptions
+ * will be raised.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Remove_Async_Invoke(AerospikeClient *self,
+													 PyObject *py_callback,
+													 PyObject *py_key,
+													 PyObject *py_meta,
+													 PyObject *py_policy)
+{
+	PyObject *py_result = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	as_policy_remove remove_policy;
+	as_policy_remove *remove_policy_p = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	// For converting predexp.
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p = NULL;
+
+	as_event_loop *event_loop = NULL;
+
+	AsyncCommand *cmd = async_command_new(self, &err, py_callback, false);
+	if (!cmd) {
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_key(&err, py_key, &cmd->key) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy) {
+		if (pyobject_to_policy_remove(
+				self, &err, py_policy, &remove_policy, &remove_policy_p,
+				&self->as->config.policies.remove, &predexp_list,
+				&predexp_list_p, &exp_list, &exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+
+		if (py_meta && PyDict_Check(py_meta)) {
+			PyObject *py_gen = PyDict_GetItemString(py_meta, "gen");
+
+			if (py_gen) {
+				if (PyLong_Check(py_gen)) {
+					remove_policy_p->generation =
+						(uint16_t)PyLong_AsLongLong(py_gen);
+					if ((uint16_t)-1 == remove_policy_p->generation &&
+						PyErr_Occurred()) {
+						PyErr_Clear();
+						as_error_update(
+							&err, AEROSPIKE_ERR_PARAM,
+							"integer value for gen exceeds sys.maxsize");
+						goto CLEANUP;
+					}
+				}
+				else {
+					as_error_update(&err, AEROSPIKE_ERR_PARAM,
+									"Generation should be an int or long");
+					goto CLEANUP;
+				}
+			}
+		}
+	}
+
+	if (async_loop_acquire(self, &err, py_policy, &cmd->key, &event_loop) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	py_result = async_command_result(cmd);
+
+	as_status status;
+	Py_BEGIN_ALLOW_THREADS
+	status = aerospike_key_remove_async(self->as, &err, remove_policy_p,
+										&cmd->key, async_write_listener, cmd,
+										event_loop, NULL);
+	Py_END_ALLOW_THREADS
+	if (status != AEROSPIKE_OK) {
+		async_loop_release(event_loop);
+		Py_CLEAR(py_result);
+		goto CLEANUP;
+	}
+
+	// cmd now belongs to the listener.
+	cmd = NULL;
+
+CLEANUP:
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (predexp_list_p) {
+		as_predexp_list_destroy(&predexp_list);
+	}
+
+	async_command_destroy(cmd);
+
+	if (err.code != AEROSPIKE_OK) {
+		return async_command_raise(&err, py_key);
+	}
+
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Removes a record, delivering the outcome to a callback.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None, the callback receives (key, error, exception).
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Remove_Async(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"remove_callback", "key", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:remove_async", kwlist,
+									&py_callback, &py_key, &py_meta,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	return AerospikeClient_Remove_Async_Invoke(self, py_callback, py_key,
+											   py_meta, py_policy);
+}
+
+/**
+ *******************************************************************************************************
+ * Removes a record without blocking the calling asyncio event loop.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an asyncio future resolving to 0.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Remove_Aio(AerospikeClient *self, PyObject *args,
+									 PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_key = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	if (!async_check_support()) {
+		return NULL;
+	}
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "meta", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:remove_aio", kwlist,
+									&py_key, &py_meta, &py_policy) == false) {
+		return NULL;
+	}
+
+	PyObject *py_deferred = NULL;
+	if (async_command_deferred(self, "remove_aio", args, kwds, &py_deferred)) {
+		return py_deferred;
+	}
+
+	return AerospikeClient_Remove_Async_Invoke(self, NULL, py_key, py_meta,
+											   py_policy);
+}
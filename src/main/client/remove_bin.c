@@ -183,17 +183,7 @@ CLEANUP:
 	}
 
 	if (err->code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(err, &py_err);
-		PyObject *exception_type = raise_exception(err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(err, py_key, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 	return PyLong_FromLong(0);
@@ -259,17 +249,7 @@ PyObject *AerospikeClient_RemoveBin(AerospikeClient *self, PyObject *args,
 CLEANUP:
 
 	if (err.code != AEROSPIKE_OK || !py_result) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 	return NULL;
@@ -223,14 +223,7 @@ CLEANUP:
 		Py_DECREF(py_ustr_name);
 	}
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "name")) {
-			PyObject_SetAttrString(exception_type, "name", py_name);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, py_name);
 		return NULL;
 	}
 
@@ -17,6 +17,7 @@
 #include <Python.h>
 #include <structmember.h>
 #include <stdbool.h>
+#include <string.h>
 #include <unistd.h>
 
 #include <aerospike/aerospike.h>
@@ -25,6 +26,9 @@
 #include <aerospike/as_policy.h>
 
 #include "admin.h"
+#include "async.h"
+#include "bin_name_cache.h"
+#include "record.h"
 #include "client.h"
 #include "policy.h"
 #include "conversions.h"
@@ -65,6 +69,17 @@ PyDoc_STRVAR(exists_doc, "exists(key[, policy]) -> (key, meta)\n\
 Check if a record with a given key exists in the cluster and return the record \
 as a tuple() consisting of key and meta. If the record does not exist the meta data will be None.");
 
+PyDoc_STRVAR(exists_async_doc,
+			 "exists_async(exists_callback, key[, policy])\n\
+\n\
+Check asynchronously if a record with a given key exists in the cluster. \
+The callback receives key, a tuple() of key and meta, an error tuple and an exception.");
+
+PyDoc_STRVAR(exists_aio_doc, "exists_aio(key[, policy]) -> asyncio.Future\n\
+\n\
+Check if a record with a given key exists without blocking the running asyncio loop. \
+The returned future resolves to the same tuple() as exists().");
+
 PyDoc_STRVAR(get_doc, "get(key[, policy]) -> (key, meta, bins)\n\
 \n\
 Read a record with a given key, and return the record as a tuple() consisting of key, meta and bins.");
@@ -74,6 +89,25 @@ PyDoc_STRVAR(get_async_doc,
 \n\
 Read a record asynchronously with a given key, and return the record as a tuple() consisting of key, meta and bins.");
 
+PyDoc_STRVAR(get_aio_doc, "get_aio(key[, policy]) -> asyncio.Future\n\
+\n\
+Read a record with a given key without blocking the running asyncio loop. \
+The returned future resolves to a tuple() consisting of key, meta and bins.");
+
+PyDoc_STRVAR(async_drain_doc, "async_drain() -> int\n\
+\n\
+Deliver the async completions queued by a client configured with async_completion \
+and return how many were delivered. Futures of the running asyncio loop are completed directly.");
+
+PyDoc_STRVAR(async_stats_doc, "async_stats() -> dict\n\
+\n\
+Return the async gauges of the client: in_flight, max_commands, waiting and queued_completions.");
+
+PyDoc_STRVAR(async_completion_fd_doc, "async_completion_fd() -> int\n\
+\n\
+Return the file descriptor that becomes readable when async completions are ready to be drained \
+with async_drain(). Requires async_completion notify_fd.");
+
 PyDoc_STRVAR(select_doc, "select(key, bins[, policy]) -> (key, meta, bins)\n\
 \n\
 Read a record with a given key, and return the record as a tuple() consisting of key, meta and bins, \
@@ -89,14 +123,40 @@ PyDoc_STRVAR(put_async_doc, "put(key, bins[, meta[, policy[, serializer]]])\n\
 \n\
 Write a record asynchronously with a given key to the cluster.");
 
+PyDoc_STRVAR(put_aio_doc, "put_aio(key, bins[, meta[, policy[, serializer]]]) -> asyncio.Future\n\
+\n\
+Write a record with a given key to the cluster without blocking the running asyncio loop. \
+The returned future resolves to 0 on success.");
+
 PyDoc_STRVAR(remove_doc, "remove(key[, policy])\n\
 \n\
 Remove a record matching the key from the cluster.");
 
+PyDoc_STRVAR(remove_async_doc,
+			 "remove_async(remove_callback, key[, meta[, policy]])\n\
+\n\
+Remove a record matching the key from the cluster asynchronously.");
+
+PyDoc_STRVAR(remove_aio_doc, "remove_aio(key[, meta[, policy]]) -> asyncio.Future\n\
+\n\
+Remove a record matching the key without blocking the running asyncio loop. \
+The returned future resolves to 0 on success.");
+
 PyDoc_STRVAR(apply_doc, "apply(key, module, function, args[, policy])\n\
 \n\
 Apply a registered (see udf_put()) record UDF to a particular record.");
 
+PyDoc_STRVAR(apply_async_doc,
+			 "apply_async(apply_callback, key, module, function, args[, policy])\n\
+\n\
+Apply a registered record UDF to a particular record asynchronously.");
+
+PyDoc_STRVAR(apply_aio_doc,
+			 "apply_aio(key, module, function, args[, policy]) -> asyncio.Future\n\
+\n\
+Apply a registered record UDF to a particular record without blocking the running asyncio loop. \
+The returned future resolves to the value returned by the UDF.");
+
 PyDoc_STRVAR(remove_bin_doc, "remove_bin(key, list[, meta[, policy]])\n\
 \n\
 Remove a list of bins from a record with a given key. \
@@ -114,10 +174,43 @@ PyDoc_STRVAR(touch_doc, "touch(key[, val=0[, meta[, policy]]])\n\
 \n\
 Touch the given record, resetting its time-to-live and incrementing its generation.");
 
+PyDoc_STRVAR(touch_async_doc,
+			 "touch_async(touch_callback, key, val[, meta[, policy]])\n\
+\n\
+Touch the given record asynchronously.");
+
+PyDoc_STRVAR(touch_aio_doc,
+			 "touch_aio(key, val[, meta[, policy]]) -> asyncio.Future\n\
+\n\
+Touch the given record without blocking the running asyncio loop. \
+The returned future resolves to 0 on success.");
+
 PyDoc_STRVAR(increment_doc, "increment(key, bin, offset[, meta[, policy]])\n\
 \n\
 Increment the integer value in bin by the integer val.");
 
+PyDoc_STRVAR(operate_aio_doc,
+			 "operate_aio(key, list[, meta[, policy]]) -> asyncio.Future\n\
+\n\
+Perform multiple bin operations on a record with a given key without blocking the running asyncio loop. \
+The returned future resolves to the same record tuple as operate().");
+
+PyDoc_STRVAR(operate_async_doc,
+			 "operate_async(operate_callback, key, list[, meta[, policy]])\n\
+\n\
+Perform multiple bin operations on a record with a given key asynchronously.");
+
+PyDoc_STRVAR(operate_ordered_async_doc,
+			 "operate_ordered_async(operate_callback, key, list[, meta[, policy]])\n\
+\n\
+Perform multiple bin operations on a record asynchronously, with the results in the order of the operations.");
+
+PyDoc_STRVAR(operate_ordered_aio_doc,
+			 "operate_ordered_aio(key, list[, meta[, policy]]) -> asyncio.Future\n\
+\n\
+Perform multiple bin operations on a record without blocking the running asyncio loop. \
+The returned future resolves to the same record tuple as operate_ordered().");
+
 PyDoc_STRVAR(operate_doc,
 			 "operate(key, list[, meta[, policy]]) -> (key, meta, bins)\n\
 \n\
@@ -502,6 +595,32 @@ PyDoc_STRVAR(batch_get_ops_doc, "batch_get_ops((list_of_keys, list_of_ops, meta,
 Batch-read multiple records, and return them as a list. \
 Any record that does not exist will have a None value for metadata and bins in the record tuple.");
 
+PyDoc_STRVAR(batch_write_doc,
+			 "batch_write(records[, policy[, serializer]]) -> [status]\n\
+\n\
+Write multiple records given as (key, bins[, meta]) tuples. The records are grouped by the node \
+owning them and the nodes are written to in parallel. Returns the status code of every record, \
+in the order given.");
+
+PyDoc_STRVAR(batch_remove_doc, "batch_remove(keys[, policy]) -> [status]\n\
+\n\
+Remove multiple records. The keys are grouped by the node owning them and the nodes are worked on \
+in parallel. Returns the status code of every key, in the order given.");
+
+PyDoc_STRVAR(batch_apply_doc,
+			 "batch_apply(keys, module, function, args[, policy]) -> [(status, result)]\n\
+\n\
+Apply a registered (see udf_put()) record UDF to multiple records. The keys are grouped by the node \
+owning them and the nodes are worked on in parallel. Returns a (status, result) tuple for every key, \
+in the order given.");
+
+PyDoc_STRVAR(batch_operate_doc,
+			 "batch_operate(records[, policy]) -> [(status, (key, meta, bins))]\n\
+\n\
+Perform a list of operations on each of multiple records, given as (key, ops[, meta]) tuples. \
+Every record has its own operations. The records are grouped by the node owning them and the \
+nodes are worked on in parallel. Returns a (status, record) tuple for every record, in the order given.");
+
 PyDoc_STRVAR(select_many_doc,
 			 "select_many(keys, bins[, policy]) -> [(key, meta, bins)]\n\
 \n\
@@ -514,6 +633,55 @@ PyDoc_STRVAR(exists_many_doc, "exists_many(keys[, policy]) -> [ (key, meta)]\n\
 Batch-read metadata for multiple keys, and return it as a list. \
 Any record that does not exist will have a None value for metadata in the result tuple.");
 
+PyDoc_STRVAR(get_many_async_doc,
+			 "get_many_async(get_many_callback, keys[, policy])\n\
+\n\
+Batch-read multiple records asynchronously. The callback receives the same list as get_many(), \
+an error tuple and an exception.");
+
+PyDoc_STRVAR(get_many_aio_doc, "get_many_aio(keys[, policy]) -> asyncio.Future\n\
+\n\
+Batch-read multiple records without blocking the running asyncio loop. \
+The returned future resolves to the same list as get_many().");
+
+PyDoc_STRVAR(batch_get_ops_async_doc,
+			 "batch_get_ops_async(batch_get_ops_callback, keys, list[, meta[, policy]])\n\
+\n\
+Apply read operations to multiple records asynchronously. The callback receives the same list as \
+batch_get_ops(), an error tuple and an exception.");
+
+PyDoc_STRVAR(batch_get_ops_aio_doc,
+			 "batch_get_ops_aio(keys, list[, meta[, policy]]) -> asyncio.Future\n\
+\n\
+Apply read operations to multiple records without blocking the running asyncio loop. \
+The returned future resolves to the same list as batch_get_ops().");
+
+PyDoc_STRVAR(exists_many_async_doc,
+			 "exists_many_async(exists_many_callback, keys[, policy])\n\
+\n\
+Batch-read metadata for multiple keys asynchronously. The callback receives the same list as \
+exists_many(), an error tuple and an exception.");
+
+PyDoc_STRVAR(exists_many_aio_doc,
+			 "exists_many_aio(keys[, policy]) -> asyncio.Future\n\
+\n\
+Batch-read metadata for multiple keys without blocking the running asyncio loop. \
+The returned future resolves to the same list as exists_many().");
+
+PyDoc_STRVAR(prepare_policy_doc,
+			 "prepare_policy(kind, policy) -> aerospike.Policy\n\
+\n\
+Convert a policy dict once. kind is one of 'read', 'write', 'operate', 'batch', 'apply', \
+'remove', 'query' or 'scan'. The returned Policy can be passed instead of the dict to any call \
+taking a policy of that kind, which then skips converting it.");
+
+PyDoc_STRVAR(prepare_operations_doc,
+			 "prepare_operations(ops) -> aerospike.Operations\n\
+\n\
+Convert a list of operations once. Values given as aerospike.Placeholder(name) are bound on \
+every call with Operations.bind(name=value). The returned Operations can be passed instead of \
+the list to operate() and operate_ordered(), which then only convert the bound operations.");
+
 PyDoc_STRVAR(get_key_digest_doc, "get_key_digest(ns, set, key) -> bytearray\n\
 \n\
 Calculate the digest of a particular key. See: Key Tuple.");
@@ -606,22 +774,44 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 
 	{"exists", (PyCFunction)AerospikeClient_Exists,
 	 METH_VARARGS | METH_KEYWORDS, exists_doc},
+	{"exists_async", (PyCFunction)AerospikeClient_Exists_Async,
+	 METH_VARARGS | METH_KEYWORDS, exists_async_doc},
+	{"exists_aio", (PyCFunction)AerospikeClient_Exists_Aio,
+	 METH_VARARGS | METH_KEYWORDS, exists_aio_doc},
 	{"get", (PyCFunction)AerospikeClient_Get, METH_VARARGS | METH_KEYWORDS,
 	 get_doc},
 	{"get_async", (PyCFunction)AerospikeClient_Get_Async,
 	 METH_VARARGS | METH_KEYWORDS, get_async_doc},
+	{"get_aio", (PyCFunction)AerospikeClient_Get_Aio,
+	 METH_VARARGS | METH_KEYWORDS, get_aio_doc},
 	{"select", (PyCFunction)AerospikeClient_Select,
 	 METH_VARARGS | METH_KEYWORDS, select_doc},
 	{"put", (PyCFunction)AerospikeClient_Put, METH_VARARGS | METH_KEYWORDS,
 	 put_doc},
 	{"put_async", (PyCFunction)AerospikeClient_Put_Async,
 	 METH_VARARGS | METH_KEYWORDS, put_async_doc},
+	{"put_aio", (PyCFunction)AerospikeClient_Put_Aio,
+	 METH_VARARGS | METH_KEYWORDS, put_aio_doc},
+	{"async_drain", (PyCFunction)AerospikeClient_Async_Drain, METH_NOARGS,
+	 async_drain_doc},
+	{"async_completion_fd", (PyCFunction)AerospikeClient_Async_Completion_Fd,
+	 METH_NOARGS, async_completion_fd_doc},
+	{"async_stats", (PyCFunction)AerospikeClient_Async_Stats, METH_NOARGS,
+	 async_stats_doc},
 	{"get_key_partition_id", (PyCFunction)AerospikeClient_Get_Key_PartitionID,
 	 METH_VARARGS | METH_KEYWORDS, get_key_partition_id_doc},
 	{"remove", (PyCFunction)AerospikeClient_Remove,
 	 METH_VARARGS | METH_KEYWORDS, remove_doc},
+	{"remove_async", (PyCFunction)AerospikeClient_Remove_Async,
+	 METH_VARARGS | METH_KEYWORDS, remove_async_doc},
+	{"remove_aio", (PyCFunction)AerospikeClient_Remove_Aio,
+	 METH_VARARGS | METH_KEYWORDS, remove_aio_doc},
 	{"apply", (PyCFunction)AerospikeClient_Apply, METH_VARARGS | METH_KEYWORDS,
 	 apply_doc},
+	{"apply_async", (PyCFunction)AerospikeClient_Apply_Async,
+	 METH_VARARGS | METH_KEYWORDS, apply_async_doc},
+	{"apply_aio", (PyCFunction)AerospikeClient_Apply_Aio,
+	 METH_VARARGS | METH_KEYWORDS, apply_aio_doc},
 	{"remove_bin", (PyCFunction)AerospikeClient_RemoveBin,
 	 METH_VARARGS | METH_KEYWORDS, remove_bin_doc},
 	{"append", (PyCFunction)AerospikeClient_Append,
@@ -630,12 +820,24 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	 METH_VARARGS | METH_KEYWORDS, prepend_doc},
 	{"touch", (PyCFunction)AerospikeClient_Touch, METH_VARARGS | METH_KEYWORDS,
 	 touch_doc},
+	{"touch_async", (PyCFunction)AerospikeClient_Touch_Async,
+	 METH_VARARGS | METH_KEYWORDS, touch_async_doc},
+	{"touch_aio", (PyCFunction)AerospikeClient_Touch_Aio,
+	 METH_VARARGS | METH_KEYWORDS, touch_aio_doc},
 	{"increment", (PyCFunction)AerospikeClient_Increment,
 	 METH_VARARGS | METH_KEYWORDS, increment_doc},
 	{"operate", (PyCFunction)AerospikeClient_Operate,
 	 METH_VARARGS | METH_KEYWORDS, operate_doc},
 	{"operate_ordered", (PyCFunction)AerospikeClient_OperateOrdered,
 	 METH_VARARGS | METH_KEYWORDS, operate_ordered_doc},
+	{"operate_aio", (PyCFunction)AerospikeClient_Operate_Aio,
+	 METH_VARARGS | METH_KEYWORDS, operate_aio_doc},
+	{"operate_async", (PyCFunction)AerospikeClient_Operate_Async,
+	 METH_VARARGS | METH_KEYWORDS, operate_async_doc},
+	{"operate_ordered_async", (PyCFunction)AerospikeClient_OperateOrdered_Async,
+	 METH_VARARGS | METH_KEYWORDS, operate_ordered_async_doc},
+	{"operate_ordered_aio", (PyCFunction)AerospikeClient_OperateOrdered_Aio,
+	 METH_VARARGS | METH_KEYWORDS, operate_ordered_aio_doc},
 
 	// LIST OPERATIONS
 
@@ -803,14 +1005,38 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 
 	{"get_many", (PyCFunction)AerospikeClient_Get_Many,
 	 METH_VARARGS | METH_KEYWORDS, get_many_doc},
+	{"get_many_async", (PyCFunction)AerospikeClient_Get_Many_Async,
+	 METH_VARARGS | METH_KEYWORDS, get_many_async_doc},
+	{"get_many_aio", (PyCFunction)AerospikeClient_Get_Many_Aio,
+	 METH_VARARGS | METH_KEYWORDS, get_many_aio_doc},
 	{"batch_get_ops", (PyCFunction)AerospikeClient_Batch_GetOps,
 	 METH_VARARGS | METH_KEYWORDS, batch_get_ops_doc},
+	{"batch_get_ops_async", (PyCFunction)AerospikeClient_Batch_GetOps_Async,
+	 METH_VARARGS | METH_KEYWORDS, batch_get_ops_async_doc},
+	{"batch_get_ops_aio", (PyCFunction)AerospikeClient_Batch_GetOps_Aio,
+	 METH_VARARGS | METH_KEYWORDS, batch_get_ops_aio_doc},
+	{"batch_write", (PyCFunction)AerospikeClient_Batch_Write,
+	 METH_VARARGS | METH_KEYWORDS, batch_write_doc},
+	{"batch_remove", (PyCFunction)AerospikeClient_Batch_Remove,
+	 METH_VARARGS | METH_KEYWORDS, batch_remove_doc},
+	{"batch_apply", (PyCFunction)AerospikeClient_Batch_Apply,
+	 METH_VARARGS | METH_KEYWORDS, batch_apply_doc},
+	{"batch_operate", (PyCFunction)AerospikeClient_Batch_Operate,
+	 METH_VARARGS | METH_KEYWORDS, batch_operate_doc},
 	{"select_many", (PyCFunction)AerospikeClient_Select_Many,
 	 METH_VARARGS | METH_KEYWORDS, select_many_doc},
 	{"exists_many", (PyCFunction)AerospikeClient_Exists_Many,
 	 METH_VARARGS | METH_KEYWORDS, exists_many_doc},
+	{"exists_many_async", (PyCFunction)AerospikeClient_Exists_Many_Async,
+	 METH_VARARGS | METH_KEYWORDS, exists_many_async_doc},
+	{"exists_many_aio", (PyCFunction)AerospikeClient_Exists_Many_Aio,
+	 METH_VARARGS | METH_KEYWORDS, exists_many_aio_doc},
 	{"get_key_digest", (PyCFunction)AerospikeClient_Get_Key_Digest,
 	 METH_VARARGS | METH_KEYWORDS, get_key_digest_doc},
+	{"prepare_policy", (PyCFunction)AerospikeClient_Prepare_Policy,
+	 METH_VARARGS | METH_KEYWORDS, prepare_policy_doc},
+	{"prepare_operations", (PyCFunction)AerospikeClient_Prepare_Operations,
+	 METH_VARARGS | METH_KEYWORDS, prepare_operations_doc},
 
 	// TRUNCATE OPERATIONS
 	{"truncate", (PyCFunction)AerospikeClient_Truncate,
@@ -845,6 +1071,16 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
 	self->use_shared_connection = false;
 	self->as = NULL;
 	self->send_bool_as = SEND_BOOL_AS_PY_BYTES;
+	self->result_format = RESULT_FORMAT_TUPLE;
+	self->lazy_bins = false;
+	self->blob_as_memoryview = false;
+	self->default_serializer = SERIALIZER_PYTHON;
+	async_completion_queue_destroy(self->async_queue);
+	self->async_queue = NULL;
+	async_limiter_destroy(self->async_limiter);
+	self->async_limiter = NULL;
+	bin_name_cache_destroy(self->bin_name_cache);
+	self->bin_name_cache = NULL;
 
 	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:client", kwlist,
 									&py_config) == false) {
@@ -1276,6 +1512,83 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
 		}
 	}
 
+	// Type of the records returned
+	PyObject *py_result_format =
+		PyDict_GetItemString(py_config, "result_format");
+	if (py_result_format && py_result_format != Py_None) {
+		const char *result_format = NULL;
+		if (PyUnicode_Check(py_result_format)) {
+			result_format = PyUnicode_AsUTF8(py_result_format);
+		}
+		if (result_format && strcmp(result_format, "record") == 0) {
+			self->result_format = RESULT_FORMAT_RECORD;
+		}
+		else if (!result_format || strcmp(result_format, "tuple") != 0) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+	}
+
+	// Convert bins when they are accessed
+	PyObject *py_lazy_bins = PyDict_GetItemString(py_config, "lazy_bins");
+	if (py_lazy_bins) {
+		self->lazy_bins = PyObject_IsTrue(py_lazy_bins);
+	}
+
+	// Read blobs as memoryviews instead of bytearray copies
+	PyObject *py_blob_as_memoryview =
+		PyDict_GetItemString(py_config, "blob_as_memoryview");
+	if (py_blob_as_memoryview) {
+		self->blob_as_memoryview = PyObject_IsTrue(py_blob_as_memoryview);
+	}
+
+	// Serializer of the values without a matching server type
+	PyObject *py_default_serializer =
+		PyDict_GetItemString(py_config, "default_serializer");
+	if (py_default_serializer && py_default_serializer != Py_None) {
+		long default_serializer = -1;
+		if (PyLong_Check(py_default_serializer)) {
+			default_serializer = PyLong_AsLong(py_default_serializer);
+		}
+		if (default_serializer != SERIALIZER_PYTHON &&
+			default_serializer != SERIALIZER_MSGPACK) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+		self->default_serializer = (uint8_t)default_serializer;
+	}
+
+	// Event loop used by async commands
+	self->event_loop_selection = EVENT_LOOP_ROUND_ROBIN;
+	self->event_loop_index = 0;
+	PyObject *py_event_loop_selection =
+		PyDict_GetItemString(py_config, "event_loop_selection");
+	if (py_event_loop_selection != NULL &&
+		PyLong_Check(py_event_loop_selection)) {
+		long selection = PyLong_AsLong(py_event_loop_selection);
+		if (selection >= EVENT_LOOP_ROUND_ROBIN &&
+			selection <= EVENT_LOOP_PINNED) {
+			self->event_loop_selection = (uint8_t)selection;
+		}
+		else {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+	}
+
+	PyObject *py_event_loop_index =
+		PyDict_GetItemString(py_config, "event_loop_index");
+	if (py_event_loop_index != NULL && PyLong_Check(py_event_loop_index)) {
+		long index = PyLong_AsLong(py_event_loop_index);
+		if (index >= 0 && index < ASYNC_MAX_EVENT_LOOPS) {
+			self->event_loop_index = (uint32_t)index;
+		}
+		else {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+	}
+
 	//compression_threshold
 	PyObject *py_compression_threshold =
 		PyDict_GetItemString(py_config, "compression_threshold");
@@ -1328,6 +1641,46 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
 			config.max_socket_idle = (uint32_t)max_socket_idle;
 		}
 	}
+	// Batched delivery of async completions
+	PyObject *py_async_completion =
+		PyDict_GetItemString(py_config, "async_completion");
+	if (py_async_completion && py_async_completion != Py_None) {
+		as_error queue_err;
+		as_error_init(&queue_err);
+		if (async_completion_queue_new(&queue_err, py_async_completion,
+									   &self->async_queue) != AEROSPIKE_OK) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+	}
+
+	// Upper bound of async commands in flight
+	PyObject *py_async_max_commands =
+		PyDict_GetItemString(py_config, "async_max_commands");
+	if (py_async_max_commands && py_async_max_commands != Py_None) {
+		as_error limiter_err;
+		as_error_init(&limiter_err);
+		if (async_limiter_new(&limiter_err, py_async_max_commands,
+							  &self->async_limiter) != AEROSPIKE_OK) {
+			error_code = INIT_POLICY_PARAM_ERR;
+			goto CONSTRUCTOR_ERROR;
+		}
+	}
+
+	// Interned bin names of converted records
+	PyObject *py_bin_name_cache_size =
+		PyDict_GetItemString(py_config, "bin_name_cache_size");
+	if (py_bin_name_cache_size == Py_None) {
+		py_bin_name_cache_size = NULL;
+	}
+	as_error cache_err;
+	as_error_init(&cache_err);
+	if (bin_name_cache_new(&cache_err, py_bin_name_cache_size,
+						   &self->bin_name_cache) != AEROSPIKE_OK) {
+		error_code = INIT_POLICY_PARAM_ERR;
+		goto CONSTRUCTOR_ERROR;
+	}
+
 	self->as = aerospike_new(&config);
 
 	return 0;
@@ -1476,6 +1829,14 @@ static void AerospikeClient_Type_Dealloc(PyObject *self)
 	AerospikeGlobalHosts *global_host = NULL;
 	AerospikeClient *client = (AerospikeClient *)self;
 
+	// Async commands hold a reference, so nothing is left to deliver.
+	async_completion_queue_destroy(client->async_queue);
+	client->async_queue = NULL;
+	async_limiter_destroy(client->async_limiter);
+	client->async_limiter = NULL;
+	bin_name_cache_destroy(client->bin_name_cache);
+	client->bin_name_cache = NULL;
+
 	// If the client has never connected
 	// It is safe to destroy the aerospike structure
 	if (client->as) {
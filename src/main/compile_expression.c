@@ -0,0 +1,106 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "client.h"
+#include "compiled_expression.h"
+#include "exceptions.h"
+#include "module_functions.h"
+#include "policy.h"
+
+/**
+ * Stands in for a client when compile_expression() is not given one,
+ * converting values with the defaults of a new client.
+ */
+static AerospikeClient default_conversion_client = {
+	.send_bool_as = SEND_BOOL_AS_PY_BYTES,
+	.default_serializer = SERIALIZER_PYTHON,
+	.strict_types = true};
+
+PyObject *Aerospike_Compile_Expression(PyObject *self, PyObject *args,
+									   PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_expression = NULL;
+	PyObject *py_client = NULL;
+
+	// Python Function Result
+	PyObject *py_compiled = NULL;
+	PyObject *py_exp_list = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"expression", "client", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:compile_expression",
+									kwlist, &py_expression,
+									&py_client) == false) {
+		return NULL;
+	}
+
+	AerospikeClient *client = &default_conversion_client;
+	if (py_client && py_client != Py_None) {
+		if (!PyObject_TypeCheck(py_client, AerospikeClient_Ready())) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"client must be an aerospike.Client");
+			goto CLEANUP;
+		}
+		client = (AerospikeClient *)py_client;
+	}
+
+	// Expressions built with aerospike_helpers are compiled here, lists
+	// already compiled are packed as they are.
+	if (PyList_Check(py_expression)) {
+		Py_INCREF(py_expression);
+		py_exp_list = py_expression;
+	}
+	else if (PyObject_HasAttrString(py_expression, "compile")) {
+		py_exp_list = PyObject_CallMethod(py_expression, "compile", NULL);
+		if (!py_exp_list) {
+			return NULL;
+		}
+	}
+	else {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"expression must be an aerospike expression or a "
+						"compiled expression list");
+		goto CLEANUP;
+	}
+
+	py_compiled = AerospikeCompiledExpression_New(client, &err, py_exp_list);
+
+CLEANUP:
+
+	Py_XDECREF(py_exp_list);
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_compiled;
+}
@@ -0,0 +1,125 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+
+#include "types.h"
+#include "conversions.h"
+#include "compiled_expression.h"
+
+// An expression packed once, for the server, by aerospike.compile_expression().
+typedef struct {
+	PyObject_HEAD
+	as_exp *exp;
+} AerospikeCompiledExpression;
+
+static PyTypeObject AerospikeCompiledExpression_Type;
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject *
+AerospikeCompiledExpression_Type_GetPacked(AerospikeCompiledExpression *self,
+										   void *closure)
+{
+	return PyBytes_FromStringAndSize((const char *)self->exp->packed,
+									 self->exp->packed_sz);
+}
+
+static PyObject *
+AerospikeCompiledExpression_Type_Repr(AerospikeCompiledExpression *self)
+{
+	return PyUnicode_FromFormat("<aerospike.CompiledExpression %u bytes>",
+								self->exp->packed_sz);
+}
+
+static void
+AerospikeCompiledExpression_Type_Dealloc(AerospikeCompiledExpression *self)
+{
+	if (self->exp) {
+		as_exp_destroy(self->exp);
+	}
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyGetSetDef AerospikeCompiledExpression_Type_GetSet[] = {
+	{"packed", (getter)AerospikeCompiledExpression_Type_GetPacked, NULL,
+	 "The expression as sent to the server.", NULL},
+	{NULL}};
+
+static PyTypeObject AerospikeCompiledExpression_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.CompiledExpression",
+	.tp_basicsize = sizeof(AerospikeCompiledExpression),
+	.tp_dealloc = (destructor)AerospikeCompiledExpression_Type_Dealloc,
+	.tp_repr = (reprfunc)AerospikeCompiledExpression_Type_Repr,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "An expression packed once by aerospike.compile_expression(),\n"
+			  "accepted wherever a compiled expression list is.\n",
+	.tp_getset = AerospikeCompiledExpression_Type_GetSet};
+
+PyTypeObject *AerospikeCompiledExpression_Ready()
+{
+	return PyType_Ready(&AerospikeCompiledExpression_Type) == 0
+			   ? &AerospikeCompiledExpression_Type
+			   : NULL;
+}
+
+PyObject *AerospikeCompiledExpression_New(AerospikeClient *client,
+										  as_error *err, PyObject *py_exp_list)
+{
+	as_exp *exp = NULL;
+
+	if (!PyList_Check(py_exp_list)) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM,
+						"Expressions must be a non empty list of 4 element "
+						"tuples, generated by a compiled aerospike expression");
+		return NULL;
+	}
+
+	if (convert_exp_list(client, py_exp_list, &exp, err) != AEROSPIKE_OK) {
+		return NULL;
+	}
+
+	AerospikeCompiledExpression *self = PyObject_New(
+		AerospikeCompiledExpression, &AerospikeCompiledExpression_Type);
+	if (!self) {
+		as_exp_destroy(exp);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the expression");
+		return NULL;
+	}
+	self->exp = exp;
+	return (PyObject *)self;
+}
+
+bool AerospikeCompiledExpression_Check(PyObject *py_exp)
+{
+	return Py_TYPE(py_exp) == &AerospikeCompiledExpression_Type;
+}
+
+as_exp *AerospikeCompiledExpression_Get(PyObject *py_exp)
+{
+	return ((AerospikeCompiledExpression *)py_exp)->exp;
+}
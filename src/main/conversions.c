@@ -39,6 +39,9 @@
 #include <aerospike/as_msgpack_ext.h>
 
 #include "conversions.h"
+#include "bin_name_cache.h"
+#include "lazy_bins.h"
+#include "record.h"
 #include "geo.h"
 #include "policy.h"
 #include "serializer.h"
@@ -1004,9 +1007,12 @@ as_status pyobject_to_record(AerospikeClient *self, as_error *err,
 				as_bytes *bytes;
 				GET_BYTES_POOL(bytes, static_pool, err);
 				if (err->code == AEROSPIKE_OK) {
-					if (serialize_based_on_serializer_policy(
+					if (!serialize_buffer_without_copy(self, serializer_type,
+													   bytes, value,
+													   static_pool) &&
+						serialize_based_on_serializer_policy(
 							self, serializer_type, &bytes, value, err) !=
-						AEROSPIKE_OK) {
+							AEROSPIKE_OK) {
 						return err->code;
 					}
 					ret_val = as_record_set_bytes(rec, name, bytes);
@@ -1044,9 +1050,12 @@ as_status pyobject_to_record(AerospikeClient *self, as_error *err,
 					as_bytes *bytes;
 					GET_BYTES_POOL(bytes, static_pool, err);
 					if (err->code == AEROSPIKE_OK) {
-						if (serialize_based_on_serializer_policy(
+						if (!serialize_buffer_without_copy(
+								self, serializer_type, bytes, value,
+								static_pool) &&
+							serialize_based_on_serializer_policy(
 								self, serializer_type, &bytes, value, err) !=
-							AEROSPIKE_OK) {
+								AEROSPIKE_OK) {
 							return err->code;
 						}
 						ret_val = as_record_set_bytes(rec, name, bytes);
@@ -1310,6 +1319,40 @@ as_status pyobject_to_key(as_error *err, PyObject *py_keytuple, as_key *key)
 	return err->code;
 }
 
+as_status pyobject_to_batch_keys(as_error *err, PyObject *py_keys,
+								 as_batch *batch)
+{
+	as_error_reset(err);
+
+	if (!py_keys || !PyList_Check(py_keys)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "Keys should be specified as a list.");
+	}
+
+	uint32_t size = (uint32_t)PyList_Size(py_keys);
+	as_batch_init(batch, size);
+	if (size == 0) {
+		return AEROSPIKE_OK;
+	}
+
+	// Keys past a conversion error are destroyed untouched.
+	memset(batch->keys.entries, 0, sizeof(as_key) * size);
+
+	for (uint32_t i = 0; i < size; i++) {
+		PyObject *py_key = PyList_GetItem(py_keys, i);
+		if (!PyTuple_Check(py_key)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "Key should be a tuple.");
+		}
+		if (pyobject_to_key(err, py_key, as_batch_keyat(batch, i)) !=
+			AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+
+	return AEROSPIKE_OK;
+}
+
 typedef struct {
 	as_error *err;
 	uint32_t count;
@@ -1666,6 +1709,21 @@ as_status do_record_to_pyobject(AerospikeClient *self, as_error *err,
 		return err->code;
 	}
 
+	if (self && self->result_format == RESULT_FORMAT_RECORD) {
+		if (bins_to_pyobject(self, err, rec, &py_rec_bins, cnvt_list_to_map) !=
+			AEROSPIKE_OK) {
+			Py_CLEAR(py_rec_key);
+			return err->code;
+		}
+
+		*obj = AerospikeRecord_New(py_rec_key, rec, py_rec_bins);
+		if (!*obj) {
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Failed to create a record");
+		}
+		return err->code;
+	}
+
 	if (metadata_to_pyobject(err, rec, &py_rec_meta) != AEROSPIKE_OK) {
 		Py_CLEAR(py_rec_key);
 		return err->code;
@@ -1884,8 +1942,17 @@ static bool do_bins_to_pyobject_each(const char *name, const as_val *val,
 		return false;
 	}
 
-	PyDict_SetItemString(py_bins, name, py_val);
+	PyObject *py_name = bin_name_cache_get(
+		convd->client ? convd->client->bin_name_cache : NULL, name);
+	if (!py_name) {
+		Py_DECREF(py_val);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to build bin name");
+		return false;
+	}
+
+	PyDict_SetItem(py_bins, py_name, py_val);
 
+	Py_DECREF(py_name);
 	Py_DECREF(py_val);
 
 	convd->count++;
@@ -1916,6 +1983,12 @@ as_status bins_to_pyobject(AerospikeClient *self, as_error *err,
 		return as_error_update(err, AEROSPIKE_ERR_CLIENT, "record is null");
 	}
 
+	if (self && self->lazy_bins) {
+		// The bins are converted when they are accessed.
+		return AerospikeLazyBins_New(self, err, (as_record *)rec,
+									 cnvt_list_to_map, py_bins);
+	}
+
 	*py_bins = PyDict_New();
 
 	conversion_data convd = {
@@ -1977,7 +2050,13 @@ as_status operate_bins_to_pyobject(AerospikeClient *self, as_error *err,
 							"Null entry in operate ordered conversion");
 			goto CLEANUP;
 		}
-		py_bin_pair = Py_BuildValue("sO", as_bin_get_name(bin), py_bin_value);
+		PyObject *py_bin_name =
+			bin_name_cache_get(self ? self->bin_name_cache : NULL,
+							   as_bin_get_name(bin));
+		if (py_bin_name) {
+			py_bin_pair = PyTuple_Pack(2, py_bin_name, py_bin_value);
+			Py_DECREF(py_bin_name);
+		}
 		if (!py_bin_pair) {
 			as_error_update(err, AEROSPIKE_ERR_CLIENT,
 							"Unable to build bin entry");
@@ -1998,6 +2077,46 @@ CLEANUP:
 	return err->code;
 }
 
+as_record *record_take_bins(as_record *rec)
+{
+	as_record *copy = as_record_new(rec->bins.size);
+	copy->gen = rec->gen;
+	copy->ttl = rec->ttl;
+
+	for (uint16_t i = 0; i < rec->bins.size; i++) {
+		as_bin *src = &rec->bins.entries[i];
+		as_bin *dst = &copy->bins.entries[i];
+
+		strcpy(dst->name, src->name);
+		if (src->valuep == &src->value) {
+			// Scalars and strings are stored in the bin itself.
+			dst->value = src->value;
+			dst->valuep = &dst->value;
+		}
+		else {
+			dst->valuep = src->valuep;
+		}
+		// The copy owns the value now, leave nothing to destroy.
+		src->valuep = (as_bin_value *)&as_nil;
+	}
+	copy->bins.size = rec->bins.size;
+	return copy;
+}
+
+as_record *record_take(as_record *rec)
+{
+	as_record *copy = record_take_bins(rec);
+
+	copy->key = rec->key;
+	copy->key._free = false;
+	if (rec->key.valuep == &rec->key.value) {
+		copy->key.valuep = &copy->key.value;
+	}
+	// The copy owns the key value too.
+	rec->key.valuep = NULL;
+	return copy;
+}
+
 as_status metadata_to_pyobject(as_error *err, const as_record *rec,
 							   PyObject **obj)
 {
@@ -2265,6 +2384,21 @@ as_status pyobject_to_index(AerospikeClient *self, as_error *err,
 	return err->code;
 }
 
+/*
+ * Build the result of a key without a record, a (key, None, None) tuple.
+ * The reference to py_key is stolen.
+ */
+PyObject *missing_record_to_pyobject(AerospikeClient *self, PyObject *py_key)
+{
+	if (self && self->result_format == RESULT_FORMAT_RECORD) {
+		return AerospikeRecord_New(py_key, NULL, NULL);
+	}
+
+	PyObject *py_rec = Py_BuildValue("OOO", py_key, Py_None, Py_None);
+	Py_DECREF(py_key);
+	return py_rec;
+}
+
 as_status as_batch_read_results_to_pyobject(as_error *err,
 											AerospikeClient *client,
 											const as_batch_read *results,
@@ -2299,8 +2433,7 @@ as_status as_batch_read_results_to_pyobject(as_error *err,
 				Py_XDECREF(temp_py_recs);
 				return err->code;
 			}
-			py_rec = Py_BuildValue("OOO", py_key, Py_None, Py_None);
-			Py_DECREF(py_key);
+			py_rec = missing_record_to_pyobject(client, py_key);
 		}
 
 		if (!py_rec) {
@@ -2357,8 +2490,7 @@ as_status batch_read_records_to_pyobject(AerospikeClient *self, as_error *err,
 				Py_CLEAR(*py_recs);
 				return err->code;
 			}
-			py_rec = Py_BuildValue("OOO", py_key, Py_None, Py_None);
-			Py_DECREF(py_key);
+			py_rec = missing_record_to_pyobject(self, py_key);
 			if (!py_rec) {
 				as_error_update(err, AEROSPIKE_ERR_CLIENT,
 								"Failed to create a record tuple");
@@ -32,6 +32,7 @@
 #include "cdt_operation_utils.h"
 #include "geo.h"
 #include "cdt_types.h"
+#include "compiled_expression.h"
 
 // EXPR OPS
 enum expr_ops {
@@ -1495,6 +1496,15 @@ add_expr_macros(AerospikeClient *self, as_static_pool *static_pool,
 as_status convert_exp_list(AerospikeClient *self, PyObject *py_exp_list,
 						   as_exp **exp_list, as_error *err)
 {
+	// Already packed, the caller gets a copy it can destroy as usual.
+	if (AerospikeCompiledExpression_Check(py_exp_list)) {
+		as_exp *compiled = AerospikeCompiledExpression_Get(py_exp_list);
+		size_t exp_size = sizeof(as_exp) + compiled->packed_sz;
+		*exp_list = cf_malloc(exp_size);
+		memcpy(*exp_list, compiled, exp_size);
+		return err->code;
+	}
+
 	int bottom = 0;
 	Py_ssize_t size = PyList_Size(py_exp_list);
 	if (size <= 0) {
@@ -18,11 +18,26 @@
 
 #include <aerospike/aerospike_index.h>
 #include <aerospike/aerospike_key.h>
+#include <aerospike/as_atomic.h>
 #include <aerospike/as_error.h>
 #include <aerospike/as_exp.h>
  
 #include "client.h"
 #include "conversions.h"
+#include "scan.h"
+
+/*
+ * A checkpoint is laid out as:
+ *   magic, version, flags (CHECKPOINT_DONE)
+ *   ns length, ns, set length, set
+ *   part_begin, part_count (little endian uint16)
+ *   bitmap of the done partitions, bitmap of those with a digest
+ *   the digests, in partition order
+ */
+#define CHECKPOINT_MAGIC "ASCP"
+#define CHECKPOINT_MAGIC_SIZE 4
+#define CHECKPOINT_VERSION 1
+#define CHECKPOINT_DONE 0x01
 
 as_partitions_status*
 parts_setup(uint16_t part_begin, uint16_t part_count, const as_digest* digest)
@@ -153,3 +168,221 @@ as_status convert_partition_filter(AerospikeClient *self,
 
 	return err->code;
 }
+
+as_status partitions_status_to_pyobject(as_error *err,
+										const as_partitions_status *parts_all,
+										PyObject **py_status)
+{
+	PyObject *py_dict = PyDict_New();
+	if (!py_dict) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to create partition status dict");
+	}
+
+	for (uint16_t i = 0; parts_all && i < parts_all->part_count; i++) {
+		const as_partition_status *ps = &parts_all->parts[i];
+		// The digest is only set once a record of the partition was read.
+		uint8_t digest[AS_DIGEST_VALUE_SIZE] = {0};
+		if (ps->digest.init) {
+			memcpy(digest, ps->digest.value, AS_DIGEST_VALUE_SIZE);
+		}
+
+		PyObject *py_id = PyLong_FromLong(ps->part_id);
+		PyObject *py_part = Py_BuildValue(
+			"(ONNN)", py_id, PyBool_FromLong(ps->digest.init),
+			PyBool_FromLong(ps->done),
+			PyByteArray_FromStringAndSize((const char *)digest,
+										  AS_DIGEST_VALUE_SIZE));
+
+		if (!py_id || !py_part || PyDict_SetItem(py_dict, py_id, py_part)) {
+			Py_XDECREF(py_id);
+			Py_XDECREF(py_part);
+			Py_DECREF(py_dict);
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Unable to convert partition status");
+		}
+		Py_DECREF(py_id);
+		Py_DECREF(py_part);
+	}
+
+	*py_status = py_dict;
+	return AEROSPIKE_OK;
+}
+
+/*
+ * Copy the status of a partition which a running scan may be updating: the
+ * digest is rewritten after every record, so read until two copies agree.
+ */
+static void partition_status_read(const as_partition_status *src,
+								  as_partition_status *dst)
+{
+	as_partition_status again;
+
+	memcpy(dst, src, sizeof(as_partition_status));
+	while (true) {
+		as_fence_memory();
+		memcpy(&again, src, sizeof(as_partition_status));
+		if (memcmp(&again, dst, sizeof(as_partition_status)) == 0) {
+			return;
+		}
+		memcpy(dst, &again, sizeof(as_partition_status));
+	}
+}
+
+as_status partitions_status_to_checkpoint(as_error *err, const char *ns,
+										  const char *set,
+										  const as_partitions_status *parts_all,
+										  PyObject **py_checkpoint)
+{
+	if (!parts_all) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "No partition status to checkpoint");
+	}
+
+	size_t ns_len = strlen(ns);
+	size_t set_len = strlen(set);
+	uint16_t part_count = parts_all->part_count;
+	size_t bitmap_size = (part_count + 7) / 8;
+	size_t header_size = CHECKPOINT_MAGIC_SIZE + 2 + 1 + ns_len + 1 +
+						 set_len + 2 * sizeof(uint16_t);
+
+	// Room for every digest; the bytes are shrunk to those which are set.
+	PyObject *py_bytes = PyBytes_FromStringAndSize(
+		NULL, header_size + 2 * bitmap_size +
+				  (size_t)part_count * AS_DIGEST_VALUE_SIZE);
+	if (!py_bytes) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to allocate checkpoint");
+	}
+
+	uint8_t *p = (uint8_t *)PyBytes_AS_STRING(py_bytes);
+	memcpy(p, CHECKPOINT_MAGIC, CHECKPOINT_MAGIC_SIZE);
+	p += CHECKPOINT_MAGIC_SIZE;
+	*p++ = CHECKPOINT_VERSION;
+	*p++ = parts_all->done ? CHECKPOINT_DONE : 0;
+	*p++ = (uint8_t)ns_len;
+	memcpy(p, ns, ns_len);
+	p += ns_len;
+	*p++ = (uint8_t)set_len;
+	memcpy(p, set, set_len);
+	p += set_len;
+	*p++ = parts_all->part_begin & 0xff;
+	*p++ = parts_all->part_begin >> 8;
+	*p++ = part_count & 0xff;
+	*p++ = part_count >> 8;
+
+	uint8_t *done_bits = p;
+	uint8_t *init_bits = done_bits + bitmap_size;
+	uint8_t *digests = init_bits + bitmap_size;
+	memset(done_bits, 0, 2 * bitmap_size);
+
+	for (uint16_t i = 0; i < part_count; i++) {
+		as_partition_status ps;
+		partition_status_read(&parts_all->parts[i], &ps);
+
+		if (ps.done) {
+			done_bits[i / 8] |= 1 << (i % 8);
+		}
+		if (ps.digest.init) {
+			init_bits[i / 8] |= 1 << (i % 8);
+			memcpy(digests, ps.digest.value, AS_DIGEST_VALUE_SIZE);
+			digests += AS_DIGEST_VALUE_SIZE;
+		}
+	}
+
+	if (_PyBytes_Resize(&py_bytes,
+						digests - (uint8_t *)PyBytes_AS_STRING(py_bytes))) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to allocate checkpoint");
+	}
+
+	*py_checkpoint = py_bytes;
+	return AEROSPIKE_OK;
+}
+
+as_status checkpoint_to_partitions_status(as_error *err, const char *ns,
+										  const char *set,
+										  PyObject *py_checkpoint,
+										  as_partitions_status **parts_all)
+{
+	if (!PyBytes_Check(py_checkpoint)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "checkpoint must be bytes");
+	}
+
+	const uint8_t *p = (const uint8_t *)PyBytes_AS_STRING(py_checkpoint);
+	const uint8_t *end = p + PyBytes_GET_SIZE(py_checkpoint);
+
+	if (end - p < CHECKPOINT_MAGIC_SIZE + 3 ||
+		memcmp(p, CHECKPOINT_MAGIC, CHECKPOINT_MAGIC_SIZE) != 0) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid checkpoint");
+	}
+	p += CHECKPOINT_MAGIC_SIZE;
+
+	if (*p++ != CHECKPOINT_VERSION) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "Unsupported checkpoint version %u", p[-1]);
+	}
+	bool all_done = *p++ & CHECKPOINT_DONE;
+
+	// The namespace and set the checkpoint was taken from must match.
+	size_t ns_len = *p++;
+	if (end - p < ns_len + 1 || ns_len != strlen(ns) ||
+		memcmp(p, ns, ns_len) != 0) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "Checkpoint is not of namespace %s", ns);
+	}
+	p += ns_len;
+
+	size_t set_len = *p++;
+	if (end - p < set_len || set_len != strlen(set) ||
+		memcmp(p, set, set_len) != 0) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "Checkpoint is not of set %s", set);
+	}
+	p += set_len;
+
+	if (end - p < 2 * sizeof(uint16_t)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid checkpoint");
+	}
+	uint16_t part_begin = p[0] | (p[1] << 8);
+	uint16_t part_count = p[2] | (p[3] << 8);
+	p += 2 * sizeof(uint16_t);
+
+	size_t bitmap_size = (part_count + 7) / 8;
+	if (part_count == 0 || part_begin + part_count > CLUSTER_NPARTITIONS ||
+		end - p < 2 * bitmap_size) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid checkpoint");
+	}
+
+	const uint8_t *done_bits = p;
+	const uint8_t *init_bits = done_bits + bitmap_size;
+	const uint8_t *digests = init_bits + bitmap_size;
+
+	size_t n_digests = 0;
+	for (uint16_t i = 0; i < part_count; i++) {
+		n_digests += (init_bits[i / 8] >> (i % 8)) & 1;
+	}
+	if (end - digests != n_digests * AS_DIGEST_VALUE_SIZE) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid checkpoint");
+	}
+
+	as_partitions_status *status = parts_setup(part_begin, part_count, NULL);
+	status->done = all_done;
+
+	for (uint16_t i = 0; i < part_count; i++) {
+		as_partition_status *ps = &status->parts[i];
+
+		ps->done = (done_bits[i / 8] >> (i % 8)) & 1;
+		if ((init_bits[i / 8] >> (i % 8)) & 1) {
+			ps->digest.init = true;
+			memcpy(ps->digest.value, digests, AS_DIGEST_VALUE_SIZE);
+			digests += AS_DIGEST_VALUE_SIZE;
+		}
+	}
+
+	*parts_all = status;
+	return AEROSPIKE_OK;
+}
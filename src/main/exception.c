@@ -28,6 +28,98 @@
 
 static PyObject *module;
 
+// Exception classes indexed by error code, offset by EXCEPTION_CODE_MIN.
+// Filled once the module is created, codes out of range raise
+// AerospikeError.
+#define EXCEPTION_CODE_MIN -64
+#define EXCEPTION_CODE_MAX 511
+
+static PyObject *exception_by_code[EXCEPTION_CODE_MAX - EXCEPTION_CODE_MIN + 1];
+static PyObject *base_exception;
+
+// Positional arguments of AerospikeError, as built by error_to_pyobject().
+static const char *exception_arg_names[] = {"code", "msg", "file", "line",
+											"in_doubt"};
+
+#define EXCEPTION_ARG_CNT                                                      \
+	(sizeof(exception_arg_names) / sizeof(exception_arg_names[0]))
+
+/**
+ * AerospikeError.__init__(self, code, msg, file, line, in_doubt)
+ * Stores the error on the instance, leaving the class attributes as the
+ * defaults of omitted arguments. Exceptions created with other arguments,
+ * such as a message alone, keep the class defaults.
+ */
+static PyObject *AerospikeError_Init(PyObject *unused, PyObject *args)
+{
+	Py_ssize_t size = PyTuple_Size(args);
+	if (size < 1) {
+		PyErr_SetString(PyExc_TypeError,
+						"__init__() missing the exception instance");
+		return NULL;
+	}
+
+	PyObject *py_self = PyTuple_GetItem(args, 0);
+	PyObject *py_args = PyTuple_GetSlice(args, 1, size);
+	if (!py_args) {
+		return NULL;
+	}
+
+	// Only the arguments built by error_to_pyobject() start with the code.
+	if (size > 1 && PyInt_Check(PyTuple_GetItem(py_args, 0))) {
+		for (Py_ssize_t i = 1;
+			 i < size && i <= (Py_ssize_t)EXCEPTION_ARG_CNT; i++) {
+			if (PyObject_SetAttrString(py_self, exception_arg_names[i - 1],
+									   PyTuple_GetItem(args, i)) == -1) {
+				Py_DECREF(py_args);
+				return NULL;
+			}
+		}
+	}
+
+	int rc = ((PyTypeObject *)PyExc_BaseException)
+				 ->tp_init(py_self, py_args, NULL);
+	Py_DECREF(py_args);
+	if (rc == -1) {
+		return NULL;
+	}
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef AerospikeError_Init_Def = {
+	"__init__", (PyCFunction)AerospikeError_Init, METH_VARARGS,
+	"Store the error code, message, file, line and in_doubt on the instance."};
+
+static void exception_by_code_init(void)
+{
+	PyObject *py_key = NULL, *py_value = NULL;
+	Py_ssize_t pos = 0;
+	PyObject *py_module_dict = PyModule_GetDict(module);
+
+	memset(exception_by_code, 0, sizeof(exception_by_code));
+	base_exception = PyDict_GetItemString(py_module_dict, "AerospikeError");
+
+	while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
+		if (!PyType_Check(py_value)) {
+			continue;
+		}
+		PyObject *py_code = PyObject_GetAttrString(py_value, "code");
+		if (!py_code) {
+			PyErr_Clear();
+			continue;
+		}
+		if (PyInt_Check(py_code)) {
+			long code = PyInt_AsLong(py_code);
+			// Classes sharing a code raise the first one defined.
+			if (code >= EXCEPTION_CODE_MIN && code <= EXCEPTION_CODE_MAX &&
+				!exception_by_code[code - EXCEPTION_CODE_MIN]) {
+				exception_by_code[code - EXCEPTION_CODE_MIN] = py_value;
+			}
+		}
+		Py_DECREF(py_code);
+	}
+}
+
 PyObject *AerospikeException_New(void)
 {
 	MOD_DEF(module, "aerospike.exception", "Exception objects", -1, NULL, NULL);
@@ -157,6 +249,13 @@ PyObject *AerospikeException_New(void)
 	PyDict_SetItemString(py_dict, "file", Py_None);
 	PyDict_SetItemString(py_dict, "msg", Py_None);
 	PyDict_SetItemString(py_dict, "line", Py_None);
+	PyDict_SetItemString(py_dict, "in_doubt", Py_None);
+
+	PyObject *py_init_func = PyCFunction_New(&AerospikeError_Init_Def, NULL);
+	PyObject *py_init = PyInstanceMethod_New(py_init_func);
+	Py_DECREF(py_init_func);
+	PyDict_SetItemString(py_dict, "__init__", py_init);
+	Py_DECREF(py_init);
 
 	exceptions_array.AerospikeError =
 		PyErr_NewException("exception.AerospikeError", NULL, py_dict);
@@ -503,63 +602,61 @@ PyObject *AerospikeException_New(void)
 	PyObject_SetAttrString(exceptions_array.QueryQueueFull, "code", py_code);
 	Py_DECREF(py_code);
 
+	exception_by_code_init();
+
 	return module;
 }
 
 PyObject *raise_exception(as_error *err)
 {
-	PyObject *py_key = NULL, *py_value = NULL;
-	Py_ssize_t pos = 0;
-	PyObject *py_module_dict = PyModule_GetDict(module);
-	bool found = false;
-
-	while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
-		if (PyObject_HasAttrString(py_value, "code")) {
-			PyObject *py_code = PyObject_GetAttrString(py_value, "code");
-			if (py_code == Py_None) {
-				continue;
-			}
-			if (err->code == PyInt_AsLong(py_code)) {
-				found = true;
-				PyObject *py_attr = NULL;
-				py_attr = PyString_FromString(err->message);
-				PyObject_SetAttrString(py_value, "msg", py_attr);
-				Py_DECREF(py_attr);
-
-				// as_error.file is a char* so this may be null
-				if (err->file) {
-					py_attr = PyString_FromString(err->file);
-					PyObject_SetAttrString(py_value, "file", py_attr);
-					Py_DECREF(py_attr);
-				}
-				else {
-					PyObject_SetAttrString(py_value, "file", Py_None);
-				}
-				// If the line is 0, set it as None
-				if (err->line > 0) {
-					py_attr = PyInt_FromLong(err->line);
-					PyObject_SetAttrString(py_value, "line", py_attr);
-					Py_DECREF(py_attr);
-				}
-				else {
-					PyObject_SetAttrString(py_value, "line", Py_None);
-				}
-
-				PyObject_SetAttrString(py_value, "in_doubt",
-									   PyBool_FromLong(err->in_doubt));
-
-				break;
-			}
-			Py_DECREF(py_code);
-		}
+	PyObject *py_exception_type = NULL;
+	if (err->code >= EXCEPTION_CODE_MIN && err->code <= EXCEPTION_CODE_MAX) {
+		py_exception_type = exception_by_code[err->code - EXCEPTION_CODE_MIN];
 	}
 	// We haven't found the right exception, just use AerospikeError
-	if (!found) {
-		PyObject *base_exception =
-			PyDict_GetItemString(py_module_dict, "AerospikeError");
-		if (base_exception) {
-			py_value = base_exception;
-		}
+	return py_exception_type ? py_exception_type : base_exception;
+}
+
+/**
+ * Set the exception instance attribute attr_name, if the class has one.
+ */
+static void set_exception_attr(PyObject *py_exception, const char *attr_name,
+							   PyObject *py_value)
+{
+	if (py_value && PyObject_HasAttrString(py_exception, attr_name)) {
+		PyObject_SetAttrString(py_exception, attr_name, py_value);
 	}
-	return py_value;
+}
+
+void raise_exception_base(as_error *err, PyObject *py_key, PyObject *py_bin,
+						  PyObject *py_module, PyObject *py_func,
+						  PyObject *py_name)
+{
+	PyObject *py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *py_exception_type = raise_exception(err);
+
+	// An exception may already be set by a failed conversion, put it aside
+	// while the instance is created and let PyErr_SetObject() replace it.
+	PyObject *py_prev_type = NULL, *py_prev_value = NULL, *py_prev_tb = NULL;
+	PyErr_Fetch(&py_prev_type, &py_prev_value, &py_prev_tb);
+
+	PyObject *py_exception = PyObject_Call(py_exception_type, py_err, NULL);
+	Py_DECREF(py_err);
+	if (!py_exception) {
+		Py_XDECREF(py_prev_type);
+		Py_XDECREF(py_prev_value);
+		Py_XDECREF(py_prev_tb);
+		return;
+	}
+
+	set_exception_attr(py_exception, "key", py_key);
+	set_exception_attr(py_exception, "bin", py_bin);
+	set_exception_attr(py_exception, "module", py_module);
+	set_exception_attr(py_exception, "func", py_func);
+	set_exception_attr(py_exception, "name", py_name);
+
+	PyErr_Restore(py_prev_type, py_prev_value, py_prev_tb);
+	PyErr_SetObject(py_exception_type, py_exception);
+	Py_DECREF(py_exception);
 }
@@ -0,0 +1,231 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_partition.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_val.h>
+
+#include "conversions.h"
+#include "foreach_chunk.h"
+#include "scan.h"
+
+as_status foreach_chunk_size(as_error *err, PyObject *py_chunk_size,
+							 uint32_t *chunk_size)
+{
+	*chunk_size = 0;
+
+	if (!py_chunk_size || py_chunk_size == Py_None) {
+		return AEROSPIKE_OK;
+	}
+
+	long size = PyInt_Check(py_chunk_size) ? PyInt_AsLong(py_chunk_size) : -1;
+	if (size <= 0 || size > UINT32_MAX) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "chunk_size must be a positive integer");
+	}
+	*chunk_size = (uint32_t)size;
+	return AEROSPIKE_OK;
+}
+
+void foreach_chunk_init(ForeachChunk *chunk, AerospikeClient *client,
+						PyObject *callback, uint32_t chunk_size,
+						bool partition_ids)
+{
+	pthread_mutex_init(&chunk->lock, NULL);
+	chunk->client = client;
+	chunk->callback = callback;
+	chunk->vals = NULL;
+	chunk->n_vals = 0;
+	chunk->chunk_size = chunk_size;
+	chunk->partition_ids = partition_ids;
+	chunk->stopped = false;
+	as_error_init(&chunk->error);
+}
+
+static void foreach_chunk_release(as_val **vals, uint32_t n_vals)
+{
+	for (uint32_t i = 0; i < n_vals; i++) {
+		as_val_destroy(vals[i]);
+	}
+	cf_free(vals);
+}
+
+/**
+ * Convert vals, which the caller hands over, and pass them to the callback.
+ * Must be called with the GIL. Returns false once the callback is stopped.
+ */
+static bool foreach_chunk_deliver(ForeachChunk *chunk, as_val **vals,
+								  uint32_t n_vals)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject *py_chunk = NULL;
+	PyObject *py_return = NULL;
+
+	pthread_mutex_lock(&chunk->lock);
+	bool stopped = chunk->stopped;
+	pthread_mutex_unlock(&chunk->lock);
+
+	// Another thread stopped the callback while this one waited for the GIL.
+	if (stopped) {
+		foreach_chunk_release(vals, n_vals);
+		return false;
+	}
+
+	py_chunk = PyList_New(n_vals);
+	if (!py_chunk) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Unable to build chunk");
+		goto CLEANUP;
+	}
+
+	for (uint32_t i = 0; i < n_vals; i++) {
+		PyObject *py_val = NULL;
+
+		if (val_to_pyobject(chunk->client, &err, vals[i], &py_val) !=
+			AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+
+		if (chunk->partition_ids) {
+			as_record *rec = as_record_fromval(vals[i]);
+			uint32_t part_id = 0;
+
+			if (rec && rec->key.digest.init) {
+				part_id = as_partition_getid(rec->key.digest.value,
+											 CLUSTER_NPARTITIONS);
+			}
+			PyObject *py_pair = Py_BuildValue("(IN)", part_id, py_val);
+			if (!py_pair) {
+				as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+								"Unable to build partition entry");
+				goto CLEANUP;
+			}
+			py_val = py_pair;
+		}
+		PyList_SET_ITEM(py_chunk, i, py_val);
+	}
+
+	// The records are no longer needed once converted.
+	foreach_chunk_release(vals, n_vals);
+	vals = NULL;
+
+	py_return = PyObject_CallFunctionObjArgs(chunk->callback, py_chunk, NULL);
+	if (!py_return) {
+		PyErr_Clear();
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Callback function raised an exception");
+		goto CLEANUP;
+	}
+
+CLEANUP:
+	if (vals) {
+		foreach_chunk_release(vals, n_vals);
+	}
+	Py_XDECREF(py_chunk);
+
+	stopped = err.code != AEROSPIKE_OK || py_return == Py_False;
+	Py_XDECREF(py_return);
+
+	if (stopped) {
+		pthread_mutex_lock(&chunk->lock);
+		if (!chunk->stopped) {
+			chunk->stopped = true;
+			as_error_copy(&chunk->error, &err);
+		}
+		pthread_mutex_unlock(&chunk->lock);
+	}
+	return !stopped;
+}
+
+bool foreach_chunk_add(ForeachChunk *chunk, const as_val *val)
+{
+	if (!val) {
+		return false;
+	}
+
+	as_val *copy = NULL;
+	if (as_val_type(val) == AS_REC) {
+		copy = (as_val *)record_take((as_record *)val);
+	}
+	else {
+		copy = as_val_reserve((as_val *)val);
+	}
+
+	as_val **full = NULL;
+	uint32_t n_full = 0;
+
+	pthread_mutex_lock(&chunk->lock);
+	if (chunk->stopped) {
+		pthread_mutex_unlock(&chunk->lock);
+		as_val_destroy(copy);
+		return false;
+	}
+
+	if (!chunk->vals) {
+		chunk->vals = cf_malloc(sizeof(as_val *) * chunk->chunk_size);
+	}
+	chunk->vals[chunk->n_vals++] = copy;
+
+	if (chunk->n_vals == chunk->chunk_size) {
+		full = chunk->vals;
+		n_full = chunk->n_vals;
+		chunk->vals = NULL;
+		chunk->n_vals = 0;
+	}
+	pthread_mutex_unlock(&chunk->lock);
+
+	if (!full) {
+		return true;
+	}
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+	bool rval = foreach_chunk_deliver(chunk, full, n_full);
+	PyGILState_Release(gstate);
+
+	return rval;
+}
+
+void foreach_chunk_flush(ForeachChunk *chunk)
+{
+	as_val **vals = chunk->vals;
+	uint32_t n_vals = chunk->n_vals;
+
+	chunk->vals = NULL;
+	chunk->n_vals = 0;
+
+	if (vals) {
+		foreach_chunk_deliver(chunk, vals, n_vals);
+	}
+}
+
+void foreach_chunk_destroy(ForeachChunk *chunk)
+{
+	if (chunk->vals) {
+		foreach_chunk_release(chunk->vals, chunk->n_vals);
+		chunk->vals = NULL;
+		chunk->n_vals = 0;
+	}
+	pthread_mutex_destroy(&chunk->lock);
+}
@@ -0,0 +1,346 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "bin_name_cache.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "lazy_bins.h"
+
+typedef struct {
+	PyObject_HEAD
+	// Needed to deserialize the values, a strong reference.
+	AerospikeClient *client;
+	// The bins not converted yet, owned by the mapping.
+	as_record *rec;
+	// The bins converted so far.
+	PyObject *py_bins;
+	bool cnvt_list_to_map;
+} AerospikeLazyBins;
+
+static PyTypeObject AerospikeLazyBins_Type;
+
+static PyObject *lazy_bins_raise(as_error *err)
+{
+	PyObject *py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *exception_type = raise_exception(err);
+	PyErr_SetObject(exception_type, py_err);
+	Py_DECREF(py_err);
+	return NULL;
+}
+
+/**
+ * Convert the bin at index, unless it already is. Returns a borrowed
+ * reference, or NULL with err set.
+ */
+static PyObject *lazy_bins_convert(AerospikeLazyBins *self, as_error *err,
+								   uint16_t index)
+{
+	as_bin *bin = &self->rec->bins.entries[index];
+	PyObject *py_name = bin_name_cache_get(self->client->bin_name_cache,
+										   bin->name);
+	if (!py_name) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to build bin name");
+		return NULL;
+	}
+
+	PyObject *py_val = PyDict_GetItem(self->py_bins, py_name);
+	if (py_val) {
+		Py_DECREF(py_name);
+		return py_val;
+	}
+
+	if (self->cnvt_list_to_map) {
+		val_to_pyobject_cnvt_list_to_map(self->client, err,
+										 (as_val *)bin->valuep, &py_val);
+	}
+	else {
+		val_to_pyobject(self->client, err, (as_val *)bin->valuep, &py_val);
+	}
+	if (err->code != AEROSPIKE_OK) {
+		Py_DECREF(py_name);
+		return NULL;
+	}
+
+	PyDict_SetItem(self->py_bins, py_name, py_val);
+	Py_DECREF(py_name);
+	Py_DECREF(py_val);
+	return py_val;
+}
+
+/**
+ * Convert every bin. Returns a borrowed reference to the dict of all bins.
+ */
+static PyObject *lazy_bins_materialize(AerospikeLazyBins *self)
+{
+	as_error err;
+	as_error_init(&err);
+
+	if (PyDict_Size(self->py_bins) < self->rec->bins.size) {
+		for (uint16_t i = 0; i < self->rec->bins.size; i++) {
+			if (!lazy_bins_convert(self, &err, i)) {
+				return lazy_bins_raise(&err);
+			}
+		}
+	}
+	return self->py_bins;
+}
+
+static int lazy_bins_find(AerospikeLazyBins *self, PyObject *py_name)
+{
+	if (!PyUnicode_Check(py_name)) {
+		return -1;
+	}
+
+	const char *name = PyUnicode_AsUTF8(py_name);
+	if (!name) {
+		PyErr_Clear();
+		return -1;
+	}
+
+	for (uint16_t i = 0; i < self->rec->bins.size; i++) {
+		if (strcmp(self->rec->bins.entries[i].name, name) == 0) {
+			return i;
+		}
+	}
+	return -1;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikeLazyBins_Keys(AerospikeLazyBins *self,
+										PyObject *Py_UNUSED(args))
+{
+	PyObject *py_keys = PyList_New(self->rec->bins.size);
+
+	for (uint16_t i = 0; py_keys && i < self->rec->bins.size; i++) {
+		PyObject *py_name = bin_name_cache_get(
+			self->client->bin_name_cache, self->rec->bins.entries[i].name);
+		if (!py_name) {
+			Py_CLEAR(py_keys);
+			break;
+		}
+		PyList_SET_ITEM(py_keys, i, py_name);
+	}
+	return py_keys;
+}
+
+static PyObject *AerospikeLazyBins_Values(AerospikeLazyBins *self,
+										  PyObject *Py_UNUSED(args))
+{
+	PyObject *py_bins = lazy_bins_materialize(self);
+	return py_bins ? PyDict_Values(py_bins) : NULL;
+}
+
+static PyObject *AerospikeLazyBins_Items(AerospikeLazyBins *self,
+										 PyObject *Py_UNUSED(args))
+{
+	PyObject *py_bins = lazy_bins_materialize(self);
+	return py_bins ? PyDict_Items(py_bins) : NULL;
+}
+
+static PyObject *AerospikeLazyBins_Get(AerospikeLazyBins *self,
+									   PyObject *args)
+{
+	PyObject *py_name = NULL;
+	PyObject *py_default = Py_None;
+
+	if (!PyArg_ParseTuple(args, "O|O:get", &py_name, &py_default)) {
+		return NULL;
+	}
+
+	int index = lazy_bins_find(self, py_name);
+	if (index < 0) {
+		Py_INCREF(py_default);
+		return py_default;
+	}
+
+	as_error err;
+	as_error_init(&err);
+	PyObject *py_val = lazy_bins_convert(self, &err, (uint16_t)index);
+	if (!py_val) {
+		return lazy_bins_raise(&err);
+	}
+	Py_INCREF(py_val);
+	return py_val;
+}
+
+static PyObject *AerospikeLazyBins_To_Dict(AerospikeLazyBins *self,
+										   PyObject *Py_UNUSED(args))
+{
+	PyObject *py_bins = lazy_bins_materialize(self);
+	return py_bins ? PyDict_Copy(py_bins) : NULL;
+}
+
+static PyMethodDef AerospikeLazyBins_Type_Methods[] = {
+	{"keys", (PyCFunction)AerospikeLazyBins_Keys, METH_NOARGS,
+	 "The list of bin names. No bin is converted."},
+	{"values", (PyCFunction)AerospikeLazyBins_Values, METH_NOARGS,
+	 "The list of bin values. Every bin is converted."},
+	{"items", (PyCFunction)AerospikeLazyBins_Items, METH_NOARGS,
+	 "The list of (bin name, value) tuples. Every bin is converted."},
+	{"get", (PyCFunction)AerospikeLazyBins_Get, METH_VARARGS,
+	 "The value of a bin, or the default if the record has no such bin."},
+	{"to_dict", (PyCFunction)AerospikeLazyBins_To_Dict, METH_NOARGS,
+	 "A dict of all the bins. Every bin is converted."},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static Py_ssize_t AerospikeLazyBins_Type_Len(AerospikeLazyBins *self)
+{
+	return self->rec->bins.size;
+}
+
+static PyObject *AerospikeLazyBins_Type_Subscript(AerospikeLazyBins *self,
+												  PyObject *py_name)
+{
+	int index = lazy_bins_find(self, py_name);
+	if (index < 0) {
+		PyErr_SetObject(PyExc_KeyError, py_name);
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+	PyObject *py_val = lazy_bins_convert(self, &err, (uint16_t)index);
+	if (!py_val) {
+		return lazy_bins_raise(&err);
+	}
+	Py_INCREF(py_val);
+	return py_val;
+}
+
+static int AerospikeLazyBins_Type_Contains(AerospikeLazyBins *self,
+										   PyObject *py_name)
+{
+	return lazy_bins_find(self, py_name) >= 0;
+}
+
+static PyObject *AerospikeLazyBins_Type_Iter(AerospikeLazyBins *self)
+{
+	PyObject *py_keys = AerospikeLazyBins_Keys(self, NULL);
+	if (!py_keys) {
+		return NULL;
+	}
+
+	PyObject *py_iter = PyObject_GetIter(py_keys);
+	Py_DECREF(py_keys);
+	return py_iter;
+}
+
+static PyObject *AerospikeLazyBins_Type_Repr(AerospikeLazyBins *self)
+{
+	PyObject *py_bins = lazy_bins_materialize(self);
+	return py_bins ? PyObject_Repr(py_bins) : NULL;
+}
+
+static PyObject *AerospikeLazyBins_Type_RichCompare(AerospikeLazyBins *self,
+													PyObject *py_other,
+													int op)
+{
+	if (op != Py_EQ && op != Py_NE) {
+		Py_RETURN_NOTIMPLEMENTED;
+	}
+
+	PyObject *py_bins = lazy_bins_materialize(self);
+	if (!py_bins) {
+		return NULL;
+	}
+
+	if (Py_TYPE(py_other) == &AerospikeLazyBins_Type) {
+		py_other = lazy_bins_materialize((AerospikeLazyBins *)py_other);
+		if (!py_other) {
+			return NULL;
+		}
+	}
+	return PyObject_RichCompare(py_bins, py_other, op);
+}
+
+static void AerospikeLazyBins_Type_Dealloc(AerospikeLazyBins *self)
+{
+	as_record_destroy(self->rec);
+	Py_XDECREF(self->py_bins);
+	Py_XDECREF(self->client);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PySequenceMethods AerospikeLazyBins_Type_Sequence = {
+	.sq_contains = (objobjproc)AerospikeLazyBins_Type_Contains};
+
+static PyMappingMethods AerospikeLazyBins_Type_Mapping = {
+	.mp_length = (lenfunc)AerospikeLazyBins_Type_Len,
+	.mp_subscript = (binaryfunc)AerospikeLazyBins_Type_Subscript};
+
+static PyTypeObject AerospikeLazyBins_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.LazyBins",
+	.tp_basicsize = sizeof(AerospikeLazyBins),
+	.tp_dealloc = (destructor)AerospikeLazyBins_Type_Dealloc,
+	.tp_repr = (reprfunc)AerospikeLazyBins_Type_Repr,
+	.tp_as_sequence = &AerospikeLazyBins_Type_Sequence,
+	.tp_as_mapping = &AerospikeLazyBins_Type_Mapping,
+	.tp_hash = PyObject_HashNotImplemented,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "The read-only mapping of the bins of a record read by a client\n"
+			  "created with lazy_bins. A bin is converted to Python when it\n"
+			  "is first accessed. dict(bins) converts all of them.\n",
+	.tp_richcompare = (richcmpfunc)AerospikeLazyBins_Type_RichCompare,
+	.tp_iter = (getiterfunc)AerospikeLazyBins_Type_Iter,
+	.tp_methods = AerospikeLazyBins_Type_Methods};
+
+PyTypeObject *AerospikeLazyBins_Ready()
+{
+	return PyType_Ready(&AerospikeLazyBins_Type) == 0 ? &AerospikeLazyBins_Type
+													  : NULL;
+}
+
+as_status AerospikeLazyBins_New(AerospikeClient *client, as_error *err,
+								as_record *rec, bool cnvt_list_to_map,
+								PyObject **py_bins)
+{
+	*py_bins = NULL;
+
+	AerospikeLazyBins *self =
+		PyObject_New(AerospikeLazyBins, &AerospikeLazyBins_Type);
+	if (!self) {
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Failed to create the bins mapping");
+	}
+
+	self->py_bins = PyDict_New();
+	self->rec = record_take_bins(rec);
+	self->cnvt_list_to_map = cnvt_list_to_map;
+	Py_INCREF(client);
+	self->client = client;
+
+	*py_bins = (PyObject *)self;
+	return AEROSPIKE_OK;
+}
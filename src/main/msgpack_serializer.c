@@ -0,0 +1,649 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <datetime.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_msgpack.h>
+#include <citrusleaf/alloc.h>
+
+#include "msgpack_serializer.h"
+
+// First byte of the serialized bytes. Pickles start with an opcode, never
+// with 0xc1 which msgpack leaves unused, so both can share AS_BYTES_PYTHON.
+#define MSGPACK_MARKER 0xc1
+
+// Deeper values, such as a list holding itself, are left to pickle.
+#define MSGPACK_MAX_DEPTH 128
+
+// msgpack ext types of the Python types msgpack has no type for.
+enum {
+	MSGPACK_EXT_TUPLE = 1,
+	MSGPACK_EXT_SET,
+	MSGPACK_EXT_FROZENSET,
+	MSGPACK_EXT_BYTEARRAY,
+	MSGPACK_EXT_DATETIME,
+	MSGPACK_EXT_DATE,
+	MSGPACK_EXT_TIME,
+	MSGPACK_EXT_TIMEDELTA,
+};
+
+static bool datetime_api_ready(void)
+{
+	if (!PyDateTimeAPI) {
+		PyDateTime_IMPORT;
+	}
+	return PyDateTimeAPI != NULL;
+}
+
+/*
+ *******************************************************************************************************
+ * Packing. Every function returns 0 on success and -1 when the value holds
+ * an unsupported type. A packer without a buffer only counts the size.
+ * Only exact types are packed so that no Python code runs between the
+ * counting and the writing pass.
+ *******************************************************************************************************
+ */
+
+typedef int (*pack_content_fn)(as_packer *pk, PyObject *value, int depth);
+
+static int pack_value(as_packer *pk, PyObject *value, int depth);
+
+static int pack_sequence(as_packer *pk, PyObject *value, int depth)
+{
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(value);
+	PyObject **items = PySequence_Fast_ITEMS(value);
+
+	if (size > UINT32_MAX || as_pack_list_header(pk, (uint32_t)size) != 0) {
+		return -1;
+	}
+	for (Py_ssize_t i = 0; i < size; i++) {
+		if (pack_value(pk, items[i], depth) != 0) {
+			return -1;
+		}
+	}
+	return 0;
+}
+
+static int pack_set(as_packer *pk, PyObject *value, int depth)
+{
+	Py_ssize_t size = PySet_GET_SIZE(value);
+	if (size > UINT32_MAX || as_pack_list_header(pk, (uint32_t)size) != 0) {
+		return -1;
+	}
+
+	PyObject *py_iter = PyObject_GetIter(value);
+	if (!py_iter) {
+		PyErr_Clear();
+		return -1;
+	}
+
+	int rc = 0;
+	PyObject *py_item = NULL;
+	while (rc == 0 && (py_item = PyIter_Next(py_iter))) {
+		rc = pack_value(pk, py_item, depth);
+		Py_DECREF(py_item);
+	}
+	Py_DECREF(py_iter);
+	return rc;
+}
+
+static int pack_dict(as_packer *pk, PyObject *value, int depth)
+{
+	Py_ssize_t size = PyDict_Size(value);
+	if (size > UINT32_MAX || as_pack_map_header(pk, (uint32_t)size) != 0) {
+		return -1;
+	}
+
+	Py_ssize_t pos = 0;
+	PyObject *py_key = NULL;
+	PyObject *py_val = NULL;
+	while (PyDict_Next(value, &pos, &py_key, &py_val)) {
+		if (pack_value(pk, py_key, depth) != 0 ||
+			pack_value(pk, py_val, depth) != 0) {
+			return -1;
+		}
+	}
+	return 0;
+}
+
+// An ext holding the msgpack content of a container.
+static int pack_ext_container(as_packer *pk, uint8_t type, PyObject *value,
+							  int depth, pack_content_fn pack_content)
+{
+	as_packer counter;
+	memset(&counter, 0, sizeof(counter));
+
+	if (pack_content(&counter, value, depth) != 0 ||
+		as_pack_ext_header(pk, counter.offset, type) != 0) {
+		return -1;
+	}
+	return pack_content(pk, value, depth);
+}
+
+static int pack_ints(as_packer *pk, const int64_t *values, uint32_t n)
+{
+	if (as_pack_list_header(pk, n) != 0) {
+		return -1;
+	}
+	for (uint32_t i = 0; i < n; i++) {
+		if (as_pack_int64(pk, values[i]) != 0) {
+			return -1;
+		}
+	}
+	return 0;
+}
+
+// An ext holding the fields of a datetime type as a list of ints.
+static int pack_ext_ints(as_packer *pk, uint8_t type, const int64_t *values,
+						 uint32_t n)
+{
+	as_packer counter;
+	memset(&counter, 0, sizeof(counter));
+
+	if (pack_ints(&counter, values, n) != 0 ||
+		as_pack_ext_header(pk, counter.offset, type) != 0) {
+		return -1;
+	}
+	return pack_ints(pk, values, n);
+}
+
+static int pack_long(as_packer *pk, PyObject *value)
+{
+	int overflow = 0;
+	long long val = PyLong_AsLongLongAndOverflow(value, &overflow);
+
+	if (overflow == 0) {
+		return as_pack_int64(pk, val);
+	}
+	if (overflow > 0) {
+		unsigned long long uval = PyLong_AsUnsignedLongLong(value);
+		if (uval == (unsigned long long)-1 && PyErr_Occurred()) {
+			PyErr_Clear();
+			return -1;
+		}
+		return as_pack_uint64(pk, uval);
+	}
+	return -1;
+}
+
+static int pack_value(as_packer *pk, PyObject *value, int depth)
+{
+	if (++depth > MSGPACK_MAX_DEPTH) {
+		return -1;
+	}
+
+	if (value == Py_None) {
+		return as_pack_nil(pk);
+	}
+	if (PyBool_Check(value)) {
+		return as_pack_bool(pk, value == Py_True);
+	}
+	if (PyLong_CheckExact(value)) {
+		return pack_long(pk, value);
+	}
+	if (PyFloat_CheckExact(value)) {
+		return as_pack_double(pk, PyFloat_AS_DOUBLE(value));
+	}
+	if (PyUnicode_CheckExact(value)) {
+		Py_ssize_t size = 0;
+		const char *str = PyUnicode_AsUTF8AndSize(value, &size);
+		if (!str) {
+			// Lone surrogates, which pickle can store.
+			PyErr_Clear();
+			return -1;
+		}
+		if (size > UINT32_MAX) {
+			return -1;
+		}
+		return as_pack_str(pk, (const uint8_t *)str, (uint32_t)size);
+	}
+	if (PyBytes_CheckExact(value)) {
+		Py_ssize_t size = PyBytes_GET_SIZE(value);
+		if (size > UINT32_MAX) {
+			return -1;
+		}
+		return as_pack_bin(pk, (const uint8_t *)PyBytes_AS_STRING(value),
+						   (uint32_t)size);
+	}
+	if (PyByteArray_CheckExact(value)) {
+		Py_ssize_t size = PyByteArray_GET_SIZE(value);
+		if (size > UINT32_MAX ||
+			as_pack_ext_header(pk, (uint32_t)size, MSGPACK_EXT_BYTEARRAY) !=
+				0) {
+			return -1;
+		}
+		return as_pack_append(pk,
+							  (const unsigned char *)PyByteArray_AS_STRING(value),
+							  (uint32_t)size);
+	}
+	if (PyList_CheckExact(value)) {
+		return pack_sequence(pk, value, depth);
+	}
+	if (PyDict_CheckExact(value)) {
+		return pack_dict(pk, value, depth);
+	}
+	if (PyTuple_CheckExact(value)) {
+		return pack_ext_container(pk, MSGPACK_EXT_TUPLE, value, depth,
+								  pack_sequence);
+	}
+	if (PySet_CheckExact(value)) {
+		return pack_ext_container(pk, MSGPACK_EXT_SET, value, depth, pack_set);
+	}
+	if (PyFrozenSet_CheckExact(value)) {
+		return pack_ext_container(pk, MSGPACK_EXT_FROZENSET, value, depth,
+								  pack_set);
+	}
+	if (PyDateTime_CheckExact(value)) {
+		// Aware datetimes keep their tzinfo only through pickle.
+		if (_PyDateTime_HAS_TZINFO(value)) {
+			return -1;
+		}
+		int64_t fields[] = {PyDateTime_GET_YEAR(value),
+							PyDateTime_GET_MONTH(value),
+							PyDateTime_GET_DAY(value),
+							PyDateTime_DATE_GET_HOUR(value),
+							PyDateTime_DATE_GET_MINUTE(value),
+							PyDateTime_DATE_GET_SECOND(value),
+							PyDateTime_DATE_GET_MICROSECOND(value),
+							PyDateTime_DATE_GET_FOLD(value)};
+		return pack_ext_ints(pk, MSGPACK_EXT_DATETIME, fields, 8);
+	}
+	if (PyDate_CheckExact(value)) {
+		int64_t fields[] = {PyDateTime_GET_YEAR(value),
+							PyDateTime_GET_MONTH(value),
+							PyDateTime_GET_DAY(value)};
+		return pack_ext_ints(pk, MSGPACK_EXT_DATE, fields, 3);
+	}
+	if (PyTime_CheckExact(value)) {
+		if (_PyDateTime_HAS_TZINFO(value)) {
+			return -1;
+		}
+		int64_t fields[] = {PyDateTime_TIME_GET_HOUR(value),
+							PyDateTime_TIME_GET_MINUTE(value),
+							PyDateTime_TIME_GET_SECOND(value),
+							PyDateTime_TIME_GET_MICROSECOND(value),
+							PyDateTime_TIME_GET_FOLD(value)};
+		return pack_ext_ints(pk, MSGPACK_EXT_TIME, fields, 5);
+	}
+	if (PyDelta_CheckExact(value)) {
+		int64_t fields[] = {PyDateTime_DELTA_GET_DAYS(value),
+							PyDateTime_DELTA_GET_SECONDS(value),
+							PyDateTime_DELTA_GET_MICROSECONDS(value)};
+		return pack_ext_ints(pk, MSGPACK_EXT_TIMEDELTA, fields, 3);
+	}
+
+	return -1;
+}
+
+bool msgpack_serialize(PyObject *value, as_bytes *bytes)
+{
+	if (!datetime_api_ready()) {
+		PyErr_Clear();
+		return false;
+	}
+
+	as_packer pk;
+	memset(&pk, 0, sizeof(pk));
+	if (pack_value(&pk, value, 0) != 0 || pk.offset >= UINT32_MAX) {
+		return false;
+	}
+
+	uint32_t size = pk.offset + 1;
+	uint8_t *buf = cf_malloc(size);
+	if (!buf) {
+		return false;
+	}
+	buf[0] = MSGPACK_MARKER;
+
+	memset(&pk, 0, sizeof(pk));
+	pk.buffer = buf + 1;
+	pk.capacity = size - 1;
+	if (pack_value(&pk, value, 0) != 0 || pk.offset != size - 1) {
+		cf_free(buf);
+		return false;
+	}
+
+	as_bytes_init_wrap(bytes, buf, size, true);
+	as_bytes_set_type(bytes, AS_BYTES_PYTHON);
+	return true;
+}
+
+/*
+ *******************************************************************************************************
+ * Unpacking. Every function returns a new reference, or NULL with a Python
+ * error set.
+ *******************************************************************************************************
+ */
+
+static PyObject *malformed(void)
+{
+	PyErr_SetString(PyExc_ValueError, "Malformed msgpack serialized value");
+	return NULL;
+}
+
+static const uint8_t *unpack_take(as_unpacker *pk, uint32_t n)
+{
+	if (pk->length - pk->offset < n) {
+		return NULL;
+	}
+	const uint8_t *p = pk->buffer + pk->offset;
+	pk->offset += n;
+	return p;
+}
+
+// Reads a big endian unsigned integer of n bytes.
+static bool unpack_uint(as_unpacker *pk, uint32_t n, uint64_t *val)
+{
+	const uint8_t *p = unpack_take(pk, n);
+	if (!p) {
+		return false;
+	}
+	*val = 0;
+	for (uint32_t i = 0; i < n; i++) {
+		*val = (*val << 8) | p[i];
+	}
+	return true;
+}
+
+static PyObject *unpack_value(as_unpacker *pk, int depth);
+
+static PyObject *unpack_list(as_unpacker *pk, uint32_t count, int depth)
+{
+	// Every element takes at least one byte.
+	if (count > pk->length - pk->offset) {
+		return malformed();
+	}
+
+	PyObject *py_list = PyList_New(count);
+	for (uint32_t i = 0; py_list && i < count; i++) {
+		PyObject *py_item = unpack_value(pk, depth);
+		if (!py_item) {
+			Py_CLEAR(py_list);
+			break;
+		}
+		PyList_SET_ITEM(py_list, i, py_item);
+	}
+	return py_list;
+}
+
+static PyObject *unpack_map(as_unpacker *pk, uint32_t count, int depth)
+{
+	if (count > (pk->length - pk->offset) / 2) {
+		return malformed();
+	}
+
+	PyObject *py_dict = PyDict_New();
+	for (uint32_t i = 0; py_dict && i < count; i++) {
+		PyObject *py_key = unpack_value(pk, depth);
+		PyObject *py_val = py_key ? unpack_value(pk, depth) : NULL;
+		if (!py_val || PyDict_SetItem(py_dict, py_key, py_val) != 0) {
+			Py_CLEAR(py_dict);
+		}
+		Py_XDECREF(py_key);
+		Py_XDECREF(py_val);
+	}
+	return py_dict;
+}
+
+// Unpacks the list of ints of a datetime type ext.
+static bool unpack_ints(as_unpacker *pk, int *values, uint32_t n)
+{
+	PyObject *py_list = unpack_value(pk, 0);
+	if (!py_list) {
+		return false;
+	}
+
+	bool ok = PyList_CheckExact(py_list) && PyList_GET_SIZE(py_list) == n;
+	for (uint32_t i = 0; ok && i < n; i++) {
+		PyObject *py_item = PyList_GET_ITEM(py_list, i);
+		ok = PyLong_CheckExact(py_item);
+		if (ok) {
+			values[i] = (int)PyLong_AsLong(py_item);
+			ok = !PyErr_Occurred();
+		}
+	}
+	Py_DECREF(py_list);
+
+	if (!ok && !PyErr_Occurred()) {
+		malformed();
+	}
+	return ok;
+}
+
+static PyObject *unpack_ext(as_unpacker *pk, uint32_t size, int depth)
+{
+	const uint8_t *type = unpack_take(pk, 1);
+	const uint8_t *data = type ? unpack_take(pk, size) : NULL;
+	if (!data) {
+		return malformed();
+	}
+
+	as_unpacker content = {.buffer = data, .offset = 0, .length = size};
+	PyObject *py_val = NULL;
+	int fields[8];
+
+	switch (*type) {
+	case MSGPACK_EXT_BYTEARRAY:
+		return PyByteArray_FromStringAndSize((const char *)data, size);
+	case MSGPACK_EXT_TUPLE:
+	case MSGPACK_EXT_SET:
+	case MSGPACK_EXT_FROZENSET: {
+		PyObject *py_list = unpack_value(&content, depth);
+		if (!py_list) {
+			return NULL;
+		}
+		if (!PyList_CheckExact(py_list)) {
+			Py_DECREF(py_list);
+			return malformed();
+		}
+		if (*type == MSGPACK_EXT_TUPLE) {
+			py_val = PyList_AsTuple(py_list);
+		}
+		else if (*type == MSGPACK_EXT_SET) {
+			py_val = PySet_New(py_list);
+		}
+		else {
+			py_val = PyFrozenSet_New(py_list);
+		}
+		Py_DECREF(py_list);
+		break;
+	}
+	case MSGPACK_EXT_DATETIME:
+		if (unpack_ints(&content, fields, 8)) {
+			py_val = PyDateTime_FromDateAndTimeAndFold(
+				fields[0], fields[1], fields[2], fields[3], fields[4],
+				fields[5], fields[6], fields[7]);
+		}
+		break;
+	case MSGPACK_EXT_DATE:
+		if (unpack_ints(&content, fields, 3)) {
+			py_val = PyDate_FromDate(fields[0], fields[1], fields[2]);
+		}
+		break;
+	case MSGPACK_EXT_TIME:
+		if (unpack_ints(&content, fields, 5)) {
+			py_val = PyTime_FromTimeAndFold(fields[0], fields[1], fields[2],
+											fields[3], fields[4]);
+		}
+		break;
+	case MSGPACK_EXT_TIMEDELTA:
+		if (unpack_ints(&content, fields, 3)) {
+			py_val = PyDelta_FromDSU(fields[0], fields[1], fields[2]);
+		}
+		break;
+	default:
+		return malformed();
+	}
+
+	if (py_val && content.offset != content.length) {
+		Py_DECREF(py_val);
+		return malformed();
+	}
+	return py_val;
+}
+
+static PyObject *unpack_value(as_unpacker *pk, int depth)
+{
+	if (++depth > MSGPACK_MAX_DEPTH) {
+		return malformed();
+	}
+
+	const uint8_t *p = unpack_take(pk, 1);
+	if (!p) {
+		return malformed();
+	}
+	uint8_t type = *p;
+	uint64_t val = 0;
+
+	if (type <= 0x7f) {
+		return PyLong_FromLong(type);
+	}
+	if (type >= 0xe0) {
+		return PyLong_FromLong((int8_t)type);
+	}
+	if ((type & 0xf0) == 0x80) {
+		return unpack_map(pk, type & 0x0f, depth);
+	}
+	if ((type & 0xf0) == 0x90) {
+		return unpack_list(pk, type & 0x0f, depth);
+	}
+	if ((type & 0xe0) == 0xa0) {
+		val = type & 0x1f;
+		p = unpack_take(pk, (uint32_t)val);
+		return p ? PyUnicode_DecodeUTF8((const char *)p, (Py_ssize_t)val,
+										NULL)
+				 : malformed();
+	}
+
+	switch (type) {
+	case 0xc0:
+		Py_RETURN_NONE;
+	case 0xc2:
+		Py_RETURN_FALSE;
+	case 0xc3:
+		Py_RETURN_TRUE;
+	case 0xc4:
+	case 0xc5:
+	case 0xc6:
+		if (!unpack_uint(pk, 1 << (type - 0xc4), &val) ||
+			!(p = unpack_take(pk, (uint32_t)val))) {
+			return malformed();
+		}
+		return PyBytes_FromStringAndSize((const char *)p, (Py_ssize_t)val);
+	case 0xc7:
+	case 0xc8:
+	case 0xc9:
+		if (!unpack_uint(pk, 1 << (type - 0xc7), &val)) {
+			return malformed();
+		}
+		return unpack_ext(pk, (uint32_t)val, depth);
+	case 0xca: {
+		float f;
+		uint32_t bits;
+		if (!unpack_uint(pk, 4, &val)) {
+			return malformed();
+		}
+		bits = (uint32_t)val;
+		memcpy(&f, &bits, sizeof(f));
+		return PyFloat_FromDouble(f);
+	}
+	case 0xcb: {
+		double d;
+		if (!unpack_uint(pk, 8, &val)) {
+			return malformed();
+		}
+		memcpy(&d, &val, sizeof(d));
+		return PyFloat_FromDouble(d);
+	}
+	case 0xcc:
+	case 0xcd:
+	case 0xce:
+	case 0xcf:
+		if (!unpack_uint(pk, 1 << (type - 0xcc), &val)) {
+			return malformed();
+		}
+		return PyLong_FromUnsignedLongLong(val);
+	case 0xd0:
+		return unpack_uint(pk, 1, &val) ? PyLong_FromLong((int8_t)val)
+										 : malformed();
+	case 0xd1:
+		return unpack_uint(pk, 2, &val) ? PyLong_FromLong((int16_t)val)
+										 : malformed();
+	case 0xd2:
+		return unpack_uint(pk, 4, &val) ? PyLong_FromLong((int32_t)val)
+										 : malformed();
+	case 0xd3:
+		return unpack_uint(pk, 8, &val) ? PyLong_FromLongLong((int64_t)val)
+										 : malformed();
+	case 0xd4:
+	case 0xd5:
+	case 0xd6:
+	case 0xd7:
+	case 0xd8:
+		return unpack_ext(pk, 1 << (type - 0xd4), depth);
+	case 0xd9:
+	case 0xda:
+	case 0xdb:
+		if (!unpack_uint(pk, 1 << (type - 0xd9), &val) ||
+			!(p = unpack_take(pk, (uint32_t)val))) {
+			return malformed();
+		}
+		return PyUnicode_DecodeUTF8((const char *)p, (Py_ssize_t)val, NULL);
+	case 0xdc:
+	case 0xdd:
+		if (!unpack_uint(pk, 2 << (type - 0xdc), &val)) {
+			return malformed();
+		}
+		return unpack_list(pk, (uint32_t)val, depth);
+	case 0xde:
+	case 0xdf:
+		if (!unpack_uint(pk, 2 << (type - 0xde), &val)) {
+			return malformed();
+		}
+		return unpack_map(pk, (uint32_t)val, depth);
+	default:
+		return malformed();
+	}
+}
+
+bool msgpack_is_serialized(const as_bytes *bytes)
+{
+	return as_bytes_size(bytes) > 0 &&
+		   as_bytes_get(bytes)[0] == MSGPACK_MARKER;
+}
+
+PyObject *msgpack_deserialize(const as_bytes *bytes)
+{
+	if (!datetime_api_ready()) {
+		return NULL;
+	}
+
+	as_unpacker pk = {.buffer = as_bytes_get(bytes) + 1,
+					  .offset = 0,
+					  .length = as_bytes_size(bytes) - 1};
+	PyObject *py_val = unpack_value(&pk, 0);
+
+	if (py_val && pk.offset != pk.length) {
+		Py_DECREF(py_val);
+		return malformed();
+	}
+	return py_val;
+}
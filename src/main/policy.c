@@ -32,6 +32,8 @@
 
 #include "conversions.h"
 #include "policy.h"
+#include "prepared_policy.h"
+#include "compiled_expression.h"
 #include "macros.h"
 
 #define MAP_WRITE_FLAGS_KEY "map_write_flags"
@@ -48,6 +50,20 @@
 	}                                                                          \
 	__policy##_init(policy);
 
+/* A prepared aerospike.Policy is copied as is, no field is looked up again */
+#define POLICY_INIT_OR_PREPARED(__policy, __kind)                              \
+	if (py_policy && AerospikePolicy_Check(py_policy)) {                       \
+		as_error_reset(err);                                                   \
+		const __policy *prepared =                                             \
+			AerospikePolicy_Get(py_policy, err, __kind);                       \
+		if (prepared) {                                                        \
+			*policy = *prepared;                                               \
+			*policy_p = policy;                                                \
+		}                                                                      \
+		return err->code;                                                      \
+	}                                                                          \
+	POLICY_INIT(__policy);
+
 #define POLICY_UPDATE() *policy_p = policy;
 
 #define POLICY_SET_FIELD(__field, __type)                                      \
@@ -83,7 +99,12 @@
 		if (exp_list) {                                                        \
 			PyObject *py_exp_list =                                            \
 				PyDict_GetItemString(py_policy, "expressions");                \
-			if (py_exp_list) {                                                 \
+			if (py_exp_list &&                                                 \
+				AerospikeCompiledExpression_Check(py_exp_list)) {              \
+				policy->base.filter_exp =                                      \
+					AerospikeCompiledExpression_Get(py_exp_list);              \
+			}                                                                  \
+			else if (py_exp_list) {                                            \
 				if (convert_exp_list(self, py_exp_list, &exp_list, err) ==     \
 					AEROSPIKE_OK) {                                            \
 					policy->base.filter_exp = exp_list;                        \
@@ -179,9 +200,13 @@ static AerospikeConstants aerospike_constants[] = {
 	{SERIALIZER_USER, "SERIALIZER_USER"},
 	{SERIALIZER_JSON, "SERIALIZER_JSON"},
 	{SERIALIZER_NONE, "SERIALIZER_NONE"},
+	{SERIALIZER_MSGPACK, "SERIALIZER_MSGPACK"},
 	{SEND_BOOL_AS_PY_BYTES, "PY_BYTES"},
 	{SEND_BOOL_AS_INTEGER, "INTEGER"},
 	{SEND_BOOL_AS_AS_BOOL, "AS_BOOL"},
+	{EVENT_LOOP_ROUND_ROBIN, "EVENT_LOOP_ROUND_ROBIN"},
+	{EVENT_LOOP_PARTITION, "EVENT_LOOP_PARTITION"},
+	{EVENT_LOOP_PINNED, "EVENT_LOOP_PINNED"},
 	{AS_INDEX_STRING, "INDEX_STRING"},
 	{AS_INDEX_NUMERIC, "INDEX_NUMERIC"},
 	{AS_INDEX_GEO2DSPHERE, "INDEX_GEO2DSPHERE"},
@@ -624,7 +649,7 @@ as_status pyobject_to_policy_apply(AerospikeClient *self, as_error *err,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_apply);
+	POLICY_INIT_OR_PREPARED(as_policy_apply, PREPARED_POLICY_APPLY);
 
 	//Initialize policy with global defaults
 	as_policy_apply_copy(config_apply_policy, policy);
@@ -700,7 +725,7 @@ as_status pyobject_to_policy_query(AerospikeClient *self, as_error *err,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_query);
+	POLICY_INIT_OR_PREPARED(as_policy_query, PREPARED_POLICY_QUERY);
 
 	//Initialize policy with global defaults
 	as_policy_query_copy(config_query_policy, policy);
@@ -742,7 +767,7 @@ as_status pyobject_to_policy_read(AerospikeClient *self, as_error *err,
 								  as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_read);
+	POLICY_INIT_OR_PREPARED(as_policy_read, PREPARED_POLICY_READ);
 
 	//Initialize policy with global defaults
 	as_policy_read_copy(config_read_policy, policy);
@@ -789,7 +814,7 @@ as_status pyobject_to_policy_remove(
 	as_predexp_list **predexp_list_p, as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_remove);
+	POLICY_INIT_OR_PREPARED(as_policy_remove, PREPARED_POLICY_REMOVE);
 
 	//Initialize policy with global defaults
 	as_policy_remove_copy(config_remove_policy, policy);
@@ -838,7 +863,7 @@ as_status pyobject_to_policy_scan(AerospikeClient *self, as_error *err,
 								  as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_scan);
+	POLICY_INIT_OR_PREPARED(as_policy_scan, PREPARED_POLICY_SCAN);
 
 	//Initialize policy with global defaults
 	as_policy_scan_copy(config_scan_policy, policy);
@@ -884,7 +909,7 @@ as_status pyobject_to_policy_write(AerospikeClient *self, as_error *err,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_write);
+	POLICY_INIT_OR_PREPARED(as_policy_write, PREPARED_POLICY_WRITE);
 
 	//Initialize policy with global defaults
 	as_policy_write_copy(config_write_policy, policy);
@@ -932,7 +957,7 @@ as_status pyobject_to_policy_operate(
 	as_predexp_list **predexp_list_p, as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_operate);
+	POLICY_INIT_OR_PREPARED(as_policy_operate, PREPARED_POLICY_OPERATE);
 
 	//Initialize policy with global defaults
 	as_policy_operate_copy(config_operate_policy, policy);
@@ -985,7 +1010,7 @@ as_status pyobject_to_policy_batch(AerospikeClient *self, as_error *err,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
 	// Initialize Policy
-	POLICY_INIT(as_policy_batch);
+	POLICY_INIT_OR_PREPARED(as_policy_batch, PREPARED_POLICY_BATCH);
 
 	//Initialize policy with global defaults
 	as_policy_batch_copy(config_batch_policy, policy);
@@ -0,0 +1,112 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+#include <citrusleaf/alloc.h>
+
+#include "types.h"
+
+// Number of released chunks kept for later pools.
+#define BYTES_POOL_MAX_FREE_CHUNKS 64
+
+// Released chunks, guarded by the GIL like the pools themselves.
+static as_bytes_pool_chunk *free_chunks = NULL;
+static uint32_t n_free_chunks = 0;
+
+as_bytes *bytes_pool_get(as_static_pool *static_pool)
+{
+	uint32_t index = static_pool->current_bytes_id % BYTES_POOL_CHUNK_SIZE;
+
+	if (index == 0) {
+		as_bytes_pool_chunk *chunk = free_chunks;
+		if (chunk) {
+			free_chunks = chunk->next;
+			n_free_chunks--;
+		}
+		else {
+			chunk = cf_malloc(sizeof(as_bytes_pool_chunk));
+			if (!chunk) {
+				return NULL;
+			}
+		}
+		chunk->next = static_pool->chunks;
+		static_pool->chunks = chunk;
+	}
+
+	// An as_bytes taken but never set is destroyed as a no-op.
+	as_bytes *bytes = &static_pool->chunks->bytes[index];
+	memset(bytes, 0, sizeof(as_bytes));
+	static_pool->current_bytes_id++;
+	return bytes;
+}
+
+void bytes_pool_destroy(as_static_pool *static_pool)
+{
+	uint32_t n_bytes = static_pool->current_bytes_id % BYTES_POOL_CHUNK_SIZE;
+	if (n_bytes == 0) {
+		n_bytes = BYTES_POOL_CHUNK_SIZE;
+	}
+
+	as_bytes_pool_chunk *chunk = static_pool->chunks;
+	while (chunk) {
+		for (uint32_t i = 0; i < n_bytes; i++) {
+			as_bytes_destroy(&chunk->bytes[i]);
+		}
+		n_bytes = BYTES_POOL_CHUNK_SIZE;
+
+		as_bytes_pool_chunk *next = chunk->next;
+		if (n_free_chunks < BYTES_POOL_MAX_FREE_CHUNKS) {
+			chunk->next = free_chunks;
+			free_chunks = chunk;
+			n_free_chunks++;
+		}
+		else {
+			cf_free(chunk);
+		}
+		chunk = next;
+	}
+	static_pool->chunks = NULL;
+	static_pool->current_bytes_id = 0;
+
+	if (static_pool->buffers) {
+		for (uint32_t i = 0; i < static_pool->buffers_size; i++) {
+			PyBuffer_Release(&static_pool->buffers[i]);
+		}
+		PyMem_Free(static_pool->buffers);
+		static_pool->buffers = NULL;
+		static_pool->buffers_size = 0;
+		static_pool->buffers_capacity = 0;
+	}
+}
+
+as_static_pool *bytes_pool_new(void)
+{
+	as_static_pool *static_pool = cf_malloc(sizeof(as_static_pool));
+	if (static_pool) {
+		memset(static_pool, 0, sizeof(as_static_pool));
+	}
+	return static_pool;
+}
+
+void bytes_pool_free(as_static_pool *static_pool)
+{
+	bytes_pool_destroy(static_pool);
+	cf_free(static_pool);
+}
@@ -0,0 +1,574 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_vector.h>
+
+#include "types.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "operate.h"
+#include "policy.h"
+#include "prepared_operations.h"
+
+// A named value of an operation, given by Operations.bind().
+typedef struct {
+	PyObject_HEAD
+	PyObject *name;
+} AerospikePlaceholder;
+
+// An operation of a prepared list.
+typedef struct {
+	// The operation dict when it holds placeholders, NULL once converted.
+	PyObject *py_op;
+	// The binops the operation was converted into, in the template's ops.
+	uint32_t binop_index;
+	uint32_t binop_count;
+	// Set for an increment or write of a placeholder, whose value is then
+	// converted without going through the operation dict.
+	PyObject *py_name;
+	as_operator operation;
+	as_bin_name bin;
+} prepared_operation;
+
+typedef struct AerospikeOperations {
+	PyObject_HEAD
+	// The template the values are bound to, NULL for a template.
+	struct AerospikeOperations *template;
+	// The values bound to the placeholders, by name.
+	PyObject *py_values;
+
+	// Only set on a template.
+	prepared_operation *operations;
+	uint32_t operations_size;
+	uint32_t dynamic_size;
+	PyObject *py_placeholders;
+	as_operations ops;
+	as_static_pool *static_pool;
+	as_vector *unicodeStrVector;
+} AerospikeOperations;
+
+static PyTypeObject AerospikePlaceholder_Type;
+static PyTypeObject AerospikeOperations_Type;
+
+static void raise_as_error(as_error *err)
+{
+	PyObject *py_err = NULL;
+	error_to_pyobject(err, &py_err);
+	PyObject *exception_type = raise_exception(err);
+	PyErr_SetObject(exception_type, py_err);
+	Py_DECREF(py_err);
+}
+
+/*******************************************************************************
+ * PLACEHOLDER
+ ******************************************************************************/
+
+static PyObject *AerospikePlaceholder_Type_New(PyTypeObject *type,
+											   PyObject *args, PyObject *kwds)
+{
+	PyObject *py_name = NULL;
+	static char *kwlist[] = {"name", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "U:Placeholder", kwlist,
+									&py_name) == false) {
+		return NULL;
+	}
+
+	AerospikePlaceholder *self = (AerospikePlaceholder *)type->tp_alloc(type, 0);
+	if (!self) {
+		return NULL;
+	}
+	Py_INCREF(py_name);
+	self->name = py_name;
+	return (PyObject *)self;
+}
+
+static PyObject *AerospikePlaceholder_Type_Repr(AerospikePlaceholder *self)
+{
+	return PyUnicode_FromFormat("aerospike.Placeholder(%R)", self->name);
+}
+
+static void AerospikePlaceholder_Type_Dealloc(AerospikePlaceholder *self)
+{
+	Py_XDECREF(self->name);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyMemberDef AerospikePlaceholder_Type_Members[] = {
+	{"name", T_OBJECT, offsetof(AerospikePlaceholder, name), READONLY,
+	 "The name the value is bound to."},
+	{NULL}};
+
+static PyTypeObject AerospikePlaceholder_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.Placeholder",
+	.tp_basicsize = sizeof(AerospikePlaceholder),
+	.tp_dealloc = (destructor)AerospikePlaceholder_Type_Dealloc,
+	.tp_repr = (reprfunc)AerospikePlaceholder_Type_Repr,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "Placeholder(name)\n\n"
+			  "A value of an operation given to prepare_operations(), bound\n"
+			  "on every call with Operations.bind(name=value).\n",
+	.tp_members = AerospikePlaceholder_Type_Members,
+	.tp_new = AerospikePlaceholder_Type_New};
+
+PyTypeObject *AerospikePlaceholder_Ready()
+{
+	return PyType_Ready(&AerospikePlaceholder_Type) == 0
+			   ? &AerospikePlaceholder_Type
+			   : NULL;
+}
+
+/*******************************************************************************
+ * OPERATIONS
+ ******************************************************************************/
+
+#define IS_PLACEHOLDER(__value)                                                \
+	(Py_TYPE(__value) == &AerospikePlaceholder_Type)
+
+/**
+ * Set up the direct conversion of py_op if it is {'op', 'bin', 'val'} with an
+ * increment or write operator, a valid bin name and a placeholder value.
+ */
+static void prepare_direct_operation(prepared_operation *prepared,
+									 PyObject *py_op)
+{
+	if (PyDict_Size(py_op) != 3) {
+		return;
+	}
+	PyObject *py_operator = PyDict_GetItemString(py_op, "op");
+	PyObject *py_bin = PyDict_GetItemString(py_op, "bin");
+	PyObject *py_value = PyDict_GetItemString(py_op, "val");
+	if (!py_operator || !PyLong_Check(py_operator) || !py_bin ||
+		!PyUnicode_Check(py_bin) || !py_value || !IS_PLACEHOLDER(py_value)) {
+		return;
+	}
+
+	long operation = PyLong_AsLong(py_operator);
+	if (operation != AS_OPERATOR_INCR && operation != AS_OPERATOR_WRITE) {
+		PyErr_Clear();
+		return;
+	}
+	Py_ssize_t bin_size = 0;
+	const char *bin = PyUnicode_AsUTF8AndSize(py_bin, &bin_size);
+	if (!bin || bin_size > AS_BIN_NAME_MAX_LEN) {
+		PyErr_Clear();
+		return;
+	}
+
+	memcpy(prepared->bin, bin, bin_size + 1);
+	prepared->operation = (as_operator)operation;
+	prepared->py_name = ((AerospikePlaceholder *)py_value)->name;
+}
+
+/**
+ * Convert the value of a direct operation into ops. Returns false, with err
+ * untouched, if the value has to go through add_op() instead.
+ */
+static bool add_direct_operation(AerospikeClient *client, as_error *err,
+								 prepared_operation *prepared,
+								 PyObject *py_value,
+								 as_static_pool *static_pool,
+								 as_operations *ops)
+{
+	as_val *put_val = NULL;
+
+	if (prepared->operation == AS_OPERATOR_INCR) {
+		if (PyFloat_Check(py_value)) {
+			return as_operations_add_incr_double(ops, prepared->bin,
+												 PyFloat_AsDouble(py_value));
+		}
+		if (!PyLong_Check(py_value)) {
+			return false;
+		}
+		long offset = PyLong_AsLong(py_value);
+		if (offset == -1 && PyErr_Occurred()) {
+			PyErr_Clear();
+			return false;
+		}
+		return as_operations_add_incr(ops, prepared->bin, offset);
+	}
+
+	if (pyobject_to_val(client, err, py_value, &put_val, static_pool,
+						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+		return true;
+	}
+	as_operations_add_write(ops, prepared->bin, (as_bin_value *)put_val);
+	return true;
+}
+
+/**
+ * Add the names of the placeholders of py_op to py_placeholders.
+ * Returns -1 on error, else whether py_op holds a placeholder.
+ */
+static int collect_placeholders(PyObject *py_op, PyObject *py_placeholders)
+{
+	PyObject *py_key = NULL, *py_value = NULL;
+	Py_ssize_t pos = 0;
+	int found = 0;
+
+	while (PyDict_Next(py_op, &pos, &py_key, &py_value)) {
+		if (IS_PLACEHOLDER(py_value)) {
+			if (PySet_Add(py_placeholders,
+						  ((AerospikePlaceholder *)py_value)->name) == -1) {
+				return -1;
+			}
+			found = 1;
+		}
+	}
+	return found;
+}
+
+PyObject *AerospikeOperations_New(AerospikeClient *client, as_error *err,
+								  PyObject *py_ops)
+{
+	long operation = 0;
+	long return_type = -1;
+
+	if (!PyList_Check(py_ops)) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM,
+						"Operations should be of type list");
+		return NULL;
+	}
+	Py_ssize_t size = PyList_Size(py_ops);
+
+	AerospikeOperations *self =
+		PyObject_New(AerospikeOperations, &AerospikeOperations_Type);
+	if (!self) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the operations");
+		return NULL;
+	}
+	self->template = NULL;
+	self->py_values = NULL;
+	self->operations_size = 0;
+	self->dynamic_size = 0;
+	self->operations = calloc(size ? size : 1, sizeof(prepared_operation));
+	self->py_placeholders = PySet_New(NULL);
+	self->static_pool = bytes_pool_new();
+	self->unicodeStrVector = as_vector_create(sizeof(char *), 16);
+	as_operations_init(&self->ops, (uint16_t)size);
+
+	if (!self->operations || !self->py_placeholders || !self->static_pool) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the operations");
+		goto CLEANUP;
+	}
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_op = PyList_GetItem(py_ops, i);
+		prepared_operation *prepared = &self->operations[i];
+
+		if (!PyDict_Check(py_op)) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+							"Operation must be a dict");
+			goto CLEANUP;
+		}
+		self->operations_size++;
+
+		int has_placeholders =
+			collect_placeholders(py_op, self->py_placeholders);
+		if (has_placeholders == -1) {
+			PyErr_Clear();
+			as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							"Failed to collect the placeholders");
+			goto CLEANUP;
+		}
+		if (has_placeholders) {
+			// Converted with its values on every use.
+			prepared->py_op = PyDict_Copy(py_op);
+			prepare_direct_operation(prepared, prepared->py_op);
+			self->dynamic_size++;
+			continue;
+		}
+
+		prepared->binop_index = self->ops.binops.size;
+		if (add_op(client, err, py_op, self->unicodeStrVector,
+				   self->static_pool, &self->ops, &operation,
+				   &return_type) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+		prepared->binop_count = self->ops.binops.size - prepared->binop_index;
+	}
+
+CLEANUP:
+	if (err->code != AEROSPIKE_OK) {
+		Py_DECREF(self);
+		return NULL;
+	}
+	return (PyObject *)self;
+}
+
+bool AerospikeOperations_Check(PyObject *py_ops)
+{
+	return Py_TYPE(py_ops) == &AerospikeOperations_Type;
+}
+
+Py_ssize_t AerospikeOperations_Size(PyObject *py_ops)
+{
+	AerospikeOperations *self = (AerospikeOperations *)py_ops;
+	AerospikeOperations *template = self->template ? self->template : self;
+
+	return template->ops.binops.size + template->dynamic_size;
+}
+
+/**
+ * Copy the operation dict py_op with its placeholders replaced by the values
+ * of py_values. Returns NULL with err set on error.
+ */
+static PyObject *bind_operation(as_error *err, PyObject *py_op,
+								PyObject *py_values)
+{
+	PyObject *py_key = NULL, *py_value = NULL;
+	Py_ssize_t pos = 0;
+
+	PyObject *py_bound = PyDict_Copy(py_op);
+	if (!py_bound) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to copy the operation");
+		return NULL;
+	}
+
+	// Only values change, which PyDict_Next allows.
+	while (PyDict_Next(py_bound, &pos, &py_key, &py_value)) {
+		if (!IS_PLACEHOLDER(py_value)) {
+			continue;
+		}
+		PyObject *py_name = ((AerospikePlaceholder *)py_value)->name;
+		PyObject *py_bound_value =
+			py_values ? PyDict_GetItem(py_values, py_name) : NULL;
+		if (!py_bound_value) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+							"No value bound to placeholder %s",
+							PyUnicode_AsUTF8(py_name));
+			Py_DECREF(py_bound);
+			return NULL;
+		}
+		if (PyDict_SetItem(py_bound, py_key, py_bound_value) == -1) {
+			PyErr_Clear();
+			as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							"Failed to bind the operation");
+			Py_DECREF(py_bound);
+			return NULL;
+		}
+	}
+	return py_bound;
+}
+
+as_status AerospikeOperations_Add(AerospikeClient *client, as_error *err,
+								  PyObject *py_ops,
+								  as_vector *unicodeStrVector,
+								  as_static_pool *static_pool,
+								  as_operations *ops)
+{
+	long operation = 0;
+	long return_type = -1;
+
+	AerospikeOperations *self = (AerospikeOperations *)py_ops;
+	AerospikeOperations *template = self->template ? self->template : self;
+
+	for (uint32_t i = 0; i < template->operations_size; i++) {
+		prepared_operation *prepared = &template->operations[i];
+
+		if (!prepared->py_op) {
+			// Share the converted binops, each holding a reference to its
+			// value so destroying ops leaves the template intact.
+			for (uint32_t j = 0; j < prepared->binop_count; j++) {
+				as_binop *binop = &ops->binops.entries[ops->binops.size++];
+				*binop =
+					template->ops.binops.entries[prepared->binop_index + j];
+				as_val_reserve(binop->bin.valuep);
+			}
+			continue;
+		}
+
+		if (prepared->py_name) {
+			PyObject *py_value =
+				self->py_values
+					? PyDict_GetItem(self->py_values, prepared->py_name)
+					: NULL;
+			if (py_value &&
+				add_direct_operation(client, err, prepared, py_value,
+									 static_pool, ops)) {
+				if (err->code != AEROSPIKE_OK) {
+					return err->code;
+				}
+				continue;
+			}
+		}
+
+		PyObject *py_op = bind_operation(err, prepared->py_op, self->py_values);
+		if (!py_op) {
+			return err->code;
+		}
+		add_op(client, err, py_op, unicodeStrVector, static_pool, ops,
+			   &operation, &return_type);
+		Py_DECREF(py_op);
+		if (err->code != AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+
+	// A touch with a ttl overrides the meta, as in a list of operations.
+	if (template->ops.ttl) {
+		ops->ttl = template->ops.ttl;
+	}
+	return err->code;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+PyDoc_STRVAR(bind_doc, "bind(**values) -> aerospike.Operations\n\
+\n\
+Return the operations with the given values bound to their placeholders, by name.");
+
+static PyObject *AerospikeOperations_Bind(AerospikeOperations *self,
+										  PyObject *args, PyObject *kwds)
+{
+	PyObject *py_key = NULL, *py_value = NULL;
+	Py_ssize_t pos = 0;
+	AerospikeOperations *template = self->template ? self->template : self;
+
+	as_error err;
+	as_error_init(&err);
+
+	if (PyArg_ParseTuple(args, ":bind") == false) {
+		return NULL;
+	}
+
+	while (kwds && PyDict_Next(kwds, &pos, &py_key, &py_value)) {
+		if (PySet_Contains(template->py_placeholders, py_key) != 1) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM, "Unknown placeholder: %s",
+							PyUnicode_AsUTF8(py_key));
+			raise_as_error(&err);
+			return NULL;
+		}
+	}
+
+	AerospikeOperations *bound =
+		PyObject_New(AerospikeOperations, &AerospikeOperations_Type);
+	if (!bound) {
+		return NULL;
+	}
+	Py_INCREF(template);
+	bound->template = template;
+	bound->py_values =
+		self->py_values ? PyDict_Copy(self->py_values) : PyDict_New();
+	bound->operations = NULL;
+	bound->operations_size = 0;
+	bound->dynamic_size = 0;
+	bound->py_placeholders = NULL;
+	bound->static_pool = NULL;
+	bound->unicodeStrVector = NULL;
+
+	if (!bound->py_values ||
+		(kwds && PyDict_Update(bound->py_values, kwds) == -1)) {
+		Py_DECREF(bound);
+		return NULL;
+	}
+	return (PyObject *)bound;
+}
+
+static PyObject *AerospikeOperations_Type_GetPlaceholders(
+	AerospikeOperations *self, void *closure)
+{
+	AerospikeOperations *template = self->template ? self->template : self;
+
+	return PyFrozenSet_New(template->py_placeholders);
+}
+
+static Py_ssize_t AerospikeOperations_Type_Len(AerospikeOperations *self)
+{
+	AerospikeOperations *template = self->template ? self->template : self;
+
+	return template->operations_size;
+}
+
+static void AerospikeOperations_Type_Dealloc(AerospikeOperations *self)
+{
+	Py_XDECREF(self->template);
+	Py_XDECREF(self->py_values);
+
+	if (self->operations) {
+		for (uint32_t i = 0; i < self->operations_size; i++) {
+			Py_XDECREF(self->operations[i].py_op);
+		}
+		free(self->operations);
+	}
+	Py_XDECREF(self->py_placeholders);
+
+	if (!self->template) {
+		// The values of the binops may live in the pool.
+		as_operations_destroy(&self->ops);
+	}
+	if (self->static_pool) {
+		bytes_pool_free(self->static_pool);
+	}
+	if (self->unicodeStrVector) {
+		for (unsigned int i = 0; i < self->unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(self->unicodeStrVector, i));
+		}
+		as_vector_destroy(self->unicodeStrVector);
+	}
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyMethodDef AerospikeOperations_Type_Methods[] = {
+	{"bind", (PyCFunction)AerospikeOperations_Bind,
+	 METH_VARARGS | METH_KEYWORDS, bind_doc},
+	{NULL}};
+
+static PyGetSetDef AerospikeOperations_Type_GetSet[] = {
+	{"placeholders", (getter)AerospikeOperations_Type_GetPlaceholders, NULL,
+	 "The names of the placeholders of the operations.", NULL},
+	{NULL}};
+
+static PySequenceMethods AerospikeOperations_Type_Sequence = {
+	.sq_length = (lenfunc)AerospikeOperations_Type_Len};
+
+static PyTypeObject AerospikeOperations_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.Operations",
+	.tp_basicsize = sizeof(AerospikeOperations),
+	.tp_dealloc = (destructor)AerospikeOperations_Type_Dealloc,
+	.tp_as_sequence = &AerospikeOperations_Type_Sequence,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "Operations converted once by Client.prepare_operations(),\n"
+			  "accepted by operate() and operate_ordered() in place of the\n"
+			  "list of operations.\n",
+	.tp_methods = AerospikeOperations_Type_Methods,
+	.tp_getset = AerospikeOperations_Type_GetSet};
+
+PyTypeObject *AerospikeOperations_Ready()
+{
+	return PyType_Ready(&AerospikeOperations_Type) == 0
+			   ? &AerospikeOperations_Type
+			   : NULL;
+}
@@ -0,0 +1,244 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+#include <aerospike/as_policy.h>
+#include <aerospike/as_predexp.h>
+
+#include "types.h"
+#include "policy.h"
+#include "prepared_policy.h"
+#include "compiled_expression.h"
+
+// A policy dict converted once, to be passed to any number of calls.
+typedef struct {
+	PyObject_HEAD
+	prepared_policy_kind kind;
+	union {
+		as_policy_read read;
+		as_policy_write write;
+		as_policy_operate operate;
+		as_policy_batch batch;
+		as_policy_apply apply;
+		as_policy_remove remove;
+		as_policy_query query;
+		as_policy_scan scan;
+	} policy;
+	// The filter expression and predexp the policy points to.
+	as_exp *exp;
+	PyObject *py_exp;
+	as_predexp_list predexp_list;
+	bool has_predexp;
+	// A copy of the policy dict, for the options read outside of the policy.
+	PyObject *py_dict;
+} AerospikePolicy;
+
+// Indexed by prepared_policy_kind.
+static const char *prepared_policy_kind_names[] = {
+	"read", "write", "operate", "batch", "apply", "remove", "query", "scan"};
+
+#define PREPARED_POLICY_KIND_CNT                                               \
+	(sizeof(prepared_policy_kind_names) / sizeof(char *))
+
+static PyTypeObject AerospikePolicy_Type;
+
+#define PREPARED_POLICY_CONVERT(__kind)                                        \
+	{                                                                          \
+		as_policy_##__kind *policy_p = NULL;                                   \
+		pyobject_to_policy_##__kind(                                           \
+			client, err, py_policy, &self->policy.__kind, &policy_p,           \
+			&client->as->config.policies.__kind, &self->predexp_list,          \
+			&predexp_list_p, &exp_list, &exp_list_p);                          \
+		break;                                                                 \
+	}
+
+static as_status prepared_policy_convert(AerospikePolicy *self,
+										 AerospikeClient *client,
+										 as_error *err, PyObject *py_policy)
+{
+	as_predexp_list *predexp_list_p = NULL;
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	switch (self->kind) {
+	case PREPARED_POLICY_READ:
+		PREPARED_POLICY_CONVERT(read);
+	case PREPARED_POLICY_WRITE:
+		PREPARED_POLICY_CONVERT(write);
+	case PREPARED_POLICY_OPERATE:
+		PREPARED_POLICY_CONVERT(operate);
+	case PREPARED_POLICY_BATCH:
+		PREPARED_POLICY_CONVERT(batch);
+	case PREPARED_POLICY_APPLY:
+		PREPARED_POLICY_CONVERT(apply);
+	case PREPARED_POLICY_REMOVE:
+		PREPARED_POLICY_CONVERT(remove);
+	case PREPARED_POLICY_QUERY:
+		PREPARED_POLICY_CONVERT(query);
+	case PREPARED_POLICY_SCAN:
+		PREPARED_POLICY_CONVERT(scan);
+	}
+
+	self->exp = exp_list_p;
+	// A compiled expression is borrowed by the policy, so keep it alive.
+	PyObject *py_exp = PyDict_GetItemString(py_policy, "expressions");
+	if (py_exp && AerospikeCompiledExpression_Check(py_exp)) {
+		Py_INCREF(py_exp);
+		self->py_exp = py_exp;
+	}
+	self->has_predexp = predexp_list_p != NULL;
+	return err->code;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject *AerospikePolicy_Type_GetKind(AerospikePolicy *self,
+											  void *closure)
+{
+	return PyUnicode_FromString(prepared_policy_kind_names[self->kind]);
+}
+
+static PyObject *AerospikePolicy_Type_Repr(AerospikePolicy *self)
+{
+	return PyUnicode_FromFormat("<aerospike.Policy '%s'>",
+								prepared_policy_kind_names[self->kind]);
+}
+
+static void AerospikePolicy_Type_Dealloc(AerospikePolicy *self)
+{
+	if (self->exp) {
+		as_exp_destroy(self->exp);
+	}
+	Py_XDECREF(self->py_exp);
+	Py_XDECREF(self->py_dict);
+	if (self->has_predexp) {
+		as_predexp_list_destroy(&self->predexp_list);
+	}
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyGetSetDef AerospikePolicy_Type_GetSet[] = {
+	{"kind", (getter)AerospikePolicy_Type_GetKind, NULL,
+	 "The kind of policy, as given to prepare_policy().", NULL},
+	{NULL}};
+
+static PyTypeObject AerospikePolicy_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.Policy",
+	.tp_basicsize = sizeof(AerospikePolicy),
+	.tp_dealloc = (destructor)AerospikePolicy_Type_Dealloc,
+	.tp_repr = (reprfunc)AerospikePolicy_Type_Repr,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "A policy converted once by Client.prepare_policy(), accepted\n"
+			  "wherever a policy dict of the same kind is.\n",
+	.tp_getset = AerospikePolicy_Type_GetSet};
+
+PyTypeObject *AerospikePolicy_Ready()
+{
+	return PyType_Ready(&AerospikePolicy_Type) == 0 ? &AerospikePolicy_Type
+													: NULL;
+}
+
+PyObject *AerospikePolicy_New(AerospikeClient *client, as_error *err,
+							  const char *kind, PyObject *py_policy)
+{
+	uint32_t i = 0;
+	while (i < PREPARED_POLICY_KIND_CNT &&
+		   strcmp(kind, prepared_policy_kind_names[i])) {
+		i++;
+	}
+	if (i == PREPARED_POLICY_KIND_CNT) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid policy kind: %s",
+						kind);
+		return NULL;
+	}
+
+	if (!PyDict_Check(py_policy)) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "policy must be a dict");
+		return NULL;
+	}
+
+	AerospikePolicy *self =
+		PyObject_New(AerospikePolicy, &AerospikePolicy_Type);
+	if (!self) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the policy");
+		return NULL;
+	}
+	self->kind = (prepared_policy_kind)i;
+	self->exp = NULL;
+	self->py_exp = NULL;
+	self->has_predexp = false;
+	self->py_dict = PyDict_Copy(py_policy);
+	if (!self->py_dict) {
+		PyErr_Clear();
+		Py_DECREF(self);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the policy");
+		return NULL;
+	}
+
+	if (prepared_policy_convert(self, client, err, py_policy) !=
+		AEROSPIKE_OK) {
+		Py_DECREF(self);
+		return NULL;
+	}
+	return (PyObject *)self;
+}
+
+bool AerospikePolicy_Check(PyObject *py_policy)
+{
+	return Py_TYPE(py_policy) == &AerospikePolicy_Type;
+}
+
+const void *AerospikePolicy_Get(PyObject *py_policy, as_error *err,
+								prepared_policy_kind kind)
+{
+	AerospikePolicy *self = (AerospikePolicy *)py_policy;
+
+	if (self->kind != kind) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM,
+						"Policy prepared as %s cannot be used as a %s policy",
+						prepared_policy_kind_names[self->kind],
+						prepared_policy_kind_names[kind]);
+		return NULL;
+	}
+	return &self->policy;
+}
+
+PyObject *AerospikePolicy_GetItem(PyObject *py_policy, const char *key)
+{
+	if (!py_policy) {
+		return NULL;
+	}
+	if (AerospikePolicy_Check(py_policy)) {
+		py_policy = ((AerospikePolicy *)py_policy)->py_dict;
+	}
+	if (!PyDict_Check(py_policy)) {
+		return NULL;
+	}
+	return PyDict_GetItemString(py_policy, key);
+}
@@ -47,13 +47,17 @@ AerospikeQuery *AerospikeQuery_Add_Ops(AerospikeQuery *self, PyObject *args,
 	long operation;
 	self->unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-	self->static_pool = &static_pool;
-
 	as_error err;
 	as_error_init(&err);
 
+	// The bytes of the ops live as long as the ops, until dealloc.
+	if (self->static_pool == NULL &&
+		(self->static_pool = bytes_pool_new()) == NULL) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the bytes pool.");
+		goto CLEANUP;
+	}
+
 	if (!self || !self->client->as) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid query object.");
 		goto CLEANUP;
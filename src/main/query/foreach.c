@@ -26,6 +26,7 @@
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "foreach_chunk.h"
 #include "query.h"
 #include "policy.h"
 
@@ -34,6 +35,8 @@ typedef struct {
 	as_error error;
 	PyObject *callback;
 	AerospikeClient *client;
+	// Set when the callback takes chunks of records.
+	ForeachChunk *chunk;
 } LocalData;
 
 static bool each_result(const as_val *val, void *udata)
@@ -46,6 +49,10 @@ static bool each_result(const as_val *val, void *udata)
 
 	// Extract callback user-data
 	LocalData *data = (LocalData *)udata;
+	if (data->chunk) {
+		return foreach_chunk_add(data->chunk, val);
+	}
+
 	as_error *err = &data->error;
 	PyObject *py_callback = data->callback;
 
@@ -112,13 +119,15 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 	PyObject *py_callback = NULL;
 	PyObject *py_policy = NULL;
 	PyObject *py_options = NULL;
+	PyObject *py_chunk_size = NULL;
 	// Python Function Keyword Arguments
-	static char *kwlist[] = {"callback", "policy", "options", NULL};
+	static char *kwlist[] = {"callback", "policy", "options", "chunk_size",
+							 NULL};
 
 	// Python Function Argument Parsing
-	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:foreach", kwlist,
-									&py_callback, &py_policy,
-									&py_options) == false) {
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OOO:foreach", kwlist,
+									&py_callback, &py_policy, &py_options,
+									&py_chunk_size) == false) {
 		as_query_destroy(&self->query);
 		return NULL;
 	}
@@ -127,8 +136,14 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 	LocalData data;
 	data.callback = py_callback;
 	data.client = self->client;
+	data.chunk = NULL;
 	as_error_init(&data.error);
 
+	ForeachChunk chunk;
+	uint32_t chunk_size = 0;
+
+	QueryPartitions partitions = {0};
+
 	// Aerospike Client Arguments
 	as_error err;
 	as_policy_query query_policy;
@@ -156,6 +171,11 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 		goto CLEANUP;
 	}
 
+	if (foreach_chunk_size(&err, py_chunk_size, &chunk_size) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	// Convert python policy object to as_policy_exists
 	pyobject_to_policy_query(
 		self->client, &err, py_policy, &query_policy, &query_policy_p,
@@ -169,21 +189,46 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 		goto CLEANUP;
 	}
 
+	if (query_partitions_init(self, &err, py_policy, &partitions) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (chunk_size) {
+		foreach_chunk_init(&chunk, self->client, py_callback, chunk_size,
+						   false);
+		data.chunk = &chunk;
+	}
+
 	// We are spawning multiple threads
 	PyThreadState *_save = PyEval_SaveThread();
 
 	// Invoke operation
-	aerospike_query_foreach(self->client->as, &err, query_policy_p,
-							&self->query, each_result, &data);
+	query_partitions_run(self, &err, query_policy_p, &partitions, each_result,
+						 &data);
 
 	// We are done using multiple threads
 	PyEval_RestoreThread(_save);
+
+	if (data.chunk) {
+		// Records received before an error still reach the callback.
+		foreach_chunk_flush(&chunk);
+		if (chunk.error.code != AEROSPIKE_OK) {
+			as_error_copy(&data.error, &chunk.error);
+		}
+	}
 	if (data.error.code != AEROSPIKE_OK) {
 		as_error_update(&data.error, data.error.code, NULL);
 		goto CLEANUP;
 	}
 
 CLEANUP:
+	if (data.chunk) {
+		foreach_chunk_destroy(&chunk);
+	}
+
+	query_partitions_destroy(&partitions);
+
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);
 		;
@@ -199,21 +244,10 @@ CLEANUP:
 	self->query.apply.arglist = NULL;
 
 	if (err.code != AEROSPIKE_OK || data.error.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		PyObject *exception_type = NULL;
-		if (err.code != AEROSPIKE_OK) {
-			error_to_pyobject(&err, &py_err);
-			exception_type = raise_exception(&err);
-		}
-		if (data.error.code != AEROSPIKE_OK) {
-			error_to_pyobject(&data.error, &py_err);
-			exception_type = raise_exception(&data.error);
-		}
-		if (PyObject_HasAttrString(exception_type, "name")) {
-			PyObject_SetAttrString(exception_type, "name", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		// An error from the callback takes precedence.
+		as_error *raise_err =
+			data.error.code != AEROSPIKE_OK ? &data.error : &err;
+		raise_exception_base(raise_err, NULL, NULL, NULL, NULL, Py_None);
 		return NULL;
 	}
 
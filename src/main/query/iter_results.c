@@ -0,0 +1,183 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_query.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_query.h>
+#include <aerospike/as_arraylist.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "query.h"
+#include "result_iterator.h"
+#include "prepared_policy.h"
+
+#define ITER_RESULTS_DEFAULT_BUFFER_SIZE 1024
+
+// A query run by an aerospike.ResultIterator, with everything it points to.
+typedef struct {
+	AerospikeQuery *query;
+	// The policy and its expressions, which the converted policy may point
+	// into.
+	PyObject *py_policy;
+	PyObject *py_exp;
+	as_policy_query policy;
+	as_policy_query *policy_p;
+	as_exp *exp_list_p;
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p;
+	QueryPartitions partitions;
+	bool ran;
+} QueryCommand;
+
+static void query_command_run(void *command, as_error *err,
+							  result_iterator_callback callback, void *udata)
+{
+	QueryCommand *cmd = (QueryCommand *)command;
+
+	cmd->ran = true;
+	query_partitions_run(cmd->query, err, cmd->policy_p, &cmd->partitions,
+						 callback, udata);
+}
+
+static void query_command_destroy(void *command)
+{
+	QueryCommand *cmd = (QueryCommand *)command;
+	as_query *query = &cmd->query->query;
+
+	if (cmd->exp_list_p) {
+		as_exp_destroy(cmd->exp_list_p);
+	}
+	if (cmd->predexp_list_p) {
+		as_predexp_list_destroy(&cmd->predexp_list);
+	}
+	query_partitions_destroy(&cmd->partitions);
+	// The arguments of an aggregation are used once, as by results().
+	if (cmd->ran && query->apply.arglist) {
+		as_arraylist_destroy((as_arraylist *)query->apply.arglist);
+		query->apply.arglist = NULL;
+	}
+	Py_XDECREF(cmd->py_policy);
+	Py_XDECREF(cmd->py_exp);
+	cf_free(cmd);
+}
+
+static const result_iterator_command_ops query_command_ops = {
+	query_command_run, query_command_destroy};
+
+PyObject *AerospikeQuery_Iter_Results(AerospikeQuery *self, PyObject *args,
+									  PyObject *kwds)
+{
+	PyObject *py_policy = NULL;
+	PyObject *py_options = NULL;
+	PyObject *py_buffer_size = NULL;
+	PyObject *py_iterator = NULL;
+	QueryCommand *cmd = NULL;
+	as_exp exp_list;
+	long buffer_size = ITER_RESULTS_DEFAULT_BUFFER_SIZE;
+
+	static char *kwlist[] = {"policy", "options", "buffer_size", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOO:iter_results", kwlist,
+									&py_policy, &py_options,
+									&py_buffer_size) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (py_buffer_size && py_buffer_size != Py_None) {
+		buffer_size = PyInt_Check(py_buffer_size)
+						  ? PyInt_AsLong(py_buffer_size)
+						  : -1;
+		if (buffer_size <= 0 || buffer_size > UINT32_MAX) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"buffer_size must be a positive integer");
+			goto CLEANUP;
+		}
+	}
+
+	cmd = cf_malloc(sizeof(QueryCommand));
+	memset(cmd, 0, sizeof(QueryCommand));
+	cmd->query = self;
+
+	// Convert python policy object to as_policy_query
+	pyobject_to_policy_query(self->client, &err, py_policy, &cmd->policy,
+							 &cmd->policy_p,
+							 &self->client->as->config.policies.query,
+							 &cmd->predexp_list, &cmd->predexp_list_p,
+							 &exp_list, &cmd->exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy && py_policy != Py_None) {
+		Py_INCREF(py_policy);
+		cmd->py_policy = py_policy;
+	}
+	cmd->py_exp = AerospikePolicy_GetItem(py_policy, "expressions");
+	Py_XINCREF(cmd->py_exp);
+
+	if (set_query_options(&err, py_options, &self->query) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (query_partitions_init(self, &err, py_policy, &cmd->partitions) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// The iterator owns the command from here on.
+	py_iterator = AerospikeResultIterator_New(
+		self->client, &err, (PyObject *)self, cmd, &query_command_ops,
+		(uint32_t)buffer_size);
+	cmd = NULL;
+
+CLEANUP:
+
+	if (cmd) {
+		query_command_destroy(cmd);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_iterator;
+}
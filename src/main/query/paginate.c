@@ -0,0 +1,204 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_partition_filter.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "query.h"
+
+PyObject *AerospikeQuery_Paginate(AerospikeQuery *self, PyObject *args,
+								  PyObject *kwds)
+{
+	PyObject *py_value = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid query object.");
+		goto CLEANUP;
+	}
+
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster.");
+		goto CLEANUP;
+	}
+
+	self->paginate = true;
+
+	py_value = PyBool_FromLong(true);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_value;
+}
+
+PyObject *AerospikeQuery_Is_Done(AerospikeQuery *self, PyObject *args,
+								 PyObject *kwds)
+{
+	PyObject *py_value = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid query object.");
+		goto CLEANUP;
+	}
+
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster.");
+		goto CLEANUP;
+	}
+
+	py_value = PyBool_FromLong(self->parts_all && self->parts_all->done);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_value;
+}
+
+PyObject *AerospikeQuery_Get_Partitions_Status(AerospikeQuery *self,
+											   PyObject *args, PyObject *kwds)
+{
+	PyObject *py_status = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid query object.");
+		goto CLEANUP;
+	}
+
+	partitions_status_to_pyobject(&err, self->parts_all, &py_status);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_status;
+}
+
+PyObject *AerospikeQuery_Checkpoint(AerospikeQuery *self, PyObject *args,
+                                    PyObject *kwds)
+{
+	PyObject *py_checkpoint = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid query object.");
+		goto CLEANUP;
+	}
+
+	if (!self->parts_all) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"No partition status to checkpoint, call paginate() "
+						"or use a partition_filter");
+		goto CLEANUP;
+	}
+
+	partitions_status_to_checkpoint(&err, self->query.ns, self->query.set,
+									self->parts_all, &py_checkpoint);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_checkpoint;
+}
+
+AerospikeQuery *AerospikeQuery_From_Checkpoint(AerospikeQuery *self, PyObject *args,
+                                               PyObject *kwds)
+{
+	PyObject *py_checkpoint = NULL;
+	as_partitions_status *parts_all = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	static char *kwlist[] = {"checkpoint", NULL};
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:from_checkpoint", kwlist,
+									 &py_checkpoint)) {
+		return NULL;
+	}
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid query object.");
+		goto CLEANUP;
+	}
+
+	if (checkpoint_to_partitions_status(&err, self->query.ns, self->query.set,
+										py_checkpoint,
+										&parts_all) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// The query continues from the checkpoint, as a paginated query would.
+	if (self->parts_all) {
+		as_partitions_status_release(self->parts_all);
+	}
+	self->parts_all = parts_all;
+	self->paginate = true;
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	Py_INCREF(self);
+	return self;
+}
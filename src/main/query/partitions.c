@@ -0,0 +1,167 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_query.h>
+#include <aerospike/aerospike_scan.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_partition_filter.h>
+#include <aerospike/as_query.h>
+#include <aerospike/as_scan.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "query.h"
+#include "prepared_policy.h"
+
+as_status query_partitions_init(AerospikeQuery *self, as_error *err,
+								PyObject *py_policy, QueryPartitions *qp)
+{
+	PyObject *py_partition_filter = NULL;
+	PyObject *py_max_records = NULL;
+
+	memset(qp, 0, sizeof(QueryPartitions));
+
+	py_partition_filter = AerospikePolicy_GetItem(py_policy, "partition_filter");
+	py_max_records = AerospikePolicy_GetItem(py_policy, "max_records");
+
+	if (!py_partition_filter && !py_max_records && !self->paginate) {
+		return AEROSPIKE_OK;
+	}
+
+	// The C client only runs queries without a secondary index filter or
+	// aggregation over partitions, as partition scans.
+	if (self->query.where.size > 0 || self->query.apply.function[0]) {
+		return as_error_update(
+			err, AEROSPIKE_ERR_PARAM,
+			"partition_filter, max_records and paginate() require a query "
+			"without a where predicate or aggregation");
+	}
+
+	if (py_max_records) {
+		if (!PyInt_Check(py_max_records)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "max_records must be an integer");
+		}
+		qp->max_records = PyLong_AsUnsignedLongLong(py_max_records);
+		if (PyErr_Occurred()) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "max_records must be a positive integer");
+		}
+	}
+
+	if (py_partition_filter) {
+		if (!PyDict_Check(py_partition_filter)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "partition_filter must be a dict");
+		}
+		if (convert_partition_filter(self->client, py_partition_filter,
+									 &qp->filter, &qp->ps,
+									 err) != AEROSPIKE_OK) {
+			return err->code;
+		}
+		as_partition_filter_set_partitions(&qp->filter, qp->ps);
+	}
+	else {
+		as_partition_filter_set_all(&qp->filter);
+	}
+
+	// Set the partition status up front, continuing from that of the
+	// previous page, and publish it on the query while the GIL is held, so
+	// checkpoint() can read it while the scan runs.
+	if (self->paginate && self->parts_all) {
+		qp->parts_all = as_partitions_status_reserve(self->parts_all);
+	}
+	else if (qp->filter.parts_all) {
+		qp->parts_all = as_partitions_status_reserve(qp->filter.parts_all);
+	}
+	else {
+		qp->parts_all = parts_setup(qp->filter.begin, qp->filter.count, NULL);
+	}
+
+	if (self->parts_all != qp->parts_all) {
+		if (self->parts_all) {
+			as_partitions_status_release(self->parts_all);
+		}
+		self->parts_all = as_partitions_status_reserve(qp->parts_all);
+	}
+
+	qp->enabled = true;
+	return AEROSPIKE_OK;
+}
+
+as_status query_partitions_run(AerospikeQuery *self, as_error *err,
+							   const as_policy_query *policy,
+							   QueryPartitions *qp,
+							   aerospike_query_foreach_callback callback,
+							   void *udata)
+{
+	aerospike *as = self->client->as;
+
+	if (!qp->enabled) {
+		return aerospike_query_foreach(as, err, policy, &self->query,
+									   callback, udata);
+	}
+
+	if (!policy) {
+		policy = &as->config.policies.query;
+	}
+
+	as_policy_scan scan_policy;
+	as_policy_scan_init(&scan_policy);
+	scan_policy.base = policy->base;
+	scan_policy.max_records = qp->max_records;
+
+	// Run the query as the partition scan the C client would convert it to,
+	// borrowing the bins, predexp and operations of the query.
+	as_query *query = &self->query;
+	as_scan scan;
+	as_scan_init(&scan, query->ns, query->set);
+	scan.select.entries = query->select.entries;
+	scan.select.capacity = query->select.capacity;
+	scan.select.size = query->select.size;
+	scan.predexp.entries = query->predexp.entries;
+	scan.predexp.capacity = query->predexp.capacity;
+	scan.predexp.size = query->predexp.size;
+	scan.ops = query->ops;
+	scan.no_bins = query->no_bins;
+	scan.concurrent = true;
+	scan.deserialize_list_map = policy->deserialize;
+
+	// The partition status is owned by qp, and self is only read here.
+	scan.parts_all = qp->parts_all;
+
+	// Everything in scan belongs to the query or qp, so it is not destroyed.
+	return aerospike_scan_partitions(as, err, &scan_policy, &scan,
+									 &qp->filter, callback, udata);
+}
+
+void query_partitions_destroy(QueryPartitions *qp)
+{
+	if (qp->ps) {
+		as_partitions_status_release(qp->ps);
+		qp->ps = NULL;
+	}
+	if (qp->parts_all) {
+		as_partitions_status_release(qp->parts_all);
+		qp->parts_all = NULL;
+	}
+}
@@ -95,6 +95,8 @@ PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
 	as_predexp_list predexp_list;
 	as_predexp_list *predexp_list_p = NULL;
 
+	QueryPartitions partitions = {0};
+
 	if (!self || !self->client->as) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
@@ -119,17 +121,24 @@ PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
 		goto CLEANUP;
 	}
 
+	if (query_partitions_init(self, &err, py_policy, &partitions) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	py_results = PyList_New(0);
 	data.py_results = py_results;
 
 	PyThreadState *_save = PyEval_SaveThread();
 
-	aerospike_query_foreach(self->client->as, &err, query_policy_p,
-							&self->query, each_result, &data);
+	query_partitions_run(self, &err, query_policy_p, &partitions, each_result,
+						 &data);
 
 	PyEval_RestoreThread(_save);
 
 CLEANUP: /*??trace()*/
+	query_partitions_destroy(&partitions);
+
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);
 		;
@@ -44,14 +44,44 @@ Add a list of write ops to the query. \
 When used with :meth:`Query.execute_background` the query will perform the write ops on any records found. \
 If no predicate is attached to the Query it will apply ops to all the records in the specified set.");
 
-PyDoc_STRVAR(foreach_doc, "foreach(callback[, policy])\n\
+PyDoc_STRVAR(foreach_doc, "foreach(callback[, policy[, options[, chunk_size]]])\n\
 \n\
-Invoke the callback function for each of the records streaming back from the query.");
+Invoke the callback function for each of the records streaming back from the query. With \
+chunk_size the callback receives lists of up to chunk_size records.");
+
+PyDoc_STRVAR(paginate_doc, "paginate()\n\
+\n\
+Set pagination, so that each query with max_records continues where the previous one stopped.");
+
+PyDoc_STRVAR(is_done_doc, "is_done() -> bool\n\
+\n\
+Gets the status of a paginated query");
+
+PyDoc_STRVAR(get_partitions_status_doc, "get_partitions_status() -> dict\n\
+\n\
+Gets the status of the partitions of the last partition query, which can be passed as the \
+partition_status of a partition_filter to resume from it.");
+
+PyDoc_STRVAR(checkpoint_doc, "checkpoint() -> bytes\n\
+\n\
+Serialize the status of the partitions of a paginated or partition query into a compact checkpoint. \
+It can be taken while the query runs, for instance from the foreach() callback.");
+
+PyDoc_STRVAR(from_checkpoint_doc, "from_checkpoint(checkpoint) -> Query\n\
+\n\
+Continue the query from a checkpoint taken by checkpoint() on a query of the same namespace and set, \
+paginating it.");
 
 PyDoc_STRVAR(results_doc, "results([policy]) -> list of (key, meta, bins)\n\
 \n\
 Buffer the records resulting from the query, and return them as a list of records.");
 
+PyDoc_STRVAR(iter_results_doc,
+			 "iter_results([policy[, options[, buffer_size]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Return an iterator over the records resulting from the query, as they stream back. \
+At most buffer_size records are buffered, the query waits for the iterator to be read beyond that.");
+
 PyDoc_STRVAR(select_doc, "select(bin1[, bin2[, bin3..]])\n\
 \n\
 Set a filter on the record bins resulting from results() or foreach(). \
@@ -86,6 +116,9 @@ static PyMethodDef AerospikeQuery_Type_Methods[] = {
 	{"results", (PyCFunction)AerospikeQuery_Results,
 	 METH_VARARGS | METH_KEYWORDS, results_doc},
 
+	{"iter_results", (PyCFunction)AerospikeQuery_Iter_Results,
+	 METH_VARARGS | METH_KEYWORDS, iter_results_doc},
+
 	{"select", (PyCFunction)AerospikeQuery_Select, METH_VARARGS | METH_KEYWORDS,
 	 select_doc},
 
@@ -99,6 +132,21 @@ static PyMethodDef AerospikeQuery_Type_Methods[] = {
 	{"add_ops", (PyCFunction)AerospikeQuery_Add_Ops,
 	 METH_VARARGS | METH_KEYWORDS, add_ops_doc},
 
+	{"paginate", (PyCFunction)AerospikeQuery_Paginate,
+	 METH_VARARGS | METH_KEYWORDS, paginate_doc},
+
+	{"is_done", (PyCFunction)AerospikeQuery_Is_Done,
+	 METH_VARARGS | METH_KEYWORDS, is_done_doc},
+
+	{"get_partitions_status", (PyCFunction)AerospikeQuery_Get_Partitions_Status,
+	 METH_VARARGS | METH_KEYWORDS, get_partitions_status_doc},
+
+	{"checkpoint", (PyCFunction)AerospikeQuery_Checkpoint,
+	 METH_VARARGS | METH_KEYWORDS, checkpoint_doc},
+
+	{"from_checkpoint", (PyCFunction)AerospikeQuery_From_Checkpoint,
+	 METH_VARARGS | METH_KEYWORDS, from_checkpoint_doc},
+
 	{NULL}};
 
 /*******************************************************************************
@@ -168,6 +216,8 @@ static int AerospikeQuery_Type_Init(AerospikeQuery *self, PyObject *args,
 
 	self->unicodeStrVector = NULL;
 	self->static_pool = NULL;
+	self->parts_all = NULL;
+	self->paginate = false;
 	as_query_init(&self->query, namespace, set);
 
 CLEANUP:
@@ -206,6 +256,14 @@ static void AerospikeQuery_Type_Dealloc(AerospikeQuery *self)
 
 	as_query_destroy(&self->query);
 
+	if (self->parts_all) {
+		as_partitions_status_release(self->parts_all);
+	}
+
+	if (self->static_pool != NULL) {
+		bytes_pool_free(self->static_pool);
+	}
+
 	if (self->unicodeStrVector != NULL) {
 		for (unsigned int i = 0; i < self->unicodeStrVector->size; ++i) {
 			free(as_vector_get_ptr(self->unicodeStrVector, i));
@@ -0,0 +1,94 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_record.h>
+
+#include "record.h"
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyStructSequence_Field AerospikeRecord_Fields[] = {
+	{"key", "The (namespace, set, primary key, digest) tuple of the record."},
+	{"gen", "The generation of the record, None if it was not found."},
+	{"ttl", "The time to live of the record, None if it was not found."},
+	{"bins", "The dict of bin names to values, None if it was not found."},
+	{NULL}};
+
+static PyStructSequence_Desc AerospikeRecord_Desc = {
+	.name = "aerospike.Record",
+	.doc = "A record returned by a client created with\n"
+		   "result_format 'record'. Fields can be accessed by name\n"
+		   "or unpacked as key, gen, ttl, bins.\n",
+	.fields = AerospikeRecord_Fields,
+	.n_in_sequence = 4};
+
+static PyTypeObject AerospikeRecord_Type;
+static bool AerospikeRecord_Type_Initialised = false;
+
+PyTypeObject *AerospikeRecord_Ready()
+{
+	if (!AerospikeRecord_Type_Initialised) {
+		if (PyStructSequence_InitType2(&AerospikeRecord_Type,
+									   &AerospikeRecord_Desc) != 0) {
+			return NULL;
+		}
+		AerospikeRecord_Type_Initialised = true;
+	}
+	return &AerospikeRecord_Type;
+}
+
+PyObject *AerospikeRecord_New(PyObject *py_key, const as_record *rec,
+							  PyObject *py_bins)
+{
+	PyObject *py_rec = PyStructSequence_New(&AerospikeRecord_Type);
+	if (!py_rec) {
+		Py_XDECREF(py_key);
+		Py_XDECREF(py_bins);
+		return NULL;
+	}
+
+	PyObject *py_gen = Py_None;
+	PyObject *py_ttl = Py_None;
+	if (rec) {
+		py_gen = PyLong_FromLong(rec->gen);
+		py_ttl = PyLong_FromLong(rec->ttl);
+	}
+	else {
+		Py_INCREF(Py_None);
+		Py_INCREF(Py_None);
+	}
+
+	if (!py_key) {
+		Py_INCREF(Py_None);
+		py_key = Py_None;
+	}
+
+	if (!py_bins) {
+		Py_INCREF(Py_None);
+		py_bins = Py_None;
+	}
+
+	PyStructSequence_SET_ITEM(py_rec, 0, py_key);
+	PyStructSequence_SET_ITEM(py_rec, 1, py_gen);
+	PyStructSequence_SET_ITEM(py_rec, 2, py_ttl);
+	PyStructSequence_SET_ITEM(py_rec, 3, py_bins);
+	return py_rec;
+}
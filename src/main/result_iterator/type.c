@@ -0,0 +1,297 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "result_iterator.h"
+
+// Records of a query or scan, converted by the threads of the C client and
+// handed over to the iterating thread through a bounded buffer.
+typedef struct {
+	PyObject_HEAD
+	AerospikeClient *client;
+	// The query or scan the command was built from.
+	PyObject *py_source;
+	void *command;
+	const result_iterator_command_ops *ops;
+	pthread_t thread;
+	// Whether the thread running the command has yet to be joined.
+	bool running;
+	pthread_mutex_t lock;
+	pthread_cond_t not_empty;
+	pthread_cond_t not_full;
+	// Ring buffer of converted records, guarded by lock.
+	PyObject **buffer;
+	uint32_t capacity;
+	uint32_t head;
+	uint32_t count;
+	// The command has returned.
+	bool done;
+	// The iterator was closed, records still sent are dropped.
+	bool closed;
+	// The error the command failed with, raised once the buffer is empty.
+	as_error err;
+} AerospikeResultIterator;
+
+static PyTypeObject AerospikeResultIterator_Type;
+
+/*******************************************************************************
+ * COMMAND THREAD
+ ******************************************************************************/
+
+static bool result_iterator_push(const as_val *val, void *udata)
+{
+	if (!val) {
+		return false;
+	}
+
+	AerospikeResultIterator *self = (AerospikeResultIterator *)udata;
+	PyObject *py_result = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+	val_to_pyobject(self->client, &err, val, &py_result);
+	if (!py_result && err.code == AEROSPIKE_OK) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Failed to convert a record");
+	}
+	PyErr_Clear();
+	PyGILState_Release(gstate);
+
+	pthread_mutex_lock(&self->lock);
+	if (err.code != AEROSPIKE_OK) {
+		if (self->err.code == AEROSPIKE_OK) {
+			as_error_copy(&self->err, &err);
+		}
+		pthread_mutex_unlock(&self->lock);
+		gstate = PyGILState_Ensure();
+		Py_XDECREF(py_result);
+		PyGILState_Release(gstate);
+		return false;
+	}
+
+	// Wait for the iterating thread to make room.
+	while (self->count == self->capacity && !self->closed) {
+		pthread_cond_wait(&self->not_full, &self->lock);
+	}
+	if (self->closed) {
+		pthread_mutex_unlock(&self->lock);
+		gstate = PyGILState_Ensure();
+		Py_DECREF(py_result);
+		PyGILState_Release(gstate);
+		return false;
+	}
+	self->buffer[(self->head + self->count) % self->capacity] = py_result;
+	self->count++;
+	pthread_cond_signal(&self->not_empty);
+	pthread_mutex_unlock(&self->lock);
+	return true;
+}
+
+static void *result_iterator_run(void *udata)
+{
+	AerospikeResultIterator *self = (AerospikeResultIterator *)udata;
+	as_error err;
+	as_error_init(&err);
+
+	self->ops->run(self->command, &err, result_iterator_push, self);
+
+	pthread_mutex_lock(&self->lock);
+	// An error converting a record comes first, it stopped the command.
+	if (self->err.code == AEROSPIKE_OK && !self->closed) {
+		as_error_copy(&self->err, &err);
+	}
+	self->done = true;
+	pthread_cond_broadcast(&self->not_empty);
+	pthread_mutex_unlock(&self->lock);
+	return NULL;
+}
+
+/**
+ * Stop the command, wait for its thread and release the records left.
+ * Called with the GIL held.
+ */
+static void result_iterator_close(AerospikeResultIterator *self)
+{
+	if (!self->running) {
+		return;
+	}
+	self->running = false;
+
+	pthread_mutex_lock(&self->lock);
+	self->closed = true;
+	pthread_cond_broadcast(&self->not_full);
+	pthread_cond_broadcast(&self->not_empty);
+	pthread_mutex_unlock(&self->lock);
+
+	Py_BEGIN_ALLOW_THREADS
+	pthread_join(self->thread, NULL);
+	Py_END_ALLOW_THREADS
+
+	while (self->count) {
+		Py_DECREF(self->buffer[self->head]);
+		self->head = (self->head + 1) % self->capacity;
+		self->count--;
+	}
+
+	self->ops->destroy(self->command);
+	self->command = NULL;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikeResultIterator_Close(AerospikeResultIterator *self,
+											   PyObject *args)
+{
+	result_iterator_close(self);
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef AerospikeResultIterator_Type_Methods[] = {
+	{"close", (PyCFunction)AerospikeResultIterator_Close, METH_NOARGS,
+	 "close()\n\nStop the query or scan and drop the records not read yet."},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject *
+AerospikeResultIterator_Type_Next(AerospikeResultIterator *self)
+{
+	PyObject *py_result = NULL;
+
+	if (!self->running) {
+		return NULL;
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	pthread_mutex_lock(&self->lock);
+	while (self->count == 0 && !self->done && !self->closed) {
+		pthread_cond_wait(&self->not_empty, &self->lock);
+	}
+	if (self->count) {
+		py_result = self->buffer[self->head];
+		self->head = (self->head + 1) % self->capacity;
+		self->count--;
+		pthread_cond_signal(&self->not_full);
+	}
+	pthread_mutex_unlock(&self->lock);
+	Py_END_ALLOW_THREADS
+
+	if (py_result) {
+		return py_result;
+	}
+
+	// All records were read, raise the error the command ended with.
+	as_error err;
+	as_error_init(&err);
+	as_error_copy(&err, &self->err);
+	result_iterator_close(self);
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+	}
+	return NULL;
+}
+
+static void AerospikeResultIterator_Type_Dealloc(AerospikeResultIterator *self)
+{
+	result_iterator_close(self);
+	if (self->command) {
+		self->ops->destroy(self->command);
+	}
+	cf_free(self->buffer);
+	pthread_cond_destroy(&self->not_full);
+	pthread_cond_destroy(&self->not_empty);
+	pthread_mutex_destroy(&self->lock);
+	Py_XDECREF(self->py_source);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeResultIterator_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.ResultIterator",
+	.tp_basicsize = sizeof(AerospikeResultIterator),
+	.tp_dealloc = (destructor)AerospikeResultIterator_Type_Dealloc,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "An iterator over the records of a query or scan, returned by\n"
+			  "iter_results(). Records are buffered as they stream back.\n",
+	.tp_iter = PyObject_SelfIter,
+	.tp_iternext = (iternextfunc)AerospikeResultIterator_Type_Next,
+	.tp_methods = AerospikeResultIterator_Type_Methods};
+
+PyTypeObject *AerospikeResultIterator_Ready()
+{
+	return PyType_Ready(&AerospikeResultIterator_Type) == 0
+			   ? &AerospikeResultIterator_Type
+			   : NULL;
+}
+
+PyObject *AerospikeResultIterator_New(AerospikeClient *client, as_error *err,
+									  PyObject *py_source, void *command,
+									  const result_iterator_command_ops *ops,
+									  uint32_t buffer_size)
+{
+	AerospikeResultIterator *self = PyObject_New(
+		AerospikeResultIterator, &AerospikeResultIterator_Type);
+	if (!self) {
+		ops->destroy(command);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the iterator");
+		return NULL;
+	}
+
+	self->client = client;
+	Py_INCREF(py_source);
+	self->py_source = py_source;
+	self->command = command;
+	self->ops = ops;
+	self->running = false;
+	pthread_mutex_init(&self->lock, NULL);
+	pthread_cond_init(&self->not_empty, NULL);
+	pthread_cond_init(&self->not_full, NULL);
+	self->buffer = cf_malloc(sizeof(PyObject *) * buffer_size);
+	self->capacity = buffer_size;
+	self->head = 0;
+	self->count = 0;
+	self->done = false;
+	self->closed = false;
+	as_error_init(&self->err);
+
+	if (pthread_create(&self->thread, NULL, result_iterator_run, self) != 0) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Failed to start the iterator thread");
+		Py_DECREF(self);
+		return NULL;
+	}
+	self->running = true;
+	return (PyObject *)self;
+}
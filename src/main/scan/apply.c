@@ -50,12 +50,17 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
 		return NULL;
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	as_error err;
 	as_error_init(&err);
 
+	// The arguments are kept by the scan until dealloc, and their bytes too.
+	if (self->static_pool == NULL &&
+		(self->static_pool = bytes_pool_new()) == NULL) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"Failed to allocate the bytes pool.");
+		goto CLEANUP;
+	}
+
 	if (!self || !self->client->as) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid scan object.");
 		goto CLEANUP;
@@ -116,7 +121,7 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
 		for (int i = 0; i < size; i++) {
 			PyObject *py_val = PyList_GetItem(py_args, (Py_ssize_t)i);
 			as_val *val = NULL;
-			pyobject_to_val(self->client, &err, py_val, &val, &static_pool,
+			pyobject_to_val(self->client, &err, py_val, &val, self->static_pool,
 							SERIALIZER_PYTHON);
 			if (err.code != AEROSPIKE_OK) {
 				as_error_update(&err, err.code, NULL);
@@ -140,8 +145,6 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
 	Py_END_ALLOW_THREADS
 
 CLEANUP:
-	POOL_DESTROY(&static_pool);
-
 	if (py_ufunction) {
 		Py_DECREF(py_ufunction);
 	}
@@ -151,17 +154,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", py_module);
-		}
-		if (PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", py_function);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, py_module, py_function, NULL);
 		return NULL;
 	}
 
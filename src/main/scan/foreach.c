@@ -25,8 +25,10 @@
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "foreach_chunk.h"
 #include "scan.h"
 #include "policy.h"
+#include "prepared_policy.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
@@ -34,6 +36,8 @@ typedef struct {
 	PyObject *callback;
 	AerospikeClient *client;
 	int partition_scan;
+	// Set when the callback takes chunks of records.
+	ForeachChunk *chunk;
 } LocalData;
 
 static bool each_result(const as_val *val, void *udata)
@@ -44,6 +48,12 @@ static bool each_result(const as_val *val, void *udata)
 		return false;
 	}
 
+	// Extract callback user-data
+	LocalData *data = (LocalData *)udata;
+	if (data->chunk) {
+		return foreach_chunk_add(data->chunk, val);
+	}
+
 	uint32_t part_id = 0;
 
 	as_record* rec = as_record_fromval(val);
@@ -52,8 +62,6 @@ static bool each_result(const as_val *val, void *udata)
 		part_id = as_partition_getid(rec->key.digest.value, CLUSTER_NPARTITIONS);
 	}
 
-	// Extract callback user-data
-	LocalData *data = (LocalData *)udata;
 	as_error *err = &data->error;
 	PyObject *py_callback = data->callback;
 
@@ -126,6 +134,7 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 	PyObject *py_policy = NULL;
 	PyObject *py_options = NULL;
 	PyObject *py_nodename = NULL;
+	PyObject *py_chunk_size = NULL;
 	PyObject *py_ustr = NULL;
 
 	char *nodename = NULL;
@@ -146,12 +155,13 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 	as_partitions_status *ps = NULL;
 
 	// Python Function Keyword Arguments
-	static char *kwlist[] = {"callback", "policy", "options", "nodename", NULL};
+	static char *kwlist[] = {"callback", "policy", "options", "nodename",
+							 "chunk_size", NULL};
 
 	// Python Function Argument Parsing
-	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OOO:foreach", kwlist,
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OOOO:foreach", kwlist,
 									&py_callback, &py_policy, &py_options,
-									&py_nodename) == false) {
+									&py_nodename, &py_chunk_size) == false) {
 		return NULL;
 	}
 
@@ -160,9 +170,13 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 	data.callback = py_callback;
 	data.client = self->client;
 	data.partition_scan = 0;
+	data.chunk = NULL;
 
 	as_error_init(&data.error);
 
+	ForeachChunk chunk;
+	uint32_t chunk_size = 0;
+
 	if (!self || !self->client->as) {
 		as_error_update(&data.error, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
 		goto CLEANUP;
@@ -174,6 +188,11 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 		goto CLEANUP;
 	}
 
+	if (foreach_chunk_size(&data.error, py_chunk_size, &chunk_size) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	// Convert python policy object to as_policy_exists
 	pyobject_to_policy_scan(
 		self->client, &data.error, py_policy, &scan_policy, &scan_policy_p,
@@ -185,7 +204,7 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 
 	if (py_policy) {
 		PyObject *py_partition_filter =
-			PyDict_GetItemString(py_policy, "partition_filter");
+			AerospikePolicy_GetItem(py_policy, "partition_filter");
 		if (py_partition_filter) {
 			if (convert_partition_filter(self->client, py_partition_filter,
 										 &partition_filter,
@@ -225,6 +244,12 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 		}
 	}
 
+	if (chunk_size) {
+		foreach_chunk_init(&chunk, self->client, py_callback, chunk_size,
+						   data.partition_scan);
+		data.chunk = &chunk;
+	}
+
 	// We are spawning multiple threads
 	Py_BEGIN_ALLOW_THREADS
 	// Invoke operation
@@ -250,11 +275,22 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 	// We are done using multiple threads
 	Py_END_ALLOW_THREADS
 
+	if (data.chunk) {
+		// Records received before an error still reach the callback.
+		foreach_chunk_flush(&chunk);
+		if (chunk.error.code != AEROSPIKE_OK) {
+			as_error_copy(&data.error, &chunk.error);
+		}
+	}
+
 	if (data.error.code != AEROSPIKE_OK) {
 		goto CLEANUP;
 	}
 
 CLEANUP:
+	if (data.chunk) {
+		foreach_chunk_destroy(&chunk);
+	}
 
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);
@@ -0,0 +1,227 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_scan.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_scan.h>
+#include <aerospike/as_partition.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "result_iterator.h"
+#include "scan.h"
+#include "prepared_policy.h"
+
+#define ITER_RESULTS_DEFAULT_BUFFER_SIZE 1024
+
+// A scan run by an aerospike.ResultIterator, with everything it points to.
+typedef struct {
+	AerospikeScan *scan;
+	// The policy and its expressions, which the converted policy may point
+	// into.
+	PyObject *py_policy;
+	PyObject *py_exp;
+	as_policy_scan policy;
+	as_policy_scan *policy_p;
+	as_exp *exp_list_p;
+	as_predexp_list predexp_list;
+	as_predexp_list *predexp_list_p;
+	as_partition_filter partition_filter;
+	as_partition_filter *partition_filter_p;
+	as_partitions_status *ps;
+	char *nodename;
+} ScanCommand;
+
+static void scan_command_run(void *command, as_error *err,
+							 result_iterator_callback callback, void *udata)
+{
+	ScanCommand *cmd = (ScanCommand *)command;
+	AerospikeClient *client = cmd->scan->client;
+
+	if (cmd->partition_filter_p) {
+		if (cmd->ps) {
+			as_partition_filter_set_partitions(cmd->partition_filter_p,
+											   cmd->ps);
+		}
+		aerospike_scan_partitions(client->as, err, cmd->policy_p,
+								  &cmd->scan->scan, cmd->partition_filter_p,
+								  callback, udata);
+	}
+	else if (cmd->nodename) {
+		aerospike_scan_node(client->as, err, cmd->policy_p, &cmd->scan->scan,
+							cmd->nodename, callback, udata);
+	}
+	else {
+		aerospike_scan_foreach(client->as, err, cmd->policy_p,
+							   &cmd->scan->scan, callback, udata);
+	}
+}
+
+static void scan_command_destroy(void *command)
+{
+	ScanCommand *cmd = (ScanCommand *)command;
+
+	if (cmd->exp_list_p) {
+		as_exp_destroy(cmd->exp_list_p);
+	}
+	if (cmd->predexp_list_p) {
+		as_predexp_list_destroy(&cmd->predexp_list);
+	}
+	if (cmd->ps) {
+		as_partitions_status_release(cmd->ps);
+	}
+	cf_free(cmd->nodename);
+	Py_XDECREF(cmd->py_policy);
+	Py_XDECREF(cmd->py_exp);
+	cf_free(cmd);
+}
+
+static const result_iterator_command_ops scan_command_ops = {
+	scan_command_run, scan_command_destroy};
+
+PyObject *AerospikeScan_Iter_Results(AerospikeScan *self, PyObject *args,
+									 PyObject *kwds)
+{
+	PyObject *py_policy = NULL;
+	PyObject *py_nodename = NULL;
+	PyObject *py_buffer_size = NULL;
+	PyObject *py_ustr = NULL;
+	PyObject *py_iterator = NULL;
+	ScanCommand *cmd = NULL;
+	as_exp exp_list;
+	long buffer_size = ITER_RESULTS_DEFAULT_BUFFER_SIZE;
+
+	static char *kwlist[] = {"policy", "nodename", "buffer_size", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOO:iter_results", kwlist,
+									&py_policy, &py_nodename,
+									&py_buffer_size) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (py_buffer_size && py_buffer_size != Py_None) {
+		buffer_size = PyInt_Check(py_buffer_size)
+						  ? PyInt_AsLong(py_buffer_size)
+						  : -1;
+		if (buffer_size <= 0 || buffer_size > UINT32_MAX) {
+			PyErr_Clear();
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"buffer_size must be a positive integer");
+			goto CLEANUP;
+		}
+	}
+
+	cmd = cf_malloc(sizeof(ScanCommand));
+	memset(cmd, 0, sizeof(ScanCommand));
+	cmd->scan = self;
+
+	// Convert python policy object to as_policy_scan
+	pyobject_to_policy_scan(self->client, &err, py_policy, &cmd->policy,
+							&cmd->policy_p,
+							&self->client->as->config.policies.scan,
+							&cmd->predexp_list, &cmd->predexp_list_p,
+							&exp_list, &cmd->exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy && py_policy != Py_None) {
+		Py_INCREF(py_policy);
+		cmd->py_policy = py_policy;
+	}
+
+	cmd->py_exp = AerospikePolicy_GetItem(py_policy, "expressions");
+	Py_XINCREF(cmd->py_exp);
+
+	PyObject *py_partition_filter =
+		AerospikePolicy_GetItem(py_policy, "partition_filter");
+	if (py_partition_filter) {
+		if (convert_partition_filter(self->client, py_partition_filter,
+									 &cmd->partition_filter, &cmd->ps,
+									 &err) == AEROSPIKE_OK) {
+			cmd->partition_filter_p = &cmd->partition_filter;
+		}
+	}
+	as_error_reset(&err);
+
+	// If the user specified a nodename, validate and copy it
+	if (py_nodename && py_nodename != Py_None) {
+		char *nodename = NULL;
+		if (PyString_Check(py_nodename)) {
+			nodename = PyString_AsString(py_nodename);
+		}
+		else if (PyUnicode_Check(py_nodename)) {
+			/* The decoding could fail, so we need to check for null */
+			py_ustr = PyUnicode_AsUTF8String(py_nodename);
+			if (!py_ustr) {
+				as_error_update(&err, AEROSPIKE_ERR_PARAM,
+								"Invalid unicode nodename");
+				goto CLEANUP;
+			}
+			nodename = PyBytes_AsString(py_ustr);
+		}
+		else {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"nodename must be a string");
+			goto CLEANUP;
+		}
+		cmd->nodename = cf_strdup(nodename);
+	}
+
+	// The iterator owns the command from here on.
+	py_iterator = AerospikeResultIterator_New(
+		self->client, &err, (PyObject *)self, cmd, &scan_command_ops,
+		(uint32_t)buffer_size);
+	cmd = NULL;
+
+CLEANUP:
+
+	if (cmd) {
+		scan_command_destroy(cmd);
+	}
+
+	Py_XDECREF(py_ustr);
+
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_iterator;
+}
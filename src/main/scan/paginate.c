@@ -96,3 +96,114 @@ CLEANUP:
 
 	return py_value;
 }
+
+PyObject *AerospikeScan_Get_Partitions_Status(AerospikeScan *self,
+											  PyObject *args, PyObject *kwds)
+{
+	PyObject *py_status = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid scan object.");
+		goto CLEANUP;
+	}
+
+	partitions_status_to_pyobject(&err, self->scan.parts_all, &py_status);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_status;
+}
+
+PyObject *AerospikeScan_Checkpoint(AerospikeScan *self, PyObject *args,
+                                   PyObject *kwds)
+{
+	PyObject *py_checkpoint = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid scan object.");
+		goto CLEANUP;
+	}
+
+	if (!self->scan.parts_all) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"No partition status to checkpoint, call paginate() "
+						"or use a partition_filter");
+		goto CLEANUP;
+	}
+
+	partitions_status_to_checkpoint(&err, self->scan.ns, self->scan.set,
+									self->scan.parts_all, &py_checkpoint);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return py_checkpoint;
+}
+
+AerospikeScan *AerospikeScan_From_Checkpoint(AerospikeScan *self, PyObject *args,
+                                             PyObject *kwds)
+{
+	PyObject *py_checkpoint = NULL;
+	as_partitions_status *parts_all = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	static char *kwlist[] = {"checkpoint", NULL};
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:from_checkpoint", kwlist,
+									 &py_checkpoint)) {
+		return NULL;
+	}
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid scan object.");
+		goto CLEANUP;
+	}
+
+	if (checkpoint_to_partitions_status(&err, self->scan.ns, self->scan.set,
+										py_checkpoint,
+										&parts_all) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// The scan continues from the checkpoint, keeping its status current.
+	if (self->scan.parts_all) {
+		as_partitions_status_release(self->scan.parts_all);
+		self->scan.parts_all = NULL;
+	}
+	as_scan_set_partitions(&self->scan, parts_all);
+	as_scan_set_paginate(&self->scan, true);
+	as_partitions_status_release(parts_all);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	Py_INCREF(self);
+	return self;
+}
@@ -28,6 +28,7 @@
 #include "exceptions.h"
 #include "policy.h"
 #include "scan.h"
+#include "prepared_policy.h"
 
 #undef TRACE
 #define TRACE()
@@ -73,9 +74,6 @@ PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 	PyObject *py_nodename = NULL;
 	PyObject *py_ustr = NULL;
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	as_policy_scan scan_policy;
 	as_policy_scan *scan_policy_p = NULL;
 
@@ -126,7 +124,7 @@ PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 
 	if (py_policy) {
 		PyObject *py_partition_filter =
-			PyDict_GetItemString(py_policy, "partition_filter");
+			AerospikePolicy_GetItem(py_policy, "partition_filter");
 		if (py_partition_filter) {
 			if (convert_partition_filter(self->client, py_partition_filter,
 										 &partition_filter,
@@ -34,10 +34,11 @@
  * PYTHON DOC METHODS
  ******************************************************************************/
 
-PyDoc_STRVAR(foreach_doc, "foreach(callback[, policy[, options [, nodename]])\n\
+PyDoc_STRVAR(foreach_doc, "foreach(callback[, policy[, options [, nodename[, chunk_size]]])\n\
 \n\
 Invoke the callback function for each of the records streaming back from the scan. If provided \
-nodename should be the Node ID of a node to limit the scan to.");
+nodename should be the Node ID of a node to limit the scan to. With chunk_size the callback \
+receives lists of up to chunk_size records.");
 
 PyDoc_STRVAR(select_doc, "select(bin1[, bin2[, bin3..]])\n\
 \n\
@@ -50,6 +51,12 @@ PyDoc_STRVAR(results_doc,
 Buffer the records resulting from the scan, and return them as a list of records.If provided \
 nodename should be the Node ID of a node to limit the scan to.");
 
+PyDoc_STRVAR(iter_results_doc,
+			 "iter_results([policy[, nodename[, buffer_size]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Return an iterator over the records resulting from the scan, as they stream back. \
+At most buffer_size records are buffered, the scan waits for the iterator to be read beyond that.");
+
 PyDoc_STRVAR(paginate_doc, "paginate()\n\
 \n\
 Set pagination filter to receive records in bunch (max_records or page_size).");
@@ -58,6 +65,20 @@ PyDoc_STRVAR(is_done_doc, "is_done() -> bool\n\
 \n\
 Gets the status of scan");
 
+PyDoc_STRVAR(get_partitions_status_doc, "get_partitions_status() -> dict\n\
+\n\
+Gets the status of the partitions of the last partition scan, which can be passed as the \
+partition_status of a partition_filter to resume from it.");
+
+PyDoc_STRVAR(checkpoint_doc, "checkpoint() -> bytes\n\
+\n\
+Serialize the status of the partitions of a paginated or partition scan into a compact checkpoint. \
+It can be taken while the scan runs, for instance from the foreach() callback.");
+
+PyDoc_STRVAR(from_checkpoint_doc, "from_checkpoint(checkpoint) -> Scan\n\
+\n\
+Continue the scan from a checkpoint taken by checkpoint() on a scan of the same namespace and set.");
+
 /*******************************************************************************
  * PYTHON TYPE METHODS
  ******************************************************************************/
@@ -73,6 +94,9 @@ static PyMethodDef AerospikeScan_Type_Methods[] = {
 	{"results", (PyCFunction)AerospikeScan_Results,
 	 METH_VARARGS | METH_KEYWORDS, results_doc},
 
+	{"iter_results", (PyCFunction)AerospikeScan_Iter_Results,
+	 METH_VARARGS | METH_KEYWORDS, iter_results_doc},
+
 	{"execute_background", (PyCFunction)AerospikeScan_ExecuteBackground,
 	 METH_VARARGS | METH_KEYWORDS, results_doc},
 
@@ -87,6 +111,15 @@ static PyMethodDef AerospikeScan_Type_Methods[] = {
 
 	{"is_done", (PyCFunction)AerospikeScan_Is_Done,
 	 METH_VARARGS | METH_KEYWORDS, is_done_doc},
+
+	{"get_partitions_status", (PyCFunction)AerospikeScan_Get_Partitions_Status,
+	 METH_VARARGS | METH_KEYWORDS, get_partitions_status_doc},
+
+	{"checkpoint", (PyCFunction)AerospikeScan_Checkpoint,
+	 METH_VARARGS | METH_KEYWORDS, checkpoint_doc},
+
+	{"from_checkpoint", (PyCFunction)AerospikeScan_From_Checkpoint,
+	 METH_VARARGS | METH_KEYWORDS, from_checkpoint_doc},
 	{NULL}};
 
 /*******************************************************************************
@@ -158,6 +191,10 @@ static void AerospikeScan_Type_Dealloc(AerospikeScan *self)
 {
 	as_scan_destroy(&self->scan);
 
+	if (self->static_pool != NULL) {
+		bytes_pool_free(self->static_pool);
+	}
+
 	if (self->unicodeStrVector != NULL) {
 		for (unsigned int i = 0; i < self->unicodeStrVector->size; ++i) {
 			free(as_vector_get_ptr(self->unicodeStrVector, i));
@@ -15,15 +15,19 @@
  ******************************************************************************/
 #include <Python.h>
 #include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
 
 #include <aerospike/aerospike_key.h>
 #include <aerospike/as_key.h>
 #include <aerospike/as_error.h>
 #include <aerospike/as_record.h>
 
+#include "blob_owner.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "msgpack_serializer.h"
 #include "policy.h"
 #include "serializer.h"
 
@@ -32,6 +36,38 @@ uint32_t is_user_deserializer_registered = 0;
 
 user_serializer_callback user_serializer_call_info, user_deserializer_call_info;
 
+// pickle.dumps and pickle.loads, looked up on first use.
+static PyObject *py_pickle_dumps = NULL;
+static PyObject *py_pickle_loads = NULL;
+
+static PyObject *pickle_function(PyObject **py_function, const char *name)
+{
+	if (!*py_function) {
+		PyObject *py_pickle = PyImport_ImportModule("pickle");
+		if (py_pickle) {
+			*py_function = PyObject_GetAttrString(py_pickle, name);
+			Py_DECREF(py_pickle);
+		}
+	}
+	return *py_function;
+}
+
+// The serializer which handles a value of a command using serializer_policy.
+static int32_t effective_serializer_policy(AerospikeClient *self,
+										   int32_t serializer_policy)
+{
+	if (self->is_client_put_serializer) {
+		return serializer_policy;
+	}
+	if (self->user_serializer_call_info.callback) {
+		return SERIALIZER_USER;
+	}
+	if (serializer_policy == SERIALIZER_PYTHON) {
+		return self->default_serializer;
+	}
+	return serializer_policy;
+}
+
 /**
  ******************************************************************************************************
  * Set a serializer in the aerospike database
@@ -323,16 +359,15 @@ extern as_status serialize_based_on_serializer_policy(AerospikeClient *self,
 			}
 		}
 	}
-	else if (self->user_serializer_call_info.callback) {
-		serializer_policy = SERIALIZER_USER;
-	}
+	serializer_policy = effective_serializer_policy(self, serializer_policy);
 
 	switch (serializer_policy) {
 	case SERIALIZER_NONE:
 		as_error_update(error_p, AEROSPIKE_ERR_PARAM,
 						"Cannot serialize: SERIALIZER_NONE selected");
 		goto CLEANUP;
-	case SERIALIZER_PYTHON: {
+	case SERIALIZER_PYTHON:
+	case SERIALIZER_MSGPACK: {
 		/*
 				 * Serialize bytearray as is and store them into database with
 				 * type AS_BYTES_BLOB, unlike other values in case of 
@@ -351,51 +386,29 @@ extern as_status serialize_based_on_serializer_policy(AerospikeClient *self,
 			uint32_t my_bytes_len = (uint32_t)PyBytes_Size(value);
 			set_as_bytes(bytes, my_bytes, my_bytes_len, AS_BYTES_BLOB, error_p);
 		}
-		else {
-
-			/* get the sys.modules dictionary */
-			PyObject *sysmodules = PyImport_GetModuleDict();
-			PyObject *cpickle_module = NULL;
-			if (PyMapping_HasKeyString(sysmodules, "pickle")) {
-				cpickle_module = PyMapping_GetItemString(sysmodules, "pickle");
-			}
-			else {
-				cpickle_module = PyImport_ImportModule("pickle");
+		else if (serializer_policy != SERIALIZER_MSGPACK ||
+				 PyBool_Check(value) || !msgpack_serialize(value, *bytes)) {
+			// Booleans stay pickled, see send_bool_as, as do the values
+			// holding types msgpack_serialize() does not support.
+			PyObject *py_dumps = pickle_function(&py_pickle_dumps, "dumps");
+			if (py_dumps) {
+				initresult =
+					PyObject_CallFunctionObjArgs(py_dumps, value, NULL);
 			}
 
-			if (!cpickle_module) {
-				/* insert error handling here! and exit this function */
+			if (!initresult) {
+				/* more error handling &c */
 				as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-								"Unable to load pickle module");
+								"Unable to call dumps function");
 				goto CLEANUP;
 			}
 			else {
-				PyObject *py_funcname = PyString_FromString("dumps");
-
-				Py_INCREF(cpickle_module);
-				initresult = PyObject_CallMethodObjArgs(
-					cpickle_module, py_funcname, value, NULL);
-				Py_DECREF(cpickle_module);
-				Py_DECREF(py_funcname);
-
-				if (!initresult) {
-					/* more error handling &c */
-					as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-									"Unable to call dumps function");
-					goto CLEANUP;
-				}
-				else {
-					Py_INCREF(initresult);
-
-					char *return_value;
-					Py_ssize_t len;
-					PyBytes_AsStringAndSize(initresult, &return_value, &len);
-					set_as_bytes(bytes, (uint8_t *)return_value, len,
-								 AS_BYTES_PYTHON, error_p);
-					Py_DECREF(initresult);
-				}
+				char *return_value;
+				Py_ssize_t len;
+				PyBytes_AsStringAndSize(initresult, &return_value, &len);
+				set_as_bytes(bytes, (uint8_t *)return_value, len,
+							 AS_BYTES_PYTHON, error_p);
 			}
-			Py_XDECREF(cpickle_module);
 		}
 	} break;
 	case SERIALIZER_JSON:
@@ -457,6 +470,80 @@ CLEANUP:
 	return error_p->code;
 }
 
+/**
+ *******************************************************************************************************
+ * Stores a bytes, bytearray, memoryview or mmap value as a blob which points
+ * at the memory of the value instead of a copy. The value must outlive the
+ * command. Other buffers, such as numpy arrays, are only stored this way
+ * when wrapped in a memoryview, as they are otherwise serialized.
+ *
+ * @param self                  AerospikeClient object
+ * @param serializer_policy     The serializer_policy of the command.
+ * @param bytes                 The as_bytes to be set.
+ * @param value                 The value to be stored.
+ * @param static_pool           Holds the buffer of the value until
+ *                              POOL_DESTROY.
+ *
+ * Returns false if the value must go through
+ * serialize_based_on_serializer_policy() instead.
+ *******************************************************************************************************
+ */
+bool serialize_buffer_without_copy(AerospikeClient *self,
+								   int32_t serializer_policy, as_bytes *bytes,
+								   PyObject *value, as_static_pool *static_pool)
+{
+	// Both store bytes like values as blobs.
+	serializer_policy = effective_serializer_policy(self, serializer_policy);
+	if (serializer_policy != SERIALIZER_PYTHON &&
+		serializer_policy != SERIALIZER_MSGPACK) {
+		return false;
+	}
+
+	if (PyBytes_Check(value)) {
+		// Immutable, so nothing has to be held.
+		as_bytes_init_wrap(bytes, (uint8_t *)PyBytes_AS_STRING(value),
+						   (uint32_t)PyBytes_GET_SIZE(value), false);
+		as_bytes_set_type(bytes, AS_BYTES_BLOB);
+		return true;
+	}
+
+	if (!PyByteArray_Check(value) && !PyMemoryView_Check(value) &&
+		strcmp(Py_TYPE(value)->tp_name, "mmap.mmap") != 0) {
+		return false;
+	}
+
+	if (static_pool->buffers_size == static_pool->buffers_capacity) {
+		uint32_t capacity = static_pool->buffers_capacity
+								? static_pool->buffers_capacity * 2
+								: 8;
+		Py_buffer *buffers = PyMem_Realloc(static_pool->buffers,
+										   sizeof(Py_buffer) * capacity);
+		if (!buffers) {
+			PyErr_Clear();
+			return false;
+		}
+		static_pool->buffers = buffers;
+		static_pool->buffers_capacity = capacity;
+	}
+
+	// Exporting the buffer stops a bytearray from being resized meanwhile.
+	Py_buffer *view = &static_pool->buffers[static_pool->buffers_size];
+	if (PyObject_GetBuffer(value, view, PyBUF_CONTIG_RO) != 0) {
+		PyErr_Clear();
+		return false;
+	}
+	if (view->len > UINT32_MAX) {
+		PyBuffer_Release(view);
+		return false;
+	}
+	static_pool->buffers_size++;
+
+	as_bytes_init_wrap(bytes, (uint8_t *)view->buf, (uint32_t)view->len,
+					   false);
+	as_bytes_set_type(bytes, AS_BYTES_BLOB);
+	return true;
+}
+
 /*
  *******************************************************************************************************
  * Checks as_bytes->type.
@@ -477,55 +564,44 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient *self,
 {
 	switch (as_bytes_get_type(bytes)) {
 	case AS_BYTES_PYTHON: {
-		PyObject *sysmodules = PyImport_GetModuleDict();
-		PyObject *cpickle_module = NULL;
-		if (PyMapping_HasKeyString(sysmodules, "pickle")) {
-			cpickle_module = PyMapping_GetItemString(sysmodules, "pickle");
-		}
-		else {
-			cpickle_module = PyImport_ImportModule("pickle");
-		}
-
 		PyObject *initresult = NULL;
-		if (!cpickle_module) {
-			/* insert error handling here! and exit this function */
-			as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-							"Unable to load pickle module");
-			goto CLEANUP;
+		if (msgpack_is_serialized(bytes)) {
+			initresult = msgpack_deserialize(bytes);
 		}
 		else {
+			PyObject *py_loads = pickle_function(&py_pickle_loads, "loads");
+			if (!py_loads) {
+				/* insert error handling here! and exit this function */
+				as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
+								"Unable to load pickle module");
+				goto CLEANUP;
+			}
+
 			char *bytes_val_p = (char *)bytes->value;
 			PyObject *py_value =
 				PyBytes_FromStringAndSize(bytes_val_p, as_bytes_size(bytes));
-			PyObject *py_funcname = PyString_FromString("loads");
-
-			Py_INCREF(cpickle_module);
-			initresult = PyObject_CallMethodObjArgs(cpickle_module, py_funcname,
-													py_value, NULL);
-			Py_DECREF(cpickle_module);
-			Py_DECREF(py_funcname);
-			Py_DECREF(py_value);
-			if (!initresult) {
-				// At this point we want to try to fallback to returning a byte array
-				uint32_t bval_size = as_bytes_size(bytes);
-				initresult = PyByteArray_FromStringAndSize(
-					(char *)as_bytes_get(bytes), bval_size);
-				// We couldn't convert the value into a byte array
-				if (!initresult) {
-					as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-									"Unable to deserialize bytes");
-					Py_XDECREF(cpickle_module);
-					goto CLEANUP;
-				}
-				// The fallback deserialization succeeded
-				*retval = initresult;
-				as_error_update(error_p, AEROSPIKE_OK, NULL);
+			if (py_value) {
+				initresult =
+					PyObject_CallFunctionObjArgs(py_loads, py_value, NULL);
+				Py_DECREF(py_value);
 			}
-			else {
-				*retval = initresult;
+		}
+
+		if (!initresult) {
+			// At this point we want to try to fallback to returning a byte array
+			uint32_t bval_size = as_bytes_size(bytes);
+			initresult = PyByteArray_FromStringAndSize(
+				(char *)as_bytes_get(bytes), bval_size);
+			// We couldn't convert the value into a byte array
+			if (!initresult) {
+				as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
+								"Unable to deserialize bytes");
+				goto CLEANUP;
 			}
+			// The fallback deserialization succeeded
+			as_error_update(error_p, AEROSPIKE_OK, NULL);
 		}
-		Py_XDECREF(cpickle_module);
+		*retval = initresult;
 	} break;
 	case AS_BYTES_BLOB: {
 		if (self->user_deserializer_call_info.callback) {
@@ -561,6 +637,15 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient *self,
 					*retval = py_val;
 				}
 			}
+			else if (self->blob_as_memoryview) {
+				PyObject *py_val = AerospikeBlobOwner_MemoryView(bytes);
+				if (!py_val) {
+					as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
+									"Unable to deserialize bytes");
+					goto CLEANUP;
+				}
+				*retval = py_val;
+			}
 			else {
 				uint32_t bval_size = as_bytes_size(bytes);
 				PyObject *py_val = PyByteArray_FromStringAndSize(
@@ -274,6 +274,23 @@ def connection_config(request):
     request.cls.connection_config = config
 
 
+@pytest.fixture(scope="class")
+def configured_client(request):
+    """
+    Sets the class attribute configured_client to a function connecting a
+    new client, with the connection config updated by its keyword arguments
+    """
+    def connect(**settings):
+        config = TestBaseClass.get_connection_config()
+        config.update(settings)
+        if config['user'] is None and config['password'] is None:
+            return aerospike.client(config).connect()
+        return aerospike.client(config).connect(config['user'],
+                                                config['password'])
+
+    request.cls.configured_client = staticmethod(connect)
+
+
 @pytest.fixture(params=invalid_data.INVALID_KEYS)
 def invalid_key(request):
     yield request.param
@@ -206,6 +206,26 @@ class TestAggregate(object):
              u'name1': 1}
         ]
 
+    def test_pos_aggregate_arguments_kept_after_iter_results_error(self):
+        """
+            Invoke iter_results() with an invalid policy, then aggregate with
+            the arguments given to apply()
+        """
+        query = self.as_connection.query('test', 'demo')
+        query.where(p.between('test_age', 0, 5))
+        query.apply('stream_example', 'group_count', [u"name", u"addr"])
+
+        with pytest.raises(e.ParamError):
+            query.iter_results({'max_records': 'a'})
+
+        assert query.results() == [
+            {u'name4': 1,
+             u'name2': 1,
+             u'name3': 1,
+             u'name0': 1,
+             u'name1': 1}
+        ]
+
     def test_pos_aggregate_with_unicode_module_and_function_name(self):
         """
             Invoke aggregate() with unicode module and function names
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import threading
+import time
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.operations import operations
+except:
+    print("Please install aerospike python client.")
+    import sys
+    sys.exit(1)
+
+aerospike.init_async()
+
+
+@pytest.mark.usefixtures("as_connection", "configured_client")
+class TestAio():
+
+    @pytest.mark.asyncio
+    async def test_pos_put_get_aio(self):
+        key = ('test', 'demo', 'aio_put_get')
+        assert await self.as_connection.put_aio(key, {'a': 1, 'b': 'x'}) == 0
+        _, meta, bins = await self.as_connection.get_aio(key)
+        assert bins == {'a': 1, 'b': 'x'}
+        assert meta['gen'] >= 1
+        self.as_connection.remove(key)
+
+    @pytest.mark.asyncio
+    async def test_pos_operate_aio(self):
+        key = ('test', 'demo', 'aio_operate')
+        self.as_connection.put(key, {'count': 1})
+        _, _, bins = await self.as_connection.operate_aio(key, [
+            operations.increment('count', 2),
+            operations.read('count')
+        ])
+        assert bins == {'count': 3}
+        self.as_connection.remove(key)
+
+    @pytest.mark.asyncio
+    async def test_pos_many_concurrent_aio(self):
+        keys = [('test', 'demo', 'aio_%d' % i) for i in range(50)]
+        await asyncio.gather(
+            *[self.as_connection.put_aio(k, {'i': i}) for i, k in enumerate(keys)])
+        records = await asyncio.gather(
+            *[self.as_connection.get_aio(k) for k in keys])
+        assert [bins['i'] for _, _, bins in records] == list(range(50))
+        for k in keys:
+            self.as_connection.remove(k)
+
+    @pytest.mark.asyncio
+    async def test_neg_get_aio_record_not_found(self):
+        key = ('test', 'demo', 'aio-non-existent-key')
+        with pytest.raises(e.RecordNotFound) as err_info:
+            await self.as_connection.get_aio(key)
+        assert err_info.value.code == aerospike.exception.RecordNotFound.code
+
+    def test_neg_get_aio_without_running_loop(self):
+        with pytest.raises(e.ClientError):
+            self.as_connection.get_aio(('test', 'demo', 1))
+
+    @pytest.mark.asyncio
+    async def test_neg_operate_aio_invalid_list(self):
+        with pytest.raises(e.ParamError):
+            await self.as_connection.operate_aio(('test', 'demo', 1), {})
+
+    @pytest.mark.asyncio
+    async def test_pos_remove_exists_aio(self):
+        key = ('test', 'demo', 'aio_remove')
+        self.as_connection.put(key, {'a': 1})
+        _, meta = await self.as_connection.exists_aio(key)
+        assert meta['gen'] >= 1
+        assert await self.as_connection.remove_aio(key) == 0
+        _, meta = await self.as_connection.exists_aio(key)
+        assert meta is None
+
+    @pytest.mark.asyncio
+    async def test_pos_touch_aio(self):
+        key = ('test', 'demo', 'aio_touch')
+        self.as_connection.put(key, {'a': 1})
+        _, meta = self.as_connection.exists(key)
+        assert await self.as_connection.touch_aio(key, 120) == 0
+        _, touched = self.as_connection.exists(key)
+        assert touched['gen'] == meta['gen'] + 1
+        self.as_connection.remove(key)
+
+    @pytest.mark.asyncio
+    async def test_pos_operate_ordered_aio(self):
+        key = ('test', 'demo', 'aio_operate_ordered')
+        self.as_connection.put(key, {'count': 1})
+        _, _, bins = await self.as_connection.operate_ordered_aio(key, [
+            operations.increment('count', 2),
+            operations.read('count')
+        ])
+        assert bins == [('count', 3)]
+        self.as_connection.remove(key)
+
+    @pytest.mark.asyncio
+    async def test_neg_remove_aio_record_not_found(self):
+        key = ('test', 'demo', 'aio-non-existent-key')
+        with pytest.raises(e.RecordNotFound) as err_info:
+            await self.as_connection.remove_aio(key)
+        assert err_info.value.key[:3] == key
+
+    @pytest.mark.asyncio
+    async def test_neg_operate_ordered_aio_non_dict_operation(self):
+        with pytest.raises(e.ParamError):
+            await self.as_connection.operate_ordered_aio(
+                ('test', 'demo', 1), [operations.read('a'), 'read'])
+
+    def test_neg_apply_aio_args_not_list(self):
+        with pytest.raises(TypeError):
+            self.as_connection.apply_aio(('test', 'demo', 1), 'module',
+                                         'function', 'args')
+
+    def test_pos_remove_async_callback(self):
+        key = ('test', 'demo', 'async_remove')
+        self.as_connection.put(key, {'a': 1})
+        done = threading.Event()
+        result = {}
+
+        def callback(key, err, exception):
+            result['err'] = err
+            result['exception'] = exception
+            done.set()
+
+        assert self.as_connection.remove_async(callback, key) is None
+        assert done.wait(5)
+        assert result['exception'] is None
+        assert self.as_connection.exists(key)[1] is None
+
+    def test_pos_operate_async_callback(self):
+        key = ('test', 'demo', 'async_operate')
+        self.as_connection.put(key, {'count': 1})
+        done = threading.Event()
+        result = {}
+
+        def callback(key, record, err, exception):
+            result['record'] = record
+            result['exception'] = exception
+            done.set()
+
+        self.as_connection.operate_async(callback, key, [
+            operations.increment('count', 1),
+            operations.read('count')
+        ])
+        assert done.wait(5)
+        assert result['exception'] is None
+        assert result['record'][2] == {'count': 2}
+        self.as_connection.remove(key)
+
+    def test_neg_exists_async_not_callable(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.exists_async(None, ('test', 'demo', 1))
+
+    @pytest.mark.asyncio
+    async def test_pos_batch_reads_aio(self):
+        keys = [('test', 'demo', 'aio_batch_%d' % i) for i in range(3)]
+        for i, key in enumerate(keys):
+            self.as_connection.put(key, {'i': i})
+        missing = ('test', 'demo', 'aio_batch_missing')
+
+        records = await self.as_connection.get_many_aio(keys + [missing])
+        assert [rec[2] for rec in records] == [{'i': 0}, {'i': 1}, {'i': 2}, None]
+
+        exists = await self.as_connection.exists_many_aio(tuple(keys + [missing]))
+        assert [meta is not None for _, meta in exists] == [True, True, True, False]
+
+        results = await self.as_connection.batch_get_ops_aio(
+            keys, [operations.read('i')])
+        assert results[0][0] == 0
+        assert [rec[1] for rec, _, _ in results[1:]] == [{'i': 0}, {'i': 1}, {'i': 2}]
+
+        for key in keys:
+            self.as_connection.remove(key)
+
+    @pytest.mark.asyncio
+    async def test_pos_get_many_aio_empty(self):
+        assert await self.as_connection.get_many_aio([]) == []
+
+    def test_pos_get_many_async_callback(self):
+        key = ('test', 'demo', 'async_get_many')
+        self.as_connection.put(key, {'a': 1})
+        done = threading.Event()
+        result = {}
+
+        def callback(records, err, exception):
+            result['records'] = records
+            result['exception'] = exception
+            done.set()
+
+        assert self.as_connection.get_many_async(callback, [key]) is None
+        assert done.wait(5)
+        assert result['exception'] is None
+        assert result['records'][0][2] == {'a': 1}
+        self.as_connection.remove(key)
+
+    @pytest.mark.asyncio
+    async def test_neg_get_many_aio_invalid_key(self):
+        with pytest.raises(e.ParamError):
+            await self.as_connection.get_many_aio([('test', 'demo', 1), 'key'])
+
+    @pytest.mark.asyncio
+    async def test_neg_batch_get_ops_aio_keys_not_list(self):
+        with pytest.raises(e.ParamError):
+            await self.as_connection.batch_get_ops_aio(
+                (('test', 'demo', 1),), [operations.read('a')])
+
+    def test_pos_event_loop_stats(self):
+        stats = aerospike.event_loop_stats()
+        assert len(stats) >= 1
+        for index, loop in enumerate(stats):
+            assert loop['index'] == index
+            assert loop['pending'] >= 0
+            assert loop['queue_size'] >= 0
+
+    @pytest.mark.asyncio
+    async def test_pos_get_aio_pinned_event_loop(self):
+        key = ('test', 'demo', 'aio_pinned')
+        await self.as_connection.put_aio(key, {'a': 1}, None, {'event_loop': 0})
+        _, _, bins = await self.as_connection.get_aio(key, {'event_loop': 0})
+        assert bins == {'a': 1}
+        assert aerospike.event_loop_stats()[0]['pending'] == 0
+        self.as_connection.remove(key)
+
+    def test_neg_get_aio_event_loop_out_of_range(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_async(lambda *args: None, ('test', 'demo', 1),
+                                         {'event_loop': 100000})
+
+    def test_neg_init_async_invalid_loops(self):
+        with pytest.raises(e.ParamError):
+            aerospike.init_async(loops=0)
+
+    def test_neg_invalid_event_loop_selection(self):
+        config = TestBaseClass.get_connection_config()
+        config['event_loop_selection'] = 100
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
+
+    @pytest.mark.asyncio
+    async def test_pos_async_completion_batched(self):
+        client = self.configured_client(
+            async_completion={'max_batch': 16, 'max_delay_ms': 5})
+        keys = [('test', 'demo', 'aio_batched_%d' % i) for i in range(50)]
+        await asyncio.gather(
+            *[client.put_aio(k, {'i': i}) for i, k in enumerate(keys)])
+        records = await asyncio.gather(*[client.get_aio(k) for k in keys])
+        assert [bins['i'] for _, _, bins in records] == list(range(50))
+        _, meta = await client.exists_aio(('test', 'demo', 'aio_batched_none'))
+        assert meta is None
+        with pytest.raises(e.RecordNotFound):
+            await client.get_aio(('test', 'demo', 'aio_batched_none'))
+        for k in keys:
+            client.remove(k)
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_pos_async_completion_notify_fd(self):
+        client = self.configured_client(
+            async_completion={'max_batch': 8, 'notify_fd': True})
+        loop = asyncio.get_running_loop()
+        loop.add_reader(client.async_completion_fd(), client.async_drain)
+        try:
+            keys = [('test', 'demo', 'aio_fd_%d' % i) for i in range(20)]
+            await asyncio.gather(
+                *[client.put_aio(k, {'i': i}) for i, k in enumerate(keys)])
+            records = await client.get_many_aio(keys)
+            assert [rec[2]['i'] for rec in records] == list(range(20))
+        finally:
+            loop.remove_reader(client.async_completion_fd())
+        assert client.async_drain() == 0
+        for k in keys:
+            client.remove(k)
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_pos_async_completion_notify_fd_max_commands(self):
+        client = self.configured_client(
+            async_max_commands=2,
+            async_completion={'max_batch': 4, 'notify_fd': True})
+        loop = asyncio.get_running_loop()
+        loop.add_reader(client.async_completion_fd(), client.async_drain)
+        keys = [('test', 'demo', 'aio_fd_limited_%d' % i) for i in range(20)]
+        done = asyncio.Event()
+        results = []
+
+        def callback(key, err, exception):
+            results.append(exception)
+            if len(results) == len(keys):
+                done.set()
+
+        try:
+            # Issued from the loop thread, which is the one draining.
+            for i, key in enumerate(keys):
+                client.put_async(callback, key, {'i': i})
+            await asyncio.wait_for(done.wait(), 5)
+            records = await asyncio.gather(*[client.get_aio(k) for k in keys])
+            assert [bins['i'] for _, _, bins in records] == list(range(20))
+        finally:
+            loop.remove_reader(client.async_completion_fd())
+        assert results == [None] * len(keys)
+        assert client.async_stats()['in_flight'] == 0
+        for k in keys:
+            client.remove(k)
+        client.close()
+
+    def test_pos_async_completion_callback(self):
+        client = self.configured_client(
+            async_completion={'max_batch': 4, 'max_delay_ms': 1})
+        key = ('test', 'demo', 'async_batched_callback')
+        client.put(key, {'a': 1})
+        done = threading.Event()
+        result = {}
+
+        def callback(key, record, err, exception):
+            result['record'] = record
+            result['exception'] = exception
+            done.set()
+
+        client.get_async(callback, key)
+        assert done.wait(5)
+        assert result['exception'] is None
+        assert result['record'][2] == {'a': 1}
+        client.remove(key)
+        client.close()
+
+    @pytest.mark.parametrize("settings", [
+        {'max_batch': 0},
+        {'max_delay_ms': -1},
+        {'notify_fd': 1},
+        []
+    ])
+    def test_neg_invalid_async_completion(self, settings):
+        config = TestBaseClass.get_connection_config()
+        config['async_completion'] = settings
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
+
+    def test_neg_async_drain_not_batched(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.async_drain()
+        with pytest.raises(e.ParamError):
+            self.as_connection.async_completion_fd()
+
+    @pytest.mark.asyncio
+    async def test_pos_async_max_commands(self):
+        client = self.configured_client(async_max_commands=8)
+        keys = [('test', 'demo', 'aio_limited_%d' % i) for i in range(40)]
+        futures = [client.put_aio(k, {'i': i}) for i, k in enumerate(keys)]
+        stats = client.async_stats()
+        assert stats['in_flight'] <= 8
+        assert stats['waiting'] <= 32
+        assert stats['max_commands'] == 8
+        assert await asyncio.gather(*futures) == [0] * 40
+        records = await asyncio.gather(*[client.get_aio(k) for k in keys])
+        assert [bins['i'] for _, _, bins in records] == list(range(40))
+        assert client.async_stats()['in_flight'] == 0
+        for k in keys:
+            client.remove(k)
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_pos_async_max_commands_cancel_waiting(self):
+        client = self.configured_client(async_max_commands=2)
+        key = ('test', 'demo', 'aio_limited_cancel')
+        client.put(key, {'a': 1})
+        futures = [client.get_aio(key) for _ in range(10)]
+        for future in futures[5:]:
+            future.cancel()
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        assert all(rec[2] == {'a': 1} for rec in results[:5])
+        assert all(isinstance(r, asyncio.CancelledError) for r in results[5:])
+        await asyncio.sleep(0.05)
+        assert client.async_stats()['in_flight'] == 0
+        assert client.async_stats()['waiting'] == 0
+        client.remove(key)
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_neg_async_max_commands_deferred_error(self):
+        client = self.configured_client(async_max_commands=1)
+        futures = [client.get_aio(('test', 'demo', 'aio_limited_none_%d' % i))
+                   for i in range(5)]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        assert all(isinstance(r, e.RecordNotFound) for r in results)
+        client.close()
+
+    def test_pos_async_max_commands_callback(self):
+        client = self.configured_client(async_max_commands=2)
+        key = ('test', 'demo', 'async_limited_callback')
+        client.put(key, {'a': 1})
+        done = threading.Event()
+        results = []
+
+        def callback(key, record, err, exception):
+            results.append(record)
+            if len(results) == 20:
+                done.set()
+
+        for _ in range(20):
+            client.get_async(callback, key)
+            assert client.async_stats()['in_flight'] <= 2
+        assert done.wait(5)
+        assert all(rec[2] == {'a': 1} for rec in results)
+        client.remove(key)
+        client.close()
+
+    def test_pos_async_max_commands_callback_notify_fd(self):
+        client = self.configured_client(
+            async_max_commands=2, async_completion={'notify_fd': True})
+        keys = [('test', 'demo', 'async_limited_fd_%d' % i) for i in range(20)]
+        results = []
+
+        def callback(key, err, exception):
+            results.append(exception)
+
+        # Nothing drains but this thread, the commands must not wait for it.
+        for i, key in enumerate(keys):
+            client.put_async(callback, key, {'i': i})
+            assert client.async_stats()['in_flight'] <= 2
+        deadline = time.time() + 5
+        while len(results) < len(keys) and time.time() < deadline:
+            client.async_drain()
+        assert results == [None] * len(keys)
+        assert client.async_stats()['in_flight'] == 0
+        for key in keys:
+            client.remove(key)
+        client.close()
+
+    def test_pos_async_stats_unlimited(self):
+        stats = self.as_connection.async_stats()
+        assert stats['max_commands'] == 0
+        assert stats['waiting'] == 0
+        assert stats['queued_completions'] == 0
+
+    @pytest.mark.parametrize("max_commands", [-1, 'ten', 1.5])
+    def test_neg_invalid_async_max_commands(self, max_commands):
+        config = TestBaseClass.get_connection_config()
+        config['async_max_commands'] = max_commands
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+def add_udfs(client):
+    client.udf_put("sample.lua", 0, {})
+
+
+def remove_udfs(client):
+    client.udf_remove("sample.lua", {})
+
+
+class TestBatchApply(TestBaseClass):
+
+    def setup_class(cls):
+        cls.connection_setup_functions = [add_udfs]
+        cls.connection_teardown_functions = [remove_udfs]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, connection_with_config_funcs):
+        as_connection = connection_with_config_funcs
+        self.keys = [('test', 'demo', 'batch_apply_%d' % i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'name': ['name%d' % i]})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_batch_apply(self):
+        results = self.as_connection.batch_apply(
+            self.keys, 'sample', 'list_append', ['name', 'car'])
+
+        assert results == [(0, 0)] * len(self.keys)
+        for i, key in enumerate(self.keys):
+            _, _, bins = self.as_connection.get(key)
+            assert bins['name'] == ['name%d' % i, 'car']
+
+    def test_pos_batch_apply_same_key_in_order(self):
+        key = self.keys[0]
+
+        results = self.as_connection.batch_apply(
+            [key] * 3, 'sample', 'list_append', ['name', 1])
+
+        assert results == [(0, 0)] * 3
+        assert self.as_connection.get(key)[2]['name'] == ['name0', 1, 1, 1]
+
+    def test_pos_batch_apply_per_key_status(self):
+        results = self.as_connection.batch_apply(
+            self.keys[:2], 'sample', 'no_such_function', [])
+
+        assert [status for status, _ in results] == [e.UDFError.code] * 2
+        assert [result for _, result in results] == [None, None]
+
+    def test_pos_batch_apply_empty(self):
+        assert self.as_connection.batch_apply(
+            [], 'sample', 'list_append', ['name', 1]) == []
+
+    @pytest.mark.parametrize("keys, module, function, args", [
+        (None, 'sample', 'list_append', []),
+        ([('test', 'demo')], 'sample', 'list_append', []),
+        ([('test', 'demo', 1)], 1, 'list_append', []),
+        ([('test', 'demo', 1)], 'sample', None, []),
+        ([('test', 'demo', 1)], 'sample', 'list_append', 'name'),
+    ])
+    def test_neg_batch_apply_invalid_params(self, keys, module, function, args):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_apply(keys, module, function, args)
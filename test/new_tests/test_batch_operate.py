@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.operations import operations
+    from aerospike_helpers.operations import list_operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestBatchOperate():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'batch_operate_%d' % i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'count': i, 'events': ['a']})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_batch_operate_different_ops_per_key(self):
+        records = [
+            (self.keys[0], [operations.increment('count', 5),
+                            operations.read('count')]),
+            (self.keys[1], [list_operations.list_append('events', 'b'),
+                            operations.read('events')]),
+            (self.keys[2], [operations.write('name', 'two')]),
+        ]
+
+        results = self.as_connection.batch_operate(records)
+
+        assert [status for status, _ in results] == [0, 0, 0]
+        assert results[0][1][2] == {'count': 5}
+        assert results[1][1][2] == {'events': ['a', 'b']}
+        assert results[0][1][0][:3] == self.keys[0]
+        assert self.as_connection.get(self.keys[2])[2]['name'] == 'two'
+
+    def test_pos_batch_operate_same_key_in_order(self):
+        records = [(self.keys[0], [operations.increment('count', 1)])] * 10
+        records.append((self.keys[0], [operations.read('count')]))
+
+        results = self.as_connection.batch_operate(records)
+
+        assert results[-1][0] == 0
+        assert results[-1][1][2] == {'count': 10}
+
+    def test_pos_batch_operate_with_meta_and_policy(self):
+        records = [(self.keys[0], [operations.write('name', 'zero')],
+                    {'gen': 1})]
+        policy = {'gen': aerospike.POLICY_GEN_EQ}
+
+        results = self.as_connection.batch_operate(records, policy)
+
+        assert results[0][0] == 0
+
+    def test_pos_batch_operate_per_record_status(self):
+        missing = ('test', 'demo', 'batch_operate_missing')
+        records = [(missing, [operations.read('count')]),
+                   (self.keys[0], [operations.read('count')])]
+
+        results = self.as_connection.batch_operate(records)
+
+        assert results[0] == (e.RecordNotFound.code, None)
+        assert results[1][0] == 0
+        assert results[1][1][2] == {'count': 0}
+
+    def test_pos_batch_operate_empty(self):
+        assert self.as_connection.batch_operate([]) == []
+
+    @pytest.mark.parametrize("records", [
+        None,
+        [(('test', 'demo', 1),)],
+        [(('test', 'demo', 1), operations.read('count'))],
+        [(('test', 'demo'), [operations.read('count')])],
+        [(('test', 'demo', 1), [operations.read('count')], 'meta')],
+    ])
+    def test_neg_batch_operate_invalid_records(self, records):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_operate(records)
+
+    def test_neg_batch_operate_invalid_record_operates_nothing(self):
+        records = [(self.keys[0], [operations.increment('count', 1)]),
+                   (self.keys[1], 'ops')]
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_operate(records)
+
+        assert self.as_connection.get(self.keys[0])[2]['count'] == 0
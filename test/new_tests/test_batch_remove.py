@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestBatchRemove():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'batch_remove_%d' % i) for i in range(20)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'i': i})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_batch_remove(self):
+        statuses = self.as_connection.batch_remove(self.keys)
+
+        assert statuses == [0] * len(self.keys)
+        for key in self.keys:
+            with pytest.raises(e.RecordNotFound):
+                self.as_connection.get(key)
+
+    def test_pos_batch_remove_with_missing_keys(self):
+        keys = self.keys[:2] + [('test', 'demo', 'batch_remove_missing')]
+
+        statuses = self.as_connection.batch_remove(keys, {'total_timeout': 1000})
+
+        assert statuses == [0, 0, e.RecordNotFound.code]
+        assert self.as_connection.get(self.keys[2])[2] == {'i': 2}
+
+    def test_pos_batch_remove_empty(self):
+        assert self.as_connection.batch_remove([]) == []
+
+    @pytest.mark.parametrize("keys", [
+        None,
+        ('test', 'demo', 1),
+        [('test', 'demo')],
+        ['key'],
+    ])
+    def test_neg_batch_remove_invalid_keys(self, keys):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_remove(keys)
+
+    def test_neg_batch_remove_invalid_policy(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_remove(self.keys, 'policy')
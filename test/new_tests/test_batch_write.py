@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestBatchWrite():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'batch_write_%d' % i) for i in range(50)]
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_batch_write(self):
+        records = [(key, {'i': i, 'name': 'name%d' % i})
+                   for i, key in enumerate(self.keys)]
+
+        statuses = self.as_connection.batch_write(records)
+
+        assert statuses == [0] * len(self.keys)
+        for i, key in enumerate(self.keys):
+            _, _, bins = self.as_connection.get(key)
+            assert bins == {'i': i, 'name': 'name%d' % i}
+
+    def test_pos_batch_write_with_meta(self):
+        records = [(self.keys[0], {'i': 0}, {'ttl': 1000}),
+                   (self.keys[1], {'i': 1})]
+
+        assert self.as_connection.batch_write(records) == [0, 0]
+
+        _, meta, _ = self.as_connection.get(self.keys[0])
+        assert 0 < meta['ttl'] <= 1000
+
+    def test_pos_batch_write_same_key_in_order(self):
+        records = [(self.keys[0], {'i': i}) for i in range(20)]
+
+        assert self.as_connection.batch_write(records) == [0] * 20
+
+        _, meta, bins = self.as_connection.get(self.keys[0])
+        assert bins == {'i': 19}
+        assert meta['gen'] == 20
+
+    def test_pos_batch_write_per_record_status(self):
+        self.as_connection.put(self.keys[0], {'i': 0})
+        records = [(self.keys[0], {'i': 1}), (self.keys[1], {'i': 1})]
+        policy = {'exists': aerospike.POLICY_EXISTS_CREATE}
+
+        statuses = self.as_connection.batch_write(records, policy)
+
+        assert statuses == [e.RecordExistsError.code, 0]
+        assert self.as_connection.get(self.keys[0])[2] == {'i': 0}
+        assert self.as_connection.get(self.keys[1])[2] == {'i': 1}
+
+    def test_pos_batch_write_empty(self):
+        assert self.as_connection.batch_write([]) == []
+
+    @pytest.mark.parametrize("records", [
+        None,
+        (('test', 'demo', 1), {'i': 1}),
+        [('test', 'demo', 1)],
+        [(('test', 'demo', 1),)],
+        [(('test', 'demo', 1), {'i': 1}, {}, {})],
+        [(('test', 'demo'), {'i': 1})],
+        [(('test', 'demo', 1), 'bins')],
+    ])
+    def test_neg_batch_write_invalid_records(self, records):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_write(records)
+
+    def test_neg_batch_write_invalid_record_writes_nothing(self):
+        records = [(self.keys[0], {'i': 0}), (self.keys[1], 'bins')]
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_write(records)
+
+        with pytest.raises(e.RecordNotFound):
+            self.as_connection.get(self.keys[0])
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("configured_client")
+class TestBinNameCache():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'bin_name_cache_%d' % i)
+                     for i in range(5)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'name': 'name%d' % i, 'age': i})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    @staticmethod
+    def bin_names(bins):
+        return {name: name for name in bins}
+
+    def test_pos_bin_names_shared_between_records(self):
+        _, _, first = self.as_connection.get(self.keys[0])
+        records = self.as_connection.get_many(self.keys)
+        names = self.bin_names(first)
+
+        for _, _, bins in records:
+            for name in bins:
+                assert name is names[name]
+
+    def test_pos_operate_bin_names_shared(self):
+        ops = [{'op': aerospike.OPERATOR_READ, 'bin': 'name'},
+               {'op': aerospike.OPERATOR_READ, 'bin': 'age'}]
+        _, _, first = self.as_connection.get(self.keys[0])
+        names = self.bin_names(first)
+
+        _, _, bins = self.as_connection.operate_ordered(self.keys[1], ops)
+
+        assert [value for _, value in bins] == ['name1', 1]
+        for name, _ in bins:
+            assert name is names[name]
+
+    def test_pos_bin_name_cache_eviction(self):
+        client = self.configured_client(bin_name_cache_size=1)
+        key = ('test', 'demo', 'bin_name_cache_wide')
+        bins = {'bin%d' % i: i for i in range(10)}
+        client.put(key, bins)
+
+        assert client.get(key)[2] == bins
+        assert client.get(key)[2] == bins
+        assert client.get(self.keys[2])[2] == {'name': 'name2', 'age': 2}
+
+        client.remove(key)
+        client.close()
+
+    def test_pos_bin_name_cache_disabled(self):
+        client = self.configured_client(bin_name_cache_size=0)
+
+        _, _, first = client.get(self.keys[0])
+        _, _, second = client.get(self.keys[1])
+
+        assert first == {'name': 'name0', 'age': 0}
+        assert second == {'name': 'name1', 'age': 1}
+        client.close()
+
+    @pytest.mark.parametrize("size", [-1, 'big', 1.5, (1 << 20) + 1])
+    def test_neg_bin_name_cache_size_invalid(self, size):
+        config = TestBaseClass.get_connection_config()
+        config['bin_name_cache_size'] = size
+
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
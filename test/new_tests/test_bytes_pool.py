@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.operations import list_operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+# More blobs than the former fixed pool of 4096 as_bytes could hold.
+BLOB_COUNT = 5000
+
+
+class TestBytesPool():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'bytes_pool_%d' % i) for i in range(4)]
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_put_list_of_bytearrays(self):
+        blobs = [bytearray(b'blob-%d' % i) for i in range(BLOB_COUNT)]
+
+        self.as_connection.put(self.keys[0], {'blobs': blobs})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blobs'] == blobs
+
+    def test_pos_put_list_of_serialized_values(self):
+        values = [(i, 'tuple') for i in range(BLOB_COUNT)]
+
+        self.as_connection.put(self.keys[0], {'values': values})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['values'] == values
+
+    def test_pos_put_map_of_bytearrays(self):
+        blobs = {i: bytearray(b'blob-%d' % i) for i in range(BLOB_COUNT)}
+
+        self.as_connection.put(self.keys[0], {'blobs': blobs})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blobs'] == blobs
+
+    def test_pos_operate_list_append_items(self):
+        blobs = [bytearray(b'blob-%d' % i) for i in range(BLOB_COUNT)]
+        ops = [list_operations.list_append_items('blobs', blobs)]
+
+        self.as_connection.operate(self.keys[0], ops)
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blobs'] == blobs
+
+    def test_pos_list_extend(self):
+        blobs = [bytearray(b'blob-%d' % i) for i in range(BLOB_COUNT)]
+
+        self.as_connection.list_extend(self.keys[0], 'blobs', blobs)
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blobs'] == blobs
+
+    def test_pos_map_put_items(self):
+        blobs = {i: bytearray(b'blob-%d' % i) for i in range(BLOB_COUNT)}
+
+        self.as_connection.map_put_items(self.keys[0], 'blobs', blobs)
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blobs'] == blobs
+
+    def test_pos_batch_write_shares_one_pool(self):
+        blobs = [bytearray(b'blob-%d' % i) for i in range(BLOB_COUNT // 2)]
+        records = [(key, {'blobs': blobs}) for key in self.keys]
+
+        statuses = self.as_connection.batch_write(records)
+
+        assert statuses == [0] * len(self.keys)
+        for key in self.keys:
+            _, _, bins = self.as_connection.get(key)
+            assert bins['blobs'] == blobs
+
+    def test_pos_repeated_calls_reuse_pool(self):
+        blobs = [bytearray(b'blob-%d' % i) for i in range(200)]
+
+        for i in range(50):
+            self.as_connection.put(self.keys[0], {'blobs': blobs, 'i': i})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins == {'blobs': blobs, 'i': 49}
+
+    def test_neg_failed_conversion_releases_pool(self):
+        blobs = [bytearray(b'blob') for i in range(BLOB_COUNT)]
+        blobs.append(2 ** 70)
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.put(self.keys[0], {'blobs': blobs})
+
+        self.as_connection.put(self.keys[0], {'blobs': blobs[:-1]})
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blobs'] == blobs[:-1]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestCheckpoint():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.test_ns = 'test'
+        self.test_set = 'checkpoint'
+        self.record_count = 100
+
+        for i in range(self.record_count):
+            as_connection.put((self.test_ns, self.test_set, i), {'i': i})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for i in range(self.record_count):
+                try:
+                    as_connection.remove((self.test_ns, self.test_set, i))
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def create(self, kind):
+        if kind == 'scan':
+            return self.as_connection.scan(self.test_ns, self.test_set)
+        return self.as_connection.query(self.test_ns, self.test_set)
+
+    def interrupted(self, kind, stop_after):
+        """
+        Read stop_after records of a paginated scan or query, and return
+        their ids and the checkpoint taken before the last of them.
+        """
+        source = self.create(kind)
+        source.paginate()
+        seen = []
+        checkpoint = []
+
+        def callback(record):
+            if len(seen) == stop_after:
+                checkpoint.append(source.checkpoint())
+                return False
+            seen.append(record[2]['i'])
+
+        source.foreach(callback)
+        return seen, checkpoint[0]
+
+    @pytest.mark.parametrize("kind", ['scan', 'query'])
+    def test_pos_checkpoint_is_bytes(self, kind):
+        source = self.create(kind)
+        source.paginate()
+        source.results()
+
+        checkpoint = source.checkpoint()
+
+        assert isinstance(checkpoint, bytes)
+        assert source.checkpoint() == checkpoint
+
+    @pytest.mark.parametrize("kind", ['scan', 'query'])
+    def test_pos_checkpoint_round_trip(self, kind):
+        source = self.create(kind)
+        source.paginate()
+        source.results({'max_records': 30})
+        checkpoint = source.checkpoint()
+
+        resumed = self.create(kind).from_checkpoint(checkpoint)
+
+        assert resumed.checkpoint() == checkpoint
+        assert (resumed.get_partitions_status() ==
+                source.get_partitions_status())
+
+    @pytest.mark.parametrize("kind", ['scan', 'query'])
+    def test_pos_resume_from_checkpoint(self, kind):
+        seen, checkpoint = self.interrupted(kind, 40)
+
+        resumed = self.create(kind).from_checkpoint(checkpoint)
+        rest = [bins['i'] for _, _, bins in resumed.results()]
+
+        assert set(seen) | set(rest) == set(range(self.record_count))
+        assert len(rest) < self.record_count
+        assert resumed.is_done()
+
+    @pytest.mark.parametrize("kind", ['scan', 'query'])
+    def test_pos_resume_finished(self, kind):
+        source = self.create(kind)
+        source.paginate()
+        source.results()
+
+        resumed = self.create(kind).from_checkpoint(source.checkpoint())
+
+        assert resumed.results() == []
+
+    def test_pos_checkpoint_partition_filter(self):
+        scan = self.create('scan')
+        scan.results({'partition_filter': {'begin': 1000, 'count': 10}})
+
+        resumed = self.create('scan').from_checkpoint(scan.checkpoint())
+
+        assert resumed.get_partitions_status().keys() == set(range(1000, 1010))
+
+    def test_pos_checkpoint_is_compact(self):
+        scan = self.create('scan')
+        scan.paginate()
+        scan.results()
+
+        # A 20 byte digest for each partition with a record, and two bits for
+        # every partition.
+        assert len(scan.checkpoint()) < 100 + 20 * self.record_count + 1024
+
+    @pytest.mark.parametrize("kind", ['scan', 'query'])
+    def test_neg_checkpoint_without_status(self, kind):
+        with pytest.raises(e.ParamError):
+            self.create(kind).checkpoint()
+
+    @pytest.mark.parametrize("kind", ['scan', 'query'])
+    def test_neg_from_checkpoint_other_set(self, kind):
+        source = self.create(kind)
+        source.paginate()
+        source.results()
+
+        other = (self.as_connection.scan if kind == 'scan' else
+                 self.as_connection.query)(self.test_ns, 'other')
+        with pytest.raises(e.ParamError):
+            other.from_checkpoint(source.checkpoint())
+
+    @pytest.mark.parametrize("checkpoint", [
+        b'',
+        b'not a checkpoint',
+        1,
+        None,
+    ])
+    def test_neg_from_checkpoint_invalid(self, checkpoint):
+        with pytest.raises(e.ParamError):
+            self.create('scan').from_checkpoint(checkpoint)
+
+    def test_neg_from_checkpoint_truncated(self):
+        scan = self.create('scan')
+        scan.paginate()
+        scan.results()
+        checkpoint = scan.checkpoint()
+
+        for size in range(0, len(checkpoint), 7):
+            with pytest.raises(e.ParamError):
+                self.create('scan').from_checkpoint(checkpoint[:size])
+        with pytest.raises(e.ParamError):
+            self.create('scan').from_checkpoint(checkpoint + b'\0')
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import expression_operations as expressions
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestCompileExpression():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ('test', 'demo', 'compiled_expression')
+        as_connection.put(self.key, {'count': 5})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            try:
+                as_connection.remove(self.key)
+            except e.RecordNotFound:
+                pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_compile_expression(self):
+        expr = exp.Eq(exp.IntBin('count'), 5)
+
+        compiled = aerospike.compile_expression(expr)
+
+        assert isinstance(compiled, aerospike.CompiledExpression)
+        assert isinstance(compiled.packed, bytes)
+        assert compiled.packed == aerospike.compile_expression(
+            expr.compile()).packed
+
+    def test_pos_compile_expression_with_client(self):
+        expr = exp.Eq(exp.IntBin('count'), 5)
+
+        compiled = aerospike.compile_expression(expr, self.as_connection)
+
+        assert compiled.packed == aerospike.compile_expression(expr).packed
+
+    def test_pos_compiled_expression_in_policy(self):
+        compiled = aerospike.compile_expression(
+            exp.Eq(exp.IntBin('count'), 5))
+
+        for _ in range(3):
+            _, _, bins = self.as_connection.get(
+                self.key, policy={'expressions': compiled})
+            assert bins == {'count': 5}
+
+    def test_pos_compiled_expression_in_prepared_policy(self):
+        policy = self.as_connection.prepare_policy(
+            'read', {'expressions': aerospike.compile_expression(
+                exp.Eq(exp.IntBin('count'), 5))})
+
+        _, _, bins = self.as_connection.get(self.key, policy=policy)
+        assert bins == {'count': 5}
+
+    def test_pos_compiled_expression_in_expression_operation(self):
+        compiled = aerospike.compile_expression(exp.IntBin('count'))
+
+        _, _, bins = self.as_connection.operate(
+            self.key, [expressions.expression_read('result', compiled)])
+        assert bins == {'result': 5}
+
+    @pytest.mark.parametrize("expression", [None, 1, {}, []])
+    def test_neg_compile_expression_invalid(self, expression):
+        with pytest.raises(e.ParamError):
+            aerospike.compile_expression(expression)
+
+    def test_neg_compile_expression_invalid_client(self):
+        with pytest.raises(e.ParamError):
+            aerospike.compile_expression(exp.IntBin('count'), client=1)
+
+    def test_neg_compiled_expression_not_constructible(self):
+        with pytest.raises(TypeError):
+            aerospike.CompiledExpression()
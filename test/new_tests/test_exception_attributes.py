@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import threading
+
+from .as_errors import *
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestExceptionAttributes():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ('test', 'demo', 'exception_attributes')
+        self.missing_key = ('test', 'demo', 'exception_attributes_missing')
+        as_connection.put(self.key, {'a': 1})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            try:
+                as_connection.remove(self.key)
+            except e.RecordNotFound:
+                pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_attributes_set_on_instance(self):
+        with pytest.raises(e.RecordNotFound) as err_info:
+            self.as_connection.get(self.missing_key)
+
+        err = err_info.value
+        assert err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND
+        assert isinstance(err.msg, str)
+        assert err.in_doubt is False
+        assert err.key == self.missing_key
+        assert err.args[0] == AEROSPIKE_ERR_RECORD_NOT_FOUND
+        assert vars(err)['msg'] == err.msg
+
+    def test_pos_class_attributes_untouched(self):
+        with pytest.raises(e.RecordNotFound):
+            self.as_connection.get(self.missing_key)
+
+        assert e.RecordNotFound.code == AEROSPIKE_ERR_RECORD_NOT_FOUND
+        assert e.RecordNotFound.msg is None
+        assert e.RecordNotFound.key is None
+
+    def test_pos_instances_keep_their_own_attributes(self):
+        errors = []
+        for key in [self.missing_key, ('test', 'demo', 1)]:
+            try:
+                self.as_connection.remove(key)
+            except e.RecordNotFound as err:
+                errors.append(err)
+
+        assert [err.key for err in errors] == [self.missing_key,
+                                               ('test', 'demo', 1)]
+
+    def test_pos_client_error_attributes(self):
+        with pytest.raises(e.ParamError) as err_info:
+            self.as_connection.get(self.key, {'total_timeout': 'a'})
+
+        err = err_info.value
+        assert err.code == AEROSPIKE_ERR_PARAM
+        assert err.msg == 'total_timeout is invalid'
+
+    def test_pos_attributes_from_threads(self):
+        keys = [('test', 'demo', 'exception_attributes_%d' % i)
+                for i in range(4)]
+        results = {}
+
+        def read(key):
+            for _ in range(100):
+                try:
+                    self.as_connection.get(key)
+                except e.RecordNotFound as err:
+                    if err.key != key:
+                        results[key] = err.key
+                        return
+            results[key] = key
+
+        threads = [threading.Thread(target=read, args=(key,)) for key in keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {key: key for key in keys}
+
+    def test_pos_construct_exception(self):
+        err = e.ParamError(AEROSPIKE_ERR_PARAM, 'message')
+
+        assert err.code == AEROSPIKE_ERR_PARAM
+        assert err.msg == 'message'
+        assert err.file is None
+
+    def test_pos_construct_exception_without_arguments(self):
+        err = e.RecordNotFound()
+
+        assert err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND
+        assert err.msg is None
+
+    def test_pos_raise_exception_with_message(self):
+        with pytest.raises(e.ParamError) as err_info:
+            raise e.ParamError('bad thing')
+
+        err = err_info.value
+        assert err.code == AEROSPIKE_ERR_PARAM
+        assert err.msg is None
+        assert err.args == ('bad thing',)
+        assert str(err) == 'bad thing'
+
+    def test_pos_construct_exception_keeps_args(self):
+        err = e.ParamError(AEROSPIKE_ERR_PARAM, 'message')
+
+        assert err.args == (AEROSPIKE_ERR_PARAM, 'message')
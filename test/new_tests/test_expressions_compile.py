@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.expressions.resources import _ExprOp
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+def compiled_ops(expr):
+    return [op for op, _, _, _ in expr.compile()]
+
+
+class TestExpressionsCompile():
+
+    def test_pos_compile_order(self):
+        expr = exp.And(exp.Eq(exp.IntBin('a'), 1), exp.Not(exp.BoolBin('b')))
+
+        assert expr.compile() == [
+            (_ExprOp.AND, None, None, 3),
+            (_ExprOp.EQ, None, None, 2),
+            (_ExprOp.BIN, exp.ResultType.INTEGER, {'bin': 'a'}, 0),
+            (_ExprOp.VAL, None, {'val': 1}, 0),
+            (_ExprOp.NOT, None, None, 1),
+            (_ExprOp.BIN, exp.ResultType.BOOLEAN, {'bin': 'b'}, 0),
+            (_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}, 0),
+        ]
+
+    def test_pos_compile_large_or(self):
+        expr = exp.Or(*[exp.Eq(exp.IntBin('a'), i) for i in range(10000)])
+
+        compiled = expr.compile()
+
+        assert len(compiled) == 3 * 10000 + 2
+        assert compiled[-2] == (_ExprOp.VAL, None, {'val': 9999}, 0)
+
+    def test_pos_compile_deep_expression(self):
+        expr = exp.IntBin('a')
+        for _ in range(sys.getrecursionlimit() * 2):
+            expr = exp.Abs(expr)
+
+        assert compiled_ops(expr) == (
+            [_ExprOp.ABS] * (sys.getrecursionlimit() * 2) + [_ExprOp.BIN])
+
+    def test_pos_compile_shared_sub_expression(self):
+        sub = exp.And(exp.Eq(exp.IntBin('a'), 1), exp.Eq(exp.IntBin('b'), 2))
+        expr = exp.Or(sub, exp.Not(sub))
+
+        assert expr.compile() == (
+            [(_ExprOp.OR, None, None, 3)] + sub.compile() +
+            [(_ExprOp.NOT, None, None, 1)] + sub.compile() +
+            [(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}, 0)])
+
+    def test_pos_compile_returns_new_list(self):
+        expr = exp.Eq(exp.IntBin('a'), 1)
+
+        compiled = expr.compile()
+        compiled.append((_ExprOp.VAL, None, {'val': 2}, 0))
+
+        assert expr.compile() == compiled[:-1]
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestForeachChunk():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.test_ns = 'test'
+        self.test_set = 'foreach_chunk'
+        self.record_count = 50
+
+        for i in range(self.record_count):
+            as_connection.put((self.test_ns, self.test_set, i),
+                              {'i': i, 'name': 'name%d' % i},
+                              policy={'key': aerospike.POLICY_KEY_SEND})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for i in range(self.record_count):
+                try:
+                    as_connection.remove((self.test_ns, self.test_set, i))
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def sorted_records(self, records):
+        return sorted(records, key=lambda record: record[2]['i'])
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 50, 1000])
+    def test_pos_scan_foreach_chunk_size(self, chunk_size):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        chunks = []
+
+        scan.foreach(chunks.append, chunk_size=chunk_size)
+
+        assert all(isinstance(chunk, list) for chunk in chunks)
+        assert sorted(len(chunk) for chunk in chunks)[1:] == [
+            min(chunk_size, self.record_count)] * (len(chunks) - 1)
+        assert len(chunks) == -(-self.record_count // chunk_size)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_pos_query_foreach_chunk_size(self, chunk_size):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        chunks = []
+
+        query.foreach(chunks.append, chunk_size=chunk_size)
+
+        assert len(chunks) == -(-self.record_count // chunk_size)
+        assert sum(len(chunk) for chunk in chunks) == self.record_count
+
+    def test_pos_scan_chunks_hold_the_records(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        records = []
+        chunked = []
+
+        scan.foreach(records.append)
+        scan.foreach(chunked.extend, chunk_size=8)
+
+        assert self.sorted_records(chunked) == self.sorted_records(records)
+
+    def test_pos_query_chunks_hold_the_records(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        query.select('name')
+        chunked = []
+
+        query.foreach(chunked.extend, None, None, 8)
+
+        assert sorted(bins['name'] for _, _, bins in chunked) == sorted(
+            'name%d' % i for i in range(self.record_count))
+        assert all(key[2] is not None for key, _, _ in chunked)
+
+    def test_pos_scan_chunk_return_false_stops(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        chunks = []
+
+        def callback(chunk):
+            chunks.append(chunk)
+            return False
+
+        scan.foreach(callback, chunk_size=5)
+
+        assert len(chunks) == 1
+        assert len(chunks[0]) == 5
+
+    def test_pos_query_chunk_return_false_stops(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        chunks = []
+
+        def callback(chunk):
+            chunks.append(chunk)
+            return len(chunks) < 2
+
+        query.foreach(callback, chunk_size=10)
+
+        assert len(chunks) == 2
+
+    def test_pos_scan_partition_chunks(self):
+        policy = {'partition_filter': {'begin': 0, 'count': 4096}}
+        records = []
+        chunked = []
+
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        scan.foreach(lambda part_id, record: records.append((part_id, record)),
+                     policy)
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        scan.foreach(chunked.extend, policy, chunk_size=16)
+
+        assert len(chunked) == self.record_count
+        assert sorted(chunked, key=lambda entry: entry[1][2]['i']) == sorted(
+            records, key=lambda entry: entry[1][2]['i'])
+
+    def test_pos_foreach_chunk_size_none(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        records = []
+
+        scan.foreach(records.append, chunk_size=None)
+
+        assert len(records) == self.record_count
+        assert all(isinstance(record, tuple) for record in records)
+
+    def test_neg_scan_chunk_callback_raises(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+
+        def callback(chunk):
+            raise ValueError("chunk")
+
+        with pytest.raises(e.ClientError):
+            scan.foreach(callback, chunk_size=5)
+
+    def test_neg_query_chunk_callback_raises(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        def callback(chunk):
+            raise ValueError("chunk")
+
+        with pytest.raises(e.ClientError):
+            query.foreach(callback, chunk_size=5)
+
+    @pytest.mark.parametrize("chunk_size", [0, -1, 1.5, '10'])
+    def test_neg_foreach_invalid_chunk_size(self, chunk_size):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        with pytest.raises(e.ParamError):
+            scan.foreach(lambda chunk: None, chunk_size=chunk_size)
+        with pytest.raises(e.ParamError):
+            query.foreach(lambda chunk: None, chunk_size=chunk_size)
@@ -233,6 +233,46 @@ class TestGetMany():
         with pytest.raises(e.ParamError):
             key, _, _ = self.as_connection.get(key)
 
+    def test_pos_get_many_with_max_batch_size(self):
+        keys = self.keys + [('test', 'demo', 'non-existent')]
+
+        records = self.as_connection.get_many(keys, {'max_batch_size': 2})
+
+        assert records == self.as_connection.get_many(keys)
+        assert [x[0][2] for x in records] == [k[2] for k in keys]
+        assert records[-1][1:] == (None, None)
+
+    def test_pos_get_many_with_max_batch_size_partial_failure(self):
+        keys = [self.keys[0], ('test1', 'demo', 1), self.keys[1]]
+
+        records = self.as_connection.get_many(keys, {'max_batch_size': 1})
+
+        assert records[0][2] == {'name': 'name0', 'age': 0}
+        assert records[1][1] is None
+        assert isinstance(records[1][2], e.AerospikeError)
+        assert records[2][2] == {'name': 'name1', 'age': 1}
+
+    def test_pos_get_many_with_max_batch_size_failure_error(self):
+        keys = [self.keys[0], ('test1', 'demo', 1)]
+
+        records = self.as_connection.get_many(keys, {'max_batch_size': 1})
+
+        with pytest.raises(e.AerospikeError) as batch_error:
+            self.as_connection.get_many(keys[1:])
+        exception = records[1][2]
+        assert type(exception) is type(batch_error.value)
+        assert exception.code == batch_error.value.code
+        assert exception.msg == batch_error.value.msg
+        assert exception.file == batch_error.value.file
+        assert exception.line == batch_error.value.line
+
+    @pytest.mark.parametrize("max_batch_size", [-1, 'ten', 2.5])
+    def test_neg_get_many_with_invalid_max_batch_size(self, max_batch_size):
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys,
+                                        {'max_batch_size': max_batch_size})
+
     def test_neg_get_many_with_invalid_key(self):
 
         with pytest.raises(e.ParamError):
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestIterResults():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.test_ns = 'test'
+        self.test_set = 'iter_results'
+        self.record_count = 50
+
+        for i in range(self.record_count):
+            as_connection.put((self.test_ns, self.test_set, i),
+                              {'i': i, 'name': 'name%d' % i})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for i in range(self.record_count):
+                try:
+                    as_connection.remove((self.test_ns, self.test_set, i))
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def sorted_bins(self, records):
+        return sorted((bins for _, _, bins in records), key=lambda b: b['i'])
+
+    def test_pos_scan_iter_results(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+
+        records = list(scan.iter_results())
+
+        assert len(records) == self.record_count
+        assert self.sorted_bins(records) == self.sorted_bins(scan.results())
+
+    def test_pos_query_iter_results(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        records = list(query.iter_results())
+
+        assert self.sorted_bins(records) == [
+            {'i': i, 'name': 'name%d' % i} for i in range(self.record_count)]
+
+    @pytest.mark.parametrize("buffer_size", [1, 3, 1000])
+    def test_pos_iter_results_buffer_size(self, buffer_size):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+
+        records = list(scan.iter_results(buffer_size=buffer_size))
+
+        assert len(records) == self.record_count
+
+    def test_pos_iter_results_with_policy(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        policy = self.as_connection.prepare_policy('scan',
+                                                   {'total_timeout': 10000})
+
+        records = list(scan.iter_results(policy))
+
+        assert len(records) == self.record_count
+
+    def test_pos_iter_results_select(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        scan.select('name')
+
+        for _, _, bins in scan.iter_results():
+            assert list(bins) == ['name']
+
+    def test_pos_iter_results_close(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        results = scan.iter_results(buffer_size=2)
+
+        next(results)
+        results.close()
+        results.close()
+
+        assert list(results) == []
+
+    def test_pos_iter_results_abandoned(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        results = scan.iter_results(buffer_size=2)
+
+        next(results)
+        del results
+
+        assert len(scan.results()) == self.record_count
+
+    def test_pos_iter_results_interleaved(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+        first = scan.iter_results(buffer_size=1)
+        second = scan.iter_results(buffer_size=1)
+
+        records = [record for pair in zip(first, second) for record in pair]
+
+        assert len(records) == 2 * self.record_count
+
+    @pytest.mark.parametrize("buffer_size", [0, -1, 'a'])
+    def test_neg_iter_results_invalid_buffer_size(self, buffer_size):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+
+        with pytest.raises(e.ParamError):
+            scan.iter_results(buffer_size=buffer_size)
+
+    def test_neg_scan_iter_results_invalid_nodename(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+
+        with pytest.raises(e.ParamError):
+            scan.iter_results(nodename=1)
+
+    def test_neg_iter_results_invalid_policy(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        with pytest.raises(e.ParamError):
+            query.iter_results({'total_timeout': 'a'})
+
+    def test_neg_iter_results_error_raised_while_iterating(self):
+        scan = self.as_connection.scan('fake_namespace', self.test_set)
+
+        results = scan.iter_results()
+
+        with pytest.raises(e.ClientError):
+            list(results)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("configured_client")
+class TestLazyBins():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.client = self.configured_client(lazy_bins=True)
+        self.keys = [('test', 'demo', 'lazy_bins_%d' % i) for i in range(5)]
+        self.bins = [{'name': 'name%d' % i, 'age': i,
+                      'list': [i, [i, 'a'], {'b': i}],
+                      'map': {'c': [1, 2], 'd': {'e': i}}}
+                     for i in range(5)]
+        for key, bins in zip(self.keys, self.bins):
+            as_connection.put(key, bins)
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    def test_pos_get_lazy_bins(self):
+        _, meta, bins = self.client.get(self.keys[1])
+
+        assert isinstance(bins, aerospike.LazyBins)
+        assert meta['gen'] == 1
+        assert len(bins) == 4
+        assert 'age' in bins
+        assert 'missing' not in bins
+        assert bins['age'] == 1
+        assert bins['list'] == [1, [1, 'a'], {'b': 1}]
+        assert bins['list'] is bins['list']
+        assert bins.get('missing') is None
+        assert bins.get('missing', 5) == 5
+        assert sorted(bins) == ['age', 'list', 'map', 'name']
+
+    def test_pos_lazy_bins_to_dict(self):
+        _, _, bins = self.client.get(self.keys[2])
+
+        assert dict(bins) == self.bins[2]
+        assert bins.to_dict() == self.bins[2]
+        assert bins == self.bins[2]
+        assert sorted(bins.keys()) == sorted(self.bins[2].keys())
+        assert sorted(bins.items()) == sorted(self.bins[2].items())
+        assert len(bins.values()) == 4
+
+    def test_pos_lazy_bins_outlive_client(self):
+        client = self.configured_client(lazy_bins=True)
+        _, _, bins = client.get(self.keys[3])
+        client.close()
+        del client
+
+        assert bins['map'] == {'c': [1, 2], 'd': {'e': 3}}
+
+    def test_pos_get_many_lazy_bins(self):
+        records = self.client.get_many(self.keys)
+
+        assert [bins['name'] for _, _, bins in records] == \
+            ['name%d' % i for i in range(5)]
+        assert [dict(bins) for _, _, bins in records] == self.bins
+
+    def test_pos_scan_lazy_bins(self):
+        scan = self.client.scan('test', 'demo')
+        records = scan.results()
+
+        assert len(records) >= len(self.keys)
+        assert all(isinstance(bins, aerospike.LazyBins)
+                   for _, _, bins in records)
+
+    def test_pos_lazy_bins_with_record_format(self):
+        client = self.configured_client(lazy_bins=True,
+                                        result_format='record')
+
+        record = client.get(self.keys[4])
+
+        assert isinstance(record.bins, aerospike.LazyBins)
+        assert record.bins['age'] == 4
+        client.close()
+
+    def test_neg_lazy_bins_missing_bin(self):
+        _, _, bins = self.client.get(self.keys[0])
+
+        with pytest.raises(KeyError):
+            bins['missing']
+        with pytest.raises(KeyError):
+            bins[1]
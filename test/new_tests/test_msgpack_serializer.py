@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import datetime
+import pytest
+import sys
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+Point = collections.namedtuple('Point', ['x', 'y'])
+
+
+def user_serializer(value):
+    return 'user'
+
+
+def user_deserializer(value):
+    return value
+
+
+VALUES = {
+    'tuple': (1, 'a', 2.5, None, b'x', bytearray(b'yz'), [1, {'k': (3,)}]),
+    'set': {1, 2, 3},
+    'frozenset': frozenset(['a', 'b']),
+    'datetime': datetime.datetime(2021, 5, 6, 7, 8, 9, 123456),
+    'date': datetime.date(2020, 1, 2),
+    'time': datetime.time(1, 2, 3, 4, fold=1),
+    'timedelta': datetime.timedelta(days=-3, seconds=5, microseconds=7),
+    'ints': (2 ** 64 - 1, -2 ** 63, -1, 200, -70000, 2 ** 40),
+    'empty': ((), set(), frozenset(), bytearray(), ''),
+    'nested': [(1, 2), {'set': {(1, 2)}}],
+}
+
+# Values msgpack cannot hold keep being pickled.
+PICKLED_VALUES = {
+    'aware': datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc),
+    'big_int': (2 ** 70,),
+    'subclass': Point(1, 2),
+    'surrogate': ('\ud800',),
+    'bool': True,
+}
+
+
+@pytest.mark.usefixtures("configured_client")
+class TestMsgpackSerializer():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.client = self.configured_client(
+            default_serializer=aerospike.SERIALIZER_MSGPACK)
+        self.keys = [('test', 'demo', 'msgpack_%d' % i) for i in range(3)]
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    @staticmethod
+    def assert_same(bins, expected):
+        assert bins == expected
+        for name, value in expected.items():
+            assert type(bins[name]) is type(value)
+
+    @pytest.mark.parametrize("values", [VALUES, PICKLED_VALUES])
+    def test_pos_msgpack_round_trip(self, values):
+        self.client.put(self.keys[0], values)
+
+        _, _, bins = self.client.get(self.keys[0])
+        self.assert_same(bins, values)
+
+    def test_pos_msgpack_read_by_pickle_client(self):
+        self.client.put(self.keys[0], VALUES)
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        self.assert_same(bins, VALUES)
+
+    def test_pos_pickle_read_by_msgpack_client(self):
+        self.as_connection.put(self.keys[0], VALUES)
+
+        _, _, bins = self.client.get(self.keys[0])
+        self.assert_same(bins, VALUES)
+
+    def test_pos_put_serializer_msgpack(self):
+        self.as_connection.put(self.keys[0], VALUES,
+                               serializer=aerospike.SERIALIZER_MSGPACK)
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        self.assert_same(bins, VALUES)
+
+    def test_pos_msgpack_batch_write_and_get_many(self):
+        records = [(key, {'value': (i, {i})})
+                   for i, key in enumerate(self.keys)]
+
+        assert self.client.batch_write(records) == [0] * 3
+
+        for i, (_, _, bins) in enumerate(self.client.get_many(self.keys)):
+            assert bins == {'value': (i, {i})}
+
+    def test_pos_msgpack_blobs_unchanged(self):
+        self.client.put(self.keys[0], {'bytes': b'abc',
+                                       'bytearray': bytearray(b'def')})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins == {'bytes': bytearray(b'abc'),
+                        'bytearray': bytearray(b'def')}
+
+    def test_pos_user_serializer_takes_precedence(self):
+        client = self.configured_client(
+            default_serializer=aerospike.SERIALIZER_MSGPACK,
+            serialization=(user_serializer, user_deserializer))
+        client.put(self.keys[0], {'value': (1, 2)})
+        client.close()
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins == {'value': bytearray(b'user')}
+
+    @pytest.mark.parametrize("serializer", [
+        aerospike.SERIALIZER_NONE,
+        aerospike.SERIALIZER_USER,
+        'msgpack',
+        99,
+    ])
+    def test_neg_default_serializer_invalid(self, serializer):
+        config = TestBaseClass.get_connection_config()
+        config['default_serializer'] = serializer
+
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.operations import operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestPrepareOperations():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ('test', 'demo', 'prepared_operations')
+        as_connection.put(self.key, {'count': 0, 'name': 'a'})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            try:
+                as_connection.remove(self.key)
+            except e.RecordNotFound:
+                pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_prepared_operations_without_placeholders(self):
+        ops = self.as_connection.prepare_operations([
+            operations.increment('count', 2),
+            operations.append('name', 'b'),
+            operations.read('count')
+        ])
+
+        assert isinstance(ops, aerospike.Operations)
+        assert len(ops) == 3
+        assert ops.placeholders == frozenset()
+        for i in range(1, 4):
+            _, _, bins = self.as_connection.operate(self.key, ops)
+            assert bins == {'count': 2 * i}
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins == {'count': 6, 'name': 'abbb'}
+
+    def test_pos_bind_placeholders(self):
+        ops = self.as_connection.prepare_operations([
+            operations.increment('count', aerospike.Placeholder('by')),
+            operations.write('name', aerospike.Placeholder('name')),
+            operations.read('count'),
+            operations.read('name')
+        ])
+
+        assert ops.placeholders == frozenset(['by', 'name'])
+        for i in range(1, 4):
+            _, _, bins = self.as_connection.operate(
+                self.key, ops.bind(by=i, name='n%d' % i))
+            assert bins == {'count': i * (i + 1) // 2, 'name': 'n%d' % i}
+
+    @pytest.mark.parametrize("value", [1.5, 'a', [1, 2]])
+    def test_pos_bind_any_value(self, value):
+        ops = self.as_connection.prepare_operations([
+            operations.write('value', aerospike.Placeholder('value')),
+            operations.read('value')
+        ])
+
+        _, _, bins = self.as_connection.operate(self.key,
+                                                ops.bind(value=value))
+        assert bins == {'value': value}
+
+    def test_pos_bind_placeholder_outside_val(self):
+        ops = self.as_connection.prepare_operations([
+            operations.write(aerospike.Placeholder('bin'), 1),
+            operations.read(aerospike.Placeholder('bin'))
+        ])
+
+        _, _, bins = self.as_connection.operate(self.key, ops.bind(bin='b1'))
+        assert bins == {'b1': 1}
+
+    def test_pos_bind_in_steps(self):
+        ops = self.as_connection.prepare_operations([
+            operations.increment('count', aerospike.Placeholder('by')),
+            operations.write('name', aerospike.Placeholder('name')),
+        ])
+        named = ops.bind(name='c')
+
+        self.as_connection.operate(self.key, named.bind(by=1))
+        self.as_connection.operate(self.key, named.bind(by=2, name='d'))
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins == {'count': 3, 'name': 'd'}
+
+    def test_pos_operate_ordered_with_prepared_operations(self):
+        ops = self.as_connection.prepare_operations([
+            operations.increment('count', aerospike.Placeholder('by')),
+            operations.read('count'),
+            operations.read('name')
+        ])
+
+        _, _, bins = self.as_connection.operate_ordered(self.key,
+                                                        ops.bind(by=5))
+        assert bins == [('count', 5), ('name', 'a')]
+
+    def test_pos_bound_operations_outlive_template(self):
+        ops = self.as_connection.prepare_operations([
+            operations.write('name', 'b'),
+            operations.increment('count', aerospike.Placeholder('by'))
+        ])
+        bound = ops.bind(by=1)
+        del ops
+
+        self.as_connection.operate(self.key, bound)
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins == {'count': 1, 'name': 'b'}
+
+    def test_neg_operate_with_unbound_placeholder(self):
+        ops = self.as_connection.prepare_operations([
+            operations.increment('count', aerospike.Placeholder('by'))
+        ])
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, ops)
+
+    def test_neg_bind_unknown_placeholder(self):
+        ops = self.as_connection.prepare_operations([
+            operations.increment('count', aerospike.Placeholder('by'))
+        ])
+
+        with pytest.raises(e.ParamError):
+            ops.bind(count=1)
+
+    def test_neg_bind_invalid_value(self):
+        ops = self.as_connection.prepare_operations([
+            operations.append('name', aerospike.Placeholder('suffix'))
+        ])
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate(self.key, ops.bind(suffix=1))
+
+    @pytest.mark.parametrize("ops", [
+        {},
+        [1],
+        [{'bin': 'count', 'val': 1}],
+    ])
+    def test_neg_prepare_operations_invalid(self, ops):
+        with pytest.raises(e.ParamError):
+            self.as_connection.prepare_operations(ops)
+
+    def test_neg_operations_not_constructible(self):
+        with pytest.raises(TypeError):
+            aerospike.Operations()
+
+    def test_neg_placeholder_name_not_str(self):
+        with pytest.raises(TypeError):
+            aerospike.Placeholder(1)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers import expressions as exp
+    from aerospike_helpers.operations import operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestPreparePolicy():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'prepared', 'prepared_%d' % i) for i in range(3)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'i': i})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.parametrize("kind", [
+        'read', 'write', 'operate', 'batch', 'apply', 'remove', 'query', 'scan'
+    ])
+    def test_pos_prepare_policy_kinds(self, kind):
+        policy = self.as_connection.prepare_policy(kind, {'total_timeout': 2000})
+
+        assert isinstance(policy, aerospike.Policy)
+        assert policy.kind == kind
+
+    def test_pos_prepared_write_and_read_policies(self):
+        write_policy = self.as_connection.prepare_policy(
+            'write', {'key': aerospike.POLICY_KEY_SEND})
+        read_policy = self.as_connection.prepare_policy('read', {})
+
+        for i in range(3):
+            self.as_connection.put(self.keys[0], {'i': i}, policy=write_policy)
+            _, _, bins = self.as_connection.get(self.keys[0],
+                                                policy=read_policy)
+            assert bins == {'i': i}
+
+    def test_pos_prepared_policy_with_expressions(self):
+        policy = self.as_connection.prepare_policy('read', {
+            'expressions': exp.Eq(exp.IntBin('i'), 1).compile()
+        })
+
+        _, _, bins = self.as_connection.get(self.keys[1], policy=policy)
+        assert bins == {'i': 1}
+        with pytest.raises(e.FilteredOut):
+            self.as_connection.get(self.keys[0], policy=policy)
+
+    def test_pos_prepared_policy_outlives_its_dict(self):
+        policy_dict = {'expressions': exp.Eq(exp.IntBin('i'), 1).compile()}
+        policy = self.as_connection.prepare_policy('read', policy_dict)
+        del policy_dict
+
+        _, _, bins = self.as_connection.get(self.keys[1], policy=policy)
+        assert bins == {'i': 1}
+
+    def test_pos_prepared_batch_and_operate_policies(self):
+        batch_policy = self.as_connection.prepare_policy('batch', {})
+        operate_policy = self.as_connection.prepare_policy('operate', {})
+
+        records = self.as_connection.get_many(self.keys, policy=batch_policy)
+        assert [bins for _, _, bins in records] == [{'i': 0}, {'i': 1}, {'i': 2}]
+
+        _, _, bins = self.as_connection.operate(
+            self.keys[2], [operations.increment('i', 1), operations.read('i')],
+            policy=operate_policy)
+        assert bins == {'i': 3}
+
+    def test_pos_prepared_remove_policy(self):
+        policy = self.as_connection.prepare_policy('remove', {})
+
+        self.as_connection.remove(self.keys[0], policy=policy)
+
+        with pytest.raises(e.RecordNotFound):
+            self.as_connection.get(self.keys[0])
+
+    @pytest.mark.parametrize("kind", ['scan', 'query'])
+    def test_pos_prepared_policy_partition_filter(self, kind):
+        partition_ids = [
+            self.as_connection.get_key_partition_id(*key) for key in self.keys]
+        begin = min(partition_ids)
+        policy_dict = {'partition_filter': {'begin': begin, 'count': 1}}
+        policy = self.as_connection.prepare_policy(kind, policy_dict)
+
+        def results(policy):
+            source = (self.as_connection.scan if kind == 'scan' else
+                      self.as_connection.query)('test', 'prepared')
+            return sorted(bins['i'] for _, _, bins in source.results(policy))
+
+        expected = [i for i, partition_id in enumerate(partition_ids)
+                    if partition_id == begin]
+        assert results(policy_dict) == expected
+        assert results(policy) == expected
+
+    def test_pos_prepared_query_policy_max_records(self):
+        policy = self.as_connection.prepare_policy('query', {'max_records': 1})
+
+        records = self.as_connection.query('test', 'prepared').results(policy)
+
+        assert len(records) == 1
+
+    def test_neg_prepared_batch_policy_max_batch_size(self):
+        policy = self.as_connection.prepare_policy(
+            'batch', {'max_batch_size': -1})
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys, policy=policy)
+
+    def test_neg_prepared_policy_of_another_kind(self):
+        policy = self.as_connection.prepare_policy('write', {})
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.get(self.keys[0], policy=policy)
+
+    @pytest.mark.parametrize("kind, policy", [
+        ('info', {}),
+        ('read', [('total_timeout', 1000)]),
+        ('read', {'total_timeout': 'a'}),
+    ])
+    def test_neg_prepare_policy_invalid(self, kind, policy):
+        with pytest.raises(e.ParamError):
+            self.as_connection.prepare_policy(kind, policy)
+
+    def test_neg_policy_not_constructible(self):
+        with pytest.raises(TypeError):
+            aerospike.Policy()
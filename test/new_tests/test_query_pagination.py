@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import threading
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike import predicates as p
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestQueryPagination():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.test_ns = 'test'
+        self.test_set = 'query_pagination'
+        self.record_count = 100
+
+        for i in range(self.record_count):
+            as_connection.put((self.test_ns, self.test_set, i), {'i': i})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for i in range(self.record_count):
+                try:
+                    as_connection.remove((self.test_ns, self.test_set, i))
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def ids(self, records):
+        return sorted(bins['i'] for _, _, bins in records)
+
+    def test_pos_query_partition_filter(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        first = query.results(
+            {'partition_filter': {'begin': 0, 'count': 2048}})
+        second = query.results(
+            {'partition_filter': {'begin': 2048, 'count': 2048}})
+
+        assert self.ids(first + second) == list(range(self.record_count))
+        for _, _, bins in first:
+            assert self.as_connection.get_key_partition_id(
+                self.test_ns, self.test_set, bins['i']) < 2048
+
+    def test_pos_query_foreach_partition_filter(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        records = []
+
+        query.foreach(records.append,
+                      {'partition_filter': {'begin': 0, 'count': 4096}})
+
+        assert self.ids(records) == list(range(self.record_count))
+
+    def test_pos_query_iter_results_partition_filter(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        records = list(query.iter_results(
+            {'partition_filter': {'begin': 1000, 'count': 3096}}))
+
+        assert self.ids(records) == self.ids(query.results(
+            {'partition_filter': {'begin': 1000, 'count': 3096}}))
+
+    def test_pos_query_max_records(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        records = query.results({'max_records': 10})
+
+        assert len(records) == 10
+
+    @pytest.mark.parametrize("page_size", [7, 30, 1000])
+    def test_pos_query_paginate(self, page_size):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        query.paginate()
+        records = []
+        pages = 0
+
+        while not query.is_done():
+            page = query.results({'max_records': page_size})
+            assert len(page) <= page_size
+            records.extend(page)
+            pages += 1
+
+        assert self.ids(records) == list(range(self.record_count))
+        assert pages >= -(-self.record_count // page_size)
+
+    def test_pos_query_resume_from_partitions_status(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        first = query.results({'max_records': 30})
+        status = query.get_partitions_status()
+
+        resumed = self.as_connection.query(self.test_ns, self.test_set)
+        rest = resumed.results({'partition_filter': {
+            'begin': 0, 'count': 4096, 'partition_status': status}})
+
+        assert len(first) == 30
+        assert self.ids(first + rest) == list(range(self.record_count))
+
+    def test_pos_query_partitions_status(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        assert query.get_partitions_status() == {}
+        query.results({'partition_filter': {'begin': 10, 'count': 5}})
+        status = query.get_partitions_status()
+
+        assert sorted(status) == list(range(10, 15))
+        for part_id, (id, init, done, digest) in status.items():
+            assert id == part_id
+            assert done is True
+            assert isinstance(init, bool)
+            assert isinstance(digest, bytearray) and len(digest) == 20
+
+    def test_pos_scan_partitions_status(self):
+        scan = self.as_connection.scan(self.test_ns, self.test_set)
+
+        scan.results({'partition_filter': {'begin': 0, 'count': 4096}})
+
+        assert len(scan.get_partitions_status()) == 4096
+
+    def test_pos_query_partitions_status_while_running(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        query.results({'max_records': 1})
+        running = [True]
+
+        def read_status():
+            while running[0]:
+                assert len(query.get_partitions_status()) == 4096
+                query.checkpoint()
+                query.is_done()
+
+        reader = threading.Thread(target=read_status)
+        reader.start()
+        try:
+            for _ in range(50):
+                query.results({'max_records': 10})
+        finally:
+            running[0] = False
+            reader.join()
+
+    def test_pos_query_is_done_without_pagination(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        assert query.is_done() is False
+
+    def test_neg_query_partition_filter_with_where(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        query.where(p.equals('i', 1))
+
+        with pytest.raises(e.ParamError):
+            query.results({'partition_filter': {'begin': 0, 'count': 4096}})
+        with pytest.raises(e.ParamError):
+            query.foreach(lambda record: None, {'max_records': 1})
+
+    def test_neg_query_paginate_with_aggregation(self):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+        query.apply('stream_example', 'count', [])
+        query.paginate()
+
+        with pytest.raises(e.ParamError):
+            query.results()
+
+    @pytest.mark.parametrize("policy", [
+        {'max_records': 'a'},
+        {'max_records': -1},
+        {'partition_filter': []},
+        {'partition_filter': {'count': 1}},
+    ])
+    def test_neg_query_invalid_partition_policy(self, policy):
+        query = self.as_connection.query(self.test_ns, self.test_set)
+
+        with pytest.raises(e.ParamError):
+            query.results(policy)
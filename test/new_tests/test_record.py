@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from .test_base_class import TestBaseClass
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("configured_client")
+class TestRecord():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.client = self.configured_client(result_format='record')
+        self.keys = [('test', 'demo', 'record_%d' % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'name': 'name%d' % i, 'age': i})
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    def test_pos_get_record(self):
+        record = self.client.get(self.keys[1])
+
+        assert isinstance(record, aerospike.Record)
+        assert record.key[:2] == ('test', 'demo')
+        assert record.gen == 1
+        assert record.ttl is not None
+        assert record.bins == {'name': 'name1', 'age': 1}
+
+        key, gen, ttl, bins = record
+        assert (key, gen, ttl, bins) == (record.key, record.gen,
+                                         record.ttl, record.bins)
+
+    def test_pos_select_record(self):
+        record = self.client.select(self.keys[2], ['age'])
+
+        assert isinstance(record, aerospike.Record)
+        assert record.bins == {'age': 2}
+
+    def test_pos_operate_record(self):
+        ops = [{'op': aerospike.OPERATOR_INCR, 'bin': 'age', 'val': 10},
+               {'op': aerospike.OPERATOR_READ, 'bin': 'age'}]
+
+        record = self.client.operate(self.keys[3], ops)
+
+        assert isinstance(record, aerospike.Record)
+        assert record.gen == 2
+        assert record.bins == {'age': 13}
+
+    def test_pos_get_many_records(self):
+        missing = ('test', 'demo', 'record_missing')
+
+        records = self.client.get_many(self.keys + [missing])
+
+        assert all(isinstance(record, aerospike.Record) for record in records)
+        assert [record.bins['age'] for record in records[:-1]] == \
+            list(range(5))
+        assert records[-1].key[:2] == ('test', 'demo')
+        assert records[-1][1:] == (None, None, None)
+
+    def test_pos_scan_records(self):
+        scan = self.client.scan('test', 'demo')
+        records = scan.results()
+
+        assert len(records) >= len(self.keys)
+        assert all(isinstance(record, aerospike.Record) for record in records)
+        assert all(isinstance(record.bins, dict) for record in records)
+
+    def test_pos_default_result_format(self):
+        key, meta, bins = self.as_connection.get(self.keys[0])
+
+        assert meta['gen'] == 1
+        assert bins == {'name': 'name0', 'age': 0}
+
+    @pytest.mark.parametrize("result_format", ['records', 1, b'record'])
+    def test_neg_result_format_invalid(self, result_format):
+        config = TestBaseClass.get_connection_config()
+        config['result_format'] = result_format
+
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
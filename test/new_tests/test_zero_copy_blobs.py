@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import array
+import mmap
+import pytest
+import sys
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("configured_client")
+class TestZeroCopyBlobs():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'zero_copy_%d' % i) for i in range(5)]
+        self.blob = bytes(range(256)) * 400
+
+        def teardown():
+            """
+            Teardown method.
+            """
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.parametrize("make_value", [
+        bytes,
+        bytearray,
+        memoryview,
+        lambda blob: memoryview(bytearray(blob))[100:5000],
+    ])
+    def test_pos_put_buffer_as_blob(self, make_value):
+        value = make_value(self.blob)
+
+        self.as_connection.put(self.keys[0], {'blob': value})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blob'] == bytearray(value)
+        assert isinstance(bins['blob'], bytearray)
+
+    def test_pos_put_mmap_as_blob(self):
+        buf = mmap.mmap(-1, len(self.blob))
+        buf.write(self.blob)
+
+        self.as_connection.put(self.keys[0], {'blob': buf})
+        buf.close()
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blob'] == bytearray(self.blob)
+
+    def test_pos_put_wrapped_array_as_blob(self):
+        values = array.array('i', range(1000))
+
+        self.as_connection.put(self.keys[0], {'blob': memoryview(values)})
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins['blob'] == bytearray(values.tobytes())
+
+    def test_pos_batch_write_buffers(self):
+        records = [(key, {'blob': memoryview(self.blob)[i:]})
+                   for i, key in enumerate(self.keys)]
+
+        assert self.as_connection.batch_write(records) == [0] * 5
+
+        for i, key in enumerate(self.keys):
+            assert self.as_connection.get(key)[2]['blob'] == self.blob[i:]
+
+    def test_pos_get_blob_as_memoryview(self):
+        client = self.configured_client(blob_as_memoryview=True)
+        self.as_connection.put(self.keys[0], {'blob': self.blob, 'i': 1})
+
+        _, _, bins = client.get(self.keys[0])
+        client.close()
+
+        assert isinstance(bins['blob'], memoryview)
+        assert bins['blob'].readonly
+        assert bins['blob'] == self.blob
+        assert bins['blob'].tobytes() == self.blob
+        assert bins['i'] == 1
+
+    def test_pos_get_many_blob_as_memoryview(self):
+        client = self.configured_client(blob_as_memoryview=True)
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'blob': self.blob[i:],
+                                         'list': [bytearray(b'abc')]})
+
+        records = client.get_many(self.keys)
+        client.close()
+
+        for i, (_, _, bins) in enumerate(records):
+            assert bytes(bins['blob']) == self.blob[i:]
+            assert bytes(bins['list'][0]) == b'abc'
+
+    def test_neg_blob_as_memoryview_is_read_only(self):
+        client = self.configured_client(blob_as_memoryview=True)
+        self.as_connection.put(self.keys[0], {'blob': b'abc'})
+
+        _, _, bins = client.get(self.keys[0])
+        client.close()
+
+        with pytest.raises(TypeError):
+            bins['blob'][0] = 1